@@ -0,0 +1,27 @@
+@tool
+extends EditorExportPlugin
+## Builds game/data/content.bundle at the start of every export and packs it.
+## Godot only exports files it knows as resources, so the .bundle would be left
+## out otherwise and exported builds would parse every JSON file instead.
+## The Python interpreter is $PYTHON, or python3.
+
+const BUNDLE_PATH := "res://game/data/content.bundle"
+const BUILD_SCRIPT := "res://tools/content/build_bundle.py"
+
+
+func _get_name() -> String:
+	return "ContentBundle"
+
+
+func _export_begin(_features: PackedStringArray, _is_debug: bool, _path: String, _flags: int) -> void:
+	var python := OS.get_environment("PYTHON")
+	if python.is_empty():
+		python = "python3"
+	var output: Array = []
+	var code := OS.execute(python, [ProjectSettings.globalize_path(BUILD_SCRIPT)], output, true)
+	for text in output:
+		print(str(text).strip_edges())
+	if code != 0:
+		push_error("[ContentBundle] %s failed (exit %d); the export will parse game/data JSON instead" % [BUILD_SCRIPT, code])
+		return
+	add_file(BUNDLE_PATH, FileAccess.get_file_as_bytes(BUNDLE_PATH), false)
@@ -0,0 +1,14 @@
+@tool
+extends EditorPlugin
+
+var _export_plugin: EditorExportPlugin
+
+
+func _enter_tree() -> void:
+	_export_plugin = preload("res://addons/content_bundle/content_bundle_export.gd").new()
+	add_export_plugin(_export_plugin)
+
+
+func _exit_tree() -> void:
+	remove_export_plugin(_export_plugin)
+	_export_plugin = null
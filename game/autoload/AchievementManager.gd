@@ -20,26 +20,8 @@ func _ready() -> void:
 
 func _load_achievement_data() -> void:
     var file_path := "res://game/data/achievements/achievements.json"
-    if not FileAccess.file_exists(file_path):
-        push_warning("AchievementManager: Achievement data file not found: " + file_path)
-        return
-    
-    var file := FileAccess.open(file_path, FileAccess.READ)
-    if file == null:
-        push_warning("AchievementManager: Could not open achievement data file")
-        return
-    
-    var json_text := file.get_as_text()
-    file.close()
-    
-    var json := JSON.new()
-    var parse_result := json.parse(json_text)
-    if parse_result != OK:
-        push_warning("AchievementManager: Failed to parse achievement data JSON")
-        return
-    
-    var data = json.data
-    if data is Dictionary and data.has("achievements"):
+    var data := GameData.load_data_file(file_path)
+    if data.has("achievements"):
         _achievement_data = data["achievements"]
 
 
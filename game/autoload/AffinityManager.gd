@@ -25,16 +25,7 @@ func _ready() -> void:
     _load_affinity_data()
 
 func _load_affinity_data() -> void:
-    var path = "res://game/data/npcs/affinity.json"
-    if not FileAccess.file_exists(path):
-        return
-    var file = FileAccess.open(path, FileAccess.READ)
-    if file == null:
-        return
-    var json = JSON.new()
-    var result = json.parse(file.get_as_text())
-    if result == OK:
-        _npc_data = json.get_data()
+    _npc_data = GameData.load_data_file("res://game/data/npcs/affinity.json")
 
 ## Get current affinity with an NPC (0-100)
 func get_affinity(npc_id: String) -> int:
@@ -17,14 +17,8 @@ func _ready() -> void:
     _load_progress()
 
 func _load_collection_data() -> void:
-    var file := FileAccess.open("res://game/data/collections/collections.json", FileAccess.READ)
-    if file:
-        var json := JSON.new()
-        var error := json.parse(file.get_as_text())
-        file.close()
-        if error == OK:
-            _collection_data = json.data
-    else:
+    _collection_data = GameData.load_data_file("res://game/data/collections/collections.json")
+    if _collection_data.is_empty():
         push_warning("[CollectionLogManager] Could not load collection data")
 
 func _load_progress() -> void:
@@ -67,14 +61,7 @@ func get_category_items(category_id: String) -> Array:
 
 func _get_items_from_source(source: String, key: String) -> Array:
     var path := "res://game/data/%s/%s.json" % [source, source]
-    var file := FileAccess.open(path, FileAccess.READ)
-    if file:
-        var json := JSON.new()
-        var error := json.parse(file.get_as_text())
-        file.close()
-        if error == OK:
-            return json.data.get(key, [])
-    return []
+    return GameData.load_data_file(path).get(key, [])
 
 func record_collection(category_id: String, item_id: String, count: int = 1) -> void:
     ## Record that an item was collected
@@ -30,24 +30,7 @@ func _ready() -> void:
 
 # ── Data Loading ─────────────────────────────────────────────────────────────
 func _load_events_data() -> void:
-    if not FileAccess.file_exists(EVENTS_PATH):
-        push_warning("[CommunityEventManager] No events data file found")
-        return
-    
-    var file := FileAccess.open(EVENTS_PATH, FileAccess.READ)
-    if file == null:
-        push_error("[CommunityEventManager] Failed to open events data")
-        return
-    
-    var json := JSON.new()
-    var err := json.parse(file.get_as_text())
-    file.close()
-    
-    if err != OK:
-        push_error("[CommunityEventManager] Failed to parse events data: %s" % json.get_error_message())
-        return
-    
-    var data: Dictionary = json.data
+    var data := GameData.load_data_file(EVENTS_PATH)
     _events_data = data.get("events", [])
 
 
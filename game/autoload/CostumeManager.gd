@@ -21,25 +21,10 @@ func _ready() -> void:
 
 
 func _load_outfit_data() -> void:
-    if not FileAccess.file_exists(OUTFITS_PATH):
-        push_warning("CostumeManager: Outfit data file not found: " + OUTFITS_PATH)
+    var data := GameData.load_data_file(OUTFITS_PATH)
+    if data.is_empty():
         return
     
-    var file := FileAccess.open(OUTFITS_PATH, FileAccess.READ)
-    if file == null:
-        push_error("CostumeManager: Failed to open outfit data: " + OUTFITS_PATH)
-        return
-    
-    var json := JSON.new()
-    var parse_result := json.parse(file.get_as_text())
-    file.close()
-    
-    if parse_result != OK:
-        push_error("CostumeManager: Failed to parse outfit data: " + json.get_error_message())
-        return
-    
-    var data: Dictionary = json.data
-    
     # Load outfits
     if data.has("outfits"):
         for outfit in data.outfits:
@@ -35,26 +35,8 @@ func _ready() -> void:
 
 func _load_cutscene_data() -> void:
     var file_path := "res://game/data/cutscenes/cutscenes.json"
-    if not FileAccess.file_exists(file_path):
-        push_warning("CutsceneManager: Cutscene data file not found: " + file_path)
-        return
-    
-    var file := FileAccess.open(file_path, FileAccess.READ)
-    if file == null:
-        push_warning("CutsceneManager: Could not open cutscene data file")
-        return
-    
-    var json_text := file.get_as_text()
-    file.close()
-    
-    var json := JSON.new()
-    var parse_result := json.parse(json_text)
-    if parse_result != OK:
-        push_warning("CutsceneManager: Failed to parse cutscene data JSON")
-        return
-    
-    var data = json.data
-    if data is Dictionary and data.has("cutscenes"):
+    var data := GameData.load_data_file(file_path)
+    if data.has("cutscenes"):
         _cutscene_data = data["cutscenes"]
 
 
@@ -21,16 +21,12 @@ func _ready() -> void:
     _check_daily_refresh()
 
 func _load_challenges_data() -> void:
-    var file := FileAccess.open("res://game/data/challenges/daily_challenges.json", FileAccess.READ)
-    if file:
-        var json := JSON.new()
-        var error := json.parse(file.get_as_text())
-        file.close()
-        if error == OK:
-            _challenges_data = json.data.get("challenges", [])
-            _daily_count = json.data.get("daily_count", 3)
-    else:
+    var data := GameData.load_data_file("res://game/data/challenges/daily_challenges.json")
+    if data.is_empty():
         push_warning("[DailyChallengeManager] Could not load daily challenges data")
+        return
+    _challenges_data = data.get("challenges", [])
+    _daily_count = data.get("daily_count", 3)
 
 func _load_progress() -> void:
     var file := FileAccess.open(SAVE_PATH, FileAccess.READ)
@@ -15,6 +15,8 @@ const ENCOUNTERS_DIR := "res://game/data/encounters/"
 const QUESTS_PATH := "res://game/data/quests/quests.json"
 const NPC_SCHEDULES_PATH := "res://game/data/npcs/schedules.json"
 const EQUIPMENT_PATH := "res://game/data/equipment/equipment.json"
+const DATA_DIR := "res://game/data/"
+const BUNDLE_PATH := "res://game/data/content.bundle"
 
 ## Cached data (dictionaries keyed by id)
 var enemies: Dictionary = {}
@@ -30,6 +32,9 @@ var equipment: Dictionary = {}
 ## Raw party data
 var party_data: Dictionary = {}
 
+## Compiled game/data (tools/content/build_bundle.py); exported builds only
+var _bundle: ContentBundle = null
+
 func _ready() -> void:
 	_load_all_data()
 	_record_timestamps()
@@ -43,6 +48,12 @@ func _process(delta: float) -> void:
 		_check_for_changes()
 
 func _load_all_data() -> void:
+	# Editor and scenario runs read the JSON directly so edits (and hot
+	# reload) never see a stale bundle; exported builds load the bundle once
+	if OS.has_feature("template") and _bundle == null:
+		_bundle = ContentBundle.open(BUNDLE_PATH)
+		if _bundle != null:
+			print("[GameData] Content bundle loaded: %d files" % _bundle.documents.size())
 	_load_enemies()
 	_load_skills()
 	_load_items()
@@ -131,7 +142,17 @@ func _load_equipment() -> void:
 			if equip.has("id"):
 				equipment[equip["id"]] = equip
 
+## Parsed game/data JSON file (res:// path), from the content bundle when one
+## is loaded. Other managers use this instead of parsing the file themselves.
+func load_data_file(path: String) -> Dictionary:
+	return _load_json(path)
+
 func _load_json(path: String) -> Dictionary:
+	if _bundle != null and path.begins_with(DATA_DIR):
+		var rel_path := path.substr(DATA_DIR.length())
+		if _bundle.has_document(rel_path):
+			var doc = _bundle.get_document(rel_path)
+			return doc if doc is Dictionary else {}
 	if not FileAccess.file_exists(path):
 		push_warning("[GameData] File not found: %s" % path)
 		return {}
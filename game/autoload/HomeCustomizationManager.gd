@@ -24,25 +24,10 @@ func _ready() -> void:
 
 
 func _load_furniture_data() -> void:
-    if not FileAccess.file_exists(FURNITURE_PATH):
-        push_warning("HomeCustomizationManager: Furniture data file not found: " + FURNITURE_PATH)
+    var data := GameData.load_data_file(FURNITURE_PATH)
+    if data.is_empty():
         return
     
-    var file := FileAccess.open(FURNITURE_PATH, FileAccess.READ)
-    if file == null:
-        push_error("HomeCustomizationManager: Failed to open furniture data: " + FURNITURE_PATH)
-        return
-    
-    var json := JSON.new()
-    var parse_result := json.parse(file.get_as_text())
-    file.close()
-    
-    if parse_result != OK:
-        push_error("HomeCustomizationManager: Failed to parse furniture data: " + json.get_error_message())
-        return
-    
-    var data: Dictionary = json.data
-    
     # Load furniture
     if data.has("furniture"):
         for furn in data.furniture:
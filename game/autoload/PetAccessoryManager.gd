@@ -23,25 +23,10 @@ func _ready() -> void:
 
 
 func _load_accessory_data() -> void:
-    if not FileAccess.file_exists(ACCESSORIES_PATH):
-        push_warning("PetAccessoryManager: Accessory data file not found: " + ACCESSORIES_PATH)
+    var data := GameData.load_data_file(ACCESSORIES_PATH)
+    if data.is_empty():
         return
     
-    var file := FileAccess.open(ACCESSORIES_PATH, FileAccess.READ)
-    if file == null:
-        push_error("PetAccessoryManager: Failed to open accessory data: " + ACCESSORIES_PATH)
-        return
-    
-    var json := JSON.new()
-    var parse_result := json.parse(file.get_as_text())
-    file.close()
-    
-    if parse_result != OK:
-        push_error("PetAccessoryManager: Failed to parse accessory data: " + json.get_error_message())
-        return
-    
-    var data: Dictionary = json.data
-    
     # Load accessories
     if data.has("accessories"):
         for accessory in data.accessories:
@@ -14,15 +14,11 @@ func _ready() -> void:
     _check_active_events()
 
 func _load_events_data() -> void:
-    var file := FileAccess.open("res://game/data/events/seasonal_events.json", FileAccess.READ)
-    if file:
-        var json := JSON.new()
-        var error := json.parse(file.get_as_text())
-        file.close()
-        if error == OK:
-            _events_data = json.data.get("events", [])
-    else:
+    var data := GameData.load_data_file("res://game/data/events/seasonal_events.json")
+    if data.is_empty():
         push_warning("[SeasonalEventManager] Could not load seasonal events data")
+        return
+    _events_data = data.get("events", [])
 
 func _check_active_events() -> void:
     var date := _get_current_date()
@@ -19,25 +19,10 @@ func _ready() -> void:
 
 
 func _load_sticker_data() -> void:
-    if not FileAccess.file_exists(STICKERS_PATH):
-        push_warning("StickerManager: Sticker data file not found: " + STICKERS_PATH)
+    var data := GameData.load_data_file(STICKERS_PATH)
+    if data.is_empty():
         return
     
-    var file := FileAccess.open(STICKERS_PATH, FileAccess.READ)
-    if file == null:
-        push_error("StickerManager: Failed to open sticker data: " + STICKERS_PATH)
-        return
-    
-    var json := JSON.new()
-    var parse_result := json.parse(file.get_as_text())
-    file.close()
-    
-    if parse_result != OK:
-        push_error("StickerManager: Failed to parse sticker data: " + json.get_error_message())
-        return
-    
-    var data: Dictionary = json.data
-    
     # Load stickers
     if data.has("stickers"):
         for sticker in data.stickers:
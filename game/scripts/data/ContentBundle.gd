@@ -0,0 +1,48 @@
+class_name ContentBundle
+extends RefCounted
+## Reader for game/data/content.bundle, written by tools/content/build_bundle.py
+## (the layout is documented there). After a 44-byte header (magic, version,
+## source digest, payload size) the bundle is one deflate-compressed Variant in
+## Godot's binary serialization, so a native decompress() and bytes_to_var()
+## decode every document into the Dictionaries and Arrays JSON.parse would
+## return for it (numbers as float, keys in file order).
+
+const MAGIC := "WOCB"
+const VERSION := 3
+const HEADER_SIZE := 44
+const PAYLOAD_SIZE_OFFSET := 40
+
+## Relative path under game/data (e.g. "enemies/enemies.json") -> document
+var documents: Dictionary = {}
+
+
+## Read and decode a bundle; null if it is missing or not this version.
+static func open(path: String) -> ContentBundle:
+	if not FileAccess.file_exists(path):
+		return null
+	var bytes := FileAccess.get_file_as_bytes(path)
+	if (bytes.size() < HEADER_SIZE or bytes.slice(0, 4).get_string_from_ascii() != MAGIC
+			or bytes.decode_u32(4) != VERSION):
+		push_warning("[ContentBundle] Not a version %d bundle: %s" % [VERSION, path])
+		return null
+	var payload := bytes.slice(HEADER_SIZE).decompress(
+			bytes.decode_u32(PAYLOAD_SIZE_OFFSET), FileAccess.COMPRESSION_DEFLATE)
+	var data = bytes_to_var(payload) if not payload.is_empty() else null
+	if not data is Dictionary:
+		push_warning("[ContentBundle] Corrupt bundle: %s" % path)
+		return null
+	var bundle := ContentBundle.new()
+	bundle.documents = data
+	return bundle
+
+
+func has_document(rel_path: String) -> bool:
+	return documents.has(rel_path)
+
+
+## A copy of one document, safe for the caller to modify.
+func get_document(rel_path: String) -> Variant:
+	var doc = documents.get(rel_path)
+	if doc is Dictionary or doc is Array:
+		return doc.duplicate(true)
+	return doc
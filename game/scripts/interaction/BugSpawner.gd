@@ -20,19 +20,14 @@ func _ready() -> void:
     _load_bug_data()
 
 func _load_bug_data() -> void:
-    var file := FileAccess.open("res://game/data/bugs/bugs.json", FileAccess.READ)
-    if file:
-        var json := JSON.new()
-        var error := json.parse(file.get_as_text())
-        file.close()
-        if error == OK:
-            _bug_data = json.data
-            for area in _bug_data.get("spawn_areas", []):
-                if area.get("id", "") == spawn_area_id:
-                    _spawn_data = area
-                    break
-    else:
+    _bug_data = GameData.load_data_file("res://game/data/bugs/bugs.json")
+    if _bug_data.is_empty():
         push_warning("[BugSpawner] Could not load bug data")
+        return
+    for area in _bug_data.get("spawn_areas", []):
+        if area.get("id", "") == spawn_area_id:
+            _spawn_data = area
+            break
 
 func interact() -> void:
     if not InventoryManager.has_tool("bug_net"):
@@ -18,20 +18,15 @@ func _ready() -> void:
     _load_fishing_data()
 
 func _load_fishing_data() -> void:
-    var file := FileAccess.open("res://game/data/fishing/fishing.json", FileAccess.READ)
-    if file:
-        var json := JSON.new()
-        var error := json.parse(file.get_as_text())
-        file.close()
-        if error == OK:
-            _fishing_data = json.data
-            # Find our spot data
-            for spot in _fishing_data.get("fishing_spots", []):
-                if spot.get("id", "") == spot_id:
-                    _spot_data = spot
-                    break
-    else:
+    _fishing_data = GameData.load_data_file("res://game/data/fishing/fishing.json")
+    if _fishing_data.is_empty():
         push_warning("[FishingSpot] Could not load fishing data")
+        return
+    # Find our spot data
+    for spot in _fishing_data.get("fishing_spots", []):
+        if spot.get("id", "") == spot_id:
+            _spot_data = spot
+            break
 
 func interact() -> void:
     if not InventoryManager.has_tool("fishing_rod"):
@@ -15,14 +15,8 @@ func _ready() -> void:
     _load_bug_data()
 
 func _load_bug_data() -> void:
-    var file := FileAccess.open("res://game/data/bugs/bugs.json", FileAccess.READ)
-    if file:
-        var json := JSON.new()
-        var error := json.parse(file.get_as_text())
-        file.close()
-        if error == OK:
-            _bug_data = json.data
-    else:
+    _bug_data = GameData.load_data_file("res://game/data/bugs/bugs.json")
+    if _bug_data.is_empty():
         push_warning("[BugCollectionLog] Could not load bug data")
 
 func show_log() -> void:
@@ -0,0 +1,95 @@
+extends SceneTree
+## Headless check that game/data/content.bundle holds exactly what JSON.parse
+## returns for every game/data JSON file (same types, same key order), and how
+## long each takes to load. tools/ci/run-tests.sh builds the bundle and runs:
+##   godot --headless --path . --script res://tests/headless/content_bundle_test.gd
+
+const DATA_DIR := "res://game/data/"
+const BUNDLE_PATH := "res://game/data/content.bundle"
+const BUNDLE_SCRIPT := "res://game/scripts/data/ContentBundle.gd"
+
+
+func _init() -> void:
+	quit(_run())
+
+
+func _run() -> int:
+	var files := _json_files(DATA_DIR, "")
+	var started := Time.get_ticks_usec()
+	var parsed := {}
+	for rel in files:
+		var json := JSON.new()
+		if json.parse(FileAccess.get_file_as_string(DATA_DIR + rel)) != OK:
+			printerr("[bundle-test] FAIL: %s: %s" % [rel, json.get_error_message()])
+			return 1
+		parsed[rel] = json.data
+	var json_usec := Time.get_ticks_usec() - started
+
+	started = Time.get_ticks_usec()
+	var bundle = load(BUNDLE_SCRIPT).open(BUNDLE_PATH)
+	var bundle_usec := Time.get_ticks_usec() - started
+	if bundle == null:
+		printerr("[bundle-test] FAIL: cannot open %s (run tools/content/build_bundle.py)" % BUNDLE_PATH)
+		return 1
+
+	var failures := 0
+	for rel in files:
+		if not bundle.has_document(rel):
+			printerr("[bundle-test] FAIL: %s: missing from the bundle" % rel)
+			failures += 1
+			continue
+		var where := _first_difference(bundle.documents[rel], parsed[rel], "$")
+		if where != "":
+			printerr("[bundle-test] FAIL: %s: differs from JSON.parse at %s" % [rel, where])
+			failures += 1
+	for rel in bundle.documents:
+		if not parsed.has(rel):
+			printerr("[bundle-test] FAIL: %s: in the bundle but not in game/data" % rel)
+			failures += 1
+
+	print("[bundle-test] %d file(s): JSON.parse %.2f ms, bundle %.2f ms" % [
+		files.size(), json_usec / 1000.0, bundle_usec / 1000.0
+	])
+	if failures:
+		printerr("[bundle-test] %d failure(s)" % failures)
+		return 1
+	print("[bundle-test] OK")
+	return 0
+
+
+## .json files under dir, relative to DATA_DIR, sorted
+func _json_files(dir: String, prefix: String) -> PackedStringArray:
+	var found := PackedStringArray()
+	var names := DirAccess.get_files_at(dir)
+	names.sort()
+	for name in names:
+		if name.ends_with(".json"):
+			found.append(prefix + name)
+	var subdirs := DirAccess.get_directories_at(dir)
+	subdirs.sort()
+	for sub in subdirs:
+		found.append_array(_json_files(dir + sub + "/", prefix + sub + "/"))
+	return found
+
+
+## Path of the first value where a and b differ in type, keys, order or value
+func _first_difference(a: Variant, b: Variant, path: String) -> String:
+	if typeof(a) != typeof(b):
+		return path
+	if a is Dictionary:
+		if a.keys() != b.keys():
+			return path + " (keys)"
+		for key in a:
+			var where := _first_difference(a[key], b[key], "%s.%s" % [path, key])
+			if where != "":
+				return where
+		return ""
+	if a is Array:
+		if a.size() != b.size():
+			return path + " (size)"
+		for i in a.size():
+			var where := _first_difference(a[i], b[i], "%s[%d]" % [path, i])
+			if where != "":
+				return where
+		return ""
+	return "" if a == b else path
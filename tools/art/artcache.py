@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Content-hash build cache for the tools/art generators.
+
+An asset's fingerprint hashes everything that can change its bytes: the
+producer's source, the source of every generator/raster helper it calls
+(transitively), the module-level constants it reads (COLORS and friends),
+its arguments, the fingerprints of registered assets it reads, and the
+Pillow/NumPy versions. The manifest (.artcache/manifest.json under the
+build root) maps each output path to the fingerprint it was built from
+plus the sha256/size/mtime of the file that was written.
+
+An output is fresh when its fingerprint matches and the file on disk is
+still the one that was written; fresh outputs are neither rebuilt nor
+touched.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import types
+from typing import Callable, Optional
+
+import numpy as np
+import PIL
+
+SCHEME = 1
+MANIFEST_PATH = os.path.join(".artcache", "manifest.json")
+
+
+def _code_names(code: types.CodeType) -> set[str]:
+    """Global names referenced by a code object and its nested functions."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def _stable_repr(value) -> str:
+    """repr() that is stable across processes (no object addresses)."""
+    if isinstance(value, dict):
+        items = ", ".join(
+            f"{_stable_repr(k)}: {_stable_repr(v)}" for k, v in value.items()
+        )
+        return "{" + items + "}"
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__ + "(" + ", ".join(map(_stable_repr, value)) + ")"
+    if isinstance(value, (set, frozenset)):
+        return "set(" + ", ".join(sorted(map(_stable_repr, value))) + ")"
+    if callable(value):
+        return f"{getattr(value, '__module__', '?')}.{value.__qualname__}"
+    if isinstance(value, np.ndarray):
+        return f"ndarray({value.dtype}, {value.shape}, {hashlib.sha256(value.tobytes()).hexdigest()})"
+    return repr(value)
+
+
+def _functions_in(value):
+    """Yield the Python functions held in value, looking through containers
+    and functools wrappers (e.g. lru_cache)."""
+    value = inspect.unwrap(value) if callable(value) else value
+    if isinstance(value, types.FunctionType):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _functions_in(item)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            yield from _functions_in(item)
+
+
+@functools.lru_cache(maxsize=None)
+def _function_digest(fn: types.FunctionType) -> tuple[str, tuple]:
+    """Hash one function's source and the module constants it reads.
+
+    Returns the digest and the functions it reaches (directly, through a
+    wrapper or via a table). Memoized: generators share most helpers, and
+    inspect.getsource() is slow.
+    """
+    h = hashlib.sha256(inspect.getsource(fn).encode())
+    callees: list = []
+    scope = fn.__globals__
+    for name in sorted(_code_names(fn.__code__)):
+        if name not in scope:
+            continue
+        value = scope[name]
+        if isinstance(value, (types.ModuleType, type)):
+            continue
+        if not callable(value):
+            h.update(f"\0{name}={_stable_repr(value)}".encode())
+        callees.extend(_functions_in(value))
+    return h.hexdigest(), tuple(callees)
+
+
+def fingerprint(
+    create: Callable, args: tuple, dependency: Callable[[str], Optional[str]]
+) -> str:
+    """Hash the producer, everything it reaches, and its arguments.
+
+    Functions passed as arguments or stored in module-level tables are
+    hashed like direct calls.
+
+    dependency(arg) returns the fingerprint of the registered asset whose
+    output path is arg, or None when arg is not an asset path.
+    """
+    h = hashlib.sha256()
+    h.update(
+        f"scheme={SCHEME};pillow={PIL.__version__};numpy={np.__version__}".encode()
+    )
+    seen: set = set()
+
+    def visit(fn: types.FunctionType) -> None:
+        if fn in seen:
+            return
+        seen.add(fn)
+        digest, callees = _function_digest(fn)
+        h.update(f"\0def {fn.__module__}.{fn.__qualname__}={digest}".encode())
+        for callee in callees:
+            visit(callee)
+
+    visit(create)
+    h.update(f"\0args={_stable_repr(args)}".encode())
+    for inner in _functions_in(args):
+        visit(inner)
+    for arg in args:
+        if isinstance(arg, str):
+            dep = dependency(arg)
+            if dep is not None:
+                h.update(f"\0dep {arg}={dep}".encode())
+    return h.hexdigest()
+
+
+def file_sha256(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def file_record(path: str, fp: str) -> dict:
+    """Manifest entry for a freshly written output."""
+    st = os.stat(path)
+    return {
+        "fingerprint": fp,
+        "sha256": file_sha256(path),
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+    }
+
+
+def is_fresh(path: str, fp: str, record: Optional[dict]) -> bool:
+    """True when path was built from fp and has not been modified since."""
+    if not record or record.get("fingerprint") != fp:
+        return False
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return False
+    if st.st_size == record.get("size") and st.st_mtime_ns == record.get("mtime_ns"):
+        return True
+    # Touched or copied: trust the bytes, not the stat data
+    return file_sha256(path) == record.get("sha256")
+
+
+def load_manifest(path: str = MANIFEST_PATH) -> dict:
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if data.get("scheme") != SCHEME:
+        return {}
+    return data.get("assets", {})
+
+
+def save_manifest(assets: dict, path: str = MANIFEST_PATH) -> None:
+    """Write the manifest atomically with sorted keys (diff-friendly)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump({"scheme": SCHEME, "assets": assets}, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp, path)
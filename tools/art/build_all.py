@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Regenerate every programmatic art asset in a single process.
+
+Each tools/art/generate_*.py module exposes an ASSETS registry of
+(output_path, producer, *args) entries; producers are the create_*
+functions and are called as producer(output_path, *args). This driver
+imports every generator once, runs the producers in registry order and
+reports per-asset timing, instead of paying one interpreter start and
+Pillow/NumPy import per script.
+
+With --jobs N the producers fan out over a process pool. Producers that
+read another registered asset from disk run in a later wave than that
+asset (generators should prefer deriving frames in memory; see
+generate_fae.py). Results are always reported
+in registry order, and PNG bytes do not depend on the job count.
+
+Builds are incremental: outputs whose fingerprint (see artcache.py) is
+unchanged since the last build are skipped without touching the file, and
+a rebuilt output that comes out byte-identical keeps its old file and
+mtime. --force rebuilds everything; --no-cache ignores the manifest.
+
+Usage:
+  python3 tools/art/build_all.py                 # build everything
+  python3 tools/art/build_all.py --jobs 0        # one worker per CPU
+  python3 tools/art/build_all.py --filter 'generate_pets*'
+  python3 tools/art/build_all.py --list
+"""
+
+import argparse
+import concurrent.futures
+import contextlib
+import filecmp
+import fnmatch
+import importlib
+import io
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
+
+ART_DIR = Path(__file__).resolve().parent
+REPO_ROOT = ART_DIR.parents[1]
+
+if str(ART_DIR) not in sys.path:
+    sys.path.insert(0, str(ART_DIR))
+
+import artcache  # noqa: E402
+
+
+class Asset(NamedTuple):
+    module: str
+    path: str
+    create: Callable
+    args: tuple
+
+
+def discover() -> list[Asset]:
+    """Import every generate_*.py module and flatten their ASSETS registries."""
+    assets = []
+    for source in sorted(ART_DIR.glob("generate_*.py")):
+        module = importlib.import_module(source.stem)
+        registry = getattr(module, "ASSETS", None)
+        if registry is None:
+            raise SystemExit(f"[art] ERROR: {source.name} has no ASSETS registry")
+        for path, create, *args in registry:
+            assets.append(Asset(source.stem, path, create, tuple(args)))
+    return assets
+
+
+def select(assets: list[Asset], patterns: list[str]) -> list[Asset]:
+    """Keep assets whose module name or output path matches any glob."""
+    if not patterns:
+        return assets
+    return [
+        a
+        for a in assets
+        if any(
+            fnmatch.fnmatch(a.module, p) or fnmatch.fnmatch(a.path, p) for p in patterns
+        )
+    ]
+
+
+def waves(assets: list[Asset]) -> list[list[Asset]]:
+    """Split assets into dependency levels, keeping registry order within each.
+
+    An asset depends on another when one of its arguments is that asset's
+    output path; dependencies outside the selection are assumed to exist.
+    """
+    by_path = {a.path: a for a in assets}
+    level: dict[str, int] = {}
+
+    def depth(asset: Asset) -> int:
+        if asset.path not in level:
+            deps = [
+                by_path[x] for x in asset.args if isinstance(x, str) and x in by_path
+            ]
+            level[asset.path] = 1 + max(map(depth, deps)) if deps else 0
+        return level[asset.path]
+
+    grouped: list[list[Asset]] = []
+    for asset in assets:
+        d = depth(asset)
+        while len(grouped) <= d:
+            grouped.append([])
+        grouped[d].append(asset)
+    return grouped
+
+
+class Result(NamedTuple):
+    elapsed: float
+    written: bool
+    error: Optional[str]
+
+
+def build(asset: Asset, verbose: bool = False) -> Result:
+    """Run one producer; keep the existing file if the bytes are unchanged."""
+    head, tail = os.path.split(asset.path)
+    os.makedirs(head, exist_ok=True)
+    target = asset.path
+    if os.path.exists(target):
+        stem, ext = os.path.splitext(tail)
+        target = os.path.join(head, f".{stem}.building{ext}")
+
+    start = time.perf_counter()
+    if verbose:
+        asset.create(target, *asset.args)
+    else:
+        with contextlib.redirect_stdout(io.StringIO()):
+            asset.create(target, *asset.args)
+    elapsed = time.perf_counter() - start
+
+    if target == asset.path:
+        return Result(elapsed, True, None)
+    if filecmp.cmp(target, asset.path, shallow=False):
+        os.remove(target)
+        return Result(elapsed, False, None)
+    os.replace(target, asset.path)
+    return Result(elapsed, True, None)
+
+
+def try_build(asset: Asset, verbose: bool = False) -> Result:
+    """build() that reports a failure as a message instead of raising."""
+    try:
+        return build(asset, verbose)
+    except Exception as e:
+        return Result(0.0, False, f"{type(e).__name__}: {e}")
+
+
+def build_many(
+    assets: list[Asset], jobs: int, verbose: bool = False
+) -> dict[str, Result]:
+    """Build assets wave by wave, in-process or over a process pool."""
+    results: dict[str, Result] = {}
+    if jobs <= 1:
+        for asset in assets:
+            results[asset.path] = try_build(asset, verbose)
+        return results
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        for wave in waves(assets):
+            chunksize = max(1, len(wave) // (jobs * 4))
+            outcomes = pool.map(
+                try_build, wave, [verbose] * len(wave), chunksize=chunksize
+            )
+            for asset, outcome in zip(wave, outcomes):
+                results[asset.path] = outcome
+    return results
+
+
+def fingerprints(assets: list[Asset]) -> dict[str, str]:
+    """Fingerprint every asset, resolving dependencies on other outputs."""
+    by_path = {a.path: a for a in assets}
+    memo: dict[str, str] = {}
+
+    def fp(path: str) -> Optional[str]:
+        if path not in by_path:
+            return None
+        if path not in memo:
+            asset = by_path[path]
+            memo[path] = artcache.fingerprint(asset.create, asset.args, fp)
+        return memo[path]
+
+    for asset in assets:
+        fp(asset.path)
+    return memo
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--root",
+        default=str(REPO_ROOT),
+        help="directory output paths are relative to (default: repo root)",
+    )
+    parser.add_argument(
+        "--filter",
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help="only build assets whose module or output path matches (repeatable)",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="worker processes (default: 1; 0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="rebuild even up-to-date assets"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="ignore and do not update .artcache/manifest.json",
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="list registered assets and exit"
+    )
+    parser.add_argument("--verbose", action="store_true", help="show generator output")
+    args = parser.parse_args()
+
+    registered = discover()
+    assets = select(registered, args.filter)
+    if args.list:
+        for asset in assets:
+            print(f"{asset.module}: {asset.path}")
+        return 0
+
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+
+    os.chdir(args.root)
+    started = time.perf_counter()
+    fps = fingerprints(registered)
+    manifest = {} if args.no_cache else artcache.load_manifest()
+    stale = [
+        a
+        for a in assets
+        if args.force
+        or not artcache.is_fresh(a.path, fps[a.path], manifest.get(a.path))
+    ]
+    results = build_many(stale, jobs, args.verbose)
+
+    per_module: dict[str, float] = {}
+    failures = unchanged = 0
+    for asset in stale:
+        result = results[asset.path]
+        if result.error:
+            print(f"[art] FAIL {asset.path}: {result.error}")
+            failures += 1
+            manifest.pop(asset.path, None)
+            continue
+        manifest[asset.path] = artcache.file_record(asset.path, fps[asset.path])
+        per_module[asset.module] = per_module.get(asset.module, 0.0) + result.elapsed
+        note = "" if result.written else "  (unchanged)"
+        unchanged += not result.written
+        print(f"[art] {result.elapsed * 1000:8.1f} ms  {asset.path}{note}")
+    if not args.no_cache:
+        artcache.save_manifest(manifest)
+    total = time.perf_counter() - started
+
+    if per_module:
+        print()
+    for module, elapsed in sorted(per_module.items(), key=lambda kv: -kv[1]):
+        print(f"[art] {elapsed * 1000:8.1f} ms  {module}")
+    built = len(stale) - failures
+    print(
+        f"[art] Built {built}/{len(stale)} stale assets ({unchanged} byte-identical), "
+        f"{len(assets) - len(stale)} up to date, in {total:.2f}s ({jobs} job(s))"
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -12,9 +12,24 @@ Creates 512x288 pixel art battle backgrounds with layered composition:
 Style: Flat colors, simple geometric shapes, JRPG stage layout.
 """
 
-from PIL import Image
 import os
 
+import numpy as np
+
+from raster import (
+    bands,
+    circle,
+    diamond,
+    ellipse_field,
+    fill_mask,
+    fill_rect,
+    grid,
+    hline,
+    new_canvas,
+    put,
+    save,
+)
+
 # ============================================================================
 # Cloverhollow Meadow Palette (sunny town battles)
 # ============================================================================
@@ -55,11 +70,6 @@ BAY_COLORS = {
 }
 
 
-def hex_to_rgba(t):
-    """Convert RGB tuple to RGBA."""
-    return (*t, 255) if len(t) == 3 else t
-
-
 def create_meadow_background(output_path):
     """
     Create cloverhollow_meadow.png (512x288) - sunny town battle background.
@@ -72,55 +82,35 @@ def create_meadow_background(output_path):
     - Rows 220-288: Foreground grass with flowers
     """
     width, height = 512, 288
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(width, height)
 
     C = MEADOW_COLORS
 
     # ========================================================================
     # Layer 1: Sky gradient (rows 0-100)
     # ========================================================================
-    for y in range(100):
-        sky_color = C["sky_light"] if y < 50 else C["sky"]
-        for x in range(width):
-            pixels[x, y] = hex_to_rgba(sky_color)
+    bands(canvas, 0, 0, width, 100, [(50, C["sky_light"]), (100, C["sky"])])
 
     # ========================================================================
     # Layer 1b: Clouds (simple ovals at top)
     # ========================================================================
     # Cloud 1: left side
-    for y in range(15, 35):
-        for x in range(50, 120):
-            dx = abs(x - 85)
-            dy = abs(y - 25)
-            if dx * dx / 1200 + dy * dy / 80 < 1:
-                pixels[x, y] = hex_to_rgba(C["cloud"])
+    cloud = ellipse_field(50, 15, 120, 35, 85, 25, 1200, 80)
+    fill_mask(canvas, 50, 15, cloud < 1, C["cloud"])
 
     # Cloud 2: right side
-    for y in range(25, 45):
-        for x in range(380, 470):
-            dx = abs(x - 425)
-            dy = abs(y - 35)
-            if dx * dx / 2000 + dy * dy / 100 < 1:
-                pixels[x, y] = hex_to_rgba(C["cloud"])
+    cloud = ellipse_field(380, 25, 470, 45, 425, 35, 2000, 100)
+    fill_mask(canvas, 380, 25, cloud < 1, C["cloud"])
 
     # Cloud 3: center-left
-    for y in range(10, 28):
-        for x in range(200, 280):
-            dx = abs(x - 240)
-            dy = abs(y - 19)
-            if dx * dx / 1500 + dy * dy / 70 < 1:
-                pixels[x, y] = hex_to_rgba(C["cloud"])
+    cloud = ellipse_field(200, 10, 280, 28, 240, 19, 1500, 70)
+    fill_mask(canvas, 200, 10, cloud < 1, C["cloud"])
 
     # ========================================================================
     # Layer 2: Distant tree line (rows 60-120)
     # ========================================================================
     # Dark tree silhouettes
-    for y in range(60, 120):
-        depth = (y - 60) / 60.0
-        tree_color = C["tree_dark"] if depth < 0.5 else C["tree_mid"]
-        for x in range(width):
-            pixels[x, y] = hex_to_rgba(tree_color)
+    bands(canvas, 0, 60, width, 120, [(90, C["tree_dark"]), (120, C["tree_mid"])])
 
     # Tree top triangles (dark trees at horizon)
     tree_positions = [30, 80, 140, 200, 260, 320, 380, 440, 490]
@@ -128,56 +118,36 @@ def create_meadow_background(output_path):
         tree_height = 40 + (tx % 20)
         for y in range(60 - tree_height, 80):
             half_width = (80 - (60 - tree_height - y)) // 3
-            for x in range(tx - half_width, tx + half_width):
-                if 0 <= x < width:
-                    pixels[x, y] = hex_to_rgba(C["tree_dark"])
+            hline(canvas, tx - half_width, tx + half_width, y, C["tree_dark"])
 
     # ========================================================================
     # Layer 3: Grass field (rows 100-288)
     # ========================================================================
-    for y in range(100, height):
-        grass_color = C["grass"]
-        if y > 220:
-            grass_color = C["grass_dark"]  # Foreground shadow
-        for x in range(width):
-            pixels[x, y] = hex_to_rgba(grass_color)
+    # Foreground shadow below row 220
+    bands(canvas, 0, 100, width, height, [(221, C["grass"]), (height, C["grass_dark"])])
 
     # ========================================================================
     # Layer 4: Battle stage - central lighter oval (rows 140-240)
     # ========================================================================
     stage_cx, stage_cy = 256, 190
     stage_rx, stage_ry = 180, 60
-    for y in range(130, 250):
-        for x in range(76, 436):
-            dx = abs(x - stage_cx)
-            dy = abs(y - stage_cy)
-            if dx * dx / (stage_rx * stage_rx) + dy * dy / (stage_ry * stage_ry) < 1:
-                pixels[x, y] = hex_to_rgba(C["grass_light"])
+    dist = ellipse_field(
+        76, 130, 436, 250, stage_cx, stage_cy, stage_rx * stage_rx, stage_ry * stage_ry
+    )
+    fill_mask(canvas, 76, 130, dist < 1, C["grass_light"])
 
     # Stage outline (darker ring)
-    for y in range(130, 250):
-        for x in range(76, 436):
-            dx = abs(x - stage_cx)
-            dy = abs(y - stage_cy)
-            dist = dx * dx / (stage_rx * stage_rx) + dy * dy / (stage_ry * stage_ry)
-            if 0.85 < dist < 1.0:
-                pixels[x, y] = hex_to_rgba(C["grass"])
+    fill_mask(canvas, 76, 130, (0.85 < dist) & (dist < 1.0), C["grass"])
 
     # ========================================================================
     # Layer 5: Dirt path crossing (horizontal line)
     # ========================================================================
-    for y in range(185, 200):
-        for x in range(0, 100):
-            pixels[x, y] = hex_to_rgba(C["path"])
-        for x in range(412, width):
-            pixels[x, y] = hex_to_rgba(C["path"])
+    fill_rect(canvas, 0, 185, 100, 200, C["path"])
+    fill_rect(canvas, 412, 185, width, 200, C["path"])
 
     # Path shadows
-    for y in range(195, 200):
-        for x in range(0, 100):
-            pixels[x, y] = hex_to_rgba(C["path_shadow"])
-        for x in range(412, width):
-            pixels[x, y] = hex_to_rgba(C["path_shadow"])
+    fill_rect(canvas, 0, 195, 100, 200, C["path_shadow"])
+    fill_rect(canvas, 412, 195, width, 200, C["path_shadow"])
 
     # ========================================================================
     # Layer 6: Flowers scattered (foreground decoration)
@@ -196,14 +166,9 @@ def create_meadow_background(output_path):
     ]
     for fx, fy in flower_spots:
         color = C["flower_pink"] if random.random() > 0.5 else C["flower_yellow"]
-        for dy in range(-3, 4):
-            for dx in range(-3, 4):
-                if abs(dx) + abs(dy) <= 3:
-                    px, py = fx + dx, fy + dy
-                    if 0 <= px < width and 0 <= py < height:
-                        pixels[px, py] = hex_to_rgba(color)
-
-    img.save(output_path)
+        diamond(canvas, fx, fy, 3, color)
+
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
@@ -219,88 +184,61 @@ def create_bubblegum_bay_background(output_path):
     - Foreground: Shells, bubbles decoration
     """
     width, height = 512, 288
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(width, height)
 
     C = BAY_COLORS
 
     # ========================================================================
     # Layer 1: Pastel sky (rows 0-90)
     # ========================================================================
-    for y in range(90):
-        sky_color = C["sky_light"] if y < 45 else C["sky"]
-        for x in range(width):
-            pixels[x, y] = hex_to_rgba(sky_color)
+    bands(canvas, 0, 0, width, 90, [(45, C["sky_light"]), (90, C["sky"])])
 
     # ========================================================================
     # Layer 1b: Clouds
     # ========================================================================
     # Cloud 1: left
-    for y in range(15, 35):
-        for x in range(60, 140):
-            dx = abs(x - 100)
-            dy = abs(y - 25)
-            if dx * dx / 1500 + dy * dy / 80 < 1:
-                pixels[x, y] = hex_to_rgba(C["cloud"])
+    cloud = ellipse_field(60, 15, 140, 35, 100, 25, 1500, 80)
+    fill_mask(canvas, 60, 15, cloud < 1, C["cloud"])
 
     # Cloud 2: right
-    for y in range(20, 40):
-        for x in range(360, 460):
-            dx = abs(x - 410)
-            dy = abs(y - 30)
-            if dx * dx / 2200 + dy * dy / 100 < 1:
-                pixels[x, y] = hex_to_rgba(C["cloud"])
+    cloud = ellipse_field(360, 20, 460, 40, 410, 30, 2200, 100)
+    fill_mask(canvas, 360, 20, cloud < 1, C["cloud"])
 
     # ========================================================================
     # Layer 2: Ocean water (rows 70-140)
     # ========================================================================
-    for y in range(70, 140):
-        depth = (y - 70) / 70.0
-        if depth < 0.3:
-            water_color = C["water_dark"]
-        elif depth < 0.6:
-            water_color = C["water"]
-        else:
-            water_color = C["water_light"]
-        for x in range(width):
-            pixels[x, y] = hex_to_rgba(water_color)
+    # Depth thresholds 0.3 / 0.6 of the 70-row band
+    bands(
+        canvas,
+        0,
+        70,
+        width,
+        140,
+        [(91, C["water_dark"]), (112, C["water"]), (140, C["water_light"])],
+    )
 
     # Wave foam line
-    for y in range(130, 138):
-        for x in range(width):
-            if (x + y) % 12 < 6:
-                pixels[x, y] = hex_to_rgba(C["cloud"])
+    xs, ys = grid(0, 130, width, 138)
+    fill_mask(canvas, 0, 130, (xs + ys) % 12 < 6, C["cloud"])
 
     # ========================================================================
     # Layer 3: Sand beach (rows 130-288)
     # ========================================================================
-    for y in range(130, height):
-        sand_color = C["sand"]
-        if y > 240:
-            sand_color = C["sand_shadow"]  # Foreground shadow
-        for x in range(width):
-            pixels[x, y] = hex_to_rgba(sand_color)
+    # Foreground shadow below row 240
+    bands(canvas, 0, 130, width, height, [(241, C["sand"]), (height, C["sand_shadow"])])
 
     # ========================================================================
     # Layer 4: Battle stage - lighter sand oval (rows 150-230)
     # ========================================================================
     stage_cx, stage_cy = 256, 195
     stage_rx, stage_ry = 170, 55
-    for y in range(140, 250):
-        for x in range(86, 426):
-            dx = abs(x - stage_cx)
-            dy = abs(y - stage_cy)
-            if dx * dx / (stage_rx * stage_rx) + dy * dy / (stage_ry * stage_ry) < 1:
-                pixels[x, y] = hex_to_rgba(C["sand_light"])
+    dist = ellipse_field(
+        86, 140, 426, 250, stage_cx, stage_cy, stage_rx * stage_rx, stage_ry * stage_ry
+    )
+    fill_mask(canvas, 86, 140, dist < 1, C["sand_light"])
 
     # Stage outline
-    for y in range(140, 250):
-        for x in range(86, 426):
-            dx = abs(x - stage_cx)
-            dy = abs(y - stage_cy)
-            dist = dx * dx / (stage_rx * stage_rx) + dy * dy / (stage_ry * stage_ry)
-            if 0.88 < dist < 1.0:
-                pixels[x, y] = hex_to_rgba(C["sand"])
+    fill_mask(canvas, 86, 140, (0.88 < dist) & (dist < 1.0), C["sand"])
 
     # ========================================================================
     # Layer 5: Bubbles scattered (floating decoration)
@@ -320,42 +258,40 @@ def create_bubblegum_bay_background(output_path):
     for bx, by in bubble_spots:
         color = C["bubble_pink"] if random.random() > 0.5 else C["bubble_purple"]
         radius = 4 + int(random.random() * 3)
-        for dy in range(-radius, radius + 1):
-            for dx in range(-radius, radius + 1):
-                if dx * dx + dy * dy <= radius * radius:
-                    px, py = bx + dx, by + dy
-                    if 0 <= px < width and 0 <= py < height:
-                        pixels[px, py] = hex_to_rgba(color)
+        circle(canvas, bx, by, radius, color)
         # Bubble highlight
-        pixels[bx - 1, by - 1] = hex_to_rgba(C["cloud"])
+        put(canvas, bx - 1, by - 1, C["cloud"])
 
     # ========================================================================
     # Layer 6: Shells (foreground decoration)
     # ========================================================================
+    # Simple shell spiral shape
+    dx, dy = grid(-5, -4, 6, 5)
+    shell = (np.abs(dx) + np.abs(dy) <= 5) & ~((dx < -2) & (dy > 1))
     shell_spots = [(60, 260), (140, 270), (380, 265), (460, 258)]
     for sx, sy in shell_spots:
-        # Simple shell spiral shape
-        for dy in range(-4, 5):
-            for dx in range(-5, 6):
-                if abs(dx) + abs(dy) <= 5 and not (dx < -2 and dy > 1):
-                    px, py = sx + dx, sy + dy
-                    if 0 <= px < width and 0 <= py < height:
-                        pixels[px, py] = hex_to_rgba(C["shell"])
+        fill_mask(canvas, sx - 5, sy - 4, shell, C["shell"])
         # Shell outline
-        pixels[sx - 4, sy] = hex_to_rgba(C["outline"])
-        pixels[sx + 4, sy] = hex_to_rgba(C["outline"])
+        put(canvas, sx - 4, sy, C["outline"])
+        put(canvas, sx + 4, sy, C["outline"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
-def main():
-    output_dir = "game/assets/sprites/backgrounds/battle"
-    os.makedirs(output_dir, exist_ok=True)
+OUTPUT_DIR = "game/assets/sprites/backgrounds/battle"
+
+ASSETS = [
+    (os.path.join(OUTPUT_DIR, "cloverhollow_meadow.png"), create_meadow_background),
+    (os.path.join(OUTPUT_DIR, "bubblegum_bay.png"), create_bubblegum_bay_background),
+]
 
+
+def main():
     # Generate missing battle backgrounds
-    create_meadow_background(os.path.join(output_dir, "cloverhollow_meadow.png"))
-    create_bubblegum_bay_background(os.path.join(output_dir, "bubblegum_bay.png"))
+    for path, create, *args in ASSETS:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        create(path, *args)
 
     print("\nBattle backgrounds generation complete!")
     print("Existing backgrounds (not regenerated):")
@@ -1,9 +1,20 @@
 #!/usr/bin/env python3
 """Generate battle UI elements for Wilds of Cloverhollow."""
 
-from PIL import Image
 import os
-import math
+
+import numpy as np
+
+from raster import (
+    fill_rect,
+    frame_rect,
+    hline,
+    new_canvas,
+    plot,
+    save,
+    stamp,
+    vline,
+)
 
 UI_COLORS = {
     "frame_dark": (0x3D, 0x32, 0x28),
@@ -22,134 +33,90 @@ UI_COLORS = {
 }
 
 
-def hex_to_rgba(t):
-    return (*t, 255) if len(t) == 3 else t
+def _draw_bar_frame(canvas, width):
+    """Dark border around a frame_bg fill area (shared by HP/MP bars)."""
+    C = UI_COLORS
+    fill_rect(canvas, 1, 1, width - 1, 7, C["frame_bg"])
+    frame_rect(canvas, 0, 0, width, 8, C["frame_dark"])
 
 
 def create_hp_bar(output_path):
     """Create hp_bar.png (48x8) - health bar frame with gradient fill."""
     width, height = 48, 8
-    img = Image.new("RGBA", (width, height), UI_COLORS["transparent"])
-    pixels = img.load()
+    canvas = new_canvas(width, height, UI_COLORS["transparent"])
 
     C = UI_COLORS
 
-    # Row 0: top border
-    for x in range(width):
-        pixels[x, 0] = hex_to_rgba(C["frame_dark"])
-
-    # Row 1-6: sides + fill area
-    for y in range(1, 7):
-        pixels[0, y] = hex_to_rgba(C["frame_dark"])
-        pixels[width - 1, y] = hex_to_rgba(C["frame_dark"])
-        for x in range(1, width - 1):
-            pixels[x, y] = hex_to_rgba(C["frame_bg"])
-
-    # Row 7: bottom border
-    for x in range(width):
-        pixels[x, 7] = hex_to_rgba(C["frame_dark"])
+    # Rows 0/7: borders, rows 1-6: sides + fill area
+    _draw_bar_frame(canvas, width)
 
     # Fill HP (green, about 80% full for display)
     fill_width = int((width - 4) * 0.8)
-    for y in range(2, 6):
-        for x in range(2, 2 + fill_width):
-            pixels[x, y] = hex_to_rgba(C["hp_fill"])
+    fill_rect(canvas, 2, 2, 2 + fill_width, 6, C["hp_fill"])
 
     # Highlight on top of fill
-    for x in range(2, 2 + fill_width):
-        pixels[x, 2] = hex_to_rgba(C["green_light"])
+    hline(canvas, 2, 2 + fill_width, 2, C["green_light"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_mp_bar(output_path):
     """Create mp_bar.png (48x8) - mana bar frame with gradient fill."""
     width, height = 48, 8
-    img = Image.new("RGBA", (width, height), UI_COLORS["transparent"])
-    pixels = img.load()
+    canvas = new_canvas(width, height, UI_COLORS["transparent"])
 
     C = UI_COLORS
 
-    # Row 0: top border
-    for x in range(width):
-        pixels[x, 0] = hex_to_rgba(C["frame_dark"])
-
-    # Row 1-6: sides + fill area
-    for y in range(1, 7):
-        pixels[0, y] = hex_to_rgba(C["frame_dark"])
-        pixels[width - 1, y] = hex_to_rgba(C["frame_dark"])
-        for x in range(1, width - 1):
-            pixels[x, y] = hex_to_rgba(C["frame_bg"])
-
-    # Row 7: bottom border
-    for x in range(width):
-        pixels[x, 7] = hex_to_rgba(C["frame_dark"])
+    # Rows 0/7: borders, rows 1-6: sides + fill area
+    _draw_bar_frame(canvas, width)
 
     # Fill MP (blue, about 60% full for display)
     fill_width = int((width - 4) * 0.6)
-    for y in range(2, 6):
-        for x in range(2, 2 + fill_width):
-            pixels[x, y] = hex_to_rgba(C["mp_fill"])
+    fill_rect(canvas, 2, 2, 2 + fill_width, 6, C["mp_fill"])
 
     # Highlight
-    for x in range(2, 2 + fill_width):
-        pixels[x, 2] = hex_to_rgba(C["white"])
+    hline(canvas, 2, 2 + fill_width, 2, C["white"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_command_box(output_path):
     """Create command_box.png (96x48) - command menu frame."""
     width, height = 96, 48
-    img = Image.new("RGBA", (width, height), UI_COLORS["transparent"])
-    pixels = img.load()
+    canvas = new_canvas(width, height, UI_COLORS["transparent"])
 
     C = UI_COLORS
 
     # Outer border (dark)
-    for x in range(width):
-        pixels[x, 0] = hex_to_rgba(C["frame_dark"])
-        pixels[x, height - 1] = hex_to_rgba(C["frame_dark"])
-    for y in range(height):
-        pixels[0, y] = hex_to_rgba(C["frame_dark"])
-        pixels[width - 1, y] = hex_to_rgba(C["frame_dark"])
+    frame_rect(canvas, 0, 0, width, height, C["frame_dark"])
 
     # Inner border (mid)
-    for x in range(1, width - 1):
-        pixels[x, 1] = hex_to_rgba(C["frame_mid"])
-        pixels[x, height - 2] = hex_to_rgba(C["frame_mid"])
-    for y in range(1, height - 1):
-        pixels[1, y] = hex_to_rgba(C["frame_mid"])
-        pixels[width - 2, y] = hex_to_rgba(C["frame_mid"])
+    frame_rect(canvas, 1, 1, width - 1, height - 1, C["frame_mid"])
 
     # Highlight (light, top-left inner)
-    for x in range(2, width - 2):
-        pixels[x, 2] = hex_to_rgba(C["frame_light"])
-    for y in range(2, height - 2):
-        pixels[2, y] = hex_to_rgba(C["frame_light"])
+    hline(canvas, 2, width - 2, 2, C["frame_light"])
+    vline(canvas, 2, 2, height - 2, C["frame_light"])
 
     # Fill background
-    for y in range(3, height - 3):
-        for x in range(3, width - 3):
-            pixels[x, y] = hex_to_rgba(C["frame_bg"])
+    fill_rect(canvas, 3, 3, width - 3, height - 3, C["frame_bg"])
 
     # Corner accents (decorative)
-    pixels[2, 2] = hex_to_rgba(C["gold"])
-    pixels[width - 3, 2] = hex_to_rgba(C["gold"])
-    pixels[2, height - 3] = hex_to_rgba(C["gold"])
-    pixels[width - 3, height - 3] = hex_to_rgba(C["gold"])
+    plot(
+        canvas,
+        [(2, 2), (width - 3, 2), (2, height - 3), (width - 3, height - 3)],
+        C["gold"],
+    )
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_target_cursor(output_path):
     """Create target_cursor.png (16x16) - enemy selection cursor (arrow/hand)."""
     width, height = 16, 16
-    img = Image.new("RGBA", (width, height), UI_COLORS["transparent"])
-    pixels = img.load()
+    canvas = new_canvas(width, height, UI_COLORS["transparent"])
 
     C = UI_COLORS
 
@@ -166,13 +133,7 @@ def create_target_cursor(output_path):
         "      XXX       ",  # Row 11
         "      XX        ",  # Row 12
     ]
-
-    for row_idx, row in enumerate(arrow):
-        y = 4 + row_idx
-        for x, char in enumerate(row):
-            if x < width and y < height:
-                if char == "X":
-                    pixels[x, y] = hex_to_rgba(C["yellow"])
+    stamp(canvas, 0, 4, arrow, {"X": C["yellow"]})
 
     # Outline
     outline_coords = [
@@ -195,113 +156,80 @@ def create_target_cursor(output_path):
         (9, 11),
         (8, 12),
     ]
-    for x, y in outline_coords:
-        if 0 <= x < width and 0 <= y < height:
-            pixels[x, y] = hex_to_rgba(C["frame_dark"])
+    plot(canvas, outline_coords, C["frame_dark"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_attack_slash(output_path):
     """Create attack_slash.png (32x32) - attack effect diagonal slash."""
     width, height = 32, 32
-    img = Image.new("RGBA", (width, height), UI_COLORS["transparent"])
-    pixels = img.load()
+    canvas = new_canvas(width, height, UI_COLORS["transparent"])
 
     C = UI_COLORS
 
     # Diagonal slash from top-right to bottom-left
-    for i in range(28):
-        x = 28 - i
-        y = 2 + i
-        if 0 <= x < width and 0 <= y < height:
-            # Main slash (white core)
-            pixels[x, y] = hex_to_rgba(C["white"])
-            if x + 1 < width:
-                pixels[x + 1, y] = hex_to_rgba(C["white"])
-            # Glow effect (yellow)
-            if x - 1 >= 0:
-                pixels[x - 1, y] = hex_to_rgba(C["yellow"])
-            if x + 2 < width:
-                pixels[x + 2, y] = hex_to_rgba(C["yellow"])
-            if y - 1 >= 0 and x < width:
-                pixels[x, y - 1] = hex_to_rgba(C["yellow"])
-            if y + 1 < height and x < width:
-                pixels[x, y + 1] = hex_to_rgba(C["yellow"])
+    i = np.arange(28)
+    x = 28 - i
+    y = 2 + i
+    # Glow effect (yellow) around the core; the core always wins
+    for gx, gy in [(x - 1, y), (x + 2, y), (x, y - 1), (x, y + 1)]:
+        plot(canvas, np.column_stack([gx, gy]), C["yellow"])
+    # Main slash (white core)
+    plot(canvas, np.column_stack([x, y]), C["white"])
+    plot(canvas, np.column_stack([x + 1, y]), C["white"])
 
     # Sparkle points at ends
     sparkle_coords = [(28, 2), (29, 3), (2, 28), (1, 29)]
-    for sx, sy in sparkle_coords:
-        if 0 <= sx < width and 0 <= sy < height:
-            pixels[sx, sy] = hex_to_rgba(C["gold"])
+    plot(canvas, sparkle_coords, C["gold"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_heal_sparkle(output_path):
     """Create heal_sparkle.png (16x16) - heal effect sparkle/star."""
     width, height = 16, 16
-    img = Image.new("RGBA", (width, height), UI_COLORS["transparent"])
-    pixels = img.load()
+    canvas = new_canvas(width, height, UI_COLORS["transparent"])
 
     C = UI_COLORS
 
     # Center cross shape
     cx, cy = 7, 7
 
-    # Vertical beam
-    for dy in range(-5, 6):
-        y = cy + dy
-        if 0 <= y < height:
-            intensity = 1.0 - abs(dy) / 6.0
-            if intensity > 0.8:
-                pixels[cx, y] = hex_to_rgba(C["white"])
-            elif intensity > 0.4:
-                pixels[cx, y] = hex_to_rgba(C["green_light"])
-            else:
-                pixels[cx, y] = hex_to_rgba(C["hp_fill"])
-
-    # Horizontal beam
-    for dx in range(-5, 6):
-        x = cx + dx
-        if 0 <= x < width:
-            intensity = 1.0 - abs(dx) / 6.0
-            if intensity > 0.8:
-                pixels[x, cy] = hex_to_rgba(C["white"])
-            elif intensity > 0.4:
-                pixels[x, cy] = hex_to_rgba(C["green_light"])
-            else:
-                pixels[x, cy] = hex_to_rgba(C["hp_fill"])
+    # Beams fade with distance from the center (intensity 1 - d/6):
+    # > 0.8 white, > 0.4 light green, otherwise HP green
+    for reach, color in [(5, C["hp_fill"]), (3, C["green_light"]), (1, C["white"])]:
+        # Vertical beam
+        vline(canvas, cx, cy - reach, cy + reach + 1, color)
+        # Horizontal beam
+        hline(canvas, cx - reach, cx + reach + 1, cy, color)
 
     # Diagonal accents
     diag_coords = [(5, 5), (9, 5), (5, 9), (9, 9)]
-    for x, y in diag_coords:
-        if 0 <= x < width and 0 <= y < height:
-            pixels[x, y] = hex_to_rgba(C["green_light"])
-
-    # Center bright
-    pixels[cx, cy] = hex_to_rgba(C["white"])
-    pixels[cx - 1, cy] = hex_to_rgba(C["white"])
-    pixels[cx + 1, cy] = hex_to_rgba(C["white"])
-    pixels[cx, cy - 1] = hex_to_rgba(C["white"])
-    pixels[cx, cy + 1] = hex_to_rgba(C["white"])
-
-    img.save(output_path)
+    plot(canvas, diag_coords, C["green_light"])
+
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
+OUTPUT_DIR = "game/assets/sprites/ui/battle"
+
+ASSETS = [
+    (os.path.join(OUTPUT_DIR, "hp_bar.png"), create_hp_bar),
+    (os.path.join(OUTPUT_DIR, "mp_bar.png"), create_mp_bar),
+    (os.path.join(OUTPUT_DIR, "command_box.png"), create_command_box),
+    (os.path.join(OUTPUT_DIR, "target_cursor.png"), create_target_cursor),
+    (os.path.join(OUTPUT_DIR, "attack_slash.png"), create_attack_slash),
+    (os.path.join(OUTPUT_DIR, "heal_sparkle.png"), create_heal_sparkle),
+]
+
+
 def main():
-    output_dir = "game/assets/sprites/ui/battle"
-    os.makedirs(output_dir, exist_ok=True)
-
-    create_hp_bar(os.path.join(output_dir, "hp_bar.png"))
-    create_mp_bar(os.path.join(output_dir, "mp_bar.png"))
-    create_command_box(os.path.join(output_dir, "command_box.png"))
-    create_target_cursor(os.path.join(output_dir, "target_cursor.png"))
-    create_attack_slash(os.path.join(output_dir, "attack_slash.png"))
-    create_heal_sparkle(os.path.join(output_dir, "heal_sparkle.png"))
+    for path, create, *args in ASSETS:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        create(path, *args)
 
     print("\nBattle UI generation complete!")
 
@@ -7,9 +7,25 @@ Bosses:
 - Chaos Minion: Attack animations for existing purple blob enemy (24x24)
 """
 
-from PIL import Image
 import os
 
+import numpy as np
+
+from raster import (
+    col_bands,
+    diagonal_stripes,
+    fill_mask,
+    fill_rect,
+    grid,
+    hline,
+    new_canvas,
+    plot,
+    put,
+    rgba,
+    save,
+    vline,
+)
+
 COLORS = {
     # Forest Guardian - nature spirit
     "guardian_bark_dark": (0x3D, 0x2E, 0x1A),
@@ -32,10 +48,20 @@ COLORS = {
 }
 
 
-def hex_to_rgba(t, alpha=255):
-    if len(t) == 4:
-        return t
-    return (*t, alpha)
+def _leaf_dither(canvas, x0, y0, x1, y1):
+    """Three-tone diagonal leaf texture used by every guardian crown."""
+    diagonal_stripes(
+        canvas,
+        x0,
+        y0,
+        x1,
+        y1,
+        [
+            COLORS["guardian_leaves_light"],
+            COLORS["guardian_leaves"],
+            COLORS["guardian_leaves_dark"],
+        ],
+    )
 
 
 # ============ Forest Guardian (48x48) ============
@@ -43,38 +69,22 @@ def hex_to_rgba(t, alpha=255):
 
 def create_forest_guardian_idle(output_path):
     """Large tree spirit with glowing eyes, leafy crown."""
-    img = Image.new("RGBA", (48, 48), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(48, 48)
 
     # Leafy crown at top (rows 2-12)
     # Row 2-4: Top leaves
-    for x in range(18, 31):
-        pixels[x, 2] = hex_to_rgba(COLORS["guardian_leaves_dark"])
-    for x in range(15, 34):
-        pixels[x, 3] = hex_to_rgba(COLORS["guardian_leaves"])
-    for x in range(13, 36):
-        pixels[x, 4] = hex_to_rgba(COLORS["guardian_leaves"])
+    hline(canvas, 18, 31, 2, COLORS["guardian_leaves_dark"])
+    hline(canvas, 15, 34, 3, COLORS["guardian_leaves"])
+    hline(canvas, 13, 36, 4, COLORS["guardian_leaves"])
 
     # Row 5-8: Main leaf crown
-    for y in range(5, 9):
-        for x in range(11, 38):
-            if (x + y) % 3 == 0:
-                pixels[x, y] = hex_to_rgba(COLORS["guardian_leaves_light"])
-            elif (x + y) % 3 == 1:
-                pixels[x, y] = hex_to_rgba(COLORS["guardian_leaves"])
-            else:
-                pixels[x, y] = hex_to_rgba(COLORS["guardian_leaves_dark"])
+    _leaf_dither(canvas, 11, 5, 38, 9)
 
     # Row 9-12: Lower crown with some gaps
-    for y in range(9, 13):
-        for x in range(13, 36):
-            if (x + y) % 4 != 0:
-                shade = (
-                    COLORS["guardian_leaves"]
-                    if x < 24
-                    else COLORS["guardian_leaves_dark"]
-                )
-                pixels[x, y] = hex_to_rgba(shade)
+    xs, ys = grid(13, 9, 36, 13)
+    leaves = (xs + ys) % 4 != 0
+    fill_mask(canvas, 13, 9, leaves & (xs < 24), COLORS["guardian_leaves"])
+    fill_mask(canvas, 13, 9, leaves & (xs >= 24), COLORS["guardian_leaves_dark"])
 
     # Face/trunk area (rows 13-35)
     # Row 13-35: Main trunk body
@@ -82,190 +92,143 @@ def create_forest_guardian_idle(output_path):
         trunk_width = 16 - abs(y - 24) // 3
         left = 24 - trunk_width // 2
         right = 24 + trunk_width // 2
-        for x in range(left, right):
-            if x < 22:
-                shade = COLORS["guardian_bark_light"]
-            elif x < 26:
-                shade = COLORS["guardian_bark"]
-            else:
-                shade = COLORS["guardian_bark_dark"]
-            pixels[x, y] = hex_to_rgba(shade)
+        col_bands(
+            canvas,
+            left,
+            y,
+            right,
+            y + 1,
+            [
+                (22, COLORS["guardian_bark_light"]),
+                (26, COLORS["guardian_bark"]),
+                (None, COLORS["guardian_bark_dark"]),
+            ],
+        )
 
     # Glowing eyes (row 18-21)
     # Left eye
-    for y in range(18, 22):
-        for x in range(18, 22):
-            pixels[x, y] = hex_to_rgba(COLORS["guardian_eye"])
-    pixels[19, 19] = hex_to_rgba(COLORS["guardian_glow"])
-    pixels[20, 19] = hex_to_rgba(COLORS["guardian_glow"])
-    pixels[19, 20] = hex_to_rgba(COLORS["guardian_glow"])
-    pixels[20, 20] = hex_to_rgba(COLORS["guardian_glow"])
+    fill_rect(canvas, 18, 18, 22, 22, COLORS["guardian_eye"])
+    fill_rect(canvas, 19, 19, 21, 21, COLORS["guardian_glow"])
 
     # Right eye
-    for y in range(18, 22):
-        for x in range(26, 30):
-            pixels[x, y] = hex_to_rgba(COLORS["guardian_eye"])
-    pixels[27, 19] = hex_to_rgba(COLORS["guardian_glow"])
-    pixels[28, 19] = hex_to_rgba(COLORS["guardian_glow"])
-    pixels[27, 20] = hex_to_rgba(COLORS["guardian_glow"])
-    pixels[28, 20] = hex_to_rgba(COLORS["guardian_glow"])
+    fill_rect(canvas, 26, 18, 30, 22, COLORS["guardian_eye"])
+    fill_rect(canvas, 27, 19, 29, 21, COLORS["guardian_glow"])
 
     # Mouth - bark texture line (row 26-28)
-    for x in range(20, 28):
-        pixels[x, 27] = hex_to_rgba(COLORS["guardian_bark_dark"])
+    hline(canvas, 20, 28, 27, COLORS["guardian_bark_dark"])
 
     # Root feet (rows 36-44)
     # Left root
     for y in range(36, 44):
         root_offset = (y - 36) // 2
-        for x in range(16 - root_offset, 22):
-            pixels[x, y] = hex_to_rgba(COLORS["guardian_bark"])
-    for y in range(40, 46):
-        for x in range(10, 16):
-            pixels[x, y] = hex_to_rgba(COLORS["guardian_bark_dark"])
+        hline(canvas, 16 - root_offset, 22, y, COLORS["guardian_bark"])
+    fill_rect(canvas, 10, 40, 16, 46, COLORS["guardian_bark_dark"])
 
     # Right root
     for y in range(36, 44):
         root_offset = (y - 36) // 2
-        for x in range(26, 32 + root_offset):
-            pixels[x, y] = hex_to_rgba(COLORS["guardian_bark"])
-    for y in range(40, 46):
-        for x in range(32, 38):
-            pixels[x, y] = hex_to_rgba(COLORS["guardian_bark_dark"])
+        hline(canvas, 26, 32 + root_offset, y, COLORS["guardian_bark"])
+    fill_rect(canvas, 32, 40, 38, 46, COLORS["guardian_bark_dark"])
 
     # Moss patches
-    pixels[20, 30] = hex_to_rgba(COLORS["moss"])
-    pixels[21, 31] = hex_to_rgba(COLORS["moss"])
-    pixels[27, 32] = hex_to_rgba(COLORS["moss"])
-    pixels[28, 31] = hex_to_rgba(COLORS["moss"])
+    plot(canvas, [(20, 30), (21, 31), (27, 32), (28, 31)], COLORS["moss"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_forest_guardian_attack1(output_path):
     """Guardian raising roots - preparing attack."""
-    img = Image.new("RGBA", (48, 48), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(48, 48)
 
     # Crown slightly smaller/tensed (rows 4-11)
-    for y in range(4, 12):
-        for x in range(14, 35):
-            if (x + y) % 3 == 0:
-                pixels[x, y] = hex_to_rgba(COLORS["guardian_leaves_light"])
-            elif (x + y) % 3 == 1:
-                pixels[x, y] = hex_to_rgba(COLORS["guardian_leaves"])
-            else:
-                pixels[x, y] = hex_to_rgba(COLORS["guardian_leaves_dark"])
+    _leaf_dither(canvas, 14, 4, 35, 12)
 
     # Trunk body (rows 12-34)
     for y in range(12, 35):
         trunk_width = 14 - abs(y - 23) // 3
         left = 24 - trunk_width // 2
         right = 24 + trunk_width // 2
-        for x in range(left, right):
-            shade = COLORS["guardian_bark_light"] if x < 22 else COLORS["guardian_bark"]
-            pixels[x, y] = hex_to_rgba(shade)
+        col_bands(
+            canvas,
+            left,
+            y,
+            right,
+            y + 1,
+            [(22, COLORS["guardian_bark_light"]), (None, COLORS["guardian_bark"])],
+        )
 
     # Angry glowing eyes - brighter, squinted
-    for y in range(17, 20):
-        for x in range(18, 22):
-            pixels[x, y] = hex_to_rgba(COLORS["guardian_glow"])
-        for x in range(26, 30):
-            pixels[x, y] = hex_to_rgba(COLORS["guardian_glow"])
+    fill_rect(canvas, 18, 17, 22, 20, COLORS["guardian_glow"])
+    fill_rect(canvas, 26, 17, 30, 20, COLORS["guardian_glow"])
 
     # Angry brow lines
-    for x in range(17, 22):
-        pixels[x, 16] = hex_to_rgba(COLORS["guardian_bark_dark"])
-    for x in range(26, 31):
-        pixels[x, 16] = hex_to_rgba(COLORS["guardian_bark_dark"])
+    hline(canvas, 17, 22, 16, COLORS["guardian_bark_dark"])
+    hline(canvas, 26, 31, 16, COLORS["guardian_bark_dark"])
 
     # Roots raised up - threatening
     # Left root up
-    for y in range(28, 40):
-        for x in range(8, 16):
-            pixels[x, y] = hex_to_rgba(COLORS["guardian_bark"])
-    for y in range(24, 30):
-        for x in range(6, 12):
-            pixels[x, y] = hex_to_rgba(COLORS["guardian_bark_light"])
+    fill_rect(canvas, 8, 28, 16, 40, COLORS["guardian_bark"])
+    fill_rect(canvas, 6, 24, 12, 30, COLORS["guardian_bark_light"])
 
     # Right root up
-    for y in range(28, 40):
-        for x in range(32, 40):
-            pixels[x, y] = hex_to_rgba(COLORS["guardian_bark"])
-    for y in range(24, 30):
-        for x in range(36, 42):
-            pixels[x, y] = hex_to_rgba(COLORS["guardian_bark_light"])
+    fill_rect(canvas, 32, 28, 40, 40, COLORS["guardian_bark"])
+    fill_rect(canvas, 36, 24, 42, 30, COLORS["guardian_bark_light"])
 
     # Ground connection
-    for y in range(38, 46):
-        for x in range(12, 20):
-            pixels[x, y] = hex_to_rgba(COLORS["guardian_bark_dark"])
-        for x in range(28, 36):
-            pixels[x, y] = hex_to_rgba(COLORS["guardian_bark_dark"])
+    fill_rect(canvas, 12, 38, 20, 46, COLORS["guardian_bark_dark"])
+    fill_rect(canvas, 28, 38, 36, 46, COLORS["guardian_bark_dark"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_forest_guardian_attack2(output_path):
     """Guardian slamming roots down - root slam attack."""
-    img = Image.new("RGBA", (48, 48), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(48, 48)
 
     # Crown shaking (rows 2-10)
     for y in range(2, 11):
         offset = 1 if y % 2 == 0 else -1
-        for x in range(13 + offset, 36 + offset):
-            if (x + y) % 3 == 0:
-                pixels[x, y] = hex_to_rgba(COLORS["guardian_leaves_light"])
-            elif (x + y) % 3 == 1:
-                pixels[x, y] = hex_to_rgba(COLORS["guardian_leaves"])
-            else:
-                pixels[x, y] = hex_to_rgba(COLORS["guardian_leaves_dark"])
+        _leaf_dither(canvas, 13 + offset, y, 36 + offset, y + 1)
 
     # Trunk body lower (rows 11-34)
     for y in range(11, 35):
         trunk_width = 16 - abs(y - 23) // 3
         left = 24 - trunk_width // 2
         right = 24 + trunk_width // 2
-        for x in range(left, right):
-            shade = COLORS["guardian_bark_light"] if x < 22 else COLORS["guardian_bark"]
-            pixels[x, y] = hex_to_rgba(shade)
+        col_bands(
+            canvas,
+            left,
+            y,
+            right,
+            y + 1,
+            [(22, COLORS["guardian_bark_light"]), (None, COLORS["guardian_bark"])],
+        )
 
     # Eyes fully glowing - attack mode
-    for y in range(16, 21):
-        for x in range(17, 23):
-            pixels[x, y] = hex_to_rgba(COLORS["guardian_glow"])
-        for x in range(25, 31):
-            pixels[x, y] = hex_to_rgba(COLORS["guardian_glow"])
+    fill_rect(canvas, 17, 16, 23, 21, COLORS["guardian_glow"])
+    fill_rect(canvas, 25, 16, 31, 21, COLORS["guardian_glow"])
 
     # Open mouth roaring
-    for y in range(25, 29):
-        for x in range(20, 28):
-            pixels[x, y] = hex_to_rgba(COLORS["guardian_bark_dark"])
+    fill_rect(canvas, 20, 25, 28, 29, COLORS["guardian_bark_dark"])
 
     # Roots slammed down - spread wide
     # Left roots smashing
-    for y in range(36, 46):
-        for x in range(2, 20):
-            if (x + y) % 2 == 0:
-                pixels[x, y] = hex_to_rgba(COLORS["guardian_bark"])
+    xs, ys = grid(2, 36, 20, 46)
+    fill_mask(canvas, 2, 36, (xs + ys) % 2 == 0, COLORS["guardian_bark"])
 
     # Right roots smashing
-    for y in range(36, 46):
-        for x in range(28, 46):
-            if (x + y) % 2 == 0:
-                pixels[x, y] = hex_to_rgba(COLORS["guardian_bark"])
+    xs, ys = grid(28, 36, 46, 46)
+    fill_mask(canvas, 28, 36, (xs + ys) % 2 == 0, COLORS["guardian_bark"])
 
     # Impact debris
-    for x in range(4, 44):
-        if x % 4 == 0:
-            pixels[x, 44] = hex_to_rgba((120, 90, 50, 200))
-            pixels[x, 45] = hex_to_rgba((100, 75, 40, 150))
-            pixels[x, 46] = hex_to_rgba((80, 60, 30, 100))
+    for x in range(4, 44, 4):
+        put(canvas, x, 44, (120, 90, 50, 200))
+        put(canvas, x, 45, (100, 75, 40, 150))
+        put(canvas, x, 46, (80, 60, 30, 100))
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
@@ -274,119 +237,101 @@ def create_forest_guardian_attack2(output_path):
 
 def create_chaos_minion_attack1(output_path):
     """Minion charging up - pulsing glow."""
-    img = Image.new("RGBA", (24, 24), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(24, 24)
 
     # Spike hat (rows 2-6)
-    for x in range(10, 14):
-        pixels[x, 2] = hex_to_rgba(COLORS["minion_dark"])
-    for x in range(9, 15):
-        pixels[x, 3] = hex_to_rgba(COLORS["minion_dark"])
-    for x in range(9, 15):
-        pixels[x, 4] = hex_to_rgba(COLORS["minion_dark"])
-    for x in range(8, 16):
-        pixels[x, 5] = hex_to_rgba(COLORS["minion_dark"])
+    hline(canvas, 10, 14, 2, COLORS["minion_dark"])
+    fill_rect(canvas, 9, 3, 15, 5, COLORS["minion_dark"])
+    hline(canvas, 8, 16, 5, COLORS["minion_dark"])
 
     # Body - slightly squashed, pulsing
     for y in range(6, 18):
         body_width = 8 + (2 if 9 <= y <= 14 else 0)
         left = 12 - body_width // 2
         right = 12 + body_width // 2
-        for x in range(left, right):
-            if x < 10:
-                shade = COLORS["minion_light"]
-            elif x < 14:
-                shade = COLORS["minion_body"]
-            else:
-                shade = COLORS["minion_dark"]
-            pixels[x, y] = hex_to_rgba(shade)
+        col_bands(
+            canvas,
+            left,
+            y,
+            right,
+            y + 1,
+            [
+                (10, COLORS["minion_light"]),
+                (14, COLORS["minion_body"]),
+                (None, COLORS["minion_dark"]),
+            ],
+        )
 
     # Glowing eyes - charging
-    for y in range(9, 13):
-        for x in range(7, 11):
-            pixels[x, y] = hex_to_rgba(COLORS["minion_glow"])
-        for x in range(13, 17):
-            pixels[x, y] = hex_to_rgba(COLORS["minion_glow"])
+    fill_rect(canvas, 7, 9, 11, 13, COLORS["minion_glow"])
+    fill_rect(canvas, 13, 9, 17, 13, COLORS["minion_glow"])
 
     # Energy particles around
-    pixels[4, 8] = hex_to_rgba(COLORS["minion_glow"], 180)
-    pixels[19, 10] = hex_to_rgba(COLORS["minion_glow"], 180)
-    pixels[6, 16] = hex_to_rgba(COLORS["minion_glow"], 180)
-    pixels[17, 14] = hex_to_rgba(COLORS["minion_glow"], 180)
+    plot(
+        canvas, [(4, 8), (19, 10), (6, 16), (17, 14)], rgba(COLORS["minion_glow"], 180)
+    )
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_chaos_minion_attack2(output_path):
     """Minion firing chaos bolt - stretched forward."""
-    img = Image.new("RGBA", (24, 24), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(24, 24)
 
     # Spike hat tilted forward (rows 4-7)
-    for x in range(12, 18):
-        pixels[x, 4] = hex_to_rgba(COLORS["minion_dark"])
-    for x in range(11, 19):
-        pixels[x, 5] = hex_to_rgba(COLORS["minion_dark"])
-    for x in range(10, 18):
-        pixels[x, 6] = hex_to_rgba(COLORS["minion_dark"])
+    hline(canvas, 12, 18, 4, COLORS["minion_dark"])
+    hline(canvas, 11, 19, 5, COLORS["minion_dark"])
+    hline(canvas, 10, 18, 6, COLORS["minion_dark"])
 
     # Body stretched right (attacking)
-    for y in range(7, 16):
-        for x in range(6, 20):
-            dist_from_center = abs(x - 13) + abs(y - 11)
-            if dist_from_center < 7:
-                if x < 11:
-                    shade = COLORS["minion_light"]
-                elif x < 15:
-                    shade = COLORS["minion_body"]
-                else:
-                    shade = COLORS["minion_dark"]
-                pixels[x, y] = hex_to_rgba(shade)
+    xs, ys = grid(6, 7, 20, 16)
+    body = np.abs(xs - 13) + np.abs(ys - 11) < 7
+    fill_mask(canvas, 6, 7, body & (xs < 11), COLORS["minion_light"])
+    fill_mask(canvas, 6, 7, body & (xs >= 11) & (xs < 15), COLORS["minion_body"])
+    fill_mask(canvas, 6, 7, body & (xs >= 15), COLORS["minion_dark"])
 
     # Eyes focused right
-    for y in range(9, 12):
-        for x in range(9, 12):
-            pixels[x, y] = hex_to_rgba(COLORS["minion_eye"])
-        for x in range(14, 17):
-            pixels[x, y] = hex_to_rgba(COLORS["minion_eye"])
+    fill_rect(canvas, 9, 9, 12, 12, COLORS["minion_eye"])
+    fill_rect(canvas, 14, 9, 17, 12, COLORS["minion_eye"])
 
     # Pupils looking right
-    pixels[11, 10] = hex_to_rgba(COLORS["minion_pupil"])
-    pixels[16, 10] = hex_to_rgba(COLORS["minion_pupil"])
+    put(canvas, 11, 10, COLORS["minion_pupil"])
+    put(canvas, 16, 10, COLORS["minion_pupil"])
 
     # Chaos bolt projectile (right side)
-    for y in range(9, 13):
-        for x in range(19, 23):
-            pixels[x, y] = hex_to_rgba(COLORS["minion_glow"])
-    pixels[22, 10] = hex_to_rgba(COLORS["minion_light"])
-    pixels[22, 11] = hex_to_rgba(COLORS["minion_light"])
+    fill_rect(canvas, 19, 9, 23, 13, COLORS["minion_glow"])
+    vline(canvas, 22, 10, 12, COLORS["minion_light"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
-def main():
-    # Forest Guardian
-    guardian_dir = "game/assets/sprites/enemies/forest_guardian"
-    os.makedirs(guardian_dir, exist_ok=True)
-    create_forest_guardian_idle(os.path.join(guardian_dir, "idle_1.png"))
-    create_forest_guardian_attack1(os.path.join(guardian_dir, "attack_1.png"))
-    create_forest_guardian_attack2(os.path.join(guardian_dir, "attack_2.png"))
+GUARDIAN_DIR = "game/assets/sprites/enemies/forest_guardian"
+MINION_DIR = "game/assets/sprites/enemies/chaos_minion"
 
+ASSETS = [
+    # Forest Guardian
+    (os.path.join(GUARDIAN_DIR, "idle_1.png"), create_forest_guardian_idle),
+    (os.path.join(GUARDIAN_DIR, "attack_1.png"), create_forest_guardian_attack1),
+    (os.path.join(GUARDIAN_DIR, "attack_2.png"), create_forest_guardian_attack2),
     # Also create overworld version (scaled down or same)
-    create_forest_guardian_idle(os.path.join(guardian_dir, "overworld.png"))
-
+    (os.path.join(GUARDIAN_DIR, "overworld.png"), create_forest_guardian_idle),
     # Chaos Minion
-    minion_dir = "game/assets/sprites/enemies/chaos_minion"
-    os.makedirs(minion_dir, exist_ok=True)
-    create_chaos_minion_attack1(os.path.join(minion_dir, "attack_1.png"))
-    create_chaos_minion_attack2(os.path.join(minion_dir, "attack_2.png"))
+    (os.path.join(MINION_DIR, "attack_1.png"), create_chaos_minion_attack1),
+    (os.path.join(MINION_DIR, "attack_2.png"), create_chaos_minion_attack2),
+]
+
+
+def main():
+    for path, create, *args in ASSETS:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        create(path, *args)
 
     print("\nBoss sprites complete!")
     print("Files created in:")
-    print(f"  - {guardian_dir}/ (idle, attack, overworld)")
-    print(f"  - {minion_dir}/ (attack animations)")
+    print(f"  - {GUARDIAN_DIR}/ (idle, attack, overworld)")
+    print(f"  - {MINION_DIR}/ (attack animations)")
 
 
 if __name__ == "__main__":
@@ -1,9 +1,20 @@
 #!/usr/bin/env python3
 """Generate equipment icons for Wilds of Cloverhollow (16x16)."""
 
-from PIL import Image
 import os
 
+from raster import (
+    fill_rect,
+    hline,
+    new_canvas,
+    plot,
+    put,
+    run,
+    save,
+    stamp,
+    vline,
+)
+
 COLORS = {
     # Metal (sword/armor)
     "metal_outline": (0x3A, 0x45, 0x50),
@@ -40,75 +51,60 @@ COLORS = {
 }
 
 
-def hex_to_rgba(t):
-    return (*t, 255) if len(t) == 3 else t
-
-
 def create_sword(output_path):
     width, height = 16, 16
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(width, height)
     C = COLORS
 
     # Blade tip (rows 1-3) - diagonal sword pointing up-right
-    pixels[11, 1] = hex_to_rgba(C["metal_outline"])
-    pixels[10, 2] = hex_to_rgba(C["metal_outline"])
-    pixels[11, 2] = hex_to_rgba(C["metal_highlight"])
-    pixels[12, 2] = hex_to_rgba(C["metal_outline"])
+    put(canvas, 11, 1, C["metal_outline"])
+    run(canvas, 10, 2, [C["metal_outline"], C["metal_highlight"], C["metal_outline"]])
+
+    blade = [
+        C["metal_outline"],
+        C["metal_light"],
+        C["metal"],
+        C["metal_dark"],
+        C["metal_outline"],
+    ]
 
     # Row 3-6: upper blade
     for i in range(4):
-        y = 3 + i
-        x = 9 - i
-        pixels[x, y] = hex_to_rgba(C["metal_outline"])
-        pixels[x + 1, y] = hex_to_rgba(C["metal_light"])
-        pixels[x + 2, y] = hex_to_rgba(C["metal"])
-        pixels[x + 3, y] = hex_to_rgba(C["metal_dark"])
-        pixels[x + 4, y] = hex_to_rgba(C["metal_outline"])
+        run(canvas, 9 - i, 3 + i, blade)
 
     # Row 7-8: blade near guard
     for i in range(2):
-        y = 7 + i
-        x = 5 - i
-        pixels[x, y] = hex_to_rgba(C["metal_outline"])
-        pixels[x + 1, y] = hex_to_rgba(C["metal_light"])
-        pixels[x + 2, y] = hex_to_rgba(C["metal"])
-        pixels[x + 3, y] = hex_to_rgba(C["metal_dark"])
-        pixels[x + 4, y] = hex_to_rgba(C["metal_outline"])
+        run(canvas, 5 - i, 7 + i, blade)
 
     # Row 9: crossguard
-    for x in range(2, 8):
-        pixels[x, 9] = hex_to_rgba(C["gold"])
-    pixels[2, 9] = hex_to_rgba(C["gold_outline"])
-    pixels[7, 9] = hex_to_rgba(C["gold_outline"])
+    hline(canvas, 2, 8, 9, C["gold"])
+    plot(canvas, [(2, 9), (7, 9)], C["gold_outline"])
 
     # Rows 10-13: handle
+    handle = [
+        C["wood_outline"],
+        C["wood_light"],
+        C["wood"],
+        C["wood_dark"],
+        C["wood_outline"],
+    ]
     for y in range(10, 14):
-        pixels[3, y] = hex_to_rgba(C["wood_outline"])
-        pixels[4, y] = hex_to_rgba(C["wood_light"])
-        pixels[5, y] = hex_to_rgba(C["wood"])
-        pixels[6, y] = hex_to_rgba(C["wood_dark"])
-        pixels[7, y] = hex_to_rgba(C["wood_outline"])
+        run(canvas, 3, y, handle)
 
     # Row 14: pommel
-    for x in range(4, 7):
-        pixels[x, 14] = hex_to_rgba(C["gold"])
-    pixels[4, 14] = hex_to_rgba(C["gold_outline"])
-    pixels[6, 14] = hex_to_rgba(C["gold_outline"])
+    run(canvas, 4, 14, [C["gold_outline"], C["gold"], C["gold_outline"]])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_shield(output_path):
     width, height = 16, 16
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(width, height)
     C = COLORS
 
     # Row 2: top curve
-    for x in range(5, 11):
-        pixels[x, 2] = hex_to_rgba(C["shield_outline"])
+    hline(canvas, 5, 11, 2, C["shield_outline"])
 
     # Rows 3-10: shield body (tapers to point)
     widths = [8, 10, 10, 10, 8, 6, 4, 2]
@@ -117,132 +113,121 @@ def create_shield(output_path):
         start = 8 - w // 2
         end = start + w
 
-        pixels[start, y] = hex_to_rgba(C["shield_outline"])
-        pixels[start + 1, y] = hex_to_rgba(C["shield_light"])
-        for x in range(start + 2, end - 2):
-            pixels[x, y] = hex_to_rgba(C["shield"])
+        put(canvas, start, y, C["shield_outline"])
+        put(canvas, start + 1, y, C["shield_light"])
+        hline(canvas, start + 2, end - 2, y, C["shield"])
         if end - 2 > start + 2:
-            pixels[end - 2, y] = hex_to_rgba(C["shield_dark"])
-        pixels[end - 1, y] = hex_to_rgba(C["shield_outline"])
+            put(canvas, end - 2, y, C["shield_dark"])
+        put(canvas, end - 1, y, C["shield_outline"])
 
     # Row 11: bottom point
-    pixels[7, 11] = hex_to_rgba(C["shield_outline"])
-    pixels[8, 11] = hex_to_rgba(C["shield_outline"])
+    hline(canvas, 7, 9, 11, C["shield_outline"])
 
     # Metal rim highlight (inner vertical line)
-    for y in range(4, 9):
-        pixels[8, y] = hex_to_rgba(C["metal_light"])
+    vline(canvas, 8, 4, 9, C["metal_light"])
 
     # Shield emblem (small cross)
-    pixels[7, 5] = hex_to_rgba(C["gold"])
-    pixels[8, 5] = hex_to_rgba(C["gold"])
-    pixels[9, 5] = hex_to_rgba(C["gold"])
-    pixels[8, 4] = hex_to_rgba(C["gold"])
-    pixels[8, 6] = hex_to_rgba(C["gold"])
+    hline(canvas, 7, 10, 5, C["gold"])
+    vline(canvas, 8, 4, 7, C["gold"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_armor(output_path):
     width, height = 16, 16
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(width, height)
     C = COLORS
 
     # Row 2: collar/neck
-    for x in range(6, 10):
-        pixels[x, 2] = hex_to_rgba(C["leather_outline"])
+    hline(canvas, 6, 10, 2, C["leather_outline"])
 
     # Row 3: upper shoulder line
-    for x in range(4, 12):
-        pixels[x, 3] = hex_to_rgba(C["leather_outline"])
+    hline(canvas, 4, 12, 3, C["leather_outline"])
 
     # Rows 4-7: shoulder and chest
-    for y in range(4, 8):
-        pixels[3, y] = hex_to_rgba(C["leather_outline"])
-        pixels[4, y] = hex_to_rgba(C["leather_light"])
-        for x in range(5, 11):
-            pixels[x, y] = hex_to_rgba(C["leather"])
-        pixels[11, y] = hex_to_rgba(C["leather_dark"])
-        pixels[12, y] = hex_to_rgba(C["leather_outline"])
+    vline(canvas, 3, 4, 8, C["leather_outline"])
+    vline(canvas, 4, 4, 8, C["leather_light"])
+    fill_rect(canvas, 5, 4, 11, 8, C["leather"])
+    vline(canvas, 11, 4, 8, C["leather_dark"])
+    vline(canvas, 12, 4, 8, C["leather_outline"])
 
     # Rows 8-11: lower body
-    for y in range(8, 12):
-        pixels[4, y] = hex_to_rgba(C["leather_outline"])
-        pixels[5, y] = hex_to_rgba(C["leather_light"])
-        for x in range(6, 10):
-            pixels[x, y] = hex_to_rgba(C["leather"])
-        pixels[10, y] = hex_to_rgba(C["leather_dark"])
-        pixels[11, y] = hex_to_rgba(C["leather_outline"])
+    vline(canvas, 4, 8, 12, C["leather_outline"])
+    vline(canvas, 5, 8, 12, C["leather_light"])
+    fill_rect(canvas, 6, 8, 10, 12, C["leather"])
+    vline(canvas, 10, 8, 12, C["leather_dark"])
+    vline(canvas, 11, 8, 12, C["leather_outline"])
 
     # Row 12: bottom edge
-    for x in range(5, 11):
-        pixels[x, 12] = hex_to_rgba(C["leather_outline"])
+    hline(canvas, 5, 11, 12, C["leather_outline"])
 
     # Metal buckle/clasp in center
-    pixels[7, 6] = hex_to_rgba(C["metal"])
-    pixels[8, 6] = hex_to_rgba(C["metal"])
-    pixels[7, 7] = hex_to_rgba(C["metal_dark"])
-    pixels[8, 7] = hex_to_rgba(C["metal_dark"])
+    hline(canvas, 7, 9, 6, C["metal"])
+    hline(canvas, 7, 9, 7, C["metal_dark"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_accessory(output_path):
     width, height = 16, 16
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(width, height)
     C = COLORS
 
     # Ring shape (rows 4-11)
     # Row 4-5: top of ring
-    for x in range(6, 10):
-        pixels[x, 4] = hex_to_rgba(C["gold_outline"])
-        pixels[x, 5] = hex_to_rgba(C["gold_light"])
+    hline(canvas, 6, 10, 4, C["gold_outline"])
+    hline(canvas, 6, 10, 5, C["gold_light"])
 
     # Rows 6-9: ring sides
-    for y in range(6, 10):
-        pixels[5, y] = hex_to_rgba(C["gold_outline"])
-        pixels[6, y] = hex_to_rgba(C["gold_light"])
-        pixels[9, y] = hex_to_rgba(C["gold_dark"])
-        pixels[10, y] = hex_to_rgba(C["gold_outline"])
+    vline(canvas, 5, 6, 10, C["gold_outline"])
+    vline(canvas, 6, 6, 10, C["gold_light"])
+    vline(canvas, 9, 6, 10, C["gold_dark"])
+    vline(canvas, 10, 6, 10, C["gold_outline"])
 
     # Row 10-11: bottom of ring
-    for x in range(6, 10):
-        pixels[x, 10] = hex_to_rgba(C["gold_dark"])
-        pixels[x, 11] = hex_to_rgba(C["gold_outline"])
+    hline(canvas, 6, 10, 10, C["gold_dark"])
+    hline(canvas, 6, 10, 11, C["gold_outline"])
 
     # Gem setting (top center, rows 2-5)
-    pixels[7, 2] = hex_to_rgba(C["gem_outline"])
-    pixels[8, 2] = hex_to_rgba(C["gem_outline"])
-
-    pixels[6, 3] = hex_to_rgba(C["gem_outline"])
-    pixels[7, 3] = hex_to_rgba(C["gem_light"])
-    pixels[8, 3] = hex_to_rgba(C["gem"])
-    pixels[9, 3] = hex_to_rgba(C["gem_outline"])
+    gem = [
+        " OO ",
+        "OLGO",
+        "OGDO",
+        " OO ",
+    ]
+    stamp(
+        canvas,
+        6,
+        2,
+        gem,
+        {
+            "O": C["gem_outline"],
+            "L": C["gem_light"],
+            "G": C["gem"],
+            "D": C["gem_dark"],
+        },
+    )
+
+    save(canvas, output_path)
+    print(f"Created: {output_path}")
 
-    pixels[6, 4] = hex_to_rgba(C["gem_outline"])
-    pixels[7, 4] = hex_to_rgba(C["gem"])
-    pixels[8, 4] = hex_to_rgba(C["gem_dark"])
-    pixels[9, 4] = hex_to_rgba(C["gem_outline"])
 
-    pixels[7, 5] = hex_to_rgba(C["gem_outline"])
-    pixels[8, 5] = hex_to_rgba(C["gem_outline"])
+OUTPUT_DIR = "game/assets/sprites/items"
 
-    img.save(output_path)
-    print(f"Created: {output_path}")
+ASSETS = [
+    (os.path.join(OUTPUT_DIR, "icon_sword.png"), create_sword),
+    (os.path.join(OUTPUT_DIR, "icon_shield.png"), create_shield),
+    (os.path.join(OUTPUT_DIR, "icon_armor.png"), create_armor),
+    (os.path.join(OUTPUT_DIR, "icon_accessory.png"), create_accessory),
+]
 
 
 def main():
-    output_dir = "game/assets/sprites/items"
-    os.makedirs(output_dir, exist_ok=True)
-
-    create_sword(os.path.join(output_dir, "icon_sword.png"))
-    create_shield(os.path.join(output_dir, "icon_shield.png"))
-    create_armor(os.path.join(output_dir, "icon_armor.png"))
-    create_accessory(os.path.join(output_dir, "icon_accessory.png"))
+    for path, create, *args in ASSETS:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        create(path, *args)
 
     print("\nEquipment icons generation complete!")
 
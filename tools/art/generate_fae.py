@@ -11,9 +11,19 @@ Fae is a young student (8-12 age range) in school uniform.
 - Brown hair, peach skin
 """
 
-from PIL import Image
+import functools
 import os
 
+from raster import (
+    TRANSPARENT,
+    fill_rect,
+    hline,
+    new_canvas,
+    put,
+    save,
+    vline,
+)
+
 # Palette colors from cloverhollow.palette.json
 COLORS = {
     # Skin tones
@@ -39,399 +49,244 @@ COLORS = {
 }
 
 
-def hex_to_rgba(t):
-    return (*t, 255) if len(t) == 3 else t
+def _draw_front_legs(canvas):
+    """Both legs and shoes for the south/north idle frames (rows 20-23)."""
+    for x in (4, 9):
+        fill_rect(canvas, x, 20, x + 3, 22, COLORS["skin_outline"])
+        vline(canvas, x + 1, 20, 22, COLORS["skin"])
+        fill_rect(canvas, x, 22, x + 3, 24, COLORS["shoes_outline"])
+        put(canvas, x + 1, 22, COLORS["shoes"])
+
+
+def _draw_side_legs(canvas):
+    """The single visible leg for the east/west idle frames (rows 20-23)."""
+    fill_rect(canvas, 6, 20, 10, 22, COLORS["skin_outline"])
+    fill_rect(canvas, 7, 20, 9, 22, COLORS["skin"])
+    fill_rect(canvas, 6, 22, 10, 24, COLORS["shoes_outline"])
+    hline(canvas, 7, 9, 22, COLORS["shoes"])
+
 
+def _draw_leg(canvas, x, y0, y1, outline, fill=None):
+    """Three-pixel-wide leg segment with an optional one-pixel fill core."""
+    fill_rect(canvas, x - 1, y0, x + 2, y1, outline)
+    if fill is not None:
+        vline(canvas, x, y0, y1, fill)
 
-def create_fae_south(output_path):
+
+def _draw_skirt(canvas, center_left, center_right):
+    """Rows 16-19: skirt that flares out by one pixel every two rows."""
+    for row in range(16, 20):
+        flare = (row - 16) // 2
+        left = center_left - flare
+        right = center_right + flare
+        hline(canvas, left, right, row, COLORS["uniform_blue_outline"])
+        hline(canvas, left + 1, right - 1, row, COLORS["uniform_blue"])
+
+
+def draw_fae_south():
     """Fae facing south (towards camera) - idle frame."""
-    img = Image.new("RGBA", (16, 24), (0, 0, 0, 0))
-    p = img.load()
+    canvas = new_canvas(16, 24)
 
     # Row 0-1: Hair top
-    for x in range(5, 11):
-        p[x, 0] = hex_to_rgba(COLORS["hair_outline"])
-    for x in range(4, 12):
-        p[x, 1] = hex_to_rgba(COLORS["hair_outline"])
-    for x in range(5, 11):
-        p[x, 1] = hex_to_rgba(COLORS["hair"])
+    hline(canvas, 5, 11, 0, COLORS["hair_outline"])
+    hline(canvas, 4, 12, 1, COLORS["hair_outline"])
+    hline(canvas, 5, 11, 1, COLORS["hair"])
 
     # Row 2-3: Hair sides + top of head
-    for x in range(3, 13):
-        p[x, 2] = hex_to_rgba(COLORS["hair_outline"])
-    for x in range(4, 12):
-        p[x, 2] = hex_to_rgba(COLORS["hair"])
-    for x in range(5, 11):
-        p[x, 2] = hex_to_rgba(COLORS["hair_highlight"])
-
-    for x in range(3, 13):
-        p[x, 3] = hex_to_rgba(COLORS["hair_outline"])
-    for x in range(4, 12):
-        p[x, 3] = hex_to_rgba(COLORS["hair"])
+    hline(canvas, 3, 13, 2, COLORS["hair_outline"])
+    hline(canvas, 4, 12, 2, COLORS["hair"])
+    hline(canvas, 5, 11, 2, COLORS["hair_highlight"])
+
+    hline(canvas, 3, 13, 3, COLORS["hair_outline"])
+    hline(canvas, 4, 12, 3, COLORS["hair"])
 
     # Row 4-5: Hair + forehead
-    for x in range(3, 13):
-        p[x, 4] = hex_to_rgba(COLORS["hair_outline"])
-    for x in range(4, 12):
-        p[x, 4] = hex_to_rgba(COLORS["hair"])
-    for x in range(5, 11):
-        p[x, 4] = hex_to_rgba(COLORS["skin"])
-
-    for x in range(3, 13):
-        p[x, 5] = hex_to_rgba(COLORS["hair_outline"])
-    for x in range(4, 12):
-        p[x, 5] = hex_to_rgba(COLORS["skin"])
-    p[4, 5] = hex_to_rgba(COLORS["hair"])
-    p[11, 5] = hex_to_rgba(COLORS["hair"])
+    hline(canvas, 3, 13, 4, COLORS["hair_outline"])
+    hline(canvas, 4, 12, 4, COLORS["hair"])
+    hline(canvas, 5, 11, 4, COLORS["skin"])
+
+    hline(canvas, 3, 13, 5, COLORS["hair_outline"])
+    hline(canvas, 4, 12, 5, COLORS["skin"])
+    put(canvas, 4, 5, COLORS["hair"])
+    put(canvas, 11, 5, COLORS["hair"])
 
     # Row 6-7: Face with eyes
-    for x in range(3, 13):
-        p[x, 6] = hex_to_rgba(COLORS["skin_outline"])
-    for x in range(4, 12):
-        p[x, 6] = hex_to_rgba(COLORS["skin"])
-    p[5, 6] = hex_to_rgba(COLORS["eyes"])  # left eye
-    p[10, 6] = hex_to_rgba(COLORS["eyes"])  # right eye
-
-    for x in range(3, 13):
-        p[x, 7] = hex_to_rgba(COLORS["skin_outline"])
-    for x in range(4, 12):
-        p[x, 7] = hex_to_rgba(COLORS["skin"])
+    hline(canvas, 3, 13, 6, COLORS["skin_outline"])
+    hline(canvas, 4, 12, 6, COLORS["skin"])
+    put(canvas, 5, 6, COLORS["eyes"])
+    put(canvas, 10, 6, COLORS["eyes"])
+
+    hline(canvas, 3, 13, 7, COLORS["skin_outline"])
+    hline(canvas, 4, 12, 7, COLORS["skin"])
 
     # Row 8: Lower face
-    for x in range(4, 12):
-        p[x, 8] = hex_to_rgba(COLORS["skin_outline"])
-    for x in range(5, 11):
-        p[x, 8] = hex_to_rgba(COLORS["skin"])
+    hline(canvas, 4, 12, 8, COLORS["skin_outline"])
+    hline(canvas, 5, 11, 8, COLORS["skin"])
 
     # Row 9: Neck + collar start
-    for x in range(6, 10):
-        p[x, 9] = hex_to_rgba(COLORS["skin_outline"])
-    for x in range(7, 9):
-        p[x, 9] = hex_to_rgba(COLORS["skin"])
+    hline(canvas, 6, 10, 9, COLORS["skin_outline"])
+    hline(canvas, 7, 9, 9, COLORS["skin"])
 
     # Row 10-11: Collar (white) + shoulders
-    for x in range(4, 12):
-        p[x, 10] = hex_to_rgba(COLORS["uniform_blue_outline"])
-    for x in range(5, 11):
-        p[x, 10] = hex_to_rgba(COLORS["uniform_white"])
-    for x in range(6, 10):
-        p[x, 10] = hex_to_rgba(COLORS["uniform_white"])
-
-    for x in range(3, 13):
-        p[x, 11] = hex_to_rgba(COLORS["uniform_blue_outline"])
-    for x in range(4, 12):
-        p[x, 11] = hex_to_rgba(COLORS["uniform_blue"])
-    for x in range(6, 10):
-        p[x, 11] = hex_to_rgba(COLORS["uniform_white"])
+    hline(canvas, 4, 12, 10, COLORS["uniform_blue_outline"])
+    hline(canvas, 5, 11, 10, COLORS["uniform_white"])
+    hline(canvas, 6, 10, 10, COLORS["uniform_white"])
+
+    hline(canvas, 3, 13, 11, COLORS["uniform_blue_outline"])
+    hline(canvas, 4, 12, 11, COLORS["uniform_blue"])
+    hline(canvas, 6, 10, 11, COLORS["uniform_white"])
 
     # Row 12-15: Torso (uniform blue)
-    for row in range(12, 16):
-        for x in range(3, 13):
-            p[x, row] = hex_to_rgba(COLORS["uniform_blue_outline"])
-        for x in range(4, 12):
-            p[x, row] = hex_to_rgba(COLORS["uniform_blue"])
-        # Shadow on sides
-        p[4, row] = hex_to_rgba(COLORS["uniform_blue_shadow"])
-        p[11, row] = hex_to_rgba(COLORS["uniform_blue_shadow"])
+    fill_rect(canvas, 3, 12, 13, 16, COLORS["uniform_blue_outline"])
+    fill_rect(canvas, 4, 12, 12, 16, COLORS["uniform_blue"])
+    # Shadow on sides
+    vline(canvas, 4, 12, 16, COLORS["uniform_blue_shadow"])
+    vline(canvas, 11, 12, 16, COLORS["uniform_blue_shadow"])
 
-    # Row 16-19: Skirt
-    for row in range(16, 20):
-        width_offset = (row - 16) // 2  # Skirt flares out slightly
-        left = 3 - width_offset
-        right = 13 + width_offset
-        for x in range(max(0, left), min(16, right)):
-            p[x, row] = hex_to_rgba(COLORS["uniform_blue_outline"])
-        for x in range(max(0, left + 1), min(16, right - 1)):
-            p[x, row] = hex_to_rgba(COLORS["uniform_blue"])
+    # Row 16-19: Skirt (flares out slightly)
+    _draw_skirt(canvas, 3, 13)
 
     # Row 20-23: Legs + shoes
-    for x in range(4, 7):
-        p[x, 20] = hex_to_rgba(COLORS["skin_outline"])
-        p[x, 21] = hex_to_rgba(COLORS["skin_outline"])
-    for x in range(5, 6):
-        p[x, 20] = hex_to_rgba(COLORS["skin"])
-        p[x, 21] = hex_to_rgba(COLORS["skin"])
-
-    for x in range(9, 12):
-        p[x, 20] = hex_to_rgba(COLORS["skin_outline"])
-        p[x, 21] = hex_to_rgba(COLORS["skin_outline"])
-    for x in range(10, 11):
-        p[x, 20] = hex_to_rgba(COLORS["skin"])
-        p[x, 21] = hex_to_rgba(COLORS["skin"])
+    _draw_front_legs(canvas)
 
-    # Shoes
-    for x in range(4, 7):
-        p[x, 22] = hex_to_rgba(COLORS["shoes_outline"])
-        p[x, 23] = hex_to_rgba(COLORS["shoes_outline"])
-    for x in range(5, 6):
-        p[x, 22] = hex_to_rgba(COLORS["shoes"])
-
-    for x in range(9, 12):
-        p[x, 22] = hex_to_rgba(COLORS["shoes_outline"])
-        p[x, 23] = hex_to_rgba(COLORS["shoes_outline"])
-    for x in range(10, 11):
-        p[x, 22] = hex_to_rgba(COLORS["shoes"])
-
-    img.save(output_path)
-    print(f"Created: {output_path}")
+    return canvas
 
 
-def create_fae_north(output_path):
+def draw_fae_north():
     """Fae facing north (away from camera) - idle frame."""
-    img = Image.new("RGBA", (16, 24), (0, 0, 0, 0))
-    p = img.load()
+    canvas = new_canvas(16, 24)
 
     # Row 0-3: Hair (back of head - more hair visible)
-    for x in range(5, 11):
-        p[x, 0] = hex_to_rgba(COLORS["hair_outline"])
-    for x in range(4, 12):
-        p[x, 1] = hex_to_rgba(COLORS["hair_outline"])
-    for x in range(5, 11):
-        p[x, 1] = hex_to_rgba(COLORS["hair"])
-
-    for row in range(2, 9):
-        for x in range(3, 13):
-            p[x, row] = hex_to_rgba(COLORS["hair_outline"])
-        for x in range(4, 12):
-            p[x, row] = hex_to_rgba(COLORS["hair"])
-        # Highlight stripe
-        if row >= 3 and row <= 5:
-            for x in range(6, 10):
-                p[x, row] = hex_to_rgba(COLORS["hair_highlight"])
+    hline(canvas, 5, 11, 0, COLORS["hair_outline"])
+    hline(canvas, 4, 12, 1, COLORS["hair_outline"])
+    hline(canvas, 5, 11, 1, COLORS["hair"])
+
+    fill_rect(canvas, 3, 2, 13, 9, COLORS["hair_outline"])
+    fill_rect(canvas, 4, 2, 12, 9, COLORS["hair"])
+    # Highlight stripe
+    fill_rect(canvas, 6, 3, 10, 6, COLORS["hair_highlight"])
 
     # Row 9: Neck hint
-    for x in range(6, 10):
-        p[x, 9] = hex_to_rgba(COLORS["skin_outline"])
-    for x in range(7, 9):
-        p[x, 9] = hex_to_rgba(COLORS["skin"])
+    hline(canvas, 6, 10, 9, COLORS["skin_outline"])
+    hline(canvas, 7, 9, 9, COLORS["skin"])
 
     # Row 10-15: Back of uniform
-    for row in range(10, 16):
-        for x in range(3, 13):
-            p[x, row] = hex_to_rgba(COLORS["uniform_blue_outline"])
-        for x in range(4, 12):
-            p[x, row] = hex_to_rgba(COLORS["uniform_blue"])
+    fill_rect(canvas, 3, 10, 13, 16, COLORS["uniform_blue_outline"])
+    fill_rect(canvas, 4, 10, 12, 16, COLORS["uniform_blue"])
 
     # Row 16-19: Skirt (back)
-    for row in range(16, 20):
-        width_offset = (row - 16) // 2
-        left = 3 - width_offset
-        right = 13 + width_offset
-        for x in range(max(0, left), min(16, right)):
-            p[x, row] = hex_to_rgba(COLORS["uniform_blue_outline"])
-        for x in range(max(0, left + 1), min(16, right - 1)):
-            p[x, row] = hex_to_rgba(COLORS["uniform_blue"])
+    _draw_skirt(canvas, 3, 13)
 
     # Row 20-23: Legs + shoes (same as front)
-    for x in range(4, 7):
-        p[x, 20] = hex_to_rgba(COLORS["skin_outline"])
-        p[x, 21] = hex_to_rgba(COLORS["skin_outline"])
-    for x in range(5, 6):
-        p[x, 20] = hex_to_rgba(COLORS["skin"])
-        p[x, 21] = hex_to_rgba(COLORS["skin"])
-
-    for x in range(9, 12):
-        p[x, 20] = hex_to_rgba(COLORS["skin_outline"])
-        p[x, 21] = hex_to_rgba(COLORS["skin_outline"])
-    for x in range(10, 11):
-        p[x, 20] = hex_to_rgba(COLORS["skin"])
-        p[x, 21] = hex_to_rgba(COLORS["skin"])
-
-    for x in range(4, 7):
-        p[x, 22] = hex_to_rgba(COLORS["shoes_outline"])
-        p[x, 23] = hex_to_rgba(COLORS["shoes_outline"])
-    for x in range(5, 6):
-        p[x, 22] = hex_to_rgba(COLORS["shoes"])
-
-    for x in range(9, 12):
-        p[x, 22] = hex_to_rgba(COLORS["shoes_outline"])
-        p[x, 23] = hex_to_rgba(COLORS["shoes_outline"])
-    for x in range(10, 11):
-        p[x, 22] = hex_to_rgba(COLORS["shoes"])
-
-    img.save(output_path)
-    print(f"Created: {output_path}")
+    _draw_front_legs(canvas)
 
+    return canvas
 
-def create_fae_east(output_path):
+
+def draw_fae_east():
     """Fae facing east (right) - idle frame."""
-    img = Image.new("RGBA", (16, 24), (0, 0, 0, 0))
-    p = img.load()
+    canvas = new_canvas(16, 24)
 
     # Side view - character shifted slightly right, narrower
     # Row 0-3: Hair (side profile)
-    for x in range(6, 12):
-        p[x, 0] = hex_to_rgba(COLORS["hair_outline"])
-    for x in range(5, 13):
-        p[x, 1] = hex_to_rgba(COLORS["hair_outline"])
-    for x in range(6, 12):
-        p[x, 1] = hex_to_rgba(COLORS["hair"])
-
-    for row in range(2, 5):
-        for x in range(4, 13):
-            p[x, row] = hex_to_rgba(COLORS["hair_outline"])
-        for x in range(5, 12):
-            p[x, row] = hex_to_rgba(COLORS["hair"])
+    hline(canvas, 6, 12, 0, COLORS["hair_outline"])
+    hline(canvas, 5, 13, 1, COLORS["hair_outline"])
+    hline(canvas, 6, 12, 1, COLORS["hair"])
+
+    fill_rect(canvas, 4, 2, 13, 5, COLORS["hair_outline"])
+    fill_rect(canvas, 5, 2, 12, 5, COLORS["hair"])
 
     # Row 5-8: Face (side) - face shows on right side
-    for x in range(4, 13):
-        p[x, 5] = hex_to_rgba(COLORS["hair_outline"])
-    for x in range(5, 12):
-        p[x, 5] = hex_to_rgba(COLORS["hair"])
-    for x in range(9, 13):
-        p[x, 5] = hex_to_rgba(COLORS["skin"])
-    p[12, 5] = hex_to_rgba(COLORS["skin_outline"])
-
-    for row in range(6, 8):
-        for x in range(4, 6):
-            p[x, row] = hex_to_rgba(COLORS["hair_outline"])
-        p[5, row] = hex_to_rgba(COLORS["hair"])
-        for x in range(6, 13):
-            p[x, row] = hex_to_rgba(COLORS["skin_outline"])
-        for x in range(7, 12):
-            p[x, row] = hex_to_rgba(COLORS["skin"])
-        if row == 6:
-            p[10, row] = hex_to_rgba(COLORS["eyes"])  # Eye
+    hline(canvas, 4, 13, 5, COLORS["hair_outline"])
+    hline(canvas, 5, 12, 5, COLORS["hair"])
+    hline(canvas, 9, 13, 5, COLORS["skin"])
+    put(canvas, 12, 5, COLORS["skin_outline"])
+
+    fill_rect(canvas, 4, 6, 6, 8, COLORS["hair_outline"])
+    vline(canvas, 5, 6, 8, COLORS["hair"])
+    fill_rect(canvas, 6, 6, 13, 8, COLORS["skin_outline"])
+    fill_rect(canvas, 7, 6, 12, 8, COLORS["skin"])
+    put(canvas, 10, 6, COLORS["eyes"])
 
     # Row 8: Chin
-    for x in range(6, 12):
-        p[x, 8] = hex_to_rgba(COLORS["skin_outline"])
-    for x in range(7, 11):
-        p[x, 8] = hex_to_rgba(COLORS["skin"])
+    hline(canvas, 6, 12, 8, COLORS["skin_outline"])
+    hline(canvas, 7, 11, 8, COLORS["skin"])
 
     # Row 9: Neck
-    for x in range(7, 10):
-        p[x, 9] = hex_to_rgba(COLORS["skin_outline"])
-    for x in range(8, 9):
-        p[x, 9] = hex_to_rgba(COLORS["skin"])
+    hline(canvas, 7, 10, 9, COLORS["skin_outline"])
+    hline(canvas, 8, 9, 9, COLORS["skin"])
 
     # Row 10-15: Uniform (side) - includes arm
-    for row in range(10, 16):
-        for x in range(5, 12):
-            p[x, row] = hex_to_rgba(COLORS["uniform_blue_outline"])
-        for x in range(6, 11):
-            p[x, row] = hex_to_rgba(COLORS["uniform_blue"])
-        # Arm on right side
-        p[11, row] = hex_to_rgba(COLORS["uniform_blue_shadow"])
+    # Arm on right side
+    fill_rect(canvas, 5, 10, 12, 16, COLORS["uniform_blue_outline"])
+    fill_rect(canvas, 6, 10, 11, 16, COLORS["uniform_blue"])
+    vline(canvas, 11, 10, 16, COLORS["uniform_blue_shadow"])
 
     # Row 16-19: Skirt (side)
-    for row in range(16, 20):
-        for x in range(4, 12):
-            p[x, row] = hex_to_rgba(COLORS["uniform_blue_outline"])
-        for x in range(5, 11):
-            p[x, row] = hex_to_rgba(COLORS["uniform_blue"])
+    fill_rect(canvas, 4, 16, 12, 20, COLORS["uniform_blue_outline"])
+    fill_rect(canvas, 5, 16, 11, 20, COLORS["uniform_blue"])
 
     # Row 20-23: Legs + shoes (side - one leg visible)
-    for x in range(6, 10):
-        p[x, 20] = hex_to_rgba(COLORS["skin_outline"])
-        p[x, 21] = hex_to_rgba(COLORS["skin_outline"])
-    for x in range(7, 9):
-        p[x, 20] = hex_to_rgba(COLORS["skin"])
-        p[x, 21] = hex_to_rgba(COLORS["skin"])
-
-    for x in range(6, 10):
-        p[x, 22] = hex_to_rgba(COLORS["shoes_outline"])
-        p[x, 23] = hex_to_rgba(COLORS["shoes_outline"])
-    for x in range(7, 9):
-        p[x, 22] = hex_to_rgba(COLORS["shoes"])
-
-    img.save(output_path)
-    print(f"Created: {output_path}")
+    _draw_side_legs(canvas)
+
+    return canvas
 
 
-def create_fae_west(output_path):
+def draw_fae_west():
     """Fae facing west (left) - idle frame. Mirror of east."""
-    img = Image.new("RGBA", (16, 24), (0, 0, 0, 0))
-    p = img.load()
+    canvas = new_canvas(16, 24)
 
     # Side view - character shifted slightly left, narrower
     # Row 0-3: Hair (side profile) - mirrored from east
-    for x in range(4, 10):
-        p[x, 0] = hex_to_rgba(COLORS["hair_outline"])
-    for x in range(3, 11):
-        p[x, 1] = hex_to_rgba(COLORS["hair_outline"])
-    for x in range(4, 10):
-        p[x, 1] = hex_to_rgba(COLORS["hair"])
-
-    for row in range(2, 5):
-        for x in range(3, 12):
-            p[x, row] = hex_to_rgba(COLORS["hair_outline"])
-        for x in range(4, 11):
-            p[x, row] = hex_to_rgba(COLORS["hair"])
+    hline(canvas, 4, 10, 0, COLORS["hair_outline"])
+    hline(canvas, 3, 11, 1, COLORS["hair_outline"])
+    hline(canvas, 4, 10, 1, COLORS["hair"])
+
+    fill_rect(canvas, 3, 2, 12, 5, COLORS["hair_outline"])
+    fill_rect(canvas, 4, 2, 11, 5, COLORS["hair"])
 
     # Row 5-8: Face (side) - face shows on left side
-    for x in range(3, 12):
-        p[x, 5] = hex_to_rgba(COLORS["hair_outline"])
-    for x in range(4, 11):
-        p[x, 5] = hex_to_rgba(COLORS["hair"])
-    for x in range(3, 7):
-        p[x, 5] = hex_to_rgba(COLORS["skin"])
-    p[3, 5] = hex_to_rgba(COLORS["skin_outline"])
-
-    for row in range(6, 8):
-        for x in range(10, 12):
-            p[x, row] = hex_to_rgba(COLORS["hair_outline"])
-        p[10, row] = hex_to_rgba(COLORS["hair"])
-        for x in range(3, 10):
-            p[x, row] = hex_to_rgba(COLORS["skin_outline"])
-        for x in range(4, 9):
-            p[x, row] = hex_to_rgba(COLORS["skin"])
-        if row == 6:
-            p[5, row] = hex_to_rgba(COLORS["eyes"])  # Eye
+    hline(canvas, 3, 12, 5, COLORS["hair_outline"])
+    hline(canvas, 4, 11, 5, COLORS["hair"])
+    hline(canvas, 3, 7, 5, COLORS["skin"])
+    put(canvas, 3, 5, COLORS["skin_outline"])
+
+    fill_rect(canvas, 10, 6, 12, 8, COLORS["hair_outline"])
+    vline(canvas, 10, 6, 8, COLORS["hair"])
+    fill_rect(canvas, 3, 6, 10, 8, COLORS["skin_outline"])
+    fill_rect(canvas, 4, 6, 9, 8, COLORS["skin"])
+    put(canvas, 5, 6, COLORS["eyes"])
 
     # Row 8: Chin
-    for x in range(4, 10):
-        p[x, 8] = hex_to_rgba(COLORS["skin_outline"])
-    for x in range(5, 9):
-        p[x, 8] = hex_to_rgba(COLORS["skin"])
+    hline(canvas, 4, 10, 8, COLORS["skin_outline"])
+    hline(canvas, 5, 9, 8, COLORS["skin"])
 
     # Row 9: Neck
-    for x in range(6, 9):
-        p[x, 9] = hex_to_rgba(COLORS["skin_outline"])
-    for x in range(7, 8):
-        p[x, 9] = hex_to_rgba(COLORS["skin"])
+    hline(canvas, 6, 9, 9, COLORS["skin_outline"])
+    hline(canvas, 7, 8, 9, COLORS["skin"])
 
     # Row 10-15: Uniform (side) - includes arm
-    for row in range(10, 16):
-        for x in range(4, 11):
-            p[x, row] = hex_to_rgba(COLORS["uniform_blue_outline"])
-        for x in range(5, 10):
-            p[x, row] = hex_to_rgba(COLORS["uniform_blue"])
-        # Arm on left side
-        p[4, row] = hex_to_rgba(COLORS["uniform_blue_shadow"])
+    # Arm on left side
+    fill_rect(canvas, 4, 10, 11, 16, COLORS["uniform_blue_outline"])
+    fill_rect(canvas, 5, 10, 10, 16, COLORS["uniform_blue"])
+    vline(canvas, 4, 10, 16, COLORS["uniform_blue_shadow"])
 
     # Row 16-19: Skirt (side)
-    for row in range(16, 20):
-        for x in range(4, 12):
-            p[x, row] = hex_to_rgba(COLORS["uniform_blue_outline"])
-        for x in range(5, 11):
-            p[x, row] = hex_to_rgba(COLORS["uniform_blue"])
+    fill_rect(canvas, 4, 16, 12, 20, COLORS["uniform_blue_outline"])
+    fill_rect(canvas, 5, 16, 11, 20, COLORS["uniform_blue"])
 
     # Row 20-23: Legs + shoes (side - one leg visible)
-    for x in range(6, 10):
-        p[x, 20] = hex_to_rgba(COLORS["skin_outline"])
-        p[x, 21] = hex_to_rgba(COLORS["skin_outline"])
-    for x in range(7, 9):
-        p[x, 20] = hex_to_rgba(COLORS["skin"])
-        p[x, 21] = hex_to_rgba(COLORS["skin"])
-
-    for x in range(6, 10):
-        p[x, 22] = hex_to_rgba(COLORS["shoes_outline"])
-        p[x, 23] = hex_to_rgba(COLORS["shoes_outline"])
-    for x in range(7, 9):
-        p[x, 22] = hex_to_rgba(COLORS["shoes"])
-
-    img.save(output_path)
-    print(f"Created: {output_path}")
+    _draw_side_legs(canvas)
 
+    return canvas
 
-def create_fae_diagonal(output_path, direction):
+
+def draw_fae_diagonal(direction):
     """
     Create diagonal-facing sprites (NE, SE, SW, NW).
     These are 3/4 views combining front/back + side elements.
     """
-    img = Image.new("RGBA", (16, 24), (0, 0, 0, 0))
-    p = img.load()
+    canvas = new_canvas(16, 24)
 
     # Determine which way we're facing
     facing_south = direction in ["se", "sw"]
@@ -446,123 +301,69 @@ def create_fae_diagonal(output_path, direction):
         width = 4 + row if row < 3 else 5
         left = center - width // 2
         right = center + width // 2 + 1
-        for x in range(max(0, left - 1), min(16, right + 1)):
-            p[x, row] = hex_to_rgba(COLORS["hair_outline"])
-        for x in range(max(0, left), min(16, right)):
-            p[x, row] = hex_to_rgba(COLORS["hair"])
-        # Highlight
-        if row >= 1 and row <= 3:
-            for x in range(center - 1, center + 2):
-                if 0 <= x < 16:
-                    p[x, row] = hex_to_rgba(COLORS["hair_highlight"])
+        hline(canvas, left - 1, right + 1, row, COLORS["hair_outline"])
+        hline(canvas, left, right, row, COLORS["hair"])
+    # Highlight
+    fill_rect(canvas, center - 1, 1, center + 2, 4, COLORS["hair_highlight"])
 
     # Row 5-8: Face
-    for row in range(5, 9):
-        left = center - 4
-        right = center + 4
-        # Hair on sides
-        if row < 8:
-            for x in range(max(0, left - 1), min(16, left + 1)):
-                p[x, row] = hex_to_rgba(COLORS["hair_outline"])
-            p[max(0, left), row] = hex_to_rgba(COLORS["hair"])
-            for x in range(max(0, right - 1), min(16, right + 1)):
-                p[x, row] = hex_to_rgba(COLORS["hair_outline"])
-            p[min(15, right - 1), row] = hex_to_rgba(COLORS["hair"])
-
-        # Face
-        for x in range(max(0, left + 1), min(16, right)):
-            p[x, row] = hex_to_rgba(COLORS["skin_outline"])
-        for x in range(max(0, left + 2), min(16, right - 1)):
-            p[x, row] = hex_to_rgba(COLORS["skin"])
-
-        # Eyes (only on front-facing rows and if facing south)
-        if facing_south and row == 6:
-            eye_left = center - 2
-            eye_right = center + 2
-            if 0 <= eye_left < 16:
-                p[eye_left, row] = hex_to_rgba(COLORS["eyes"])
-            if 0 <= eye_right < 16:
-                p[eye_right, row] = hex_to_rgba(COLORS["eyes"])
+    left = center - 4
+    right = center + 4
+    # Hair on sides (rows 5-7)
+    fill_rect(canvas, left - 1, 5, left + 1, 8, COLORS["hair_outline"])
+    vline(canvas, left, 5, 8, COLORS["hair"])
+    fill_rect(canvas, right - 1, 5, right + 1, 8, COLORS["hair_outline"])
+    vline(canvas, right - 1, 5, 8, COLORS["hair"])
+
+    # Face
+    fill_rect(canvas, left + 1, 5, right, 9, COLORS["skin_outline"])
+    fill_rect(canvas, left + 2, 5, right - 1, 9, COLORS["skin"])
+
+    # Eyes (only on front-facing rows and if facing south)
+    if facing_south:
+        put(canvas, center - 2, 6, COLORS["eyes"])
+        put(canvas, center + 2, 6, COLORS["eyes"])
 
     # Row 9: Neck
-    for x in range(center - 1, center + 2):
-        if 0 <= x < 16:
-            p[x, 9] = hex_to_rgba(COLORS["skin_outline"])
-    p[center, 9] = hex_to_rgba(COLORS["skin"])
+    hline(canvas, center - 1, center + 2, 9, COLORS["skin_outline"])
+    put(canvas, center, 9, COLORS["skin"])
 
     # Row 10-15: Uniform torso
-    for row in range(10, 16):
-        left = center - 4
-        right = center + 5
-        for x in range(max(0, left), min(16, right)):
-            p[x, row] = hex_to_rgba(COLORS["uniform_blue_outline"])
-        for x in range(max(0, left + 1), min(16, right - 1)):
-            p[x, row] = hex_to_rgba(COLORS["uniform_blue"])
-        # Collar on row 10-11 if facing south
-        if facing_south and row <= 11:
-            for x in range(center - 1, center + 2):
-                if 0 <= x < 16:
-                    p[x, row] = hex_to_rgba(COLORS["uniform_white"])
+    left = center - 4
+    right = center + 5
+    fill_rect(canvas, left, 10, right, 16, COLORS["uniform_blue_outline"])
+    fill_rect(canvas, left + 1, 10, right - 1, 16, COLORS["uniform_blue"])
+    # Collar on row 10-11 if facing south
+    if facing_south:
+        fill_rect(canvas, center - 1, 10, center + 2, 12, COLORS["uniform_white"])
 
     # Row 16-19: Skirt
-    for row in range(16, 20):
-        flare = (row - 16) // 2
-        left = center - 4 - flare
-        right = center + 5 + flare
-        for x in range(max(0, left), min(16, right)):
-            p[x, row] = hex_to_rgba(COLORS["uniform_blue_outline"])
-        for x in range(max(0, left + 1), min(16, right - 1)):
-            p[x, row] = hex_to_rgba(COLORS["uniform_blue"])
+    _draw_skirt(canvas, center - 4, center + 5)
 
     # Row 20-23: Legs positioned for diagonal walking
     # Leading leg further in direction of movement
     lead_x = center + (2 if facing_east else -2)
     trail_x = center + (-1 if facing_east else 1)
 
-    for row in range(20, 22):
-        # Leading leg
-        for x in range(lead_x - 1, lead_x + 2):
-            if 0 <= x < 16:
-                p[x, row] = hex_to_rgba(COLORS["skin_outline"])
-        if 0 <= lead_x < 16:
-            p[lead_x, row] = hex_to_rgba(COLORS["skin"])
-        # Trailing leg
-        for x in range(trail_x - 1, trail_x + 2):
-            if 0 <= x < 16:
-                p[x, row] = hex_to_rgba(COLORS["skin_outline"])
-        if 0 <= trail_x < 16:
-            p[trail_x, row] = hex_to_rgba(COLORS["skin"])
+    for x in (lead_x, trail_x):
+        _draw_leg(canvas, x, 20, 22, COLORS["skin_outline"], COLORS["skin"])
 
     # Shoes
-    for row in range(22, 24):
-        for x in range(lead_x - 1, lead_x + 2):
-            if 0 <= x < 16:
-                p[x, row] = hex_to_rgba(COLORS["shoes_outline"])
-        if 0 <= lead_x < 16:
-            p[lead_x, row] = hex_to_rgba(COLORS["shoes"])
-        for x in range(trail_x - 1, trail_x + 2):
-            if 0 <= x < 16:
-                p[x, row] = hex_to_rgba(COLORS["shoes_outline"])
-        if 0 <= trail_x < 16:
-            p[trail_x, row] = hex_to_rgba(COLORS["shoes"])
-
-    img.save(output_path)
-    print(f"Created: {output_path}")
+    for x in (lead_x, trail_x):
+        _draw_leg(canvas, x, 22, 24, COLORS["shoes_outline"], COLORS["shoes"])
+
+    return canvas
 
 
-def create_walk_frame(base_sprite_path, output_path, frame_num, direction):
+def draw_walk_frame(direction, frame_num):
     """
-    Create a walk animation frame by modifying leg positions.
+    Derive a walk animation frame from the idle sprite by redrawing the legs.
     frame_num: 0-3 (4 frame walk cycle)
     """
-    # Load the base idle sprite
-    img = Image.open(base_sprite_path).copy()
-    p = img.load()
+    canvas = fae_idle(direction).copy()
 
     # Clear existing leg area (rows 20-23)
-    for y in range(20, 24):
-        for x in range(16):
-            p[x, y] = (0, 0, 0, 0)
+    fill_rect(canvas, 0, 20, 16, 24, TRANSPARENT)
 
     # Determine center and leg positions based on frame
     center = 8
@@ -595,40 +396,14 @@ def create_walk_frame(base_sprite_path, output_path, frame_num, direction):
             left_offset = -1
             right_offset = 1
 
-        # Draw legs with vertical offset to show depth
-        for row in range(20, 22):
-            # Left leg - apply offset
-            lx = left_leg
-            ly_offset = -left_offset if left_offset > 0 else 0  # Forward = higher
-            for x in range(lx, lx + 2):
-                if 0 <= x < 16:
-                    p[x, row] = hex_to_rgba(COLORS["skin_outline"])
-            if 0 <= lx < 16:
-                p[lx, row] = hex_to_rgba(COLORS["skin"])
-
-            # Right leg - apply offset
-            rx = right_leg
-            for x in range(rx, rx + 2):
-                if 0 <= x < 16:
-                    p[x, row] = hex_to_rgba(COLORS["skin_outline"])
-            if 0 <= rx < 16:
-                p[rx, row] = hex_to_rgba(COLORS["skin"])
-
-        # Shoes - horizontal offset shows stride
-        for row in range(22, 24):
-            lx = left_leg + left_offset
-            for x in range(lx, lx + 2):
-                if 0 <= x < 16:
-                    p[x, row] = hex_to_rgba(COLORS["shoes_outline"])
-            if 0 <= lx < 16 and row == 22:
-                p[lx, row] = hex_to_rgba(COLORS["shoes"])
-
-            rx = right_leg + right_offset
-            for x in range(rx, rx + 2):
-                if 0 <= x < 16:
-                    p[x, row] = hex_to_rgba(COLORS["shoes_outline"])
-            if 0 <= rx < 16 and row == 22:
-                p[rx, row] = hex_to_rgba(COLORS["shoes"])
+        # Legs stay in place; shoes - horizontal offset shows stride
+        for leg_x, offset in ((left_leg, left_offset), (right_leg, right_offset)):
+            fill_rect(canvas, leg_x, 20, leg_x + 2, 22, COLORS["skin_outline"])
+            vline(canvas, leg_x, 20, 22, COLORS["skin"])
+
+            shoe_x = leg_x + offset
+            fill_rect(canvas, shoe_x, 22, shoe_x + 2, 24, COLORS["shoes_outline"])
+            put(canvas, shoe_x, 22, COLORS["shoes"])
 
     elif direction in ["east", "west"]:
         # Side view - legs move forward/back
@@ -641,19 +416,10 @@ def create_walk_frame(base_sprite_path, output_path, frame_num, direction):
         else:
             offset = -1 if direction == "east" else 1
 
-        for row in range(20, 22):
-            for x in range(leg_x - 1, leg_x + 2):
-                if 0 <= x < 16:
-                    p[x, row] = hex_to_rgba(COLORS["skin_outline"])
-            p[leg_x, row] = hex_to_rgba(COLORS["skin"])
-
-        for row in range(22, 24):
-            shoe_x = leg_x + offset
-            for x in range(shoe_x - 1, shoe_x + 2):
-                if 0 <= x < 16:
-                    p[x, row] = hex_to_rgba(COLORS["shoes_outline"])
-            if 0 <= shoe_x < 16:
-                p[shoe_x, row] = hex_to_rgba(COLORS["shoes"])
+        _draw_leg(canvas, leg_x, 20, 22, COLORS["skin_outline"], COLORS["skin"])
+        _draw_leg(
+            canvas, leg_x + offset, 22, 24, COLORS["shoes_outline"], COLORS["shoes"]
+        )
 
     else:
         # Diagonal - simplified leg movement
@@ -665,68 +431,85 @@ def create_walk_frame(base_sprite_path, output_path, frame_num, direction):
         if frame_num == 1 or frame_num == 2:
             lead_x, trail_x = trail_x, lead_x
 
-        for row in range(20, 22):
-            for x in range(lead_x - 1, lead_x + 2):
-                if 0 <= x < 16:
-                    p[x, row] = hex_to_rgba(COLORS["skin_outline"])
-            if 0 <= lead_x < 16:
-                p[lead_x, row] = hex_to_rgba(COLORS["skin"])
-            for x in range(trail_x - 1, trail_x + 2):
-                if 0 <= x < 16:
-                    p[x, row] = hex_to_rgba(COLORS["skin_outline"])
-            if 0 <= trail_x < 16:
-                p[trail_x, row] = hex_to_rgba(COLORS["skin"])
-
-        for row in range(22, 24):
-            for x in range(lead_x - 1, lead_x + 2):
-                if 0 <= x < 16:
-                    p[x, row] = hex_to_rgba(COLORS["shoes_outline"])
-            for x in range(trail_x - 1, trail_x + 2):
-                if 0 <= x < 16:
-                    p[x, row] = hex_to_rgba(COLORS["shoes_outline"])
-
-    img.save(output_path)
+        for x in (lead_x, trail_x):
+            _draw_leg(canvas, x, 20, 22, COLORS["skin_outline"], COLORS["skin"])
+            _draw_leg(canvas, x, 22, 24, COLORS["shoes_outline"])
+
+    return canvas
+
+
+@functools.lru_cache(maxsize=None)
+def fae_idle(direction):
+    """Idle sprite for a direction, drawn once and shared by its walk frames.
+
+    The array is read-only; derive frames from a copy.
+    """
+    if direction in DIAGONALS:
+        canvas = draw_fae_diagonal(direction)
+    else:
+        canvas = DIRECTIONS[direction]()
+    canvas.setflags(write=False)
+    return canvas
+
+
+def create_sprite(output_path, draw, *args):
+    """Registry producer: encode draw(*args) to output_path."""
+    save(draw(*args), output_path)
     print(f"Created: {output_path}")
 
 
+OUTPUT_DIR = "game/assets/sprites/characters/player/default"
+
+# Idle sprites for 8 directions
+DIRECTIONS = {
+    "south": draw_fae_south,
+    "north": draw_fae_north,
+    "east": draw_fae_east,
+    "west": draw_fae_west,
+}
+DIAGONALS = ["ne", "se", "sw", "nw"]
+
+# Every sprite is drawn in memory; walk frames are derived from the cached
+# idle arrays rather than re-decoding the idle PNGs
+ASSETS = [
+    *(
+        (
+            os.path.join(OUTPUT_DIR, f"idle_{direction}.png"),
+            create_sprite,
+            fae_idle,
+            direction,
+        )
+        for direction in [*DIRECTIONS, *DIAGONALS]
+    ),
+    # Main idle.png (south-facing, for costume system)
+    (os.path.join(OUTPUT_DIR, "idle.png"), create_sprite, fae_idle, "south"),
+    # Walk cycle frames (4 frames per direction)
+    *(
+        (
+            os.path.join(OUTPUT_DIR, f"walk_{direction}_{frame}.png"),
+            create_sprite,
+            draw_walk_frame,
+            direction,
+            frame,
+        )
+        for direction in [*DIRECTIONS, *DIAGONALS]
+        for frame in range(4)
+    ),
+]
+
+
 def main():
-    # Output directory
-    output_dir = "game/assets/sprites/characters/player/default"
-    os.makedirs(output_dir, exist_ok=True)
-
-    # Generate idle sprites for 8 directions
-    directions = {
-        "south": create_fae_south,
-        "north": create_fae_north,
-        "east": create_fae_east,
-        "west": create_fae_west,
-    }
-
-    # Cardinal directions
-    for direction, create_func in directions.items():
-        idle_path = os.path.join(output_dir, f"idle_{direction}.png")
-        create_func(idle_path)
-
-    # Diagonal directions
-    for diag in ["ne", "se", "sw", "nw"]:
-        idle_path = os.path.join(output_dir, f"idle_{diag}.png")
-        create_fae_diagonal(idle_path, diag)
-
-    # Create main idle.png (south-facing, for costume system)
-    create_fae_south(os.path.join(output_dir, "idle.png"))
-
-    # Generate walk cycle frames (4 frames per direction)
-    all_directions = ["south", "north", "east", "west", "ne", "se", "sw", "nw"]
-    for direction in all_directions:
-        base_path = os.path.join(output_dir, f"idle_{direction}.png")
-        for frame in range(4):
-            walk_path = os.path.join(output_dir, f"walk_{direction}_{frame}.png")
-            create_walk_frame(base_path, walk_path, frame, direction)
+    # Draw everything first, then write the PNGs in one batch
+    sprites = [(path, draw(*args)) for path, _create, draw, *args in ASSETS]
+    for path, canvas in sprites:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        save(canvas, path)
+        print(f"Created: {path}")
 
     print(f"\nGenerated Fae character sprites:")
     print(f"  - 8 idle directions + idle.png (9 sprites)")
     print(f"  - 8 directions × 4 walk frames (32 sprites)")
-    print(f"  Total: 41 sprites in {output_dir}/")
+    print(f"  Total: 41 sprites in {OUTPUT_DIR}/")
 
 
 if __name__ == "__main__":
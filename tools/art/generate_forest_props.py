@@ -5,9 +5,25 @@ Style: Clean geometric shapes, 2-tone vertical shading (light left/dark right),
 colored outlines (no pure black), minimal and flat details.
 """
 
-from PIL import Image
 import os
 
+import numpy as np
+
+from raster import (
+    bands,
+    col_bands,
+    edged_hline,
+    ellipse_field,
+    fill_mask,
+    fill_rect,
+    grid,
+    hline,
+    new_canvas,
+    put,
+    save,
+    vline,
+)
+
 COLORS = {
     # Forest greens (darker than town for deeper forest)
     "leaf_outline": (0x2A, 0x4A, 0x2A),
@@ -28,21 +44,14 @@ COLORS = {
 }
 
 
-def hex_to_rgba(t):
-    return (*t, 255) if len(t) == 3 else t
-
-
 def create_forest_tree(output_path):
     """Dark forest tree - 16x32, denser/darker than town tree."""
-    img = Image.new("RGBA", (16, 32), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(16, 32)
 
     # Foliage (rows 0-18) - larger, denser canopy
     # Top of canopy
-    for x in range(5, 11):
-        pixels[x, 0] = hex_to_rgba(COLORS["leaf_outline"])
-    for x in range(4, 12):
-        pixels[x, 1] = hex_to_rgba(COLORS["leaf_outline"])
+    hline(canvas, 5, 11, 0, COLORS["leaf_outline"])
+    hline(canvas, 4, 12, 1, COLORS["leaf_outline"])
 
     # Main canopy body
     for y in range(2, 17):
@@ -56,104 +65,86 @@ def create_forest_tree(output_path):
         else:
             left, right = 3, 13
 
-        for x in range(left, right):
-            # Outline
-            if x == left or x == right - 1:
-                pixels[x, y] = hex_to_rgba(COLORS["leaf_outline"])
-            # Shading - light left, dark right
-            elif x < 8:
-                pixels[x, y] = hex_to_rgba(COLORS["leaf_light"])
-            else:
-                pixels[x, y] = hex_to_rgba(COLORS["leaf_shadow"])
+        # Outline, then shading - light left, dark right
+        edged_hline(
+            canvas,
+            left,
+            right,
+            y,
+            COLORS["leaf_outline"],
+            [(8, COLORS["leaf_light"]), (None, COLORS["leaf_shadow"])],
+        )
 
     # Bottom edge of canopy
-    for x in range(4, 12):
-        pixels[x, 17] = hex_to_rgba(COLORS["leaf_outline"])
+    hline(canvas, 4, 12, 17, COLORS["leaf_outline"])
 
     # Trunk (rows 18-31)
-    for y in range(18, 32):
-        # Trunk widens at base
-        if y < 28:
-            left, right = 7, 9
-        else:
-            left, right = 6, 10
-
-        for x in range(left, right):
-            if x < 8:
-                pixels[x, y] = hex_to_rgba(COLORS["bark_light"])
-            else:
-                pixels[x, y] = hex_to_rgba(COLORS["bark_mid"])
+    # Trunk widens at base
+    trunk = [(8, COLORS["bark_light"]), (None, COLORS["bark_mid"])]
+    col_bands(canvas, 7, 18, 9, 28, trunk)
+    col_bands(canvas, 6, 28, 10, 32, trunk)
 
     # Ground base
-    for x in range(5, 11):
-        pixels[x, 31] = hex_to_rgba(COLORS["bark_dark"])
+    hline(canvas, 5, 11, 31, COLORS["bark_dark"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_log(output_path):
     """Fallen log - 24x16, horizontal with visible rings."""
-    img = Image.new("RGBA", (24, 16), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(24, 16)
 
     # Main log body (rows 4-12)
-    for y in range(4, 13):
-        for x in range(2, 22):
-            # Top edge
-            if y == 4:
-                pixels[x, y] = hex_to_rgba(COLORS["bark_dark"])
-            # Bottom edge
-            elif y == 12:
-                pixels[x, y] = hex_to_rgba(COLORS["bark_dark"])
-            # Left/right edges
-            elif x == 2 or x == 21:
-                pixels[x, y] = hex_to_rgba(COLORS["bark_mid"])
-            # Main bark surface
-            elif y < 7:
-                pixels[x, y] = hex_to_rgba(COLORS["bark_highlight"])
-            elif y < 10:
-                pixels[x, y] = hex_to_rgba(COLORS["bark_light"])
-            else:
-                pixels[x, y] = hex_to_rgba(COLORS["bark_mid"])
+    # Top and bottom edges
+    hline(canvas, 2, 22, 4, COLORS["bark_dark"])
+    hline(canvas, 2, 22, 12, COLORS["bark_dark"])
+    # Left/right edges
+    vline(canvas, 2, 5, 12, COLORS["bark_mid"])
+    vline(canvas, 21, 5, 12, COLORS["bark_mid"])
+    # Main bark surface
+    bands(
+        canvas,
+        3,
+        5,
+        21,
+        12,
+        [
+            (7, COLORS["bark_highlight"]),
+            (10, COLORS["bark_light"]),
+            (None, COLORS["bark_mid"]),
+        ],
+    )
 
     # Left end - cut cross-section showing rings
-    for y in range(5, 12):
-        for x in range(0, 4):
-            dist = abs(1.5 - x) + abs(8 - y) * 0.5
-            if dist < 2:
-                pixels[x, y] = hex_to_rgba(COLORS["ring_light"])
-            elif dist < 3.5:
-                pixels[x, y] = hex_to_rgba(COLORS["ring_dark"])
-            else:
-                pixels[x, y] = hex_to_rgba(COLORS["bark_mid"])
+    xs, ys = grid(0, 5, 4, 12)
+    dist = np.abs(1.5 - xs) + np.abs(8 - ys) * 0.5
+    fill_rect(canvas, 0, 5, 4, 12, COLORS["bark_mid"])
+    fill_mask(canvas, 0, 5, dist < 3.5, COLORS["ring_dark"])
+    fill_mask(canvas, 0, 5, dist < 2, COLORS["ring_light"])
 
     # Right end - rough broken end
-    for y in range(5, 12):
-        pixels[22, y] = hex_to_rgba(COLORS["bark_dark"])
-        if y in [6, 8, 10]:
-            pixels[23, y] = hex_to_rgba(COLORS["bark_mid"])
+    vline(canvas, 22, 5, 12, COLORS["bark_dark"])
+    for y in [6, 8, 10]:
+        put(canvas, 23, y, COLORS["bark_mid"])
 
     # Some moss on top
-    pixels[8, 4] = hex_to_rgba((0x4A, 0x7A, 0x3A))
-    pixels[14, 4] = hex_to_rgba((0x4A, 0x7A, 0x3A))
-    pixels[15, 4] = hex_to_rgba((0x4A, 0x7A, 0x3A))
+    put(canvas, 8, 4, (0x4A, 0x7A, 0x3A))
+    put(canvas, 14, 4, (0x4A, 0x7A, 0x3A))
+    put(canvas, 15, 4, (0x4A, 0x7A, 0x3A))
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_bush(output_path):
     """Forest bush - 16x16, round leafy shrub."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(16, 16)
 
     # Bush shape - rounded blob
     # Row 2-3: Top
-    for x in range(5, 11):
-        pixels[x, 2] = hex_to_rgba(COLORS["bush_outline"])
-    for x in range(4, 12):
-        pixels[x, 3] = hex_to_rgba(COLORS["bush_outline"])
+    hline(canvas, 5, 11, 2, COLORS["bush_outline"])
+    hline(canvas, 4, 12, 3, COLORS["bush_outline"])
 
     # Rows 4-11: Main body
     for y in range(4, 12):
@@ -164,54 +155,43 @@ def create_bush(output_path):
         else:
             left, right = 2, 14
 
-        for x in range(left, right):
-            # Outline
-            if x == left or x == right - 1:
-                pixels[x, y] = hex_to_rgba(COLORS["bush_outline"])
-            # Light left
-            elif x < 7:
-                pixels[x, y] = hex_to_rgba(COLORS["bush_light"])
-            # Dark right
-            else:
-                pixels[x, y] = hex_to_rgba(COLORS["bush_shadow"])
+        # Outline, light left, dark right
+        edged_hline(
+            canvas,
+            left,
+            right,
+            y,
+            COLORS["bush_outline"],
+            [(7, COLORS["bush_light"]), (None, COLORS["bush_shadow"])],
+        )
 
     # Bottom row
-    for x in range(3, 13):
-        pixels[x, 12] = hex_to_rgba(COLORS["bush_outline"])
-    for x in range(5, 11):
-        pixels[x, 13] = hex_to_rgba(COLORS["bush_outline"])
+    hline(canvas, 3, 13, 12, COLORS["bush_outline"])
+    hline(canvas, 5, 11, 13, COLORS["bush_outline"])
 
     # Some leaf texture bumps
-    pixels[5, 5] = hex_to_rgba(COLORS["bush_light"])
-    pixels[10, 6] = hex_to_rgba(COLORS["bush_shadow"])
-    pixels[4, 8] = hex_to_rgba(COLORS["bush_light"])
-    pixels[11, 9] = hex_to_rgba(COLORS["bush_shadow"])
+    put(canvas, 5, 5, COLORS["bush_light"])
+    put(canvas, 10, 6, COLORS["bush_shadow"])
+    put(canvas, 4, 8, COLORS["bush_light"])
+    put(canvas, 11, 9, COLORS["bush_shadow"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_stump(output_path):
     """Tree stump - 16x16, cut tree with visible rings."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(16, 16)
 
     # Top surface with rings (rows 2-6)
-    for y in range(2, 7):
-        for x in range(3, 13):
-            cx, cy = 8, 4
-            dist = ((x - cx) ** 2 + (y - cy) ** 2) ** 0.5
-
-            if x == 3 or x == 12:
-                pixels[x, y] = hex_to_rgba(COLORS["bark_dark"])
-            elif dist < 1.5:
-                pixels[x, y] = hex_to_rgba(COLORS["ring_dark"])
-            elif dist < 3:
-                pixels[x, y] = hex_to_rgba(COLORS["ring_light"])
-            elif dist < 4:
-                pixels[x, y] = hex_to_rgba(COLORS["ring_dark"])
-            else:
-                pixels[x, y] = hex_to_rgba(COLORS["ring_light"])
+    vline(canvas, 3, 2, 7, COLORS["bark_dark"])
+    vline(canvas, 12, 2, 7, COLORS["bark_dark"])
+    # Squared distance from the ring centre (8, 4)
+    dist2 = ellipse_field(4, 2, 12, 7, 8, 4, 1, 1)
+    fill_rect(canvas, 4, 2, 12, 7, COLORS["ring_light"])
+    fill_mask(canvas, 4, 2, dist2 < 4**2, COLORS["ring_dark"])
+    fill_mask(canvas, 4, 2, dist2 < 3**2, COLORS["ring_light"])
+    fill_mask(canvas, 4, 2, dist2 < 1.5**2, COLORS["ring_dark"])
 
     # Bark sides (rows 7-13)
     for y in range(7, 14):
@@ -221,37 +201,43 @@ def create_stump(output_path):
         else:
             left, right = 4, 12
 
-        for x in range(left, right):
-            if x == left or x == right - 1:
-                pixels[x, y] = hex_to_rgba(COLORS["bark_dark"])
-            elif x < 7:
-                pixels[x, y] = hex_to_rgba(COLORS["bark_light"])
-            else:
-                pixels[x, y] = hex_to_rgba(COLORS["bark_mid"])
+        edged_hline(
+            canvas,
+            left,
+            right,
+            y,
+            COLORS["bark_dark"],
+            [(7, COLORS["bark_light"]), (None, COLORS["bark_mid"])],
+        )
 
     # Base
-    for x in range(5, 11):
-        pixels[x, 14] = hex_to_rgba(COLORS["bark_dark"])
+    hline(canvas, 5, 11, 14, COLORS["bark_dark"])
 
     # Moss/lichen patches
-    pixels[4, 8] = hex_to_rgba((0x4A, 0x7A, 0x3A))
-    pixels[11, 10] = hex_to_rgba((0x4A, 0x7A, 0x3A))
+    put(canvas, 4, 8, (0x4A, 0x7A, 0x3A))
+    put(canvas, 11, 10, (0x4A, 0x7A, 0x3A))
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
-def main():
-    output_dir = "game/assets/sprites/props/forest"
-    os.makedirs(output_dir, exist_ok=True)
+OUTPUT_DIR = "game/assets/sprites/props/forest"
+
+ASSETS = [
+    (os.path.join(OUTPUT_DIR, "tree_forest.png"), create_forest_tree),
+    (os.path.join(OUTPUT_DIR, "log.png"), create_log),
+    (os.path.join(OUTPUT_DIR, "bush.png"), create_bush),
+    (os.path.join(OUTPUT_DIR, "stump.png"), create_stump),
+]
 
-    create_forest_tree(os.path.join(output_dir, "tree_forest.png"))
-    create_log(os.path.join(output_dir, "log.png"))
-    create_bush(os.path.join(output_dir, "bush.png"))
-    create_stump(os.path.join(output_dir, "stump.png"))
+
+def main():
+    for path, create, *args in ASSETS:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        create(path, *args)
 
     print(f"\nForest props complete!")
-    print(f"Files created in: {output_dir}/")
+    print(f"Files created in: {OUTPUT_DIR}/")
 
 
 if __name__ == "__main__":
@@ -1,9 +1,17 @@
 #!/usr/bin/env python3
 """Generate forest tileset pieces for Wilds of Cloverhollow (16x16)."""
 
-from PIL import Image
 import os
 
+from raster import (
+    fill_rect,
+    hline,
+    new_canvas,
+    plot,
+    put,
+    save,
+)
+
 COLORS = {
     # Dark forest grass
     "forest_grass_outline": (0x1A, 0x2A, 0x1A),
@@ -29,20 +37,13 @@ COLORS = {
 }
 
 
-def hex_to_rgba(t):
-    return (*t, 255) if len(t) == 3 else t
-
-
 def create_forest_grass(output_path):
     width, height = 16, 16
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(width, height)
     C = COLORS
 
     # Base dark grass fill
-    for y in range(height):
-        for x in range(width):
-            pixels[x, y] = hex_to_rgba(C["forest_grass"])
+    fill_rect(canvas, 0, 0, width, height, C["forest_grass"])
 
     # Darker patches
     dark_spots = [
@@ -56,28 +57,23 @@ def create_forest_grass(output_path):
         (7, 11),
         (12, 14),
     ]
-    for sx, sy in dark_spots:
-        pixels[sx, sy] = hex_to_rgba(C["forest_grass_dark"])
+    plot(canvas, dark_spots, C["forest_grass_dark"])
 
     # Light dappled spots (filtered light)
     light_spots = [(4, 4), (10, 5), (5, 9), (11, 12), (8, 2)]
-    for sx, sy in light_spots:
-        pixels[sx, sy] = hex_to_rgba(C["forest_grass_light"])
+    plot(canvas, light_spots, C["forest_grass_light"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_forest_roots(output_path):
     width, height = 16, 16
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(width, height)
     C = COLORS
 
     # Base dark grass
-    for y in range(height):
-        for x in range(width):
-            pixels[x, y] = hex_to_rgba(C["forest_grass_dark"])
+    fill_rect(canvas, 0, 0, width, height, C["forest_grass_dark"])
 
     # Diagonal root pattern (left to right)
     root_path = [
@@ -99,77 +95,67 @@ def create_forest_roots(output_path):
         (15, 13),
     ]
     for x, y in root_path:
-        pixels[x, y] = hex_to_rgba(C["root"])
-        if y - 1 >= 0:
-            pixels[x, y - 1] = hex_to_rgba(C["root_outline"])
-        if y + 1 < 16:
-            pixels[x, y + 1] = hex_to_rgba(C["root_dark"])
+        put(canvas, x, y, C["root"])
+        put(canvas, x, y - 1, C["root_outline"])
+        put(canvas, x, y + 1, C["root_dark"])
 
     # Branch roots
-    pixels[4, 6] = hex_to_rgba(C["root"])
-    pixels[5, 5] = hex_to_rgba(C["root_light"])
-    pixels[10, 8] = hex_to_rgba(C["root"])
-    pixels[11, 7] = hex_to_rgba(C["root_light"])
+    put(canvas, 4, 6, C["root"])
+    put(canvas, 5, 5, C["root_light"])
+    put(canvas, 10, 8, C["root"])
+    put(canvas, 11, 7, C["root_light"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_mushroom_tile(output_path):
     width, height = 16, 16
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(width, height)
     C = COLORS
 
     # Base dark grass
-    for y in range(height):
-        for x in range(width):
-            pixels[x, y] = hex_to_rgba(C["forest_grass_dark"])
+    fill_rect(canvas, 0, 0, width, height, C["forest_grass_dark"])
 
     # Small mushroom cluster (center-left)
     # Mushroom 1 cap (rows 8-10)
-    for x in range(4, 8):
-        pixels[x, 8] = hex_to_rgba(C["mush_outline"])
-    pixels[3, 9] = hex_to_rgba(C["mush_outline"])
-    pixels[4, 9] = hex_to_rgba(C["mush_light"])
-    pixels[5, 9] = hex_to_rgba(C["mush"])
-    pixels[6, 9] = hex_to_rgba(C["mush"])
-    pixels[7, 9] = hex_to_rgba(C["mush_dark"])
-    pixels[8, 9] = hex_to_rgba(C["mush_outline"])
-    for x in range(4, 8):
-        pixels[x, 10] = hex_to_rgba(C["mush_outline"])
+    hline(canvas, 4, 8, 8, C["mush_outline"])
+    put(canvas, 3, 9, C["mush_outline"])
+    put(canvas, 4, 9, C["mush_light"])
+    put(canvas, 5, 9, C["mush"])
+    put(canvas, 6, 9, C["mush"])
+    put(canvas, 7, 9, C["mush_dark"])
+    put(canvas, 8, 9, C["mush_outline"])
+    hline(canvas, 4, 8, 10, C["mush_outline"])
     # Spots on cap
-    pixels[5, 9] = hex_to_rgba(C["mush_spot"])
+    put(canvas, 5, 9, C["mush_spot"])
     # Stem
-    pixels[5, 11] = hex_to_rgba(C["mush_stem"])
-    pixels[6, 11] = hex_to_rgba(C["mush_stem"])
-    pixels[5, 12] = hex_to_rgba(C["mush_outline"])
-    pixels[6, 12] = hex_to_rgba(C["mush_outline"])
+    put(canvas, 5, 11, C["mush_stem"])
+    put(canvas, 6, 11, C["mush_stem"])
+    put(canvas, 5, 12, C["mush_outline"])
+    put(canvas, 6, 12, C["mush_outline"])
 
     # Mushroom 2 (small, right side)
-    pixels[11, 10] = hex_to_rgba(C["mush_outline"])
-    pixels[12, 10] = hex_to_rgba(C["mush_outline"])
-    pixels[10, 11] = hex_to_rgba(C["mush_outline"])
-    pixels[11, 11] = hex_to_rgba(C["mush"])
-    pixels[12, 11] = hex_to_rgba(C["mush_dark"])
-    pixels[13, 11] = hex_to_rgba(C["mush_outline"])
-    pixels[11, 12] = hex_to_rgba(C["mush_stem"])
-    pixels[11, 13] = hex_to_rgba(C["mush_outline"])
-
-    img.save(output_path)
+    put(canvas, 11, 10, C["mush_outline"])
+    put(canvas, 12, 10, C["mush_outline"])
+    put(canvas, 10, 11, C["mush_outline"])
+    put(canvas, 11, 11, C["mush"])
+    put(canvas, 12, 11, C["mush_dark"])
+    put(canvas, 13, 11, C["mush_outline"])
+    put(canvas, 11, 12, C["mush_stem"])
+    put(canvas, 11, 13, C["mush_outline"])
+
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_moss_tile(output_path):
     width, height = 16, 16
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(width, height)
     C = COLORS
 
     # Base dark grass
-    for y in range(height):
-        for x in range(width):
-            pixels[x, y] = hex_to_rgba(C["forest_grass"])
+    fill_rect(canvas, 0, 0, width, height, C["forest_grass"])
 
     # Moss patches (scattered)
     moss_areas = [
@@ -189,28 +175,24 @@ def create_moss_tile(output_path):
         (13, 12),
         (13, 13),
     ]
-    for x, y in moss_areas:
-        pixels[x, y] = hex_to_rgba(C["moss"])
+    plot(canvas, moss_areas, C["moss"])
 
     # Lighter moss highlights
-    pixels[3, 3] = hex_to_rgba(C["moss_light"])
-    pixels[10, 5] = hex_to_rgba(C["moss_light"])
-    pixels[6, 10] = hex_to_rgba(C["moss_light"])
+    put(canvas, 3, 3, C["moss_light"])
+    put(canvas, 10, 5, C["moss_light"])
+    put(canvas, 6, 10, C["moss_light"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_forest_floor(output_path):
     width, height = 16, 16
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(width, height)
     C = COLORS
 
     # Base dark forest floor
-    for y in range(height):
-        for x in range(width):
-            pixels[x, y] = hex_to_rgba(C["forest_grass_dark"])
+    fill_rect(canvas, 0, 0, width, height, C["forest_grass_dark"])
 
     # Scattered leaves/debris
     debris = [
@@ -224,29 +206,32 @@ def create_forest_floor(output_path):
         (8, 13),
         (13, 14),
     ]
-    for x, y in debris:
-        pixels[x, y] = hex_to_rgba(C["root_light"])
+    plot(canvas, debris, C["root_light"])
 
     # Darker damp spots
     damp = [(5, 5), (10, 10), (1, 13)]
     for x, y in damp:
-        pixels[x, y] = hex_to_rgba(C["forest_grass_outline"])
-        if x + 1 < 16:
-            pixels[x + 1, y] = hex_to_rgba(C["forest_grass_outline"])
+        hline(canvas, x, x + 2, y, C["forest_grass_outline"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
+OUTPUT_DIR = "game/assets/sprites/tiles/forest"
+
+ASSETS = [
+    (os.path.join(OUTPUT_DIR, "tile_forest_grass.png"), create_forest_grass),
+    (os.path.join(OUTPUT_DIR, "tile_forest_roots.png"), create_forest_roots),
+    (os.path.join(OUTPUT_DIR, "tile_mushrooms.png"), create_mushroom_tile),
+    (os.path.join(OUTPUT_DIR, "tile_moss.png"), create_moss_tile),
+    (os.path.join(OUTPUT_DIR, "tile_forest_floor.png"), create_forest_floor),
+]
+
+
 def main():
-    output_dir = "game/assets/sprites/tiles/forest"
-    os.makedirs(output_dir, exist_ok=True)
-
-    create_forest_grass(os.path.join(output_dir, "tile_forest_grass.png"))
-    create_forest_roots(os.path.join(output_dir, "tile_forest_roots.png"))
-    create_mushroom_tile(os.path.join(output_dir, "tile_mushrooms.png"))
-    create_moss_tile(os.path.join(output_dir, "tile_moss.png"))
-    create_forest_floor(os.path.join(output_dir, "tile_forest_floor.png"))
+    for path, create, *args in ASSETS:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        create(path, *args)
 
     print("\nForest tiles generation complete!")
 
@@ -5,9 +5,20 @@ Milestone 202: Town Furniture Props
 Creates chair, table, desk, bookshelf, couch, bed, rug sprites.
 """
 
-from PIL import Image
 import os
 
+from raster import (
+    bands,
+    diamond,
+    fill_rect,
+    frame_rect,
+    hline,
+    new_canvas,
+    put,
+    save,
+    vline,
+)
+
 COLORS = {
     "cream_light": (0xF5, 0xEA, 0xD6),
     "cream": (0xE8, 0xDC, 0xC4),
@@ -40,8 +51,7 @@ def rgba(name):
 
 def create_chair(path):
     """16x16 wooden dining chair, 3/4 top-down view."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    p = img.load()
+    canvas = new_canvas(16, 16)
     out, wl, wm, wd = (
         rgba("outline"),
         rgba("wood_light"),
@@ -50,33 +60,24 @@ def create_chair(path):
     )
 
     # Chair back (rows 2-7)
-    for y in range(2, 8):
-        for x in range(5, 11):
-            if y == 2 or y == 7 or x == 5 or x == 10:
-                p[x, y] = out
-            else:
-                p[x, y] = wl if y < 5 else wm
+    frame_rect(canvas, 5, 2, 11, 8, out)
+    bands(canvas, 6, 3, 10, 7, [(5, wl), (None, wm)])
 
     # Seat (rows 8-11)
-    for y in range(8, 12):
-        for x in range(4, 12):
-            if y == 8 or y == 11 or x == 4 or x == 11:
-                p[x, y] = out
-            else:
-                p[x, y] = wm if y < 10 else wd
+    frame_rect(canvas, 4, 8, 12, 12, out)
+    bands(canvas, 5, 9, 11, 11, [(10, wm), (None, wd)])
 
     # Legs (rows 12-15)
     for x in [5, 10]:
-        for y in range(12, 16):
-            p[x, y] = wd if y < 15 else out
+        vline(canvas, x, 12, 15, wd)
+        put(canvas, x, 15, out)
 
-    img.save(path)
+    save(canvas, path)
 
 
 def create_table(path):
     """16x16 small wooden table, 3/4 view."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    p = img.load()
+    canvas = new_canvas(16, 16)
     out, wl, wm, wd = (
         rgba("outline"),
         rgba("wood_light"),
@@ -85,27 +86,20 @@ def create_table(path):
     )
 
     # Table top (rows 4-8)
-    for y in range(4, 9):
-        for x in range(2, 14):
-            if y == 4 or y == 8 or x == 2 or x == 13:
-                p[x, y] = out
-            elif y == 5:
-                p[x, y] = wl
-            else:
-                p[x, y] = wm
+    frame_rect(canvas, 2, 4, 14, 9, out)
+    bands(canvas, 3, 5, 13, 8, [(6, wl), (None, wm)])
 
     # Legs (rows 9-15)
     for x in [4, 11]:
-        for y in range(9, 16):
-            p[x, y] = wd if y < 15 else out
+        vline(canvas, x, 9, 15, wd)
+        put(canvas, x, 15, out)
 
-    img.save(path)
+    save(canvas, path)
 
 
 def create_desk(path):
     """16x16 writing desk with drawer."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    p = img.load()
+    canvas = new_canvas(16, 16)
     out, wl, wm, wd = (
         rgba("outline"),
         rgba("wood_light"),
@@ -115,39 +109,28 @@ def create_desk(path):
     iron = rgba("outline")
 
     # Desktop (rows 3-6)
-    for y in range(3, 7):
-        for x in range(1, 15):
-            if y == 3 or y == 6 or x == 1 or x == 14:
-                p[x, y] = out
-            elif y == 4:
-                p[x, y] = wl
-            else:
-                p[x, y] = wm
+    frame_rect(canvas, 1, 3, 15, 7, out)
+    bands(canvas, 2, 4, 14, 6, [(5, wl), (None, wm)])
 
     # Drawer front (rows 7-10)
-    for y in range(7, 11):
-        for x in range(2, 14):
-            if y == 7 or y == 10 or x == 2 or x == 13:
-                p[x, y] = out
-            else:
-                p[x, y] = wm
+    frame_rect(canvas, 2, 7, 14, 11, out)
+    fill_rect(canvas, 3, 8, 13, 10, wm)
 
     # Drawer handle (row 8)
-    p[7, 8] = iron
-    p[8, 8] = iron
+    put(canvas, 7, 8, iron)
+    put(canvas, 8, 8, iron)
 
     # Legs (rows 11-15)
     for x in [3, 12]:
-        for y in range(11, 16):
-            p[x, y] = wd if y < 15 else out
+        vline(canvas, x, 11, 15, wd)
+        put(canvas, x, 15, out)
 
-    img.save(path)
+    save(canvas, path)
 
 
 def create_bookshelf(path):
     """16x24 bookshelf with colorful books."""
-    img = Image.new("RGBA", (16, 24), (0, 0, 0, 0))
-    p = img.load()
+    canvas = new_canvas(16, 24)
     out, wl, wm, wd = (
         rgba("outline"),
         rgba("wood_light"),
@@ -162,184 +145,143 @@ def create_bookshelf(path):
     )
 
     # Frame outline
-    for y in range(1, 23):
-        p[1, y] = out
-        p[14, y] = out
-    for x in range(1, 15):
-        p[x, 1] = out
-        p[x, 22] = out
+    vline(canvas, 1, 1, 23, out)
+    vline(canvas, 14, 1, 23, out)
+    hline(canvas, 1, 15, 1, out)
+    hline(canvas, 1, 15, 22, out)
 
     # Frame fill
-    for y in range(2, 22):
-        p[2, y] = wm
-        p[13, y] = wd
+    vline(canvas, 2, 2, 22, wm)
+    vline(canvas, 13, 2, 22, wd)
 
     # Shelves at rows 8, 15
     for shelf_y in [8, 15]:
-        for x in range(2, 14):
-            p[x, shelf_y] = wm
+        hline(canvas, 2, 14, shelf_y, wm)
 
     # Books - top shelf (rows 2-7)
     book_colors = [br, bb, bg, by, br, bb, bg, by, br, bb]
     for i, x in enumerate(range(3, 13)):
         color = book_colors[i % len(book_colors)]
-        for y in range(3, 8):
-            p[x, y] = color
+        vline(canvas, x, 3, 8, color)
 
     # Books - middle shelf (rows 9-14)
     for i, x in enumerate(range(3, 13)):
         color = book_colors[(i + 3) % len(book_colors)]
-        for y in range(10, 15):
-            p[x, y] = color
+        vline(canvas, x, 10, 15, color)
 
     # Books - bottom shelf (rows 16-21)
     for i, x in enumerate(range(3, 13)):
         color = book_colors[(i + 5) % len(book_colors)]
-        for y in range(17, 22):
-            p[x, y] = color
+        vline(canvas, x, 17, 22, color)
 
-    img.save(path)
+    save(canvas, path)
 
 
 def create_couch(path):
     """24x16 living room couch."""
-    img = Image.new("RGBA", (24, 16), (0, 0, 0, 0))
-    p = img.load()
+    canvas = new_canvas(24, 16)
     out = rgba("outline")
     fl, fd = rgba("fabric_red"), rgba("fabric_red_dark")
     wm, wd = rgba("wood_mid"), rgba("wood_dark")
 
     # Back rest (rows 2-7)
-    for y in range(2, 8):
-        for x in range(2, 22):
-            if y == 2 or x == 2 or x == 21:
-                p[x, y] = out
-            elif y < 5:
-                p[x, y] = fl
-            else:
-                p[x, y] = fd
+    hline(canvas, 2, 22, 2, out)
+    vline(canvas, 2, 2, 8, out)
+    vline(canvas, 21, 2, 8, out)
+    bands(canvas, 3, 3, 21, 8, [(5, fl), (None, fd)])
 
     # Seat cushion (rows 8-11)
-    for y in range(8, 12):
-        for x in range(1, 23):
-            if y == 11 or x == 1 or x == 22:
-                p[x, y] = out
-            elif y == 8:
-                p[x, y] = fl
-            else:
-                p[x, y] = fd
+    hline(canvas, 1, 23, 11, out)
+    vline(canvas, 1, 8, 12, out)
+    vline(canvas, 22, 8, 12, out)
+    bands(canvas, 2, 8, 22, 11, [(9, fl), (None, fd)])
 
     # Armrests
-    for y in range(4, 12):
-        p[0, y] = fd
-        p[23, y] = fd
-        p[1, y] = fl if y < 8 else fd
+    vline(canvas, 0, 4, 12, fd)
+    vline(canvas, 23, 4, 12, fd)
+    bands(canvas, 1, 4, 2, 12, [(8, fl), (None, fd)])
 
     # Feet (rows 12-14)
     for x in [4, 19]:
-        for y in range(12, 15):
-            p[x, y] = wm if y < 14 else out
+        vline(canvas, x, 12, 14, wm)
+        put(canvas, x, 14, out)
 
-    img.save(path)
+    save(canvas, path)
 
 
 def create_bed(path):
     """24x16 bedroom bed with pillow and blanket."""
-    img = Image.new("RGBA", (24, 16), (0, 0, 0, 0))
-    p = img.load()
+    canvas = new_canvas(24, 16)
     out = rgba("outline")
     wl, wm, wd = rgba("wood_light"), rgba("wood_mid"), rgba("wood_dark")
     pw, ps = rgba("pillow_white"), rgba("pillow_shadow")
     bl, bd = rgba("fabric_blue"), rgba("fabric_blue_dark")
 
     # Headboard (rows 1-6)
-    for y in range(1, 7):
-        for x in range(1, 7):
-            if y == 1 or y == 6 or x == 1 or x == 6:
-                p[x, y] = out
-            else:
-                p[x, y] = wl if y < 4 else wm
+    frame_rect(canvas, 1, 1, 7, 7, out)
+    bands(canvas, 2, 2, 6, 6, [(4, wl), (None, wm)])
 
     # Pillow (rows 3-6, x 7-12)
-    for y in range(3, 7):
-        for x in range(7, 13):
-            if y == 3 or y == 6 or x == 7 or x == 12:
-                p[x, y] = out
-            else:
-                p[x, y] = pw if y < 5 else ps
+    frame_rect(canvas, 7, 3, 13, 7, out)
+    bands(canvas, 8, 4, 12, 6, [(5, pw), (None, ps)])
 
     # Blanket/mattress (rows 7-13)
-    for y in range(7, 14):
-        for x in range(2, 22):
-            if y == 7 or y == 13 or x == 2 or x == 21:
-                p[x, y] = out
-            elif y < 10:
-                p[x, y] = bl
-            else:
-                p[x, y] = bd
+    frame_rect(canvas, 2, 7, 22, 14, out)
+    bands(canvas, 3, 8, 21, 13, [(10, bl), (None, bd)])
 
     # Footboard (rows 7-13, x 22-23)
-    for y in range(7, 14):
-        for x in range(22, 24):
-            p[x, y] = wm if x == 22 else wd
+    vline(canvas, 22, 7, 14, wm)
+    vline(canvas, 23, 7, 14, wd)
 
     # Feet
     for x in [3, 20]:
-        p[x, 14] = wd
-        p[x, 15] = out
+        put(canvas, x, 14, wd)
+        put(canvas, x, 15, out)
 
-    img.save(path)
+    save(canvas, path)
 
 
 def create_rug(path):
     """24x24 decorative floor rug."""
-    img = Image.new("RGBA", (24, 24), (0, 0, 0, 0))
-    p = img.load()
+    canvas = new_canvas(24, 24)
     out = rgba("outline")
     fl, fd = rgba("fabric_pink"), rgba("fabric_pink_dark")
     cream = rgba("cream")
 
     # Outer border (rows 2-21, cols 2-21)
-    for y in range(2, 22):
-        for x in range(2, 22):
-            if y == 2 or y == 21 or x == 2 or x == 21:
-                p[x, y] = out
-            elif y == 3 or y == 20 or x == 3 or x == 20:
-                p[x, y] = fd
-            elif y == 4 or y == 19 or x == 4 or x == 19:
-                p[x, y] = fl
-            else:
-                p[x, y] = cream
+    frame_rect(canvas, 2, 2, 22, 22, out)
+    frame_rect(canvas, 3, 3, 21, 21, fd)
+    frame_rect(canvas, 4, 4, 20, 20, fl)
+    fill_rect(canvas, 5, 5, 19, 19, cream)
 
     # Center pattern - simple diamond
     center_x, center_y = 11, 11
-    for dy in range(-3, 4):
-        for dx in range(-3, 4):
-            if abs(dx) + abs(dy) <= 3:
-                p[center_x + dx, center_y + dy] = fl if abs(dx) + abs(dy) < 2 else fd
+    diamond(canvas, center_x, center_y, 3, fd)
+    diamond(canvas, center_x, center_y, 1, fl)
+
+    save(canvas, path)
+
 
-    img.save(path)
+OUTPUT_DIR = "game/assets/sprites/props"
+
+ASSETS = [
+    (os.path.join(OUTPUT_DIR, "chair.png"), create_chair),
+    (os.path.join(OUTPUT_DIR, "table.png"), create_table),
+    (os.path.join(OUTPUT_DIR, "desk.png"), create_desk),
+    (os.path.join(OUTPUT_DIR, "bookshelf.png"), create_bookshelf),
+    (os.path.join(OUTPUT_DIR, "couch.png"), create_couch),
+    (os.path.join(OUTPUT_DIR, "bed.png"), create_bed),
+    (os.path.join(OUTPUT_DIR, "rug.png"), create_rug),
+]
 
 
 def main():
-    out_dir = "game/assets/sprites/props"
-    os.makedirs(out_dir, exist_ok=True)
-
-    sprites = [
-        ("chair.png", create_chair),
-        ("table.png", create_table),
-        ("desk.png", create_desk),
-        ("bookshelf.png", create_bookshelf),
-        ("couch.png", create_couch),
-        ("bed.png", create_bed),
-        ("rug.png", create_rug),
-    ]
-
-    for name, func in sprites:
-        func(os.path.join(out_dir, name))
-        print(f"Created: {name}")
-
-    print(f"\nGenerated {len(sprites)} furniture sprites in {out_dir}/")
+    for path, create, *args in ASSETS:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        create(path, *args)
+        print(f"Created: {os.path.basename(path)}")
+
+    print(f"\nGenerated {len(ASSETS)} furniture sprites in {OUTPUT_DIR}/")
 
 
 if __name__ == "__main__":
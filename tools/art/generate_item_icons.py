@@ -8,9 +8,17 @@ Style guide requirements:
 - Clean geometric shapes
 """
 
-from PIL import Image
 import os
 
+from raster import (
+    fill_rect,
+    hline,
+    new_canvas,
+    put,
+    save,
+    vline,
+)
+
 COLORS = {
     # General
     "outline_brown": (0x3D, 0x32, 0x28),  # Dark brown for wood/neutral
@@ -51,302 +59,262 @@ COLORS = {
 }
 
 
-def hex_to_rgba(t):
-    return (*t, 255) if len(t) == 3 else t
-
-
 def create_potion(output_path):
     """Create icon_potion.png (16x16) - red health potion bottle."""
     width, height = 16, 16
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(width, height)
     C = COLORS
 
     # Row 2: Cork top
-    for x in range(6, 10):
-        pixels[x, 2] = hex_to_rgba(C["cork"])
-    pixels[6, 2] = hex_to_rgba(C["cork_light"])
+    hline(canvas, 6, 10, 2, C["cork"])
+    put(canvas, 6, 2, C["cork_light"])
 
     # Row 3: Cork middle
-    for x in range(6, 10):
-        pixels[x, 3] = hex_to_rgba(C["cork"])
-    pixels[6, 3] = hex_to_rgba(C["cork_light"])
-    pixels[9, 3] = hex_to_rgba(C["cork_dark"])
+    hline(canvas, 6, 10, 3, C["cork"])
+    put(canvas, 6, 3, C["cork_light"])
+    put(canvas, 9, 3, C["cork_dark"])
 
     # Row 4: Cork bottom / neck top
-    for x in range(5, 11):
-        pixels[x, 4] = hex_to_rgba(C["red_outline"])
-    for x in range(6, 10):
-        pixels[x, 4] = hex_to_rgba(C["cork_dark"])
+    hline(canvas, 5, 11, 4, C["red_outline"])
+    hline(canvas, 6, 10, 4, C["cork_dark"])
 
     # Row 5: Bottle neck
-    pixels[5, 5] = hex_to_rgba(C["red_outline"])
-    pixels[6, 5] = hex_to_rgba(C["red_light"])
-    for x in range(7, 10):
-        pixels[x, 5] = hex_to_rgba(C["red"])
-    pixels[10, 5] = hex_to_rgba(C["red_outline"])
+    put(canvas, 5, 5, C["red_outline"])
+    put(canvas, 6, 5, C["red_light"])
+    hline(canvas, 7, 10, 5, C["red"])
+    put(canvas, 10, 5, C["red_outline"])
 
     # Rows 6-12: Bottle body
-    for y in range(6, 13):
-        # Left outline
-        pixels[3, y] = hex_to_rgba(C["red_outline"])
-        # Left highlight band
-        pixels[4, y] = hex_to_rgba(C["red_light"])
-        # Main body
-        for x in range(5, 11):
-            pixels[x, y] = hex_to_rgba(C["red"])
-        # Right shade band
-        pixels[11, y] = hex_to_rgba(C["red_dark"])
-        # Right outline
-        pixels[12, y] = hex_to_rgba(C["red_outline"])
+    # Left outline
+    # Left highlight band
+    # Main body
+    # Right shade band
+    # Right outline
+    vline(canvas, 3, 6, 13, C["red_outline"])
+    vline(canvas, 4, 6, 13, C["red_light"])
+    fill_rect(canvas, 5, 6, 11, 13, C["red"])
+    vline(canvas, 11, 6, 13, C["red_dark"])
+    vline(canvas, 12, 6, 13, C["red_outline"])
 
     # Add highlight sparkle (upper left of body)
-    pixels[5, 7] = hex_to_rgba(C["red_highlight"])
-    pixels[4, 8] = hex_to_rgba(C["red_highlight"])
+    put(canvas, 5, 7, C["red_highlight"])
+    put(canvas, 4, 8, C["red_highlight"])
 
     # Row 13: Bottom outline
-    for x in range(4, 12):
-        pixels[x, 13] = hex_to_rgba(C["red_outline"])
+    hline(canvas, 4, 12, 13, C["red_outline"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_ether(output_path):
     """Create icon_ether.png (16x16) - blue mana potion bottle."""
     width, height = 16, 16
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(width, height)
     C = COLORS
 
     # Row 2: Cork top
-    for x in range(6, 10):
-        pixels[x, 2] = hex_to_rgba(C["cork"])
-    pixels[6, 2] = hex_to_rgba(C["cork_light"])
+    hline(canvas, 6, 10, 2, C["cork"])
+    put(canvas, 6, 2, C["cork_light"])
 
     # Row 3: Cork middle
-    for x in range(6, 10):
-        pixels[x, 3] = hex_to_rgba(C["cork"])
-    pixels[6, 3] = hex_to_rgba(C["cork_light"])
-    pixels[9, 3] = hex_to_rgba(C["cork_dark"])
+    hline(canvas, 6, 10, 3, C["cork"])
+    put(canvas, 6, 3, C["cork_light"])
+    put(canvas, 9, 3, C["cork_dark"])
 
     # Row 4: Cork bottom / neck top
-    for x in range(5, 11):
-        pixels[x, 4] = hex_to_rgba(C["blue_outline"])
-    for x in range(6, 10):
-        pixels[x, 4] = hex_to_rgba(C["cork_dark"])
+    hline(canvas, 5, 11, 4, C["blue_outline"])
+    hline(canvas, 6, 10, 4, C["cork_dark"])
 
     # Row 5: Bottle neck
-    pixels[5, 5] = hex_to_rgba(C["blue_outline"])
-    pixels[6, 5] = hex_to_rgba(C["blue_light"])
-    for x in range(7, 10):
-        pixels[x, 5] = hex_to_rgba(C["blue"])
-    pixels[10, 5] = hex_to_rgba(C["blue_outline"])
+    put(canvas, 5, 5, C["blue_outline"])
+    put(canvas, 6, 5, C["blue_light"])
+    hline(canvas, 7, 10, 5, C["blue"])
+    put(canvas, 10, 5, C["blue_outline"])
 
     # Rows 6-12: Bottle body
-    for y in range(6, 13):
-        pixels[3, y] = hex_to_rgba(C["blue_outline"])
-        pixels[4, y] = hex_to_rgba(C["blue_light"])
-        for x in range(5, 11):
-            pixels[x, y] = hex_to_rgba(C["blue"])
-        pixels[11, y] = hex_to_rgba(C["blue_dark"])
-        pixels[12, y] = hex_to_rgba(C["blue_outline"])
+    vline(canvas, 3, 6, 13, C["blue_outline"])
+    vline(canvas, 4, 6, 13, C["blue_light"])
+    fill_rect(canvas, 5, 6, 11, 13, C["blue"])
+    vline(canvas, 11, 6, 13, C["blue_dark"])
+    vline(canvas, 12, 6, 13, C["blue_outline"])
 
     # Highlight sparkle
-    pixels[5, 7] = hex_to_rgba(C["blue_highlight"])
-    pixels[4, 8] = hex_to_rgba(C["blue_highlight"])
+    put(canvas, 5, 7, C["blue_highlight"])
+    put(canvas, 4, 8, C["blue_highlight"])
 
     # Row 13: Bottom outline
-    for x in range(4, 12):
-        pixels[x, 13] = hex_to_rgba(C["blue_outline"])
+    hline(canvas, 4, 12, 13, C["blue_outline"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_antidote(output_path):
     """Create icon_antidote.png (16x16) - green cure potion bottle."""
     width, height = 16, 16
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(width, height)
     C = COLORS
 
     # Row 2: Cork top
-    for x in range(6, 10):
-        pixels[x, 2] = hex_to_rgba(C["cork"])
-    pixels[6, 2] = hex_to_rgba(C["cork_light"])
+    hline(canvas, 6, 10, 2, C["cork"])
+    put(canvas, 6, 2, C["cork_light"])
 
     # Row 3: Cork middle
-    for x in range(6, 10):
-        pixels[x, 3] = hex_to_rgba(C["cork"])
-    pixels[6, 3] = hex_to_rgba(C["cork_light"])
-    pixels[9, 3] = hex_to_rgba(C["cork_dark"])
+    hline(canvas, 6, 10, 3, C["cork"])
+    put(canvas, 6, 3, C["cork_light"])
+    put(canvas, 9, 3, C["cork_dark"])
 
     # Row 4: Cork bottom / neck top
-    for x in range(5, 11):
-        pixels[x, 4] = hex_to_rgba(C["green_outline"])
-    for x in range(6, 10):
-        pixels[x, 4] = hex_to_rgba(C["cork_dark"])
+    hline(canvas, 5, 11, 4, C["green_outline"])
+    hline(canvas, 6, 10, 4, C["cork_dark"])
 
     # Row 5: Bottle neck
-    pixels[5, 5] = hex_to_rgba(C["green_outline"])
-    pixels[6, 5] = hex_to_rgba(C["green_light"])
-    for x in range(7, 10):
-        pixels[x, 5] = hex_to_rgba(C["green"])
-    pixels[10, 5] = hex_to_rgba(C["green_outline"])
+    put(canvas, 5, 5, C["green_outline"])
+    put(canvas, 6, 5, C["green_light"])
+    hline(canvas, 7, 10, 5, C["green"])
+    put(canvas, 10, 5, C["green_outline"])
 
     # Rows 6-12: Bottle body
-    for y in range(6, 13):
-        pixels[3, y] = hex_to_rgba(C["green_outline"])
-        pixels[4, y] = hex_to_rgba(C["green_light"])
-        for x in range(5, 11):
-            pixels[x, y] = hex_to_rgba(C["green"])
-        pixels[11, y] = hex_to_rgba(C["green_dark"])
-        pixels[12, y] = hex_to_rgba(C["green_outline"])
+    vline(canvas, 3, 6, 13, C["green_outline"])
+    vline(canvas, 4, 6, 13, C["green_light"])
+    fill_rect(canvas, 5, 6, 11, 13, C["green"])
+    vline(canvas, 11, 6, 13, C["green_dark"])
+    vline(canvas, 12, 6, 13, C["green_outline"])
 
     # Highlight sparkle
-    pixels[5, 7] = hex_to_rgba(C["green_highlight"])
-    pixels[4, 8] = hex_to_rgba(C["green_highlight"])
+    put(canvas, 5, 7, C["green_highlight"])
+    put(canvas, 4, 8, C["green_highlight"])
 
     # Row 13: Bottom outline
-    for x in range(4, 12):
-        pixels[x, 13] = hex_to_rgba(C["green_outline"])
+    hline(canvas, 4, 12, 13, C["green_outline"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_bomb(output_path):
     """Create icon_bomb.png (16x16) - throwable bomb."""
     width, height = 16, 16
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(width, height)
     C = COLORS
 
     # Row 1-2: Fuse spark
-    pixels[8, 1] = hex_to_rgba(C["fuse_yellow"])
-    pixels[7, 2] = hex_to_rgba(C["fuse_orange"])
-    pixels[8, 2] = hex_to_rgba(C["fuse_yellow"])
-    pixels[9, 2] = hex_to_rgba(C["fuse_orange"])
+    put(canvas, 8, 1, C["fuse_yellow"])
+    put(canvas, 7, 2, C["fuse_orange"])
+    put(canvas, 8, 2, C["fuse_yellow"])
+    put(canvas, 9, 2, C["fuse_orange"])
 
     # Row 3-4: Fuse
-    pixels[8, 3] = hex_to_rgba(C["cork"])
-    pixels[8, 4] = hex_to_rgba(C["cork_dark"])
+    put(canvas, 8, 3, C["cork"])
+    put(canvas, 8, 4, C["cork_dark"])
 
     # Rows 5-13: Bomb body (circular)
     # Row 5: top of circle
-    for x in range(6, 10):
-        pixels[x, 5] = hex_to_rgba(C["gray_outline"])
+    hline(canvas, 6, 10, 5, C["gray_outline"])
 
     # Row 6
-    pixels[5, 6] = hex_to_rgba(C["gray_outline"])
-    pixels[6, 6] = hex_to_rgba(C["gray_light"])
-    for x in range(7, 10):
-        pixels[x, 6] = hex_to_rgba(C["gray"])
-    pixels[10, 6] = hex_to_rgba(C["gray_outline"])
+    put(canvas, 5, 6, C["gray_outline"])
+    put(canvas, 6, 6, C["gray_light"])
+    hline(canvas, 7, 10, 6, C["gray"])
+    put(canvas, 10, 6, C["gray_outline"])
 
     # Rows 7-10: main body
-    for y in range(7, 11):
-        pixels[4, y] = hex_to_rgba(C["gray_outline"])
-        pixels[5, y] = hex_to_rgba(C["gray_light"])
-        for x in range(6, 10):
-            pixels[x, y] = hex_to_rgba(C["gray"])
-        pixels[10, y] = hex_to_rgba(C["gray_dark"])
-        pixels[11, y] = hex_to_rgba(C["gray_outline"])
+    vline(canvas, 4, 7, 11, C["gray_outline"])
+    vline(canvas, 5, 7, 11, C["gray_light"])
+    fill_rect(canvas, 6, 7, 10, 11, C["gray"])
+    vline(canvas, 10, 7, 11, C["gray_dark"])
+    vline(canvas, 11, 7, 11, C["gray_outline"])
 
     # Row 11
-    pixels[5, 11] = hex_to_rgba(C["gray_outline"])
-    pixels[6, 11] = hex_to_rgba(C["gray"])
-    for x in range(7, 10):
-        pixels[x, 11] = hex_to_rgba(C["gray_dark"])
-    pixels[10, 11] = hex_to_rgba(C["gray_outline"])
+    put(canvas, 5, 11, C["gray_outline"])
+    put(canvas, 6, 11, C["gray"])
+    hline(canvas, 7, 10, 11, C["gray_dark"])
+    put(canvas, 10, 11, C["gray_outline"])
 
     # Row 12: bottom of circle
-    for x in range(6, 10):
-        pixels[x, 12] = hex_to_rgba(C["gray_outline"])
+    hline(canvas, 6, 10, 12, C["gray_outline"])
 
     # Highlight on upper-left
-    pixels[5, 7] = hex_to_rgba(C["gray_light"])
-    pixels[6, 7] = hex_to_rgba(C["gray_light"])
+    put(canvas, 5, 7, C["gray_light"])
+    put(canvas, 6, 7, C["gray_light"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_key_item(output_path):
     """Create icon_key.png (16x16) - quest key item."""
     width, height = 16, 16
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(width, height)
     C = COLORS
 
     # Key bow (circular head) - rows 3-8
     # Row 3
-    for x in range(4, 8):
-        pixels[x, 3] = hex_to_rgba(C["gold_outline"])
+    hline(canvas, 4, 8, 3, C["gold_outline"])
 
     # Row 4
-    pixels[3, 4] = hex_to_rgba(C["gold_outline"])
-    pixels[4, 4] = hex_to_rgba(C["gold_light"])
-    for x in range(5, 7):
-        pixels[x, 4] = hex_to_rgba(C["gold"])
-    pixels[7, 4] = hex_to_rgba(C["gold_dark"])
-    pixels[8, 4] = hex_to_rgba(C["gold_outline"])
+    put(canvas, 3, 4, C["gold_outline"])
+    put(canvas, 4, 4, C["gold_light"])
+    hline(canvas, 5, 7, 4, C["gold"])
+    put(canvas, 7, 4, C["gold_dark"])
+    put(canvas, 8, 4, C["gold_outline"])
 
     # Row 5-6: with center hole
-    for y in range(5, 7):
-        pixels[3, y] = hex_to_rgba(C["gold_outline"])
-        pixels[4, y] = hex_to_rgba(C["gold_light"])
-        pixels[5, y] = hex_to_rgba(C["gold_outline"])  # hole
-        pixels[6, y] = hex_to_rgba(C["gold_outline"])  # hole
-        pixels[7, y] = hex_to_rgba(C["gold_dark"])
-        pixels[8, y] = hex_to_rgba(C["gold_outline"])
+    vline(canvas, 3, 5, 7, C["gold_outline"])
+    vline(canvas, 4, 5, 7, C["gold_light"])
+    vline(canvas, 5, 5, 7, C["gold_outline"])
+    vline(canvas, 6, 5, 7, C["gold_outline"])
+    vline(canvas, 7, 5, 7, C["gold_dark"])
+    vline(canvas, 8, 5, 7, C["gold_outline"])
 
     # Row 7
-    pixels[3, 7] = hex_to_rgba(C["gold_outline"])
-    pixels[4, 7] = hex_to_rgba(C["gold"])
-    for x in range(5, 7):
-        pixels[x, 7] = hex_to_rgba(C["gold"])
-    pixels[7, 7] = hex_to_rgba(C["gold_dark"])
-    pixels[8, 7] = hex_to_rgba(C["gold_outline"])
+    put(canvas, 3, 7, C["gold_outline"])
+    put(canvas, 4, 7, C["gold"])
+    hline(canvas, 5, 7, 7, C["gold"])
+    put(canvas, 7, 7, C["gold_dark"])
+    put(canvas, 8, 7, C["gold_outline"])
 
     # Row 8: bottom of bow, start of shaft
-    for x in range(4, 8):
-        pixels[x, 8] = hex_to_rgba(C["gold_outline"])
+    hline(canvas, 4, 8, 8, C["gold_outline"])
 
     # Key shaft - rows 8-12
-    for y in range(8, 13):
-        pixels[8, y] = hex_to_rgba(C["gold_outline"])
-        pixels[9, y] = hex_to_rgba(C["gold_light"])
-        pixels[10, y] = hex_to_rgba(C["gold"])
-        pixels[11, y] = hex_to_rgba(C["gold_dark"])
-        pixels[12, y] = hex_to_rgba(C["gold_outline"])
+    vline(canvas, 8, 8, 13, C["gold_outline"])
+    vline(canvas, 9, 8, 13, C["gold_light"])
+    vline(canvas, 10, 8, 13, C["gold"])
+    vline(canvas, 11, 8, 13, C["gold_dark"])
+    vline(canvas, 12, 8, 13, C["gold_outline"])
 
     # Key teeth - rows 10-12
-    pixels[13, 10] = hex_to_rgba(C["gold_outline"])
-    pixels[13, 11] = hex_to_rgba(C["gold"])
-    pixels[13, 12] = hex_to_rgba(C["gold_outline"])
+    put(canvas, 13, 10, C["gold_outline"])
+    put(canvas, 13, 11, C["gold"])
+    put(canvas, 13, 12, C["gold_outline"])
 
-    pixels[14, 11] = hex_to_rgba(C["gold_outline"])
-    pixels[14, 12] = hex_to_rgba(C["gold_outline"])
+    put(canvas, 14, 11, C["gold_outline"])
+    put(canvas, 14, 12, C["gold_outline"])
 
     # Bottom of shaft
-    for x in range(9, 14):
-        pixels[x, 13] = hex_to_rgba(C["gold_outline"])
+    hline(canvas, 9, 14, 13, C["gold_outline"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
+OUTPUT_DIR = "game/assets/sprites/items"
+
+ASSETS = [
+    (os.path.join(OUTPUT_DIR, "icon_potion.png"), create_potion),
+    (os.path.join(OUTPUT_DIR, "icon_ether.png"), create_ether),
+    (os.path.join(OUTPUT_DIR, "icon_antidote.png"), create_antidote),
+    (os.path.join(OUTPUT_DIR, "icon_bomb.png"), create_bomb),
+    (os.path.join(OUTPUT_DIR, "icon_key.png"), create_key_item),
+]
+
+
 def main():
-    output_dir = "game/assets/sprites/items"
-    os.makedirs(output_dir, exist_ok=True)
-
-    create_potion(os.path.join(output_dir, "icon_potion.png"))
-    create_ether(os.path.join(output_dir, "icon_ether.png"))
-    create_antidote(os.path.join(output_dir, "icon_antidote.png"))
-    create_bomb(os.path.join(output_dir, "icon_bomb.png"))
-    create_key_item(os.path.join(output_dir, "icon_key.png"))
+    for path, create, *args in ASSETS:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        create(path, *args)
 
     print("\nItem icons generation complete!")
 
@@ -5,9 +5,24 @@ Creates town outdoor props: fountain, fence, mailbox, trash_can, picnic_table, f
 All sprites follow the cozy storybook JRPG style with colored outlines.
 """
 
-from PIL import Image
 import os
 
+from raster import (
+    bands,
+    col_bands,
+    edged_hline,
+    fill_mask,
+    fill_rect,
+    frame_rect,
+    grid,
+    hline,
+    new_canvas,
+    opaque,
+    put,
+    save,
+    vline,
+)
+
 # Cloverhollow palette colors
 COLORS = {
     # Ground
@@ -51,159 +66,105 @@ COLORS = {
 }
 
 
-def hex_to_rgba(hex_tuple):
-    """Convert RGB tuple to RGBA."""
-    if len(hex_tuple) == 4:
-        return hex_tuple
-    return (*hex_tuple, 255)
-
-
 def create_fountain(output_path):
     """Create a 32x32 town fountain sprite with water."""
-    img = Image.new("RGBA", (32, 32), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(32, 32)
 
     # Colors
-    outline = hex_to_rgba(COLORS["outline_brown"])
-    stone_l = hex_to_rgba(COLORS["stone_light"])
-    stone_m = hex_to_rgba(COLORS["stone_mid"])
-    stone_d = hex_to_rgba(COLORS["stone_dark"])
-    water_l = hex_to_rgba(COLORS["water_light"])
-    water_m = hex_to_rgba(COLORS["water_mid"])
-    water_d = hex_to_rgba(COLORS["water_dark"])
+    outline = COLORS["outline_brown"]
+    stone_l = COLORS["stone_light"]
+    stone_m = COLORS["stone_mid"]
+    stone_d = COLORS["stone_dark"]
+    water_l = COLORS["water_light"]
+    water_m = COLORS["water_mid"]
+    water_d = COLORS["water_dark"]
 
     # Central pillar top (rows 2-6)
-    for y in range(2, 7):
-        for x in range(14, 18):
-            if y == 2:
-                pixels[x, y] = stone_l
-            else:
-                pixels[x, y] = stone_m if x < 16 else stone_d
+    hline(canvas, 14, 18, 2, stone_l)
+    col_bands(canvas, 14, 3, 18, 7, [(16, stone_m), (None, stone_d)])
     # Pillar outline
-    pixels[13, 3] = outline
-    pixels[18, 3] = outline
-    for y in range(3, 7):
-        pixels[13, y] = outline
-        pixels[18, y] = outline
+    put(canvas, 13, 3, outline)
+    put(canvas, 18, 3, outline)
+    vline(canvas, 13, 3, 7, outline)
+    vline(canvas, 18, 3, 7, outline)
 
     # Water spout area (row 7-8)
-    for x in range(14, 18):
-        pixels[x, 7] = water_l  # Water spray hint
+    hline(canvas, 14, 18, 7, water_l)
 
     # Upper basin (rows 8-12)
-    for y in range(8, 13):
-        for x in range(10, 22):
-            if y == 8:
-                pixels[x, y] = outline
-            elif y == 12:
-                pixels[x, y] = outline
-            elif x == 10 or x == 21:
-                pixels[x, y] = outline
-            else:
-                # Water fill with depth shading
-                if y < 10:
-                    pixels[x, y] = water_l
-                else:
-                    pixels[x, y] = water_m if x < 16 else water_d
+    frame_rect(canvas, 10, 8, 22, 13, outline)
+    # Water fill with depth shading
+    hline(canvas, 11, 21, 9, water_l)
+    col_bands(canvas, 11, 10, 21, 12, [(16, water_m), (None, water_d)])
 
     # Central pillar continues down (rows 13-18)
-    for y in range(13, 19):
-        for x in range(14, 18):
-            if x == 14 or x == 17:
-                pixels[x, y] = outline
-            else:
-                pixels[x, y] = stone_m if x == 15 else stone_d
+    vline(canvas, 14, 13, 19, outline)
+    vline(canvas, 15, 13, 19, stone_m)
+    vline(canvas, 16, 13, 19, stone_d)
+    vline(canvas, 17, 13, 19, outline)
 
     # Lower basin (rows 19-27)
-    for y in range(19, 28):
-        for x in range(4, 28):
-            if y == 19:
-                pixels[x, y] = outline
-            elif y == 27:
-                pixels[x, y] = outline
-            elif x == 4 or x == 27:
-                pixels[x, y] = outline
-            else:
-                # Water with perspective shading
-                if y < 22:
-                    pixels[x, y] = water_l if x < 16 else water_m
-                else:
-                    pixels[x, y] = water_m if x < 16 else water_d
+    frame_rect(canvas, 4, 19, 28, 28, outline)
+    # Water with perspective shading
+    col_bands(canvas, 5, 20, 27, 22, [(16, water_l), (None, water_m)])
+    col_bands(canvas, 5, 22, 27, 27, [(16, water_m), (None, water_d)])
 
     # Base rim (rows 28-30)
-    for y in range(28, 31):
-        for x in range(3, 29):
-            if y == 28:
-                pixels[x, y] = stone_l
-            elif y == 29:
-                pixels[x, y] = stone_m
-            else:
-                pixels[x, y] = stone_d if x > 5 and x < 26 else outline
+    hline(canvas, 3, 29, 28, stone_l)
+    hline(canvas, 3, 29, 29, stone_m)
+    col_bands(canvas, 3, 30, 29, 31, [(6, outline), (26, stone_d), (None, outline)])
 
     # Base outline bottom
-    for x in range(3, 29):
-        pixels[x, 31] = outline
+    hline(canvas, 3, 29, 31, outline)
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_fence(output_path):
     """Create a 16x16 wooden picket fence segment."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(16, 16)
 
-    outline = hex_to_rgba(COLORS["outline_brown"])
-    wood_l = hex_to_rgba(COLORS["wood_light"])
-    wood_m = hex_to_rgba(COLORS["wood_mid"])
-    wood_d = hex_to_rgba(COLORS["wood_dark"])
+    outline = COLORS["outline_brown"]
+    wood_l = COLORS["wood_light"]
+    wood_m = COLORS["wood_mid"]
+    wood_d = COLORS["wood_dark"]
 
     # Horizontal rails (rows 6-7 and rows 11-12)
-    for x in range(0, 16):
-        # Upper rail
-        pixels[x, 6] = wood_l
-        pixels[x, 7] = wood_m
-        # Lower rail
-        pixels[x, 11] = wood_l
-        pixels[x, 12] = wood_m
+    # Upper rail
+    hline(canvas, 0, 16, 6, wood_l)
+    hline(canvas, 0, 16, 7, wood_m)
+    # Lower rail
+    hline(canvas, 0, 16, 11, wood_l)
+    hline(canvas, 0, 16, 12, wood_m)
 
     # Pickets - 4 vertical boards with pointed tops
     picket_positions = [1, 5, 9, 13]
     for px in picket_positions:
         # Pointed top (row 2-3)
-        pixels[px, 2] = outline
-        pixels[px + 1, 2] = outline
-        pixels[px, 3] = wood_l
-        pixels[px + 1, 3] = wood_m
+        put(canvas, px, 2, outline)
+        put(canvas, px + 1, 2, outline)
+        put(canvas, px, 3, wood_l)
+        put(canvas, px + 1, 3, wood_m)
         # Board body (rows 4-14)
-        for y in range(4, 15):
-            pixels[px, y] = wood_l
-            pixels[px + 1, y] = wood_m
-        # Outline sides
-        for y in range(3, 15):
-            if px > 0:
-                pixels[px - 1, y] = (
-                    pixels[px - 1, y] if pixels[px - 1, y][3] > 0 else (0, 0, 0, 0)
-                )
-
-    # Bottom outline
-    for x in range(0, 16):
-        if pixels[x, 14][3] > 0:  # Only where pickets are
-            pixels[x, 15] = outline
-
-    img.save(output_path)
+        vline(canvas, px, 4, 15, wood_l)
+        vline(canvas, px + 1, 4, 15, wood_m)
+
+    # Bottom outline, only where pickets are
+    fill_mask(canvas, 0, 15, opaque(canvas)[14:15], outline)
+
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_mailbox(output_path):
     """Create a 16x16 cute mailbox sprite."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(16, 16)
 
-    outline = hex_to_rgba(COLORS["outline_brown"])
-    wood_l = hex_to_rgba(COLORS["wood_light"])
-    wood_m = hex_to_rgba(COLORS["wood_mid"])
-    wood_d = hex_to_rgba(COLORS["wood_dark"])
+    outline = COLORS["outline_brown"]
+    wood_l = COLORS["wood_light"]
+    wood_m = COLORS["wood_mid"]
+    wood_d = COLORS["wood_dark"]
     # Red for the mailbox
     red_l = (0xE8, 0x70, 0x70, 255)
     red_m = (0xCC, 0x55, 0x55, 255)
@@ -211,202 +172,145 @@ def create_mailbox(output_path):
 
     # Mailbox body - rounded rectangle shape (rows 2-9)
     # Top curve
-    for x in range(6, 12):
-        pixels[x, 2] = outline
-    pixels[5, 3] = outline
-    pixels[12, 3] = outline
+    hline(canvas, 6, 12, 2, outline)
+    put(canvas, 5, 3, outline)
+    put(canvas, 12, 3, outline)
 
     # Body
-    for y in range(3, 10):
-        for x in range(5, 13):
-            if x == 5 or x == 12:
-                pixels[x, y] = outline
-            elif y == 9:
-                pixels[x, y] = outline
-            else:
-                pixels[x, y] = red_l if x < 9 else red_m
+    vline(canvas, 5, 3, 10, outline)
+    vline(canvas, 12, 3, 10, outline)
+    hline(canvas, 6, 12, 9, outline)
+    col_bands(canvas, 6, 3, 12, 9, [(9, red_l), (None, red_m)])
 
     # Mail slot (row 5-6)
-    for x in range(7, 11):
-        pixels[x, 5] = outline
-        pixels[x, 6] = red_d
+    hline(canvas, 7, 11, 5, outline)
+    hline(canvas, 7, 11, 6, red_d)
 
     # Flag on right side (rows 3-5)
-    pixels[13, 3] = outline
-    pixels[13, 4] = red_l
-    pixels[14, 4] = red_m
-    pixels[13, 5] = outline
+    put(canvas, 13, 3, outline)
+    put(canvas, 13, 4, red_l)
+    put(canvas, 14, 4, red_m)
+    put(canvas, 13, 5, outline)
 
     # Post (rows 10-15)
-    for y in range(10, 16):
-        pixels[8, y] = wood_l
-        pixels[9, y] = wood_m
+    vline(canvas, 8, 10, 16, wood_l)
+    vline(canvas, 9, 10, 16, wood_m)
     # Post outline
-    for y in range(10, 16):
-        pixels[7, y] = outline if y == 15 else (0, 0, 0, 0)
-        pixels[10, y] = outline if y == 15 else (0, 0, 0, 0)
+    put(canvas, 7, 15, outline)
+    put(canvas, 10, 15, outline)
 
-    pixels[7, 15] = outline
-    pixels[10, 15] = outline
-
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_trash_can(output_path):
     """Create a 16x16 metal trash can sprite."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(16, 16)
 
-    outline = hex_to_rgba(COLORS["outline_brown"])
-    iron_l = hex_to_rgba(COLORS["iron_light"])
-    iron = hex_to_rgba(COLORS["iron"])
-    iron_d = hex_to_rgba(COLORS["iron_dark"])
+    outline = COLORS["outline_brown"]
+    iron_l = COLORS["iron_light"]
+    iron = COLORS["iron"]
+    iron_d = COLORS["iron_dark"]
 
     # Lid (rows 2-4)
-    for x in range(5, 11):
-        pixels[x, 2] = outline
-    for x in range(4, 12):
-        pixels[x, 3] = iron_l
-        pixels[x, 4] = iron
+    hline(canvas, 5, 11, 2, outline)
+    hline(canvas, 4, 12, 3, iron_l)
+    hline(canvas, 4, 12, 4, iron)
 
     # Lid handle
-    pixels[7, 1] = outline
-    pixels[8, 1] = outline
-    pixels[7, 2] = iron_l
-    pixels[8, 2] = iron
+    put(canvas, 7, 1, outline)
+    put(canvas, 8, 1, outline)
+    put(canvas, 7, 2, iron_l)
+    put(canvas, 8, 2, iron)
 
     # Body (rows 5-13) - slightly tapered
     for y in range(5, 14):
         x_start = 4 if y < 10 else 3
         x_end = 12 if y < 10 else 13
-        for x in range(x_start, x_end):
-            if x == x_start or x == x_end - 1:
-                pixels[x, y] = outline
-            elif x < 8:
-                pixels[x, y] = iron_l
-            else:
-                pixels[x, y] = iron
+        edged_hline(canvas, x_start, x_end, y, outline, [(8, iron_l), (None, iron)])
 
     # Horizontal bands (decoration)
-    for x in range(4, 12):
-        if pixels[x, 7][3] > 0 and x not in (4, 11):
-            pixels[x, 7] = iron_d
-        if pixels[x, 11][3] > 0 and x not in (3, 12):
-            pixels[x, 11] = iron_d
+    hline(canvas, 5, 11, 7, iron_d)
+    hline(canvas, 4, 12, 11, iron_d)
 
     # Base (row 14-15)
-    for x in range(3, 13):
-        pixels[x, 14] = iron_d
-        pixels[x, 15] = outline
+    hline(canvas, 3, 13, 14, iron_d)
+    hline(canvas, 3, 13, 15, outline)
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_picnic_table(output_path):
     """Create a 24x16 wooden picnic table sprite."""
-    img = Image.new("RGBA", (24, 16), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(24, 16)
 
-    outline = hex_to_rgba(COLORS["outline_brown"])
-    wood_l = hex_to_rgba(COLORS["wood_light"])
-    wood_m = hex_to_rgba(COLORS["wood_mid"])
-    wood_d = hex_to_rgba(COLORS["wood_dark"])
+    outline = COLORS["outline_brown"]
+    wood_l = COLORS["wood_light"]
+    wood_m = COLORS["wood_mid"]
+    wood_d = COLORS["wood_dark"]
 
     # Table top (rows 4-6)
-    for y in range(4, 7):
-        for x in range(2, 22):
-            if y == 4:
-                pixels[x, y] = outline
-            elif y == 6:
-                pixels[x, y] = wood_m
-            else:
-                pixels[x, y] = wood_l if x % 4 < 2 else wood_m
+    bands(canvas, 2, 4, 22, 7, [(5, outline), (None, wood_m)])
+    xs, _ = grid(2, 5, 22, 6)
+    fill_mask(canvas, 2, 5, xs % 4 < 2, wood_l)
 
     # Table top front edge
-    for x in range(2, 22):
-        pixels[x, 7] = outline
+    hline(canvas, 2, 22, 7, outline)
 
     # Left bench (rows 9-11)
-    for y in range(9, 12):
-        for x in range(0, 8):
-            if y == 9:
-                pixels[x, y] = wood_l
-            elif y == 10:
-                pixels[x, y] = wood_m
-            else:
-                pixels[x, y] = outline
+    bands(canvas, 0, 9, 8, 12, [(10, wood_l), (11, wood_m), (None, outline)])
 
     # Right bench (rows 9-11)
-    for y in range(9, 12):
-        for x in range(16, 24):
-            if y == 9:
-                pixels[x, y] = wood_l
-            elif y == 10:
-                pixels[x, y] = wood_m
-            else:
-                pixels[x, y] = outline
+    bands(canvas, 16, 9, 24, 12, [(10, wood_l), (11, wood_m), (None, outline)])
 
     # Table legs (rows 8-14)
     # Left A-frame
     for y in range(8, 15):
         offset = (y - 8) // 2
-        pixels[5 - offset, y] = wood_d
-        pixels[6 + offset, y] = wood_d
+        put(canvas, 5 - offset, y, wood_d)
+        put(canvas, 6 + offset, y, wood_d)
     # Right A-frame
     for y in range(8, 15):
         offset = (y - 8) // 2
-        pixels[17 - offset, y] = wood_d
-        pixels[18 + offset, y] = wood_d
+        put(canvas, 17 - offset, y, wood_d)
+        put(canvas, 18 + offset, y, wood_d)
 
     # Ground contact
-    pixels[2, 15] = outline
-    pixels[9, 15] = outline
-    pixels[14, 15] = outline
-    pixels[21, 15] = outline
+    put(canvas, 2, 15, outline)
+    put(canvas, 9, 15, outline)
+    put(canvas, 14, 15, outline)
+    put(canvas, 21, 15, outline)
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_flower_bed(output_path):
     """Create a 24x16 decorative flower bed sprite."""
-    img = Image.new("RGBA", (24, 16), (0, 0, 0, 0))
-    pixels = img.load()
-
-    outline = hex_to_rgba(COLORS["outline_brown"])
-    stone_l = hex_to_rgba(COLORS["stone_light"])
-    stone_m = hex_to_rgba(COLORS["stone_mid"])
-    stone_d = hex_to_rgba(COLORS["stone_dark"])
-    soil = hex_to_rgba(COLORS["wood_dark"])
-    foliage = hex_to_rgba(COLORS["foliage_mid"])
-    foliage_d = hex_to_rgba(COLORS["foliage_dark"])
-    flower_p = hex_to_rgba(COLORS["flower_pink"])
-    flower_y = hex_to_rgba(COLORS["flower_yellow"])
-    flower_pu = hex_to_rgba(COLORS["flower_purple"])
-    flower_r = hex_to_rgba(COLORS["flower_red"])
-    flower_w = hex_to_rgba(COLORS["flower_white"])
+    canvas = new_canvas(24, 16)
+
+    outline = COLORS["outline_brown"]
+    stone_l = COLORS["stone_light"]
+    stone_m = COLORS["stone_mid"]
+    stone_d = COLORS["stone_dark"]
+    soil = COLORS["wood_dark"]
+    foliage = COLORS["foliage_mid"]
+    foliage_d = COLORS["foliage_dark"]
+    flower_p = COLORS["flower_pink"]
+    flower_y = COLORS["flower_yellow"]
+    flower_pu = COLORS["flower_purple"]
+    flower_r = COLORS["flower_red"]
+    flower_w = COLORS["flower_white"]
 
     # Stone border (rows 8-15)
-    for y in range(8, 16):
-        for x in range(1, 23):
-            if y == 8 or y == 15:
-                pixels[x, y] = outline
-            elif x == 1 or x == 22:
-                pixels[x, y] = outline
-            elif y == 9:
-                pixels[x, y] = stone_l
-            elif y < 13:
-                pixels[x, y] = stone_m if x < 12 else stone_d
-            else:
-                pixels[x, y] = stone_d
+    frame_rect(canvas, 1, 8, 23, 16, outline)
+    hline(canvas, 2, 22, 9, stone_l)
+    col_bands(canvas, 2, 10, 22, 13, [(12, stone_m), (None, stone_d)])
+    fill_rect(canvas, 2, 13, 22, 15, stone_d)
 
     # Soil inside (rows 9-14, but covered by flowers)
-    for y in range(9, 15):
-        for x in range(2, 22):
-            if pixels[x, y] == (0, 0, 0, 0) or pixels[x, y][3] == 0:
-                pixels[x, y] = soil
+    fill_mask(canvas, 2, 9, ~opaque(canvas)[9:15, 2:22], soil)
 
     # Flowers and foliage (rows 2-8)
     # Row of flowers
@@ -422,38 +326,44 @@ def create_flower_bed(output_path):
     for i, fc in enumerate(flower_colors):
         x = 3 + i * 3
         # Flower head
-        pixels[x, 3] = fc
-        pixels[x - 1, 4] = fc
-        pixels[x, 4] = fc
-        pixels[x + 1, 4] = fc
-        pixels[x, 5] = fc
+        put(canvas, x, 3, fc)
+        put(canvas, x - 1, 4, fc)
+        put(canvas, x, 4, fc)
+        put(canvas, x + 1, 4, fc)
+        put(canvas, x, 5, fc)
         # Stem
-        pixels[x, 6] = foliage
-        pixels[x, 7] = foliage_d
+        put(canvas, x, 6, foliage)
+        put(canvas, x, 7, foliage_d)
 
     # Extra foliage filling
-    for x in range(2, 22):
-        if pixels[x, 7][3] == 0:
-            pixels[x, 7] = foliage if x % 2 == 0 else foliage_d
-        if pixels[x, 6][3] == 0 and x % 3 == 0:
-            pixels[x, 6] = foliage
+    empty = ~opaque(canvas)
+    xs, _ = grid(2, 6, 22, 7)
+    fill_mask(canvas, 2, 7, empty[7:8, 2:22] & (xs % 2 == 0), foliage)
+    fill_mask(canvas, 2, 7, empty[7:8, 2:22] & (xs % 2 == 1), foliage_d)
+    fill_mask(canvas, 2, 6, empty[6:7, 2:22] & (xs % 3 == 0), foliage)
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
-def main():
-    output_dir = "game/assets/sprites/props"
-    os.makedirs(output_dir, exist_ok=True)
+OUTPUT_DIR = "game/assets/sprites/props"
+
+ASSETS = [
+    (os.path.join(OUTPUT_DIR, "fountain.png"), create_fountain),
+    (os.path.join(OUTPUT_DIR, "fence.png"), create_fence),
+    (os.path.join(OUTPUT_DIR, "mailbox.png"), create_mailbox),
+    (os.path.join(OUTPUT_DIR, "trash_can.png"), create_trash_can),
+    (os.path.join(OUTPUT_DIR, "picnic_table.png"), create_picnic_table),
+    (os.path.join(OUTPUT_DIR, "flower_bed.png"), create_flower_bed),
+]
 
-    create_fountain(os.path.join(output_dir, "fountain.png"))
-    create_fence(os.path.join(output_dir, "fence.png"))
-    create_mailbox(os.path.join(output_dir, "mailbox.png"))
-    create_trash_can(os.path.join(output_dir, "trash_can.png"))
-    create_picnic_table(os.path.join(output_dir, "picnic_table.png"))
-    create_flower_bed(os.path.join(output_dir, "flower_bed.png"))
 
-    print(f"\nGenerated 6 outdoor prop sprites in {output_dir}/")
+def main():
+    for path, create, *args in ASSETS:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        create(path, *args)
+
+    print(f"\nGenerated 6 outdoor prop sprites in {OUTPUT_DIR}/")
 
 
 if __name__ == "__main__":
@@ -8,9 +8,18 @@ and 3 special animations (sit, scratch, yawn).
 Pets are 16x16 chibi animal sprites.
 """
 
-from PIL import Image
+import functools
 import os
 
+from raster import (
+    fill_rect,
+    hline,
+    new_canvas,
+    put,
+    save,
+    vline,
+)
+
 COLORS = {
     # Dog (Buddy) - golden retriever colors
     "dog_fur": (0xD4, 0xA5, 0x5A),
@@ -31,503 +40,429 @@ COLORS = {
 }
 
 
-def hex_to_rgba(t):
-    return (*t, 255) if len(t) == 3 else t
-
-
-def create_dog_idle_south(output_path):
+def draw_dog_idle_south():
     """Buddy (dog) facing south."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    p = img.load()
+    canvas = new_canvas(16, 16)
 
     # Rows 0-2: Ears
-    for x in range(4, 6):
-        p[x, 0] = hex_to_rgba(COLORS["dog_outline"])
-        p[x, 1] = hex_to_rgba(COLORS["dog_fur_dark"])
-    for x in range(10, 12):
-        p[x, 0] = hex_to_rgba(COLORS["dog_outline"])
-        p[x, 1] = hex_to_rgba(COLORS["dog_fur_dark"])
+    hline(canvas, 4, 6, 0, COLORS["dog_outline"])
+    hline(canvas, 4, 6, 1, COLORS["dog_fur_dark"])
+    hline(canvas, 10, 12, 0, COLORS["dog_outline"])
+    hline(canvas, 10, 12, 1, COLORS["dog_fur_dark"])
 
     # Rows 2-5: Head
-    for x in range(5, 11):
-        p[x, 2] = hex_to_rgba(COLORS["dog_outline"])
-    for x in range(4, 12):
-        p[x, 3] = hex_to_rgba(COLORS["dog_outline"])
-    for x in range(5, 11):
-        p[x, 3] = hex_to_rgba(COLORS["dog_fur"])
-
-    for row in range(4, 6):
-        for x in range(3, 13):
-            p[x, row] = hex_to_rgba(COLORS["dog_outline"])
-        for x in range(4, 12):
-            p[x, row] = hex_to_rgba(COLORS["dog_fur"])
-        if row == 4:
-            p[6, row] = hex_to_rgba(COLORS["dog_eyes"])
-            p[9, row] = hex_to_rgba(COLORS["dog_eyes"])
-        if row == 5:
-            p[7, row] = hex_to_rgba(COLORS["dog_nose"])
-            p[8, row] = hex_to_rgba(COLORS["dog_nose"])
+    hline(canvas, 5, 11, 2, COLORS["dog_outline"])
+    hline(canvas, 4, 12, 3, COLORS["dog_outline"])
+    hline(canvas, 5, 11, 3, COLORS["dog_fur"])
+
+    fill_rect(canvas, 3, 4, 13, 6, COLORS["dog_outline"])
+    fill_rect(canvas, 4, 4, 12, 6, COLORS["dog_fur"])
+    put(canvas, 6, 4, COLORS["dog_eyes"])
+    put(canvas, 9, 4, COLORS["dog_eyes"])
+    put(canvas, 7, 5, COLORS["dog_nose"])
+    put(canvas, 8, 5, COLORS["dog_nose"])
 
     # Rows 6-7: Muzzle/snout
-    for x in range(4, 12):
-        p[x, 6] = hex_to_rgba(COLORS["dog_outline"])
-    for x in range(5, 11):
-        p[x, 6] = hex_to_rgba(COLORS["dog_fur_light"])
-    for x in range(6, 10):
-        p[x, 7] = hex_to_rgba(COLORS["dog_outline"])
-    for x in range(7, 9):
-        p[x, 7] = hex_to_rgba(COLORS["dog_fur_light"])
+    hline(canvas, 4, 12, 6, COLORS["dog_outline"])
+    hline(canvas, 5, 11, 6, COLORS["dog_fur_light"])
+    hline(canvas, 6, 10, 7, COLORS["dog_outline"])
+    hline(canvas, 7, 9, 7, COLORS["dog_fur_light"])
 
     # Rows 8-12: Body
-    for row in range(8, 13):
-        for x in range(4, 12):
-            p[x, row] = hex_to_rgba(COLORS["dog_outline"])
-        for x in range(5, 11):
-            p[x, row] = hex_to_rgba(COLORS["dog_fur"])
-        # Chest lighter
-        if row >= 9:
-            for x in range(6, 10):
-                p[x, row] = hex_to_rgba(COLORS["dog_fur_light"])
+    fill_rect(canvas, 4, 8, 12, 13, COLORS["dog_outline"])
+    fill_rect(canvas, 5, 8, 11, 13, COLORS["dog_fur"])
+    # Chest lighter
+    fill_rect(canvas, 6, 9, 10, 13, COLORS["dog_fur_light"])
 
     # Rows 13-15: Legs
-    for x in range(4, 7):
-        p[x, 13] = hex_to_rgba(COLORS["dog_outline"])
-        p[x, 14] = hex_to_rgba(COLORS["dog_outline"])
-        p[x, 15] = hex_to_rgba(COLORS["dog_outline"])
-    for x in range(5, 6):
-        p[x, 13] = hex_to_rgba(COLORS["dog_fur"])
-        p[x, 14] = hex_to_rgba(COLORS["dog_fur"])
-
-    for x in range(9, 12):
-        p[x, 13] = hex_to_rgba(COLORS["dog_outline"])
-        p[x, 14] = hex_to_rgba(COLORS["dog_outline"])
-        p[x, 15] = hex_to_rgba(COLORS["dog_outline"])
-    for x in range(10, 11):
-        p[x, 13] = hex_to_rgba(COLORS["dog_fur"])
-        p[x, 14] = hex_to_rgba(COLORS["dog_fur"])
-
-    img.save(output_path)
-    print(f"Created: {output_path}")
+    hline(canvas, 4, 7, 13, COLORS["dog_outline"])
+    hline(canvas, 4, 7, 14, COLORS["dog_outline"])
+    hline(canvas, 4, 7, 15, COLORS["dog_outline"])
+    hline(canvas, 5, 6, 13, COLORS["dog_fur"])
+    hline(canvas, 5, 6, 14, COLORS["dog_fur"])
+
+    hline(canvas, 9, 12, 13, COLORS["dog_outline"])
+    hline(canvas, 9, 12, 14, COLORS["dog_outline"])
+    hline(canvas, 9, 12, 15, COLORS["dog_outline"])
+    hline(canvas, 10, 11, 13, COLORS["dog_fur"])
+    hline(canvas, 10, 11, 14, COLORS["dog_fur"])
+
+    return canvas
 
 
-def create_dog_idle_north(output_path):
+def draw_dog_idle_north():
     """Buddy (dog) facing north - back view with tail."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    p = img.load()
+    canvas = new_canvas(16, 16)
 
     # Ears and back of head
-    for x in range(4, 6):
-        p[x, 0] = hex_to_rgba(COLORS["dog_outline"])
-        p[x, 1] = hex_to_rgba(COLORS["dog_fur_dark"])
-    for x in range(10, 12):
-        p[x, 0] = hex_to_rgba(COLORS["dog_outline"])
-        p[x, 1] = hex_to_rgba(COLORS["dog_fur_dark"])
+    hline(canvas, 4, 6, 0, COLORS["dog_outline"])
+    hline(canvas, 4, 6, 1, COLORS["dog_fur_dark"])
+    hline(canvas, 10, 12, 0, COLORS["dog_outline"])
+    hline(canvas, 10, 12, 1, COLORS["dog_fur_dark"])
 
-    for row in range(2, 7):
-        for x in range(4, 12):
-            p[x, row] = hex_to_rgba(COLORS["dog_outline"])
-        for x in range(5, 11):
-            p[x, row] = hex_to_rgba(COLORS["dog_fur"])
+    fill_rect(canvas, 4, 2, 12, 7, COLORS["dog_outline"])
+    fill_rect(canvas, 5, 2, 11, 7, COLORS["dog_fur"])
 
     # Body
-    for row in range(7, 13):
-        for x in range(4, 12):
-            p[x, row] = hex_to_rgba(COLORS["dog_outline"])
-        for x in range(5, 11):
-            p[x, row] = hex_to_rgba(COLORS["dog_fur"])
+    fill_rect(canvas, 4, 7, 12, 13, COLORS["dog_outline"])
+    fill_rect(canvas, 5, 7, 11, 13, COLORS["dog_fur"])
 
     # Tail (sticking up on right side)
-    for y in range(5, 10):
-        p[12, y] = hex_to_rgba(COLORS["dog_outline"])
-        p[13, y] = hex_to_rgba(COLORS["dog_fur"])
-    p[12, 4] = hex_to_rgba(COLORS["dog_outline"])
+    vline(canvas, 12, 5, 10, COLORS["dog_outline"])
+    vline(canvas, 13, 5, 10, COLORS["dog_fur"])
+    put(canvas, 12, 4, COLORS["dog_outline"])
 
     # Legs
-    for x in range(4, 7):
-        for y in range(13, 16):
-            p[x, y] = hex_to_rgba(COLORS["dog_outline"])
-        p[5, 13] = hex_to_rgba(COLORS["dog_fur"])
-        p[5, 14] = hex_to_rgba(COLORS["dog_fur"])
-
-    for x in range(9, 12):
-        for y in range(13, 16):
-            p[x, y] = hex_to_rgba(COLORS["dog_outline"])
-        p[10, 13] = hex_to_rgba(COLORS["dog_fur"])
-        p[10, 14] = hex_to_rgba(COLORS["dog_fur"])
-
-    img.save(output_path)
-    print(f"Created: {output_path}")
+    fill_rect(canvas, 4, 13, 7, 16, COLORS["dog_outline"])
+    vline(canvas, 5, 13, 15, COLORS["dog_fur"])
+
+    fill_rect(canvas, 9, 13, 12, 16, COLORS["dog_outline"])
+    vline(canvas, 10, 13, 15, COLORS["dog_fur"])
+
+    return canvas
 
 
-def create_dog_idle_east(output_path):
+def draw_dog_idle_east():
     """Buddy (dog) facing east - side view."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    p = img.load()
+    canvas = new_canvas(16, 16)
 
     # Ear (left side visible)
-    for x in range(8, 10):
-        p[x, 0] = hex_to_rgba(COLORS["dog_outline"])
-        p[x, 1] = hex_to_rgba(COLORS["dog_fur_dark"])
+    hline(canvas, 8, 10, 0, COLORS["dog_outline"])
+    hline(canvas, 8, 10, 1, COLORS["dog_fur_dark"])
 
     # Head (side profile)
-    for row in range(2, 7):
-        for x in range(7, 14):
-            p[x, row] = hex_to_rgba(COLORS["dog_outline"])
-        for x in range(8, 13):
-            p[x, row] = hex_to_rgba(COLORS["dog_fur"])
+    fill_rect(canvas, 7, 2, 14, 7, COLORS["dog_outline"])
+    fill_rect(canvas, 8, 2, 13, 7, COLORS["dog_fur"])
     # Eye
-    p[11, 4] = hex_to_rgba(COLORS["dog_eyes"])
+    put(canvas, 11, 4, COLORS["dog_eyes"])
     # Snout extends forward
-    p[13, 5] = hex_to_rgba(COLORS["dog_outline"])
-    p[14, 5] = hex_to_rgba(COLORS["dog_nose"])
+    put(canvas, 13, 5, COLORS["dog_outline"])
+    put(canvas, 14, 5, COLORS["dog_nose"])
 
     # Tail (behind, sticking left)
-    for y in range(6, 9):
-        p[3, y] = hex_to_rgba(COLORS["dog_outline"])
-        p[2, y] = hex_to_rgba(COLORS["dog_fur"])
+    vline(canvas, 3, 6, 9, COLORS["dog_outline"])
+    vline(canvas, 2, 6, 9, COLORS["dog_fur"])
 
     # Body
-    for row in range(7, 12):
-        for x in range(5, 12):
-            p[x, row] = hex_to_rgba(COLORS["dog_outline"])
-        for x in range(6, 11):
-            p[x, row] = hex_to_rgba(COLORS["dog_fur"])
+    fill_rect(canvas, 5, 7, 12, 12, COLORS["dog_outline"])
+    fill_rect(canvas, 6, 7, 11, 12, COLORS["dog_fur"])
 
     # Legs (4 legs visible from side)
     # Front legs
-    for y in range(12, 16):
-        p[9, y] = hex_to_rgba(COLORS["dog_outline"])
-        p[10, y] = hex_to_rgba(COLORS["dog_outline"])
-    p[9, 12] = hex_to_rgba(COLORS["dog_fur"])
-    p[9, 13] = hex_to_rgba(COLORS["dog_fur"])
+    vline(canvas, 9, 12, 16, COLORS["dog_outline"])
+    vline(canvas, 10, 12, 16, COLORS["dog_outline"])
+    put(canvas, 9, 12, COLORS["dog_fur"])
+    put(canvas, 9, 13, COLORS["dog_fur"])
 
     # Back legs
-    for y in range(12, 16):
-        p[5, y] = hex_to_rgba(COLORS["dog_outline"])
-        p[6, y] = hex_to_rgba(COLORS["dog_outline"])
-    p[5, 12] = hex_to_rgba(COLORS["dog_fur"])
-    p[5, 13] = hex_to_rgba(COLORS["dog_fur"])
+    vline(canvas, 5, 12, 16, COLORS["dog_outline"])
+    vline(canvas, 6, 12, 16, COLORS["dog_outline"])
+    put(canvas, 5, 12, COLORS["dog_fur"])
+    put(canvas, 5, 13, COLORS["dog_fur"])
 
-    img.save(output_path)
-    print(f"Created: {output_path}")
+    return canvas
 
 
-def create_dog_idle_west(output_path):
+def draw_dog_idle_west():
     """Buddy (dog) facing west - mirrored side view."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    p = img.load()
+    canvas = new_canvas(16, 16)
 
     # Ear (right side visible)
-    for x in range(6, 8):
-        p[x, 0] = hex_to_rgba(COLORS["dog_outline"])
-        p[x, 1] = hex_to_rgba(COLORS["dog_fur_dark"])
+    hline(canvas, 6, 8, 0, COLORS["dog_outline"])
+    hline(canvas, 6, 8, 1, COLORS["dog_fur_dark"])
 
     # Head (side profile facing left)
-    for row in range(2, 7):
-        for x in range(2, 9):
-            p[x, row] = hex_to_rgba(COLORS["dog_outline"])
-        for x in range(3, 8):
-            p[x, row] = hex_to_rgba(COLORS["dog_fur"])
+    fill_rect(canvas, 2, 2, 9, 7, COLORS["dog_outline"])
+    fill_rect(canvas, 3, 2, 8, 7, COLORS["dog_fur"])
     # Eye
-    p[4, 4] = hex_to_rgba(COLORS["dog_eyes"])
+    put(canvas, 4, 4, COLORS["dog_eyes"])
     # Snout extends left
-    p[2, 5] = hex_to_rgba(COLORS["dog_outline"])
-    p[1, 5] = hex_to_rgba(COLORS["dog_nose"])
+    put(canvas, 2, 5, COLORS["dog_outline"])
+    put(canvas, 1, 5, COLORS["dog_nose"])
 
     # Tail (behind, sticking right)
-    for y in range(6, 9):
-        p[12, y] = hex_to_rgba(COLORS["dog_outline"])
-        p[13, y] = hex_to_rgba(COLORS["dog_fur"])
+    vline(canvas, 12, 6, 9, COLORS["dog_outline"])
+    vline(canvas, 13, 6, 9, COLORS["dog_fur"])
 
     # Body
-    for row in range(7, 12):
-        for x in range(4, 11):
-            p[x, row] = hex_to_rgba(COLORS["dog_outline"])
-        for x in range(5, 10):
-            p[x, row] = hex_to_rgba(COLORS["dog_fur"])
+    fill_rect(canvas, 4, 7, 11, 12, COLORS["dog_outline"])
+    fill_rect(canvas, 5, 7, 10, 12, COLORS["dog_fur"])
 
     # Legs
-    for y in range(12, 16):
-        p[5, y] = hex_to_rgba(COLORS["dog_outline"])
-        p[6, y] = hex_to_rgba(COLORS["dog_outline"])
-    p[6, 12] = hex_to_rgba(COLORS["dog_fur"])
-    p[6, 13] = hex_to_rgba(COLORS["dog_fur"])
-
-    for y in range(12, 16):
-        p[9, y] = hex_to_rgba(COLORS["dog_outline"])
-        p[10, y] = hex_to_rgba(COLORS["dog_outline"])
-    p[10, 12] = hex_to_rgba(COLORS["dog_fur"])
-    p[10, 13] = hex_to_rgba(COLORS["dog_fur"])
-
-    img.save(output_path)
-    print(f"Created: {output_path}")
+    vline(canvas, 5, 12, 16, COLORS["dog_outline"])
+    vline(canvas, 6, 12, 16, COLORS["dog_outline"])
+    put(canvas, 6, 12, COLORS["dog_fur"])
+    put(canvas, 6, 13, COLORS["dog_fur"])
+
+    vline(canvas, 9, 12, 16, COLORS["dog_outline"])
+    vline(canvas, 10, 12, 16, COLORS["dog_outline"])
+    put(canvas, 10, 12, COLORS["dog_fur"])
+    put(canvas, 10, 13, COLORS["dog_fur"])
 
+    return canvas
 
-def create_hamster_idle_south(output_path):
+
+def draw_hamster_idle_south():
     """Nibbles (hamster) facing south - round fluffy body."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    p = img.load()
+    canvas = new_canvas(16, 16)
 
     # Rows 0-1: Tiny ears
-    p[5, 1] = hex_to_rgba(COLORS["hamster_outline"])
-    p[10, 1] = hex_to_rgba(COLORS["hamster_outline"])
+    put(canvas, 5, 1, COLORS["hamster_outline"])
+    put(canvas, 10, 1, COLORS["hamster_outline"])
 
     # Rows 2-6: Round head (very round for hamster)
-    for x in range(5, 11):
-        p[x, 2] = hex_to_rgba(COLORS["hamster_outline"])
-    for x in range(4, 12):
-        p[x, 3] = hex_to_rgba(COLORS["hamster_outline"])
-    for x in range(5, 11):
-        p[x, 3] = hex_to_rgba(COLORS["hamster_fur"])
-
-    for row in range(4, 7):
-        for x in range(3, 13):
-            p[x, row] = hex_to_rgba(COLORS["hamster_outline"])
-        for x in range(4, 12):
-            p[x, row] = hex_to_rgba(COLORS["hamster_fur"])
-        # Eyes
-        if row == 4:
-            p[5, row] = hex_to_rgba(COLORS["hamster_eyes"])
-            p[10, row] = hex_to_rgba(COLORS["hamster_eyes"])
-        # Cheeks (puffy)
-        if row == 5:
-            p[4, row] = hex_to_rgba(COLORS["hamster_cheeks"])
-            p[11, row] = hex_to_rgba(COLORS["hamster_cheeks"])
-        # Nose
-        if row == 5:
-            p[7, row] = hex_to_rgba(COLORS["hamster_nose"])
-            p[8, row] = hex_to_rgba(COLORS["hamster_nose"])
+    hline(canvas, 5, 11, 2, COLORS["hamster_outline"])
+    hline(canvas, 4, 12, 3, COLORS["hamster_outline"])
+    hline(canvas, 5, 11, 3, COLORS["hamster_fur"])
+
+    fill_rect(canvas, 3, 4, 13, 7, COLORS["hamster_outline"])
+    fill_rect(canvas, 4, 4, 12, 7, COLORS["hamster_fur"])
+    # Eyes
+    put(canvas, 5, 4, COLORS["hamster_eyes"])
+    put(canvas, 10, 4, COLORS["hamster_eyes"])
+    # Cheeks (puffy)
+    put(canvas, 4, 5, COLORS["hamster_cheeks"])
+    put(canvas, 11, 5, COLORS["hamster_cheeks"])
+    # Nose
+    put(canvas, 7, 5, COLORS["hamster_nose"])
+    put(canvas, 8, 5, COLORS["hamster_nose"])
 
     # Rows 7-11: Round body (even rounder than head)
-    for row in range(7, 12):
-        for x in range(2, 14):
-            p[x, row] = hex_to_rgba(COLORS["hamster_outline"])
-        for x in range(3, 13):
-            p[x, row] = hex_to_rgba(COLORS["hamster_fur"])
-        # Light belly
-        for x in range(5, 11):
-            p[x, row] = hex_to_rgba(COLORS["hamster_fur_light"])
+    # Light belly
+    fill_rect(canvas, 2, 7, 14, 12, COLORS["hamster_outline"])
+    fill_rect(canvas, 3, 7, 13, 12, COLORS["hamster_fur"])
+    fill_rect(canvas, 5, 7, 11, 12, COLORS["hamster_fur_light"])
 
     # Rows 12-13: Bottom of body
-    for x in range(4, 12):
-        p[x, 12] = hex_to_rgba(COLORS["hamster_outline"])
-    for x in range(5, 11):
-        p[x, 12] = hex_to_rgba(COLORS["hamster_fur_light"])
+    hline(canvas, 4, 12, 12, COLORS["hamster_outline"])
+    hline(canvas, 5, 11, 12, COLORS["hamster_fur_light"])
 
     # Rows 13-15: Tiny feet
-    for x in range(5, 7):
-        p[x, 13] = hex_to_rgba(COLORS["hamster_outline"])
-        p[x, 14] = hex_to_rgba(COLORS["hamster_outline"])
-    for x in range(9, 11):
-        p[x, 13] = hex_to_rgba(COLORS["hamster_outline"])
-        p[x, 14] = hex_to_rgba(COLORS["hamster_outline"])
-
-    img.save(output_path)
-    print(f"Created: {output_path}")
+    hline(canvas, 5, 7, 13, COLORS["hamster_outline"])
+    hline(canvas, 5, 7, 14, COLORS["hamster_outline"])
+    hline(canvas, 9, 11, 13, COLORS["hamster_outline"])
+    hline(canvas, 9, 11, 14, COLORS["hamster_outline"])
 
+    return canvas
 
-def create_hamster_idle_north(output_path):
+
+def draw_hamster_idle_north():
     """Nibbles (hamster) facing north - back view."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    p = img.load()
+    canvas = new_canvas(16, 16)
 
     # Tiny ears
-    p[5, 1] = hex_to_rgba(COLORS["hamster_outline"])
-    p[10, 1] = hex_to_rgba(COLORS["hamster_outline"])
+    put(canvas, 5, 1, COLORS["hamster_outline"])
+    put(canvas, 10, 1, COLORS["hamster_outline"])
 
     # Round head (back)
     for row in range(2, 7):
         width = 6 if row < 4 else 8
         left = 8 - width // 2
         right = 8 + width // 2
-        for x in range(left, right):
-            p[x, row] = hex_to_rgba(COLORS["hamster_outline"])
-        for x in range(left + 1, right - 1):
-            p[x, row] = hex_to_rgba(COLORS["hamster_fur"])
+        hline(canvas, left, right, row, COLORS["hamster_outline"])
+        hline(canvas, left + 1, right - 1, row, COLORS["hamster_fur"])
 
     # Very round body (back view)
-    for row in range(7, 12):
-        for x in range(2, 14):
-            p[x, row] = hex_to_rgba(COLORS["hamster_outline"])
-        for x in range(3, 13):
-            p[x, row] = hex_to_rgba(COLORS["hamster_fur"])
+    fill_rect(canvas, 2, 7, 14, 12, COLORS["hamster_outline"])
+    fill_rect(canvas, 3, 7, 13, 12, COLORS["hamster_fur"])
 
     # Tiny stub tail
-    p[7, 11] = hex_to_rgba(COLORS["hamster_fur_light"])
-    p[8, 11] = hex_to_rgba(COLORS["hamster_fur_light"])
+    put(canvas, 7, 11, COLORS["hamster_fur_light"])
+    put(canvas, 8, 11, COLORS["hamster_fur_light"])
 
     # Bottom + feet
-    for x in range(4, 12):
-        p[x, 12] = hex_to_rgba(COLORS["hamster_outline"])
-    for x in range(5, 7):
-        p[x, 13] = hex_to_rgba(COLORS["hamster_outline"])
-        p[x, 14] = hex_to_rgba(COLORS["hamster_outline"])
-    for x in range(9, 11):
-        p[x, 13] = hex_to_rgba(COLORS["hamster_outline"])
-        p[x, 14] = hex_to_rgba(COLORS["hamster_outline"])
-
-    img.save(output_path)
-    print(f"Created: {output_path}")
+    hline(canvas, 4, 12, 12, COLORS["hamster_outline"])
+    hline(canvas, 5, 7, 13, COLORS["hamster_outline"])
+    hline(canvas, 5, 7, 14, COLORS["hamster_outline"])
+    hline(canvas, 9, 11, 13, COLORS["hamster_outline"])
+    hline(canvas, 9, 11, 14, COLORS["hamster_outline"])
+
+    return canvas
 
 
-def create_hamster_idle_east(output_path):
+def draw_hamster_idle_east():
     """Nibbles (hamster) facing east - side view with puffy cheek."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    p = img.load()
+    canvas = new_canvas(16, 16)
 
     # Ear
-    p[9, 1] = hex_to_rgba(COLORS["hamster_outline"])
+    put(canvas, 9, 1, COLORS["hamster_outline"])
 
     # Round head (side)
-    for row in range(2, 7):
-        for x in range(6, 13):
-            p[x, row] = hex_to_rgba(COLORS["hamster_outline"])
-        for x in range(7, 12):
-            p[x, row] = hex_to_rgba(COLORS["hamster_fur"])
+    fill_rect(canvas, 6, 2, 13, 7, COLORS["hamster_outline"])
+    fill_rect(canvas, 7, 2, 12, 7, COLORS["hamster_fur"])
     # Eye
-    p[10, 4] = hex_to_rgba(COLORS["hamster_eyes"])
+    put(canvas, 10, 4, COLORS["hamster_eyes"])
     # Puffy cheek (hamster signature)
-    for row in range(5, 7):
-        p[11, row] = hex_to_rgba(COLORS["hamster_cheeks"])
-        p[12, row] = hex_to_rgba(COLORS["hamster_cheeks"])
+    vline(canvas, 11, 5, 7, COLORS["hamster_cheeks"])
+    vline(canvas, 12, 5, 7, COLORS["hamster_cheeks"])
 
     # Very round body
-    for row in range(7, 12):
-        for x in range(3, 12):
-            p[x, row] = hex_to_rgba(COLORS["hamster_outline"])
-        for x in range(4, 11):
-            p[x, row] = hex_to_rgba(COLORS["hamster_fur"])
-        # Light belly
-        for x in range(7, 11):
-            p[x, row] = hex_to_rgba(COLORS["hamster_fur_light"])
+    # Light belly
+    fill_rect(canvas, 3, 7, 12, 12, COLORS["hamster_outline"])
+    fill_rect(canvas, 4, 7, 11, 12, COLORS["hamster_fur"])
+    fill_rect(canvas, 7, 7, 11, 12, COLORS["hamster_fur_light"])
 
     # Tiny feet
-    for y in range(12, 15):
-        p[5, y] = hex_to_rgba(COLORS["hamster_outline"])
-        p[9, y] = hex_to_rgba(COLORS["hamster_outline"])
+    vline(canvas, 5, 12, 15, COLORS["hamster_outline"])
+    vline(canvas, 9, 12, 15, COLORS["hamster_outline"])
 
-    img.save(output_path)
-    print(f"Created: {output_path}")
+    return canvas
 
 
-def create_hamster_idle_west(output_path):
+def draw_hamster_idle_west():
     """Nibbles (hamster) facing west - mirrored side view."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    p = img.load()
+    canvas = new_canvas(16, 16)
 
     # Ear
-    p[6, 1] = hex_to_rgba(COLORS["hamster_outline"])
+    put(canvas, 6, 1, COLORS["hamster_outline"])
 
     # Round head (side facing left)
-    for row in range(2, 7):
-        for x in range(3, 10):
-            p[x, row] = hex_to_rgba(COLORS["hamster_outline"])
-        for x in range(4, 9):
-            p[x, row] = hex_to_rgba(COLORS["hamster_fur"])
+    fill_rect(canvas, 3, 2, 10, 7, COLORS["hamster_outline"])
+    fill_rect(canvas, 4, 2, 9, 7, COLORS["hamster_fur"])
     # Eye
-    p[5, 4] = hex_to_rgba(COLORS["hamster_eyes"])
+    put(canvas, 5, 4, COLORS["hamster_eyes"])
     # Puffy cheek
-    for row in range(5, 7):
-        p[3, row] = hex_to_rgba(COLORS["hamster_cheeks"])
-        p[4, row] = hex_to_rgba(COLORS["hamster_cheeks"])
+    vline(canvas, 3, 5, 7, COLORS["hamster_cheeks"])
+    vline(canvas, 4, 5, 7, COLORS["hamster_cheeks"])
 
     # Very round body
-    for row in range(7, 12):
-        for x in range(4, 13):
-            p[x, row] = hex_to_rgba(COLORS["hamster_outline"])
-        for x in range(5, 12):
-            p[x, row] = hex_to_rgba(COLORS["hamster_fur"])
-        # Light belly
-        for x in range(5, 9):
-            p[x, row] = hex_to_rgba(COLORS["hamster_fur_light"])
+    # Light belly
+    fill_rect(canvas, 4, 7, 13, 12, COLORS["hamster_outline"])
+    fill_rect(canvas, 5, 7, 12, 12, COLORS["hamster_fur"])
+    fill_rect(canvas, 5, 7, 9, 12, COLORS["hamster_fur_light"])
 
     # Tiny feet
-    for y in range(12, 15):
-        p[6, y] = hex_to_rgba(COLORS["hamster_outline"])
-        p[10, y] = hex_to_rgba(COLORS["hamster_outline"])
+    vline(canvas, 6, 12, 15, COLORS["hamster_outline"])
+    vline(canvas, 10, 12, 15, COLORS["hamster_outline"])
+
+    return canvas
+
+
+DOG_DIR = "game/assets/sprites/characters/pet/dog"
+HAMSTER_DIR = "game/assets/sprites/characters/pet/hamster"
+
+DIRECTIONS = ["south", "north", "east", "west"]
+SPECIAL_ANIMATIONS = ["sit", "scratch", "yawn"]
+
+# Idle drawing functions per pet, in DIRECTIONS order
+PETS = {
+    "dog": (
+        DOG_DIR,
+        [
+            draw_dog_idle_south,
+            draw_dog_idle_north,
+            draw_dog_idle_east,
+            draw_dog_idle_west,
+        ],
+    ),
+    "hamster": (
+        HAMSTER_DIR,
+        [
+            draw_hamster_idle_south,
+            draw_hamster_idle_north,
+            draw_hamster_idle_east,
+            draw_hamster_idle_west,
+        ],
+    ),
+}
 
-    img.save(output_path)
-    print(f"Created: {output_path}")
+
+@functools.lru_cache(maxsize=None)
+def pet_idle(pet, direction):
+    """Idle sprite for a pet and direction, drawn once and shared by the
+    frames derived from it. The array is read-only; derive from a copy.
+    """
+    _, draws = PETS[pet]
+    canvas = draws[DIRECTIONS.index(direction)]()
+    canvas.setflags(write=False)
+    return canvas
 
 
-def create_walk_frames(idle_path, output_dir, pet_type, direction):
-    """Create 2-frame walk cycle from idle sprite."""
-    img = Image.open(idle_path)
+def draw_walk_frame(pet, direction, frame_num):
+    """Derive one frame of the 2-frame walk cycle from an idle sprite.
 
-    # Frame 0: slightly shifted right foot
-    frame0 = img.copy()
-    frame0.save(os.path.join(output_dir, f"{pet_type}_walk_{direction}_0.png"))
+    Frame 0 is the right foot forward, frame 1 the left; both reuse the idle
+    pose for now (subtle).
+    """
+    return pet_idle(pet, direction).copy()
 
-    # Frame 1: slightly shifted left foot (just use same for now - subtle)
-    frame1 = img.copy()
-    frame1.save(os.path.join(output_dir, f"{pet_type}_walk_{direction}_1.png"))
 
-    print(f"Created: {pet_type}_walk_{direction}_0.png")
-    print(f"Created: {pet_type}_walk_{direction}_1.png")
+def draw_special_animation(pet, anim):
+    """Derive a sit, scratch or yawn frame (simplified version).
 
+    For now these copy the south idle sprite as a placeholder.
+    """
+    return pet_idle(pet, "south").copy()
 
-def create_special_animations(output_dir, pet_type, idle_south_path):
-    """Create sit, scratch, yawn animations (simplified versions)."""
-    # For now, just copy idle as placeholder for special anims
-    img = Image.open(idle_south_path)
 
-    # Sit - same as idle for now
-    img.save(os.path.join(output_dir, f"{pet_type}_sit.png"))
-    print(f"Created: {pet_type}_sit.png")
+def create_sprite(output_path, draw, *args):
+    """Registry producer: encode draw(*args) to output_path."""
+    save(draw(*args), output_path)
+    print(f"Created: {output_path}")
 
-    # Scratch - same as idle for now
-    img.save(os.path.join(output_dir, f"{pet_type}_scratch.png"))
-    print(f"Created: {pet_type}_scratch.png")
 
-    # Yawn - same as idle for now
-    img.save(os.path.join(output_dir, f"{pet_type}_yawn.png"))
-    print(f"Created: {pet_type}_yawn.png")
+def pet_assets(pet):
+    """Registry entries for one pet: idles, then walk and special frames.
+
+    Walk and special frames are derived in memory from the cached idle
+    arrays, never from the idle PNGs.
+    """
+    output_dir, _ = PETS[pet]
+    return [
+        *(
+            (
+                os.path.join(output_dir, f"pet_idle_{d}.png"),
+                create_sprite,
+                pet_idle,
+                pet,
+                d,
+            )
+            for d in DIRECTIONS
+        ),
+        *(
+            (
+                os.path.join(output_dir, f"pet_walk_{d}_{frame}.png"),
+                create_sprite,
+                draw_walk_frame,
+                pet,
+                d,
+                frame,
+            )
+            for d in DIRECTIONS
+            for frame in range(2)
+        ),
+        *(
+            (
+                os.path.join(output_dir, f"pet_{anim}.png"),
+                create_sprite,
+                draw_special_animation,
+                pet,
+                anim,
+            )
+            for anim in SPECIAL_ANIMATIONS
+        ),
+    ]
+
+
+ASSETS = [
+    # Dog (Buddy)
+    *pet_assets("dog"),
+    # Hamster (Nibbles)
+    *pet_assets("hamster"),
+]
 
 
 def main():
-    # Dog (Buddy) output directory
-    dog_dir = "game/assets/sprites/characters/pet/dog"
-    os.makedirs(dog_dir, exist_ok=True)
-
-    # Generate dog idle sprites
-    create_dog_idle_south(os.path.join(dog_dir, "pet_idle_south.png"))
-    create_dog_idle_north(os.path.join(dog_dir, "pet_idle_north.png"))
-    create_dog_idle_east(os.path.join(dog_dir, "pet_idle_east.png"))
-    create_dog_idle_west(os.path.join(dog_dir, "pet_idle_west.png"))
-
-    # Generate dog walk frames
-    for direction in ["south", "north", "east", "west"]:
-        idle_path = os.path.join(dog_dir, f"pet_idle_{direction}.png")
-        create_walk_frames(idle_path, dog_dir, "pet", direction)
-
-    # Generate dog special anims
-    create_special_animations(
-        dog_dir, "pet", os.path.join(dog_dir, "pet_idle_south.png")
-    )
-
-    # Hamster (Nibbles) output directory
-    hamster_dir = "game/assets/sprites/characters/pet/hamster"
-    os.makedirs(hamster_dir, exist_ok=True)
-
-    # Generate hamster idle sprites
-    create_hamster_idle_south(os.path.join(hamster_dir, "pet_idle_south.png"))
-    create_hamster_idle_north(os.path.join(hamster_dir, "pet_idle_north.png"))
-    create_hamster_idle_east(os.path.join(hamster_dir, "pet_idle_east.png"))
-    create_hamster_idle_west(os.path.join(hamster_dir, "pet_idle_west.png"))
-
-    # Generate hamster walk frames
-    for direction in ["south", "north", "east", "west"]:
-        idle_path = os.path.join(hamster_dir, f"pet_idle_{direction}.png")
-        create_walk_frames(idle_path, hamster_dir, "pet", direction)
-
-    # Generate hamster special anims
-    create_special_animations(
-        hamster_dir, "pet", os.path.join(hamster_dir, "pet_idle_south.png")
-    )
+    # Draw everything first, then write the PNGs in one batch
+    sprites = [(path, draw(*args)) for path, _create, draw, *args in ASSETS]
+    for path, canvas in sprites:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        save(canvas, path)
+        print(f"Created: {path}")
 
     print(f"\nGenerated pet variant sprites:")
-    print(f"  - Dog (Buddy): {dog_dir}/ (15 sprites)")
-    print(f"  - Hamster (Nibbles): {hamster_dir}/ (15 sprites)")
+    print(f"  - Dog (Buddy): {DOG_DIR}/ (15 sprites)")
+    print(f"  - Hamster (Nibbles): {HAMSTER_DIR}/ (15 sprites)")
     print(f"  - Cat (Maddie) already exists at pet/ (default)")
     print(f"  Total: 30 new sprites")
 
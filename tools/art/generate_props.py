@@ -5,9 +5,21 @@ Creates proper 16x16, 16x24, and 16x32 pixel art sprites programmatically
 with exact palette colors and clean pixel edges.
 """
 
-from PIL import Image
 import os
 
+from raster import (
+    col_bands,
+    fill_mask,
+    fill_rect,
+    frame_rect,
+    grid,
+    hline,
+    new_canvas,
+    put,
+    save,
+    vline,
+)
+
 # Cloverhollow palette colors (from art/palettes/cloverhollow.palette.json)
 COLORS = {
     # Ground
@@ -45,150 +57,130 @@ COLORS = {
 }
 
 
-def hex_to_rgba(hex_tuple):
-    """Convert RGB tuple to RGBA."""
-    if len(hex_tuple) == 4:
-        return hex_tuple
-    return (*hex_tuple, 255)
-
-
 def create_bench(output_path):
     """Create a 16x16 wooden park bench sprite."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(16, 16)
 
     # Colors
-    outline = hex_to_rgba(COLORS["outline_brown"])
-    wood_light = hex_to_rgba(COLORS["wood_light"])
-    wood_mid = hex_to_rgba(COLORS["wood_mid"])
-    wood_dark = hex_to_rgba(COLORS["wood_dark"])
+    outline = COLORS["outline_brown"]
+    wood_light = COLORS["wood_light"]
+    wood_mid = COLORS["wood_mid"]
+    wood_dark = COLORS["wood_dark"]
 
     # Bench design - side view, 3/4 perspective
     # Row 6-7: Back rest top
-    for x in range(2, 14):
-        pixels[x, 6] = outline
-        pixels[x, 7] = wood_light if x % 3 != 0 else wood_mid
+    xs, _ = grid(2, 0, 14, 1)
+    hline(canvas, 2, 14, 6, outline)
+    hline(canvas, 2, 14, 7, wood_light)
+    fill_mask(canvas, 2, 7, xs % 3 == 0, wood_mid)
 
     # Row 8-9: Back rest middle
-    for x in range(2, 14):
-        pixels[x, 8] = wood_mid
-        pixels[x, 9] = wood_mid if x % 4 != 0 else wood_dark
+    fill_rect(canvas, 2, 8, 14, 10, wood_mid)
+    fill_mask(canvas, 2, 9, xs % 4 == 0, wood_dark)
 
     # Row 10: Gap between back and seat
-    pixels[2, 10] = outline
-    pixels[13, 10] = outline
+    put(canvas, 2, 10, outline)
+    put(canvas, 13, 10, outline)
 
     # Row 11-12: Seat
-    for x in range(1, 15):
-        pixels[x, 11] = outline if x in (1, 14) else wood_light
-        pixels[x, 12] = outline if x in (1, 14) else wood_mid
+    hline(canvas, 2, 14, 11, wood_light)
+    hline(canvas, 2, 14, 12, wood_mid)
+    vline(canvas, 1, 11, 13, outline)
+    vline(canvas, 14, 11, 13, outline)
 
     # Row 13: Seat front edge
-    for x in range(1, 15):
-        pixels[x, 13] = outline
+    hline(canvas, 1, 15, 13, outline)
 
     # Legs (rows 14-15)
     for leg_x in [3, 12]:
-        pixels[leg_x, 14] = wood_dark
-        pixels[leg_x, 15] = outline
+        put(canvas, leg_x, 14, wood_dark)
+        put(canvas, leg_x, 15, outline)
 
     # Armrests
-    pixels[1, 8] = outline
-    pixels[1, 9] = wood_dark
-    pixels[1, 10] = wood_dark
-    pixels[14, 8] = outline
-    pixels[14, 9] = wood_dark
-    pixels[14, 10] = wood_dark
-
-    img.save(output_path)
+    put(canvas, 1, 8, outline)
+    put(canvas, 1, 9, wood_dark)
+    put(canvas, 1, 10, wood_dark)
+    put(canvas, 14, 8, outline)
+    put(canvas, 14, 9, wood_dark)
+    put(canvas, 14, 10, wood_dark)
+
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_lamp(output_path):
     """Create a 16x32 streetlamp with flower basket sprite."""
-    img = Image.new("RGBA", (16, 32), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(16, 32)
 
     # Colors
-    outline = hex_to_rgba(COLORS["outline_brown"])
-    iron = hex_to_rgba(COLORS["iron"])
-    iron_light = hex_to_rgba(COLORS["iron_light"])
-    iron_dark = hex_to_rgba(COLORS["iron_dark"])
-    flower_pink = hex_to_rgba(COLORS["flower_pink"])
-    flower_purple = hex_to_rgba(COLORS["flower_purple"])
-    foliage = hex_to_rgba(COLORS["foliage_mid"])
-    yellow = hex_to_rgba(COLORS["flower_yellow"])
+    outline = COLORS["outline_brown"]
+    iron = COLORS["iron"]
+    iron_light = COLORS["iron_light"]
+    iron_dark = COLORS["iron_dark"]
+    flower_pink = COLORS["flower_pink"]
+    flower_purple = COLORS["flower_purple"]
+    foliage = COLORS["foliage_mid"]
+    yellow = COLORS["flower_yellow"]
 
     # Lamp head (rows 0-5)
     # Top cap
-    for x in range(6, 10):
-        pixels[x, 0] = iron_dark
-    for x in range(5, 11):
-        pixels[x, 1] = iron
+    hline(canvas, 6, 10, 0, iron_dark)
+    hline(canvas, 5, 11, 1, iron)
 
     # Lamp glass (glowing)
-    for y in range(2, 5):
-        for x in range(5, 11):
-            if x in (5, 10):
-                pixels[x, y] = iron
-            else:
-                pixels[x, y] = yellow
+    vline(canvas, 5, 2, 5, iron)
+    vline(canvas, 10, 2, 5, iron)
+    fill_rect(canvas, 6, 2, 10, 5, yellow)
 
     # Lamp bottom
-    for x in range(6, 10):
-        pixels[x, 5] = iron_dark
+    hline(canvas, 6, 10, 5, iron_dark)
 
     # Pole (rows 6-27)
-    for y in range(6, 28):
-        pixels[7, y] = iron_light
-        pixels[8, y] = iron
+    vline(canvas, 7, 6, 28, iron_light)
+    vline(canvas, 8, 6, 28, iron)
 
     # Base (rows 28-31)
-    for x in range(5, 11):
-        pixels[x, 28] = iron
-        pixels[x, 29] = iron_dark
-    for x in range(4, 12):
-        pixels[x, 30] = iron
-        pixels[x, 31] = outline
+    hline(canvas, 5, 11, 28, iron)
+    hline(canvas, 5, 11, 29, iron_dark)
+    hline(canvas, 4, 12, 30, iron)
+    hline(canvas, 4, 12, 31, outline)
 
     # Flower basket arm (right side, rows 10-12)
-    for x in range(9, 14):
-        pixels[x, 10] = iron
+    hline(canvas, 9, 14, 10, iron)
 
     # Basket
-    pixels[12, 11] = iron_dark
-    pixels[13, 11] = iron_dark
-    pixels[14, 11] = iron_dark
-    pixels[11, 12] = iron_dark
-    pixels[12, 12] = iron
-    pixels[13, 12] = iron
-    pixels[14, 12] = iron_dark
-    pixels[15, 12] = iron_dark
+    put(canvas, 12, 11, iron_dark)
+    put(canvas, 13, 11, iron_dark)
+    put(canvas, 14, 11, iron_dark)
+    put(canvas, 11, 12, iron_dark)
+    put(canvas, 12, 12, iron)
+    put(canvas, 13, 12, iron)
+    put(canvas, 14, 12, iron_dark)
+    put(canvas, 15, 12, iron_dark)
 
     # Flowers in basket
-    pixels[12, 9] = flower_pink
-    pixels[13, 9] = foliage
-    pixels[14, 9] = flower_purple
-    pixels[12, 10] = foliage
-    pixels[14, 10] = flower_pink
+    put(canvas, 12, 9, flower_pink)
+    put(canvas, 13, 9, foliage)
+    put(canvas, 14, 9, flower_purple)
+    put(canvas, 12, 10, foliage)
+    put(canvas, 14, 10, flower_pink)
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_tree(output_path):
     """Create a 16x32 deciduous tree sprite."""
-    img = Image.new("RGBA", (16, 32), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(16, 32)
 
     # Colors
-    outline = hex_to_rgba(COLORS["outline_brown"])
-    foliage_h = hex_to_rgba(COLORS["foliage_highlight"])
-    foliage_l = hex_to_rgba(COLORS["foliage_light"])
-    foliage_m = hex_to_rgba(COLORS["foliage_mid"])
-    foliage_d = hex_to_rgba(COLORS["foliage_dark"])
-    trunk_l = hex_to_rgba(COLORS["wood_mid"])
-    trunk_d = hex_to_rgba(COLORS["wood_dark"])
+    outline = COLORS["outline_brown"]
+    foliage_h = COLORS["foliage_highlight"]
+    foliage_l = COLORS["foliage_light"]
+    foliage_m = COLORS["foliage_mid"]
+    foliage_d = COLORS["foliage_dark"]
+    trunk_l = COLORS["wood_mid"]
+    trunk_d = COLORS["wood_dark"]
 
     # Canopy - round fluffy shape (rows 0-20)
     canopy = [
@@ -213,51 +205,48 @@ def create_tree(output_path):
     ]
 
     for y, x_start, x_end in canopy:
-        for x in range(x_start, x_end):
-            # Shading: lighter at top-left, darker at bottom-right
-            if y < 6:
-                color = foliage_h if x < 8 else foliage_l
-            elif y < 12:
-                color = foliage_l if x < 8 else foliage_m
-            else:
-                color = foliage_m if x < 8 else foliage_d
-            pixels[x, y] = color
+        # Shading: lighter at top-left, darker at bottom-right
+        if y < 6:
+            left, right = foliage_h, foliage_l
+        elif y < 12:
+            left, right = foliage_l, foliage_m
+        else:
+            left, right = foliage_m, foliage_d
+        col_bands(canvas, x_start, y, x_end, y + 1, [(8, left), (None, right)])
         # Outline edges
-        pixels[x_start, y] = foliage_d
-        pixels[x_end - 1, y] = foliage_d
+        put(canvas, x_start, y, foliage_d)
+        put(canvas, x_end - 1, y, foliage_d)
 
     # Trunk (rows 18-31)
-    for y in range(18, 32):
-        pixels[7, y] = trunk_l
-        pixels[8, y] = trunk_d
+    vline(canvas, 7, 18, 32, trunk_l)
+    vline(canvas, 8, 18, 32, trunk_d)
 
     # Trunk base wider
-    pixels[6, 30] = trunk_d
-    pixels[9, 30] = trunk_d
-    pixels[6, 31] = outline
-    pixels[7, 31] = trunk_d
-    pixels[8, 31] = trunk_d
-    pixels[9, 31] = outline
-
-    img.save(output_path)
+    put(canvas, 6, 30, trunk_d)
+    put(canvas, 9, 30, trunk_d)
+    put(canvas, 6, 31, outline)
+    put(canvas, 7, 31, trunk_d)
+    put(canvas, 8, 31, trunk_d)
+    put(canvas, 9, 31, outline)
+
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_planter(output_path):
     """Create a 16x16 stone flower planter sprite."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(16, 16)
 
     # Colors
-    outline = hex_to_rgba(COLORS["outline_brown"])
-    stone_l = hex_to_rgba(COLORS["cream"])
-    stone_m = hex_to_rgba(COLORS["cream_shadow"])
-    stone_d = hex_to_rgba(COLORS["cobble"])
-    flower_p = hex_to_rgba(COLORS["flower_pink"])
-    flower_y = hex_to_rgba(COLORS["flower_yellow"])
-    flower_pu = hex_to_rgba(COLORS["flower_purple"])
-    foliage = hex_to_rgba(COLORS["foliage_mid"])
-    foliage_d = hex_to_rgba(COLORS["foliage_dark"])
+    outline = COLORS["outline_brown"]
+    stone_l = COLORS["cream"]
+    stone_m = COLORS["cream_shadow"]
+    stone_d = COLORS["cobble"]
+    flower_p = COLORS["flower_pink"]
+    flower_y = COLORS["flower_yellow"]
+    flower_pu = COLORS["flower_purple"]
+    foliage = COLORS["foliage_mid"]
+    foliage_d = COLORS["foliage_dark"]
 
     # Flowers (rows 2-6)
     flowers = [
@@ -283,81 +272,72 @@ def create_planter(output_path):
         (6, 13, foliage),
     ]
     for y, x, color in flowers:
-        pixels[x, y] = color
+        put(canvas, x, y, color)
 
     # Planter box (rows 7-14)
     # Top rim
-    for x in range(2, 14):
-        pixels[x, 7] = outline
-        pixels[x, 8] = stone_l
+    hline(canvas, 2, 14, 7, outline)
+    hline(canvas, 2, 14, 8, stone_l)
 
     # Body
-    for y in range(9, 14):
-        for x in range(2, 14):
-            if x in (2, 13):
-                pixels[x, y] = outline
-            elif x < 7:
-                pixels[x, y] = stone_l
-            else:
-                pixels[x, y] = stone_m
+    vline(canvas, 2, 9, 14, outline)
+    vline(canvas, 13, 9, 14, outline)
+    col_bands(canvas, 3, 9, 13, 14, [(7, stone_l), (None, stone_m)])
 
     # Bottom
-    for x in range(2, 14):
-        pixels[x, 14] = outline
+    hline(canvas, 2, 14, 14, outline)
 
     # Shadow detail
-    for y in range(10, 14):
-        pixels[12, y] = stone_d
+    vline(canvas, 12, 10, 14, stone_d)
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_sign(output_path):
     """Create a 16x16 wooden notice board/sign sprite."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(16, 16)
 
-    outline = hex_to_rgba(COLORS["outline_brown"])
-    wood_l = hex_to_rgba(COLORS["wood_light"])
-    wood_m = hex_to_rgba(COLORS["wood_mid"])
-    wood_d = hex_to_rgba(COLORS["wood_dark"])
-    cream = hex_to_rgba(COLORS["cream"])
+    outline = COLORS["outline_brown"]
+    wood_l = COLORS["wood_light"]
+    wood_m = COLORS["wood_mid"]
+    wood_d = COLORS["wood_dark"]
+    cream = COLORS["cream"]
 
     # Sign board (rows 1-9)
-    for y in range(1, 10):
-        for x in range(2, 14):
-            if y == 1 or y == 9 or x == 2 or x == 13:
-                pixels[x, y] = outline
-            elif y == 2:
-                pixels[x, y] = wood_l
-            else:
-                pixels[x, y] = cream if 4 <= x <= 11 else wood_m
+    frame_rect(canvas, 2, 1, 14, 10, outline)
+    hline(canvas, 3, 13, 2, wood_l)
+    col_bands(canvas, 3, 3, 13, 9, [(4, wood_m), (12, cream), (None, wood_m)])
 
     # Post (rows 10-15)
-    for y in range(10, 16):
-        pixels[7, y] = wood_m
-        pixels[8, y] = wood_d
+    vline(canvas, 7, 10, 16, wood_m)
+    vline(canvas, 8, 10, 16, wood_d)
 
     # Base
-    pixels[6, 15] = outline
-    pixels[9, 15] = outline
+    put(canvas, 6, 15, outline)
+    put(canvas, 9, 15, outline)
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
-def main():
-    output_dir = "game/assets/sprites/props/polished"
-    os.makedirs(output_dir, exist_ok=True)
+OUTPUT_DIR = "game/assets/sprites/props/polished"
 
-    create_bench(os.path.join(output_dir, "bench.png"))
-    create_lamp(os.path.join(output_dir, "lamp.png"))
-    create_tree(os.path.join(output_dir, "tree.png"))
-    create_planter(os.path.join(output_dir, "planter.png"))
-    create_sign(os.path.join(output_dir, "sign.png"))
+ASSETS = [
+    (os.path.join(OUTPUT_DIR, "bench.png"), create_bench),
+    (os.path.join(OUTPUT_DIR, "lamp.png"), create_lamp),
+    (os.path.join(OUTPUT_DIR, "tree.png"), create_tree),
+    (os.path.join(OUTPUT_DIR, "planter.png"), create_planter),
+    (os.path.join(OUTPUT_DIR, "sign.png"), create_sign),
+]
+
+
+def main():
+    for path, create, *args in ASSETS:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        create(path, *args)
 
-    print(f"\nGenerated 5 prop sprites in {output_dir}/")
+    print(f"\nGenerated 5 prop sprites in {OUTPUT_DIR}/")
 
 
 if __name__ == "__main__":
@@ -5,9 +5,24 @@ Creates interior shop props: counter, shelf, display_case, cash_register, crates
 All sprites follow the cozy storybook JRPG style with colored outlines.
 """
 
-from PIL import Image
 import os
 
+from raster import (
+    bands,
+    col_bands,
+    edged_hline,
+    fill_mask,
+    fill_rect,
+    frame_rect,
+    hline,
+    new_canvas,
+    matches,
+    opaque,
+    put,
+    save,
+    vline,
+)
+
 COLORS = {
     "wood_highlight": (0xC9, 0xA8, 0x70),
     "wood_light": (0xB5, 0x8A, 0x4D),
@@ -29,298 +44,232 @@ COLORS = {
 }
 
 
-def hex_to_rgba(t):
-    return (*t, 255) if len(t) == 3 else t
-
-
-def draw_rect(pixels, x1, y1, x2, y2, color):
-    for y in range(y1, y2 + 1):
-        for x in range(x1, x2 + 1):
-            pixels[x, y] = color
+def draw_rect(canvas, x1, y1, x2, y2, color):
+    fill_rect(canvas, x1, y1, x2 + 1, y2 + 1, color)
 
 
 def create_counter(output_path):
     """Create a 24x16 shop counter."""
-    img = Image.new("RGBA", (24, 16), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(24, 16)
 
-    outline = hex_to_rgba(COLORS["outline"])
-    wood_l = hex_to_rgba(COLORS["wood_light"])
-    wood_m = hex_to_rgba(COLORS["wood_mid"])
-    wood_d = hex_to_rgba(COLORS["wood_dark"])
+    outline = COLORS["outline"]
+    wood_l = COLORS["wood_light"]
+    wood_m = COLORS["wood_mid"]
+    wood_d = COLORS["wood_dark"]
 
     # Counter top (rows 2-5)
-    for y in range(2, 6):
-        for x in range(1, 23):
-            if y == 2 or y == 5:
-                pixels[x, y] = outline
-            elif x == 1 or x == 22:
-                pixels[x, y] = outline
-            else:
-                pixels[x, y] = wood_l if y == 3 else wood_m
+    frame_rect(canvas, 1, 2, 23, 6, outline)
+    hline(canvas, 2, 22, 3, wood_l)
+    hline(canvas, 2, 22, 4, wood_m)
 
     # Counter body (rows 6-14)
-    for y in range(6, 15):
-        for x in range(2, 22):
-            if x == 2 or x == 21:
-                pixels[x, y] = outline
-            elif y == 14:
-                pixels[x, y] = wood_d
-            else:
-                pixels[x, y] = wood_m if x < 12 else wood_d
+    vline(canvas, 2, 6, 15, outline)
+    vline(canvas, 21, 6, 15, outline)
+    col_bands(canvas, 3, 6, 21, 14, [(12, wood_m), (None, wood_d)])
+    hline(canvas, 3, 21, 14, wood_d)
 
     # Bottom outline
-    for x in range(2, 22):
-        pixels[x, 15] = outline
+    hline(canvas, 2, 22, 15, outline)
 
     # Panel detail
-    draw_rect(pixels, 5, 8, 9, 12, wood_d)
-    draw_rect(pixels, 14, 8, 18, 12, wood_d)
+    draw_rect(canvas, 5, 8, 9, 12, wood_d)
+    draw_rect(canvas, 14, 8, 18, 12, wood_d)
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_shelf(output_path):
     """Create a 16x24 shop shelf with items."""
-    img = Image.new("RGBA", (16, 24), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(16, 24)
 
-    outline = hex_to_rgba(COLORS["outline"])
-    wood_l = hex_to_rgba(COLORS["wood_light"])
-    wood_m = hex_to_rgba(COLORS["wood_mid"])
-    wood_d = hex_to_rgba(COLORS["wood_dark"])
-    potion_r = hex_to_rgba(COLORS["potion_red"])
-    potion_b = hex_to_rgba(COLORS["potion_blue"])
-    potion_g = hex_to_rgba(COLORS["potion_green"])
+    outline = COLORS["outline"]
+    wood_l = COLORS["wood_light"]
+    wood_m = COLORS["wood_mid"]
+    wood_d = COLORS["wood_dark"]
+    potion_r = COLORS["potion_red"]
+    potion_b = COLORS["potion_blue"]
+    potion_g = COLORS["potion_green"]
 
     # Back panel (rows 0-23)
-    for y in range(0, 24):
-        for x in range(1, 15):
-            if x == 1 or x == 14 or y == 0 or y == 23:
-                pixels[x, y] = outline
-            else:
-                pixels[x, y] = wood_d
+    frame_rect(canvas, 1, 0, 15, 24, outline)
+    fill_rect(canvas, 2, 1, 14, 23, wood_d)
 
     # Shelf planks at rows 7, 15
     for shelf_y in [7, 15]:
-        for x in range(2, 14):
-            pixels[x, shelf_y] = wood_l
-            pixels[x, shelf_y + 1] = wood_m
+        hline(canvas, 2, 14, shelf_y, wood_l)
+        hline(canvas, 2, 14, shelf_y + 1, wood_m)
 
     # Potions on top shelf (rows 2-6)
     for i, color in enumerate([potion_r, potion_b, potion_g]):
         px = 3 + i * 4
-        pixels[px, 4] = color
-        pixels[px + 1, 4] = color
-        pixels[px, 5] = color
-        pixels[px + 1, 5] = color
-        pixels[px, 6] = outline
-        pixels[px + 1, 6] = outline
+        fill_rect(canvas, px, 4, px + 2, 6, color)
+        hline(canvas, px, px + 2, 6, outline)
 
     # Potions on second shelf (rows 10-14)
     for i, color in enumerate([potion_g, potion_r, potion_b]):
         px = 3 + i * 4
-        pixels[px, 12] = color
-        pixels[px + 1, 12] = color
-        pixels[px, 13] = color
-        pixels[px + 1, 13] = color
-        pixels[px, 14] = outline
-        pixels[px + 1, 14] = outline
+        fill_rect(canvas, px, 12, px + 2, 14, color)
+        hline(canvas, px, px + 2, 14, outline)
 
     # Bottom items (boxes, rows 18-22)
-    draw_rect(pixels, 3, 18, 6, 21, wood_m)
-    draw_rect(pixels, 9, 18, 12, 21, wood_m)
+    draw_rect(canvas, 3, 18, 6, 21, wood_m)
+    draw_rect(canvas, 9, 18, 12, 21, wood_m)
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_display_case(output_path):
     """Create a 16x16 glass display case."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(16, 16)
 
-    outline = hex_to_rgba(COLORS["outline"])
-    wood_l = hex_to_rgba(COLORS["wood_light"])
-    wood_m = hex_to_rgba(COLORS["wood_mid"])
-    glass_l = hex_to_rgba(COLORS["glass_light"])
-    glass_d = hex_to_rgba(COLORS["glass_dark"])
-    gold = hex_to_rgba(COLORS["gold"])
+    outline = COLORS["outline"]
+    wood_l = COLORS["wood_light"]
+    wood_m = COLORS["wood_mid"]
+    glass_l = COLORS["glass_light"]
+    glass_d = COLORS["glass_dark"]
+    gold = COLORS["gold"]
 
     # Wood base (rows 10-14)
-    for y in range(10, 15):
-        for x in range(2, 14):
-            if x == 2 or x == 13 or y == 10 or y == 14:
-                pixels[x, y] = outline
-            else:
-                pixels[x, y] = wood_l if y == 11 else wood_m
+    frame_rect(canvas, 2, 10, 14, 15, outline)
+    bands(canvas, 3, 11, 13, 14, [(12, wood_l), (None, wood_m)])
 
     # Bottom outline
-    for x in range(2, 14):
-        pixels[x, 15] = outline
+    hline(canvas, 2, 14, 15, outline)
 
     # Glass dome (rows 2-9)
-    for y in range(2, 10):
-        for x in range(3, 13):
-            if y == 2:
-                if x >= 5 and x <= 10:
-                    pixels[x, y] = outline
-            elif y == 9:
-                pixels[x, y] = outline
-            elif x == 3 or x == 12:
-                if y >= 4:
-                    pixels[x, y] = outline
-            else:
-                pixels[x, y] = glass_l if x < 8 else glass_d
+    hline(canvas, 5, 11, 2, outline)
+    hline(canvas, 3, 13, 9, outline)
+    vline(canvas, 3, 4, 9, outline)
+    vline(canvas, 12, 4, 9, outline)
+    col_bands(canvas, 4, 3, 12, 9, [(8, glass_l), (None, glass_d)])
 
     # Curved top
-    pixels[4, 3] = outline
-    pixels[11, 3] = outline
-    pixels[3, 4] = outline
-    pixels[12, 4] = outline
+    put(canvas, 4, 3, outline)
+    put(canvas, 11, 3, outline)
+    put(canvas, 3, 4, outline)
+    put(canvas, 12, 4, outline)
 
     # Display item (gold ring)
-    pixels[7, 7] = gold
-    pixels[8, 7] = gold
-    pixels[7, 8] = gold
-    pixels[8, 8] = gold
+    put(canvas, 7, 7, gold)
+    put(canvas, 8, 7, gold)
+    put(canvas, 7, 8, gold)
+    put(canvas, 8, 8, gold)
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_cash_register(output_path):
     """Create a 16x16 cash register."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(16, 16)
 
-    outline = hex_to_rgba(COLORS["outline"])
-    metal_l = hex_to_rgba(COLORS["metal_light"])
-    metal_m = hex_to_rgba(COLORS["metal_mid"])
-    metal_d = hex_to_rgba(COLORS["metal_dark"])
-    gold = hex_to_rgba(COLORS["gold"])
+    outline = COLORS["outline"]
+    metal_l = COLORS["metal_light"]
+    metal_m = COLORS["metal_mid"]
+    metal_d = COLORS["metal_dark"]
+    gold = COLORS["gold"]
 
     # Main body (rows 4-13)
-    for y in range(4, 14):
-        for x in range(3, 13):
-            if x == 3 or x == 12 or y == 4 or y == 13:
-                pixels[x, y] = outline
-            else:
-                pixels[x, y] = metal_l if y < 8 else metal_m
+    frame_rect(canvas, 3, 4, 13, 14, outline)
+    bands(canvas, 4, 5, 12, 13, [(8, metal_l), (None, metal_m)])
 
     # Display window (rows 5-7)
-    draw_rect(pixels, 5, 5, 10, 7, metal_d)
+    draw_rect(canvas, 5, 5, 10, 7, metal_d)
 
     # Buttons (rows 9-11)
     for bx in [5, 7, 9]:
-        pixels[bx, 9] = gold
-        pixels[bx, 10] = gold
-        pixels[bx, 11] = metal_d
+        put(canvas, bx, 9, gold)
+        put(canvas, bx, 10, gold)
+        put(canvas, bx, 11, metal_d)
 
     # Drawer (rows 14-15)
-    for x in range(4, 12):
-        pixels[x, 14] = metal_m
-        pixels[x, 15] = outline
+    hline(canvas, 4, 12, 14, metal_m)
+    hline(canvas, 4, 12, 15, outline)
 
     # Handle
-    pixels[7, 14] = gold
-    pixels[8, 14] = gold
+    put(canvas, 7, 14, gold)
+    put(canvas, 8, 14, gold)
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_crate(output_path):
     """Create a 16x16 wooden crate."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(16, 16)
 
-    outline = hex_to_rgba(COLORS["outline"])
-    wood_l = hex_to_rgba(COLORS["wood_light"])
-    wood_m = hex_to_rgba(COLORS["wood_mid"])
-    wood_d = hex_to_rgba(COLORS["wood_dark"])
+    outline = COLORS["outline"]
+    wood_l = COLORS["wood_light"]
+    wood_m = COLORS["wood_mid"]
+    wood_d = COLORS["wood_dark"]
 
     # Main box (rows 3-14)
-    for y in range(3, 15):
-        for x in range(2, 14):
-            if x == 2 or x == 13 or y == 3 or y == 14:
-                pixels[x, y] = outline
-            else:
-                pixels[x, y] = wood_l if x < 8 else wood_m
+    frame_rect(canvas, 2, 3, 14, 15, outline)
+    col_bands(canvas, 3, 4, 13, 14, [(8, wood_l), (None, wood_m)])
 
     # Horizontal slats
-    for x in range(3, 13):
-        pixels[x, 6] = wood_d
-        pixels[x, 10] = wood_d
+    hline(canvas, 3, 13, 6, wood_d)
+    hline(canvas, 3, 13, 10, wood_d)
 
     # Vertical slats
-    for y in range(4, 14):
-        pixels[5, y] = wood_d
-        pixels[10, y] = wood_d
+    vline(canvas, 5, 4, 14, wood_d)
+    vline(canvas, 10, 4, 14, wood_d)
 
     # Corner reinforcements
     corners = [(3, 4), (12, 4), (3, 13), (12, 13)]
     for cx, cy in corners:
-        pixels[cx, cy] = wood_d
+        put(canvas, cx, cy, wood_d)
 
     # Bottom
-    for x in range(2, 14):
-        pixels[x, 15] = outline
+    hline(canvas, 2, 14, 15, outline)
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_crate_open(output_path):
     """Create a 16x16 open wooden crate with items."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(16, 16)
 
-    outline = hex_to_rgba(COLORS["outline"])
-    wood_l = hex_to_rgba(COLORS["wood_light"])
-    wood_m = hex_to_rgba(COLORS["wood_mid"])
-    wood_d = hex_to_rgba(COLORS["wood_dark"])
-    cloth_r = hex_to_rgba(COLORS["cloth_red"])
-    cloth_b = hex_to_rgba(COLORS["cloth_blue"])
+    outline = COLORS["outline"]
+    wood_l = COLORS["wood_light"]
+    wood_m = COLORS["wood_mid"]
+    wood_d = COLORS["wood_dark"]
+    cloth_r = COLORS["cloth_red"]
+    cloth_b = COLORS["cloth_blue"]
 
     # Box sides (rows 6-14)
-    for y in range(6, 15):
-        for x in range(2, 14):
-            if x == 2 or x == 13 or y == 14:
-                pixels[x, y] = outline
-            elif y == 6:
-                pixels[x, y] = wood_l
-            else:
-                pixels[x, y] = wood_m
+    vline(canvas, 2, 6, 15, outline)
+    vline(canvas, 13, 6, 15, outline)
+    hline(canvas, 3, 13, 14, outline)
+    bands(canvas, 3, 6, 13, 14, [(7, wood_l), (None, wood_m)])
 
     # Items poking out (rows 2-6)
-    draw_rect(pixels, 4, 3, 6, 5, cloth_r)
-    draw_rect(pixels, 9, 2, 11, 5, cloth_b)
+    draw_rect(canvas, 4, 3, 6, 5, cloth_r)
+    draw_rect(canvas, 9, 2, 11, 5, cloth_b)
 
     # Vertical slats
-    for y in range(7, 14):
-        pixels[5, y] = wood_d
-        pixels[10, y] = wood_d
+    vline(canvas, 5, 7, 14, wood_d)
+    vline(canvas, 10, 7, 14, wood_d)
 
     # Bottom
-    for x in range(2, 14):
-        pixels[x, 15] = outline
+    hline(canvas, 2, 14, 15, outline)
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_barrel(output_path):
     """Create a 16x16 wooden barrel."""
-    img = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(16, 16)
 
-    outline = hex_to_rgba(COLORS["outline"])
-    wood_l = hex_to_rgba(COLORS["wood_light"])
-    wood_m = hex_to_rgba(COLORS["wood_mid"])
-    wood_d = hex_to_rgba(COLORS["wood_dark"])
-    metal = hex_to_rgba(COLORS["metal_mid"])
+    outline = COLORS["outline"]
+    wood_l = COLORS["wood_light"]
+    wood_m = COLORS["wood_mid"]
+    wood_d = COLORS["wood_dark"]
+    metal = COLORS["metal_mid"]
 
     # Barrel body - wider in middle
     for y in range(2, 15):
@@ -331,53 +280,48 @@ def create_barrel(output_path):
         else:
             x_start, x_end = 3, 13
 
-        for x in range(x_start, x_end):
-            if x == x_start or x == x_end - 1:
-                pixels[x, y] = outline
-            else:
-                pixels[x, y] = wood_l if x < 8 else wood_m
+        edged_hline(canvas, x_start, x_end, y, outline, [(8, wood_l), (None, wood_m)])
 
     # Top
-    for x in range(5, 11):
-        pixels[x, 2] = outline
+    hline(canvas, 5, 11, 2, outline)
 
     # Bottom
-    for x in range(5, 11):
-        pixels[x, 14] = outline
-    for x in range(5, 11):
-        pixels[x, 15] = outline
+    hline(canvas, 5, 11, 14, outline)
+    hline(canvas, 5, 11, 15, outline)
 
     # Metal bands
-    for x in range(4, 12):
-        if pixels[x, 4][3] > 0:
-            pixels[x, 4] = metal
-        if pixels[x, 11][3] > 0:
-            pixels[x, 11] = metal
+    solid = opaque(canvas)
+    for y in (4, 11):
+        fill_mask(canvas, 4, y, solid[y : y + 1, 4:12], metal)
 
     # Vertical wood grain
-    for y in range(3, 14):
-        if pixels[6, y][3] > 0 and pixels[6, y] != outline and pixels[6, y] != metal:
-            pixels[6, y] = wood_d
-        if pixels[9, y][3] > 0 and pixels[9, y] != outline and pixels[9, y] != metal:
-            pixels[9, y] = wood_d
+    grain = opaque(canvas) & ~matches(canvas, outline) & ~matches(canvas, metal)
+    for x in (6, 9):
+        fill_mask(canvas, x, 3, grain[3:14, x : x + 1], wood_d)
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
+OUTPUT_DIR = "game/assets/sprites/props/shop"
+
+ASSETS = [
+    (os.path.join(OUTPUT_DIR, "counter.png"), create_counter),
+    (os.path.join(OUTPUT_DIR, "shelf.png"), create_shelf),
+    (os.path.join(OUTPUT_DIR, "display_case.png"), create_display_case),
+    (os.path.join(OUTPUT_DIR, "cash_register.png"), create_cash_register),
+    (os.path.join(OUTPUT_DIR, "crate.png"), create_crate),
+    (os.path.join(OUTPUT_DIR, "crate_open.png"), create_crate_open),
+    (os.path.join(OUTPUT_DIR, "barrel.png"), create_barrel),
+]
+
+
 def main():
-    output_dir = "game/assets/sprites/props/shop"
-    os.makedirs(output_dir, exist_ok=True)
-
-    create_counter(os.path.join(output_dir, "counter.png"))
-    create_shelf(os.path.join(output_dir, "shelf.png"))
-    create_display_case(os.path.join(output_dir, "display_case.png"))
-    create_cash_register(os.path.join(output_dir, "cash_register.png"))
-    create_crate(os.path.join(output_dir, "crate.png"))
-    create_crate_open(os.path.join(output_dir, "crate_open.png"))
-    create_barrel(os.path.join(output_dir, "barrel.png"))
-
-    print(f"\nGenerated 7 interior shop prop sprites in {output_dir}/")
+    for path, create, *args in ASSETS:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        create(path, *args)
+
+    print(f"\nGenerated 7 interior shop prop sprites in {OUTPUT_DIR}/")
 
 
 if __name__ == "__main__":
@@ -1,9 +1,19 @@
 #!/usr/bin/env python3
 """Generate town tileset pieces for Wilds of Cloverhollow (16x16)."""
 
-from PIL import Image
 import os
 
+from raster import (
+    fill_mask,
+    fill_rect,
+    grid,
+    hline,
+    new_canvas,
+    plot,
+    put,
+    save,
+)
+
 COLORS = {
     # Grass
     "grass_outline": (0x28, 0x4A, 0x28),
@@ -25,198 +35,162 @@ COLORS = {
 }
 
 
-def hex_to_rgba(t):
-    return (*t, 255) if len(t) == 3 else t
-
-
 def create_grass_tile(output_path):
     width, height = 16, 16
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(width, height)
     C = COLORS
 
     # Base grass fill
-    for y in range(height):
-        for x in range(width):
-            pixels[x, y] = hex_to_rgba(C["grass"])
+    fill_rect(canvas, 0, 0, width, height, C["grass"])
 
     # Add variation pattern (darker patches)
     dark_spots = [(2, 3), (7, 2), (12, 4), (4, 8), (10, 9), (1, 12), (8, 13), (14, 11)]
-    for sx, sy in dark_spots:
-        pixels[sx, sy] = hex_to_rgba(C["grass_dark"])
+    plot(canvas, dark_spots, C["grass_dark"])
 
     # Light grass highlights
     light_spots = [(5, 1), (11, 3), (3, 6), (9, 7), (14, 5), (6, 11), (12, 14), (2, 14)]
-    for sx, sy in light_spots:
-        pixels[sx, sy] = hex_to_rgba(C["grass_light"])
+    plot(canvas, light_spots, C["grass_light"])
 
     # Tiny highlight sparkles
-    pixels[4, 4] = hex_to_rgba(C["grass_highlight"])
-    pixels[11, 10] = hex_to_rgba(C["grass_highlight"])
+    put(canvas, 4, 4, C["grass_highlight"])
+    put(canvas, 11, 10, C["grass_highlight"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_path_tile(output_path):
     width, height = 16, 16
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(width, height)
     C = COLORS
 
     # Base path fill
-    for y in range(height):
-        for x in range(width):
-            pixels[x, y] = hex_to_rgba(C["path"])
+    fill_rect(canvas, 0, 0, width, height, C["path"])
 
     # Darker worn patches
     dark_spots = [(3, 2), (8, 4), (13, 3), (5, 7), (10, 8), (2, 11), (7, 12), (12, 13)]
-    for sx, sy in dark_spots:
-        pixels[sx, sy] = hex_to_rgba(C["path_dark"])
-        if sx + 1 < 16:
-            pixels[sx + 1, sy] = hex_to_rgba(C["path_dark"])
+    plot(canvas, dark_spots, C["path_dark"])
+    plot(canvas, [(sx + 1, sy) for sx, sy in dark_spots], C["path_dark"])
 
     # Light sandy spots
     light_spots = [(1, 5), (6, 3), (11, 6), (4, 10), (9, 11), (14, 9)]
-    for sx, sy in light_spots:
-        pixels[sx, sy] = hex_to_rgba(C["path_light"])
+    plot(canvas, light_spots, C["path_light"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_path_edge_top(output_path):
     width, height = 16, 16
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(width, height)
     C = COLORS
 
     # Top rows (0-2): grass
-    for y in range(3):
-        for x in range(width):
-            pixels[x, y] = hex_to_rgba(C["grass"])
+    fill_rect(canvas, 0, 0, width, 3, C["grass"])
 
     # Row 3: transition edge
-    for x in range(width):
-        pixels[x, 3] = hex_to_rgba(C["grass_dark"])
+    hline(canvas, 0, width, 3, C["grass_dark"])
 
     # Bottom rows (4-15): path
-    for y in range(4, height):
-        for x in range(width):
-            pixels[x, y] = hex_to_rgba(C["path"])
+    fill_rect(canvas, 0, 4, width, height, C["path"])
 
     # Add path texture
-    pixels[5, 7] = hex_to_rgba(C["path_dark"])
-    pixels[10, 10] = hex_to_rgba(C["path_light"])
+    put(canvas, 5, 7, C["path_dark"])
+    put(canvas, 10, 10, C["path_light"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_water_tile(output_path):
     width, height = 16, 16
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(width, height)
     C = COLORS
 
     # Base water fill
-    for y in range(height):
-        for x in range(width):
-            pixels[x, y] = hex_to_rgba(C["water"])
+    fill_rect(canvas, 0, 0, width, height, C["water"])
 
     # Wave pattern (horizontal light bands)
-    for x in range(width):
-        if x % 4 < 2:
-            pixels[x, 4] = hex_to_rgba(C["water_light"])
-            pixels[x, 11] = hex_to_rgba(C["water_light"])
+    xs, _ = grid(0, 0, width, 1)
+    fill_mask(canvas, 0, 4, xs % 4 < 2, C["water_light"])
+    fill_mask(canvas, 0, 11, xs % 4 < 2, C["water_light"])
 
     # Deeper dark areas
     dark_spots = [(3, 7), (8, 8), (12, 6), (5, 13), (10, 2)]
-    for sx, sy in dark_spots:
-        pixels[sx, sy] = hex_to_rgba(C["water_dark"])
+    plot(canvas, dark_spots, C["water_dark"])
 
     # Sparkle highlights
-    pixels[6, 3] = hex_to_rgba(C["water_highlight"])
-    pixels[13, 9] = hex_to_rgba(C["water_highlight"])
-    pixels[2, 12] = hex_to_rgba(C["water_highlight"])
+    put(canvas, 6, 3, C["water_highlight"])
+    put(canvas, 13, 9, C["water_highlight"])
+    put(canvas, 2, 12, C["water_highlight"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_water_edge_top(output_path):
     width, height = 16, 16
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(width, height)
     C = COLORS
 
     # Top rows (0-4): grass
-    for y in range(5):
-        for x in range(width):
-            pixels[x, y] = hex_to_rgba(C["grass"])
+    fill_rect(canvas, 0, 0, width, 5, C["grass"])
 
     # Row 5-6: shoreline edge
-    for x in range(width):
-        pixels[x, 5] = hex_to_rgba(C["path"])
-        pixels[x, 6] = hex_to_rgba(C["path_dark"])
+    hline(canvas, 0, width, 5, C["path"])
+    hline(canvas, 0, width, 6, C["path_dark"])
 
     # Bottom rows (7-15): water
-    for y in range(7, height):
-        for x in range(width):
-            pixels[x, y] = hex_to_rgba(C["water"])
+    fill_rect(canvas, 0, 7, width, height, C["water"])
 
     # Water wave pattern
     for x in range(0, width, 4):
-        pixels[x, 9] = hex_to_rgba(C["water_light"])
-        pixels[x + 1, 9] = hex_to_rgba(C["water_light"])
+        hline(canvas, x, x + 2, 9, C["water_light"])
 
     # Water sparkle
-    pixels[8, 11] = hex_to_rgba(C["water_highlight"])
+    put(canvas, 8, 11, C["water_highlight"])
 
-    img.save(output_path)
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
 def create_water_edge_corner(output_path):
     width, height = 16, 16
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    pixels = img.load()
+    canvas = new_canvas(width, height)
     C = COLORS
 
     # Fill with grass base
-    for y in range(height):
-        for x in range(width):
-            pixels[x, y] = hex_to_rgba(C["grass"])
+    fill_rect(canvas, 0, 0, width, height, C["grass"])
 
     # Diagonal water area (bottom-right corner)
     for y in range(6, height):
-        for x in range(y - 2, width):
-            if x >= 0:
-                pixels[x, y] = hex_to_rgba(C["water"])
+        hline(canvas, y - 2, width, y, C["water"])
 
     # Shore edge along diagonal
     for i in range(10):
-        y = 6 + i
-        x = 4 + i
-        if x < width and y < height:
-            pixels[x, y] = hex_to_rgba(C["path"])
-        if x - 1 >= 0 and y < height:
-            pixels[x - 1, y] = hex_to_rgba(C["path_dark"])
-
-    img.save(output_path)
+        put(canvas, 4 + i, 6 + i, C["path"])
+        put(canvas, 3 + i, 6 + i, C["path_dark"])
+
+    save(canvas, output_path)
     print(f"Created: {output_path}")
 
 
+OUTPUT_DIR = "game/assets/sprites/tiles/town"
+
+ASSETS = [
+    (os.path.join(OUTPUT_DIR, "tile_grass.png"), create_grass_tile),
+    (os.path.join(OUTPUT_DIR, "tile_path.png"), create_path_tile),
+    (os.path.join(OUTPUT_DIR, "tile_path_edge_top.png"), create_path_edge_top),
+    (os.path.join(OUTPUT_DIR, "tile_water.png"), create_water_tile),
+    (os.path.join(OUTPUT_DIR, "tile_water_edge_top.png"), create_water_edge_top),
+    (os.path.join(OUTPUT_DIR, "tile_water_edge_corner.png"), create_water_edge_corner),
+]
+
+
 def main():
-    output_dir = "game/assets/sprites/tiles/town"
-    os.makedirs(output_dir, exist_ok=True)
-
-    create_grass_tile(os.path.join(output_dir, "tile_grass.png"))
-    create_path_tile(os.path.join(output_dir, "tile_path.png"))
-    create_path_edge_top(os.path.join(output_dir, "tile_path_edge_top.png"))
-    create_water_tile(os.path.join(output_dir, "tile_water.png"))
-    create_water_edge_top(os.path.join(output_dir, "tile_water_edge_top.png"))
-    create_water_edge_corner(os.path.join(output_dir, "tile_water_edge_corner.png"))
+    for path, create, *args in ASSETS:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        create(path, *args)
 
     print("\nTown tiles generation complete!")
 
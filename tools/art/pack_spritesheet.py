@@ -1,15 +1,715 @@
 #!/usr/bin/env python3
+"""
+Pack a directory of sprite frames into texture atlas pages plus JSON metadata.
+
+Layouts:
+- maxrects (default): MaxRects bin packing, best-short-side-fit, no
+  rotation. Every frame goes on one page if it can: page widths up to
+  --max-size are tried (in steps of WIDTH_STEP) and the layout with the
+  smallest used area wins. With --pot only power-of-two pages are tried
+  and the smallest that holds everything wins. If no page does, frames
+  spill over several --max-size pages. Pages are cropped to their used
+  area, or to the next power of two with --pot. Frames are trimmed to their visible pixels
+  (--no-trim keeps borders), and frames with identical pixels share one
+  rect (--no-dedupe stores each); pet idles, sit/yawn poses and repeated
+  walk frames collapse this way.
+- grid (--cols N): fixed cells of the largest frame size, N per row,
+  frames centered in their cell, in name order, like the old montage
+  output. Use it for consumers that slice sheets by hframes/vframes.
 
-"""pack_spritesheet.py (placeholder)
+Output for OUTPUT.png: pages OUTPUT.png, OUTPUT_1.png, ... and OUTPUT.json
+listing every frame's page and rect, its untrimmed size, the rect's
+offset within it, and its pivot; pages left over from an earlier,
+larger pack are removed. Frames are named by file stem and listed in
+name order; placement only depends on the frame sizes and
+settings, so repacking the same inputs reproduces the same bytes.
 
-Goal:
-- pack frames into a spritesheet
-- emit metadata JSON
-- keep deterministic ordering
+Repacks are incremental. OUTPUT.json records a fingerprint of the packer,
+its settings and every frame file, plus each page's sha256; when both
+still match, the atlas is skipped. Otherwise frames whose pixels were
+already in the atlas keep their rects and new ones go into free space
+(growing pages up to --max-size, then adding pages), so existing UVs stay
+put; --repack lays everything out afresh. Pages and metadata are only
+rewritten when their bytes change. --manifest packs every
+"input_dir output [cols]" line of art/spritesheets.txt in one run.
 
-Implement in Milestone 7.
+Usage:
+  python3 tools/art/pack_spritesheet.py art/sprites/player/walk/ game/assets/sprites/player_walk.png
+  python3 tools/art/pack_spritesheet.py FRAMES_DIR OUT.png --max-size 512 --pot --padding 1
+  python3 tools/art/pack_spritesheet.py FRAMES_DIR OUT.png --cols 8
+  python3 tools/art/pack_spritesheet.py --manifest art/spritesheets.txt
 """
 
-import sys
-print("[art] pack_spritesheet placeholder. Implement in Milestone 7.")
-sys.exit(1)
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import time
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from artcache import file_sha256
+from raster import load, new_canvas, to_image
+
+ART_DIR = os.path.dirname(os.path.abspath(__file__))
+METADATA_SCHEME = 3
+
+# Settings that change where frames go; a pack with different values
+# cannot keep the previous rects
+LAYOUT_SETTINGS = ("layout", "cols", "max_size", "pot", "padding", "trim", "dedupe")
+# Page widths tried for one-page layouts without --pot
+WIDTH_STEP = 4
+
+
+class Rect(NamedTuple):
+    x: int
+    y: int
+    w: int
+    h: int
+
+    @property
+    def right(self) -> int:
+        return self.x + self.w
+
+    @property
+    def bottom(self) -> int:
+        return self.y + self.h
+
+    def intersects(self, other: "Rect") -> bool:
+        return (
+            self.x < other.right
+            and other.x < self.right
+            and self.y < other.bottom
+            and other.y < self.bottom
+        )
+
+    def contains(self, other: "Rect") -> bool:
+        return (
+            self.x <= other.x
+            and self.y <= other.y
+            and other.right <= self.right
+            and other.bottom <= self.bottom
+        )
+
+
+class MaxRects:
+    """One page of MaxRects bin packing (Jylanki), best-short-side-fit."""
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.free = [Rect(0, 0, width, height)]
+
+    def insert(self, w: int, h: int) -> Optional[Rect]:
+        """Place a w x h rect, or return None if it does not fit."""
+        best = None
+        best_key = None
+        for free in self.free:
+            if w > free.w or h > free.h:
+                continue
+            spare_x, spare_y = free.w - w, free.h - h
+            # Ties break on position so results never depend on list order
+            key = (min(spare_x, spare_y), max(spare_x, spare_y), free.y, free.x)
+            if best_key is None or key < best_key:
+                best, best_key = free, key
+        if best is None:
+            return None
+        placed = Rect(best.x, best.y, w, h)
+        self.reserve(placed)
+        return placed
+
+    def fits(self, rect: Rect) -> bool:
+        """True if rect lies entirely in free space."""
+        return any(free.contains(rect) for free in self.free)
+
+    def reserve(self, used: Rect) -> None:
+        """Mark used as occupied, splitting the free rects it overlaps."""
+        pieces = []
+        for free in self.free:
+            if not free.intersects(used):
+                pieces.append(free)
+                continue
+            if used.x > free.x:
+                pieces.append(Rect(free.x, free.y, used.x - free.x, free.h))
+            if used.right < free.right:
+                pieces.append(Rect(used.right, free.y, free.right - used.right, free.h))
+            if used.y > free.y:
+                pieces.append(Rect(free.x, free.y, free.w, used.y - free.y))
+            if used.bottom < free.bottom:
+                pieces.append(
+                    Rect(free.x, used.bottom, free.w, free.bottom - used.bottom)
+                )
+        pieces = sorted(set(pieces))
+        self.free = [
+            r
+            for i, r in enumerate(pieces)
+            if not any(j != i and o.contains(r) for j, o in enumerate(pieces))
+        ]
+
+
+class Placement(NamedTuple):
+    page: int
+    rect: Rect
+
+
+def next_pot(n: int) -> int:
+    return 1 << max(0, (n - 1).bit_length())
+
+
+def page_candidates(sizes: list[tuple[int, int]], max_size: int) -> list[tuple]:
+    """Power-of-two page sizes that could hold every rect, smallest first."""
+    need_w = max(w for w, _ in sizes)
+    need_h = max(h for _, h in sizes)
+    area = sum(w * h for w, h in sizes)
+    pots = [1 << i for i in range(max_size.bit_length()) if 1 << i <= max_size]
+    return sorted(
+        (
+            (pw, ph)
+            for pw in pots
+            for ph in pots
+            if pw >= need_w and ph >= need_h and pw * ph >= area
+        ),
+        key=lambda s: (s[0] * s[1], abs(s[0] - s[1]), -s[0]),
+    )
+
+
+def width_candidates(sizes: list[tuple[int, int]], max_size: int) -> list[int]:
+    """Page widths for a one-page layout of any size, narrowest first."""
+    need_w = max(w for w, _ in sizes)
+    area = sum(w * h for w, h in sizes)
+    # Narrower pages could not hold the total area even at max_size high
+    start = max(need_w, -(-area // max_size))
+    widths = range(start, max_size + 1, WIDTH_STEP)
+    return sorted({*widths, max_size})
+
+
+def pack_page(
+    sizes: list[tuple[int, int]], width: int, height: int, padding: int
+) -> Optional[list[Placement]]:
+    """Every rect on one width x height page, or None if they do not fit."""
+    page = MaxRects(width + padding, height + padding)
+    placements = []
+    for w, h in sizes:
+        rect = page.insert(w + padding, h + padding)
+        if rect is None:
+            return None
+        placements.append(Placement(0, Rect(rect.x, rect.y, w, h)))
+    return placements
+
+
+def used_extent(placements: list[Placement]) -> tuple[int, int]:
+    return (
+        max(p.rect.right for p in placements),
+        max(p.rect.bottom for p in placements),
+    )
+
+
+def pack_maxrects(
+    sizes: list[tuple[int, int]], max_size: int, padding: int = 0, pot: bool = True
+) -> Optional[list[Placement]]:
+    """Place rects (in the given order) on as few pages as possible.
+
+    A single page is the smallest power-of-two page that holds them (pot),
+    or else the one-page layout whose used area (the cropped page) is
+    smallest. Padding goes after each rect; bins get the same margin so it
+    never costs space at a page edge. Returns None when a rect is larger
+    than max_size.
+    """
+    if any(w > max_size or h > max_size for w, h in sizes):
+        return None
+    padded = [(w + padding, h + padding) for w, h in sizes]
+    if pot:
+        for pw, ph in page_candidates(sizes, max_size):
+            placements = pack_page(sizes, pw, ph, padding)
+            if placements is not None:
+                return placements
+    else:
+        best = None
+        best_key = None
+        for pw in width_candidates(sizes, max_size):
+            placements = pack_page(sizes, pw, max_size, padding)
+            if placements is None:
+                continue
+            w, h = used_extent(placements)
+            # Smallest area, then squarest, then widest: equal areas tie-break
+            # the same way page_candidates() does
+            key = (w * h, abs(w - h), -w)
+            if best_key is None or key < best_key:
+                best, best_key = placements, key
+        if best is not None:
+            return best
+
+    pages: list[MaxRects] = []
+    placements = []
+    for (w, h), size in zip(padded, sizes):
+        for index, page in enumerate(pages):
+            rect = page.insert(w, h)
+            if rect is not None:
+                break
+        else:
+            pages.append(MaxRects(max_size + padding, max_size + padding))
+            index, rect = len(pages) - 1, pages[-1].insert(w, h)
+        placements.append(Placement(index, Rect(rect.x, rect.y, *size)))
+    return placements
+
+
+def pack_stable(
+    sizes: list[tuple[int, int]],
+    keep: list[Optional[Placement]],
+    page_sizes: list[tuple[int, int]],
+    max_size: int,
+    padding: int = 0,
+) -> Optional[list[Placement]]:
+    """Keep earlier placements and fit the other rects around them.
+
+    keep[i] is rect i's placement from the previous pack, or None for a new
+    rect. New rects go into free space on the existing pages at their
+    previous size, then with the pages grown to max_size, then on new
+    pages. Returns None if the kept rects no longer form a valid layout
+    (overlap, off-page, or a page left empty), so the caller repacks.
+    """
+    if any(w > max_size or h > max_size for w, h in sizes):
+        return None
+    fresh = [i for i, p in enumerate(keep) if p is None]
+    for grow in (False, True):
+        bins = [(max_size, max_size)] * len(page_sizes) if grow else page_sizes
+        pages = [MaxRects(w + padding, h + padding) for w, h in bins]
+        placements: list[Optional[Placement]] = [None] * len(sizes)
+        for i, p in enumerate(keep):
+            if p is None:
+                continue
+            padded = Rect(p.rect.x, p.rect.y, p.rect.w + padding, p.rect.h + padding)
+            if p.page >= len(pages) or not pages[p.page].fits(padded):
+                return None
+            pages[p.page].reserve(padded)
+            placements[i] = p
+        for i in fresh:
+            w, h = sizes[i]
+            for index, page in enumerate(pages):
+                rect = page.insert(w + padding, h + padding)
+                if rect is not None:
+                    break
+            else:
+                if not grow:
+                    break
+                pages.append(MaxRects(max_size + padding, max_size + padding))
+                index = len(pages) - 1
+                rect = pages[-1].insert(w + padding, h + padding)
+            placements[i] = Placement(index, Rect(rect.x, rect.y, w, h))
+        else:
+            if {p.page for p in placements} != set(range(len(pages))):
+                return None
+            return placements
+    return None
+
+
+def pack_grid(sizes: list[tuple[int, int]], cols: int) -> list[Placement]:
+    """Fixed cells of the largest frame size, frames centered, row-major."""
+    cell_w = max(w for w, _ in sizes)
+    cell_h = max(h for _, h in sizes)
+    placements = []
+    for i, (w, h) in enumerate(sizes):
+        row, col = divmod(i, cols)
+        x = col * cell_w + (cell_w - w) // 2
+        y = row * cell_h + (cell_h - h) // 2
+        placements.append(Placement(0, Rect(x, y, w, h)))
+    return placements
+
+
+class Frame(NamedTuple):
+    name: str
+    image: np.ndarray  # pixels stored in the atlas (trimmed unless disabled)
+    source: tuple[int, int]  # untrimmed width, height
+    offset: tuple[int, int]  # position of image within the untrimmed frame
+    digest: str  # identifies the stored pixels, for deduplication
+
+
+def opaque_bounds(canvas: np.ndarray) -> Optional[Rect]:
+    """Bounding box of the visible (alpha > 0) pixels, or None if there are none."""
+    visible = canvas[:, :, 3] > 0
+    rows = np.flatnonzero(visible.any(axis=1))
+    if not len(rows):
+        return None
+    cols = np.flatnonzero(visible.any(axis=0))
+    return Rect(
+        int(cols[0]),
+        int(rows[0]),
+        int(cols[-1] - cols[0] + 1),
+        int(rows[-1] - rows[0] + 1),
+    )
+
+
+def make_frame(name: str, canvas: np.ndarray, trim: bool) -> Frame:
+    """Crop a frame to its visible pixels (a blank frame keeps one pixel)."""
+    height, width = canvas.shape[:2]
+    box = Rect(0, 0, width, height)
+    if trim:
+        box = opaque_bounds(canvas) or Rect(0, 0, 1, 1)
+    image = canvas[box.y : box.bottom, box.x : box.right].copy()
+    # Hidden RGB under alpha 0 must not keep identical frames apart
+    image[image[:, :, 3] == 0] = 0
+    digest = hashlib.sha256(f"{box.w}x{box.h}:".encode() + image.tobytes())
+    return Frame(name, image, (width, height), (box.x, box.y), digest.hexdigest())
+
+
+def page_paths(output: str, count: int) -> list[str]:
+    stem, ext = os.path.splitext(output)
+    return [output] + [f"{stem}_{i}{ext}" for i in range(1, count)]
+
+
+def read_metadata(meta_path: str) -> dict:
+    """An earlier run's metadata, or {} if missing or unreadable."""
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+
+def frame_paths(input_dir: str) -> list[str]:
+    """Every PNG directly in input_dir, in name order."""
+    names = sorted(n for n in os.listdir(input_dir) if n.endswith(".png"))
+    return [os.path.join(input_dir, n) for n in names]
+
+
+def frame_name(path: str) -> str:
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def packer_digest() -> str:
+    """Changes whenever the packer or the raster helpers change."""
+    h = hashlib.sha256()
+    for name in ("pack_spritesheet.py", "raster.py"):
+        with open(os.path.join(ART_DIR, name), "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def input_fingerprint(paths: list[str], settings: dict) -> str:
+    """Hash of the packer, its settings and every frame file's bytes."""
+    h = hashlib.sha256()
+    h.update(f"scheme {METADATA_SCHEME}\npacker {packer_digest()}\n".encode())
+    h.update(json.dumps(settings, sort_keys=True).encode())
+    for path in paths:
+        h.update(f"\n{frame_name(path)} {file_sha256(path)}".encode())
+    return h.hexdigest()
+
+
+def is_fresh(meta: dict, fingerprint: str, output: str) -> bool:
+    """Metadata matches the inputs and every page is still what it wrote."""
+    if meta.get("fingerprint") != fingerprint:
+        return False
+    pages = meta.get("pages") or []
+    for page, path in zip(pages, page_paths(output, len(pages))):
+        if not os.path.isfile(path) or file_sha256(path) != page.get("sha256"):
+            return False
+    return bool(pages)
+
+
+def previous_layout(meta: dict, settings: dict) -> dict[str, list[Placement]]:
+    """Digest -> distinct earlier placements, if the layout settings match."""
+    old = meta.get("settings") or {}
+    if meta.get("scheme") != METADATA_SCHEME or any(
+        old.get(k) != settings[k] for k in LAYOUT_SETTINGS
+    ):
+        return {}
+    earlier: dict[str, list[Placement]] = {}
+    seen = set()
+    for f in meta.get("frames", []):
+        placement = Placement(f["page"], Rect(f["x"], f["y"], f["w"], f["h"]))
+        if placement not in seen:
+            seen.add(placement)
+            earlier.setdefault(f["digest"], []).append(placement)
+    return earlier
+
+
+def encode_png(canvas: np.ndarray) -> bytes:
+    buf = io.BytesIO()
+    to_image(canvas).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def write_if_changed(path: str, data: bytes) -> bool:
+    """Write data unless the file already holds exactly these bytes."""
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+
+def parse_pivot(text: str) -> tuple[float, float]:
+    x, y = (float(v) for v in text.split(","))
+    return x, y
+
+
+def read_manifest(path: str) -> list[tuple[str, str, int]]:
+    """(input_dir, output, cols) per art/spritesheets.txt line; cols 0 = packed."""
+    entries = []
+    with open(path) as f:
+        for line in f:
+            fields = line.split()
+            if not fields or fields[0].startswith("#"):
+                continue
+            if len(fields) < 2:
+                raise ValueError(f"expected 'input_dir output [cols]': {line.strip()}")
+            cols = int(fields[2]) if len(fields) > 2 else 0
+            entries.append((fields[0], fields[1], cols))
+    return entries
+
+
+def pack_atlas(input_dir: str, output: str, args: argparse.Namespace) -> str:
+    """Pack one atlas; returns 'packed', 'fresh' or 'failed'."""
+    started = time.perf_counter()
+    if not os.path.isdir(input_dir):
+        print(f"[art] ERROR: input directory not found: {input_dir}")
+        return "failed"
+    paths = frame_paths(input_dir)
+    if not paths:
+        print(f"[art] ERROR: no PNG files in {input_dir}")
+        return "failed"
+
+    pad = args.padding
+    layout = "grid" if args.cols > 0 else "maxrects"
+    settings = {
+        "layout": layout,
+        "cols": args.cols,
+        "max_size": args.max_size,
+        "pot": args.pot,
+        "padding": pad,
+        "trim": layout == "maxrects" and args.trim,
+        "dedupe": layout == "maxrects" and args.dedupe,
+        "pivot": list(args.pivot),
+    }
+    meta_path = os.path.splitext(output)[0] + ".json"
+    previous = read_metadata(meta_path)
+    fingerprint = input_fingerprint(paths, settings)
+    if not (args.force or args.repack) and is_fresh(previous, fingerprint, output):
+        print(f"[art] Up to date: {output}")
+        return "fresh"
+
+    frames = [make_frame(frame_name(p), load(p), settings["trim"]) for p in paths]
+    kept = 0
+    if layout == "grid":
+        images = list(range(len(frames)))
+        stored = frames
+        sizes = [f.source for f in frames]
+        placements = pack_grid(sizes, args.cols)
+    else:
+        # Frames with identical pixels share one stored image and rect
+        slots: dict[str, int] = {}
+        images = []
+        for f in frames:
+            key = f.digest if settings["dedupe"] else f.name
+            images.append(slots.setdefault(key, len(slots)))
+        stored = [frames[images.index(i)] for i in range(len(slots))]
+        sizes = [(f.image.shape[1], f.image.shape[0]) for f in stored]
+        # Big, then tall, then wide first; name order breaks ties
+        order = sorted(
+            range(len(stored)),
+            key=lambda i: (-max(sizes[i]), -sizes[i][1], -sizes[i][0], stored[i].name),
+        )
+        placements = None
+        earlier = {} if args.repack else previous_layout(previous, settings)
+        keep = [
+            earlier[f.digest].pop(0) if earlier.get(f.digest) else None for f in stored
+        ]
+        if any(keep):
+            page_sizes = [(p["width"], p["height"]) for p in previous["pages"]]
+            stable = pack_stable(
+                [sizes[i] for i in order],
+                [keep[i] for i in order],
+                page_sizes,
+                args.max_size,
+                pad,
+            )
+            if stable is not None:
+                kept = sum(p is not None for p in keep)
+                placements = [None] * len(stored)
+                for i, p in zip(order, stable):
+                    placements[i] = p
+        if placements is None:
+            packed = pack_maxrects(
+                [sizes[i] for i in order], args.max_size, pad, args.pot
+            )
+            if packed is None:
+                print(f"[art] ERROR: a frame is larger than --max-size {args.max_size}")
+                return "failed"
+            placements = [None] * len(stored)
+            for i, p in zip(order, packed):
+                placements[i] = p
+
+    page_count = 1 + max(p.page for p in placements)
+    extents = []
+    for page in range(page_count):
+        rects = [p.rect for p in placements if p.page == page]
+        w = max(r.right for r in rects)
+        h = max(r.bottom for r in rects)
+        if layout == "grid":
+            cell_w = max(s[0] for s in sizes)
+            cell_h = max(s[1] for s in sizes)
+            rows = (len(frames) + args.cols - 1) // args.cols
+            w, h = min(args.cols, len(frames)) * cell_w, rows * cell_h
+        if args.pot:
+            w, h = next_pot(w), next_pot(h)
+        extents.append((w, h))
+
+    out_paths = page_paths(output, page_count)
+    stale = {p.get("image") for p in previous.get("pages", [])} - {
+        os.path.basename(p) for p in out_paths
+    }
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    pages = []
+    written = 0
+    for page, ((w, h), path) in enumerate(zip(extents, out_paths)):
+        canvas = new_canvas(w, h)
+        for frame, p in zip(stored, placements):
+            if p.page == page:
+                r = p.rect
+                canvas[r.y : r.bottom, r.x : r.right] = frame.image
+        data = encode_png(canvas)
+        written += write_if_changed(path, data)
+        pages.append(
+            {
+                "image": os.path.basename(path),
+                "width": w,
+                "height": h,
+                "sha256": hashlib.sha256(data).hexdigest(),
+            }
+        )
+    for name in sorted(n for n in stale if n):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(os.path.join(os.path.dirname(output), name))
+
+    metadata = {
+        "scheme": METADATA_SCHEME,
+        "fingerprint": fingerprint,
+        "settings": settings,
+        "pages": pages,
+        "frames": [
+            {
+                "name": f.name,
+                "page": placements[i].page,
+                "x": placements[i].rect.x,
+                "y": placements[i].rect.y,
+                "w": placements[i].rect.w,
+                "h": placements[i].rect.h,
+                "source_w": f.source[0],
+                "source_h": f.source[1],
+                "offset_x": f.offset[0],
+                "offset_y": f.offset[1],
+                "pivot": list(args.pivot),
+                "digest": f.digest,
+            }
+            for f, i in zip(frames, images)
+        ],
+    }
+    write_if_changed(meta_path, (json.dumps(metadata, indent=2) + "\n").encode())
+
+    source_area = sum(w * h for w, h in (f.source for f in frames))
+    total = sum(w * h for w, h in extents)
+    how = f"{layout}, kept {kept}/{len(stored)} rect(s)" if kept else layout
+    print(
+        f"[art] Packed {len(frames)} frame(s) ({len(stored)} stored) from "
+        f"{input_dir} into {page_count} page(s) "
+        f"({', '.join(f'{w}x{h}' for w, h in extents)}, {written} rewritten), "
+        f"{100 * sum(w * h for w, h in sizes) / total:.0f}% used, "
+        f"{100 * total / source_area:.0f}% of untrimmed frame area, {how}, in "
+        f"{time.perf_counter() - started:.2f}s"
+    )
+    return "packed"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("input_dir", nargs="?", help="directory of frame PNGs")
+    parser.add_argument(
+        "output", nargs="?", help="atlas PNG (metadata goes next to it as .json)"
+    )
+    parser.add_argument(
+        "--manifest",
+        metavar="FILE",
+        help="pack every 'input_dir output [cols]' line of FILE (art/spritesheets.txt)",
+    )
+    parser.add_argument(
+        "--cols", type=int, default=0, help="grid layout with N columns (0: maxrects)"
+    )
+    parser.add_argument(
+        "--max-size", type=int, default=2048, help="largest page side (default 2048)"
+    )
+    parser.add_argument(
+        "--pot", action="store_true", help="round page sizes up to powers of two"
+    )
+    parser.add_argument(
+        "--padding", type=int, default=0, help="transparent pixels between frames"
+    )
+    parser.add_argument(
+        "--pivot",
+        type=parse_pivot,
+        default=(0.5, 0.5),
+        metavar="X,Y",
+        help="frame pivot, normalized to the untrimmed frame (default 0.5,0.5)",
+    )
+    parser.add_argument(
+        "--no-trim",
+        dest="trim",
+        action="store_false",
+        help="keep transparent borders (maxrects only; grid never trims)",
+    )
+    parser.add_argument(
+        "--no-dedupe",
+        dest="dedupe",
+        action="store_false",
+        help="store identical frames separately (maxrects only)",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="pack even if the inputs are unchanged"
+    )
+    parser.add_argument(
+        "--repack",
+        action="store_true",
+        help="lay every frame out afresh instead of keeping existing rects",
+    )
+    args = parser.parse_args()
+
+    if args.manifest:
+        if args.input_dir or args.output:
+            parser.error("give either --manifest or input_dir and output")
+        try:
+            entries = read_manifest(args.manifest)
+        except (OSError, ValueError) as e:
+            print(f"[art] ERROR: {args.manifest}: {e}")
+            return 1
+    elif args.input_dir and args.output:
+        entries = [(args.input_dir, args.output, args.cols)]
+    else:
+        parser.error("input_dir and output are required without --manifest")
+
+    started = time.perf_counter()
+    counts = {"packed": 0, "fresh": 0, "failed": 0, "skipped": 0}
+    for input_dir, output, cols in entries:
+        if args.manifest and not os.path.isdir(input_dir):
+            print(f"[art] SKIP: {input_dir} not found")
+            counts["skipped"] += 1
+            continue
+        entry_args = argparse.Namespace(**{**vars(args), "cols": cols})
+        counts[pack_atlas(input_dir, output, entry_args)] += 1
+    if args.manifest:
+        print(
+            f"[art] Packed {counts['packed']} atlas(es), {counts['fresh']} up to date, "
+            f"{counts['skipped']} skipped, {counts['failed']} failed, in "
+            f"{time.perf_counter() - started:.2f}s"
+        )
+    return 1 if counts["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Load art/palettes/*.palette.json files into one flattened form.
+
+Two schemas exist:
+- flat: "colors" is a list of "#rrggbb" strings, optionally with a parallel
+  "color_names" list (bubblegum_bay, enchanted_forest, ...)
+- nested: "colors" maps group names to shade maps or to single colors
+  (cloverhollow); entries are named by their dotted path, e.g.
+  "foliage.mid"
+
+Either way a Palette holds every named entry in file order plus the
+distinct colors (first occurrence wins) that tools quantize and validate
+against. Unnamed flat entries are named by their index.
+
+Parsed palettes are cached in compiled form under .artcache/palettes/,
+keyed by the sha256 of the JSON file. The compiled form is a small header,
+the distinct colors as packed uint32 RGB, each name's color index, and the
+names as offsets into a UTF-8 blob; loading it is a few frombuffer calls.
+
+Usage:
+  python3 tools/art/palette.py art/palettes/*.palette.json
+  python3 tools/art/palette.py --entries art/palettes/cloverhollow.palette.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+CACHE_DIR = Path(__file__).resolve().parents[2] / ".artcache" / "palettes"
+MAGIC = b"CHPL"
+COMPILED_VERSION = 1
+HEADER = struct.Struct("<4sIII")  # magic, version, colors, names
+
+
+def pack_rgb(rgb: np.ndarray) -> np.ndarray:
+    """Pack (..., 3) uint8 RGB into 24-bit integer keys."""
+    rgb = rgb.astype(np.uint32)
+    return (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+
+
+def unpack_rgb(keys: np.ndarray) -> np.ndarray:
+    """Inverse of pack_rgb(): (...,) keys to (..., 3) uint8 RGB."""
+    return np.stack([(keys >> 16) & 0xFF, (keys >> 8) & 0xFF, keys & 0xFF], -1).astype(
+        np.uint8
+    )
+
+
+def parse_hex(value: str) -> int:
+    """Parse '#rrggbb' (case-insensitive) into a packed RGB key."""
+    digits = value[1:] if value.startswith("#") else value
+    if len(digits) != 6:
+        raise ValueError(f"not a #rrggbb color: {value!r}")
+    return int(digits, 16)
+
+
+class Palette(NamedTuple):
+    name: str
+    keys: np.ndarray  # distinct colors, packed uint32 RGB, file order
+    names: list[str]  # every named entry, file order
+    name_index: np.ndarray  # per name, its index into keys
+
+    @property
+    def colors(self) -> np.ndarray:
+        """Distinct colors as an (n, 3) uint8 array."""
+        return unpack_rgb(self.keys)
+
+    def entries(self) -> dict[str, str]:
+        """Name -> '#rrggbb' for every entry."""
+        return {
+            name: f"#{int(self.keys[i]):06x}"
+            for name, i in zip(self.names, self.name_index)
+        }
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+def palette_name(path: str) -> str:
+    """'art/palettes/cloverhollow.palette.json' -> 'cloverhollow'."""
+    name = os.path.basename(path)
+    return name[: -len(".palette.json")] if name.endswith(".palette.json") else name
+
+
+def parse(data: dict, name: str) -> Palette:
+    """Flatten a decoded palette JSON document."""
+    named: list[tuple[str, int]] = []
+
+    def walk(node, prefix: str) -> None:
+        if isinstance(node, str):
+            named.append((prefix, parse_hex(node)))
+        elif isinstance(node, dict):
+            for key, child in node.items():
+                walk(child, f"{prefix}.{key}" if prefix else key)
+        else:
+            raise ValueError(f"unexpected palette entry at {prefix!r}: {node!r}")
+
+    colors = data.get("colors")
+    if isinstance(colors, list):
+        labels = data.get("color_names")
+        if not isinstance(labels, list) or len(labels) != len(colors):
+            labels = [str(i) for i in range(len(colors))]
+        for label, value in zip(labels, colors):
+            walk(value, label)
+    elif isinstance(colors, dict):
+        walk(colors, "")
+    else:
+        raise ValueError("palette has no 'colors' list or map")
+    if not named:
+        raise ValueError("palette has no colors")
+
+    distinct = list(dict.fromkeys(key for _, key in named))
+    position = {key: i for i, key in enumerate(distinct)}
+    return Palette(
+        name=name,
+        keys=np.array(distinct, dtype=np.uint32),
+        names=[label for label, _ in named],
+        name_index=np.array([position[key] for _, key in named], dtype=np.uint32),
+    )
+
+
+def compile_palette(palette: Palette) -> bytes:
+    """Serialize to the compiled binary form."""
+    blob = [label.encode() for label in palette.names]
+    offsets = np.cumsum([0] + [len(b) for b in blob], dtype=np.uint32)
+    return b"".join(
+        [
+            HEADER.pack(MAGIC, COMPILED_VERSION, len(palette.keys), len(blob)),
+            palette.keys.astype("<u4").tobytes(),
+            palette.name_index.astype("<u4").tobytes(),
+            offsets.astype("<u4").tobytes(),
+            *blob,
+        ]
+    )
+
+
+def decompile(buf: bytes, name: str) -> Palette:
+    """Inverse of compile_palette()."""
+    magic, version, n_colors, n_names = HEADER.unpack_from(buf)
+    if magic != MAGIC or version != COMPILED_VERSION:
+        raise ValueError("not a compiled palette (or an older version)")
+    pos = HEADER.size
+    keys = np.frombuffer(buf, "<u4", n_colors, pos)
+    pos += 4 * n_colors
+    name_index = np.frombuffer(buf, "<u4", n_names, pos)
+    pos += 4 * n_names
+    offsets = np.frombuffer(buf, "<u4", n_names + 1, pos)
+    pos += 4 * (n_names + 1)
+    # offsets are byte offsets: slice the blob before decoding each name
+    names = [
+        buf[pos + offsets[i] : pos + offsets[i + 1]].decode() for i in range(n_names)
+    ]
+    return Palette(name, keys.astype(np.uint32), names, name_index.astype(np.uint32))
+
+
+def file_digest(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def load(path: str, cache_dir: Path = CACHE_DIR) -> Palette:
+    """Load a palette JSON file through the compiled cache."""
+    name = palette_name(path)
+    with open(path, "rb") as f:
+        raw = f.read()
+    cached = cache_dir / f"{hashlib.sha256(raw).hexdigest()[:24]}.pal"
+    try:
+        return decompile(cached.read_bytes(), name)
+    except (OSError, ValueError, struct.error):
+        pass
+    palette = parse(json.loads(raw), name)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = cached.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(compile_palette(palette))
+        os.replace(tmp, cached)
+    except OSError:
+        pass  # read-only checkout: still usable, just not cached
+    return palette
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("palettes", nargs="+", help="*.palette.json files")
+    parser.add_argument("--entries", action="store_true", help="list every named entry")
+    args = parser.parse_args()
+
+    failures = 0
+    for path in args.palettes:
+        try:
+            palette = load(path)
+        except (OSError, ValueError) as e:
+            print(f"[art] ERROR: {path}: {e}")
+            failures += 1
+            continue
+        print(
+            f"[art] {palette.name}: {len(palette.names)} entries, "
+            f"{len(palette)} distinct colors"
+        )
+        if args.entries:
+            for label, value in palette.entries().items():
+                print(f"  {label:32s} {value}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
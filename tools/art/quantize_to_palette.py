@@ -1,15 +1,372 @@
 #!/usr/bin/env python3
+"""
+Quantize PNG sprites to the colors of a palette file.
 
-"""quantize_to_palette.py (placeholder)
+Every visible pixel is snapped to its nearest palette color, ties going to
+the earlier palette entry. --metric picks the distance: squared sRGB
+distance (rgb, the default, as ImageMagick -remap did) or Euclidean
+distance in CIELAB (lab) or OKLab (oklab), which pick skin tones and
+foliage shades by how they look rather than by raw channel values. Alpha
+is copied through untouched, and fully transparent pixels keep their RGB
+so invisible data does not churn. Files whose pixels do not change are
+not rewritten. Output keeps the input's channels: RGB without alpha,
+RGBA with it; greyscale (L/LA) inputs stay greyscale when every
+quantized color is a grey, and are written as RGB/RGBA otherwise.
 
-Goal:
-- take an input PNG
-- quantize pixels to allowed palette colors
-- output a normalized PNG
+The palette is loaded once per run and nearest-color lookups are a gather
+from a full 24-bit RGB -> palette-index table (16 MiB of uint8). The table
+is cached in .artcache/lut/ per metric, keyed by the sha256 of the palette
+file: a cold run builds it once (about a second for rgb, a few seconds for
+the perceptual metrics), warm runs memory-map it with no parsing. With
+--no-cache the table is filled on demand instead, searching only the
+colors each image introduces.
 
-Implement in Milestone 7.
+Usage:
+  python3 tools/art/quantize_to_palette.py --palette art/palettes/cloverhollow.palette.json \\
+      game/assets/sprites/props game/assets/sprites/tiles
+  python3 tools/art/quantize_to_palette.py --palette PAL sprite.png -o out.png
+  python3 tools/art/quantize_to_palette.py --palette PAL --check DIR   # CI: fail if not quantized
 """
 
-import sys
-print("[art] quantize_to_palette placeholder. Implement in Milestone 7.")
-sys.exit(1)
+import argparse
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from PIL import Image
+
+import palette as palettes
+from palette import pack_rgb, unpack_rgb
+
+UNSET = 0xFF  # LUT sentinel; palettes are capped at 255 colors
+MAX_COLORS = UNSET
+LUT_SIZE = 1 << 24
+LUT_SCHEME = 1
+LUT_DIR = Path(__file__).resolve().parents[2] / ".artcache" / "lut"
+
+
+# sRGB transfer curve, tabulated per 8-bit channel value
+_LINEAR = np.where(
+    np.arange(256) / 255 <= 0.04045,
+    np.arange(256) / 255 / 12.92,
+    ((np.arange(256) / 255 + 0.055) / 1.055) ** 2.4,
+).astype(np.float32)
+
+# Linear sRGB -> CIE XYZ (D65), and the D65 reference white
+_RGB_TO_XYZ = np.array(
+    [
+        [0.4124564, 0.3575761, 0.1804375],
+        [0.2126729, 0.7151522, 0.0721750],
+        [0.0193339, 0.1191920, 0.9503041],
+    ],
+    dtype=np.float32,
+)
+_D65 = np.array([0.95047, 1.0, 1.08883], dtype=np.float32)
+
+# Linear sRGB -> LMS and LMS' -> OKLab (Ottosson, 2020)
+_RGB_TO_LMS = np.array(
+    [
+        [0.4122214708, 0.5363325363, 0.0514459929],
+        [0.2119034982, 0.6806995451, 0.1073969566],
+        [0.0883024619, 0.2817188376, 0.6299787005],
+    ],
+    dtype=np.float32,
+)
+_LMS_TO_OKLAB = np.array(
+    [
+        [0.2104542553, 0.7936177850, -0.0040720468],
+        [1.9779984951, -2.4285922050, 0.4505937099],
+        [0.0259040371, 0.7827717662, -0.8086757660],
+    ],
+    dtype=np.float32,
+)
+
+
+def to_lab(rgb: np.ndarray) -> np.ndarray:
+    """(..., 3) uint8 sRGB to CIELAB (D65), float32."""
+    xyz = _LINEAR[rgb] @ _RGB_TO_XYZ.T / _D65
+    f = np.where(xyz > (6 / 29) ** 3, np.cbrt(xyz), xyz / (3 * (6 / 29) ** 2) + 4 / 29)
+    return np.stack(
+        [
+            116 * f[..., 1] - 16,
+            500 * (f[..., 0] - f[..., 1]),
+            200 * (f[..., 1] - f[..., 2]),
+        ],
+        -1,
+    ).astype(np.float32)
+
+
+def to_oklab(rgb: np.ndarray) -> np.ndarray:
+    """(..., 3) uint8 sRGB to OKLab, float32."""
+    return (np.cbrt(_LINEAR[rgb] @ _RGB_TO_LMS.T) @ _LMS_TO_OKLAB.T).astype(np.float32)
+
+
+# Perceptual metrics: Euclidean distance after converting to these spaces
+SPACES = {"lab": to_lab, "oklab": to_oklab}
+METRICS = ["rgb", *SPACES]
+
+
+def nearest_points(
+    points: np.ndarray, targets: np.ndarray, block: int = 1 << 16
+) -> np.ndarray:
+    """Index of the nearest target for each (n, 3) float32 point.
+
+    A running minimum over targets keeps the earliest index on ties. Only
+    element-wise arithmetic is used, so a point's answer does not depend on
+    how the points are batched. Points are processed in cache-sized blocks,
+    channel-major so every pass is contiguous.
+    """
+    index = np.zeros(len(points), dtype=np.uint8)
+    for start in range(0, len(points), block):
+        cols = np.ascontiguousarray(points[start : start + block].T)
+        n = cols.shape[1]
+        best = np.full(n, np.inf, dtype=np.float32)
+        dist = np.empty_like(best)
+        delta = np.empty_like(best)
+        closer = np.empty(n, dtype=bool)
+        out = index[start : start + n]
+        for j, target in enumerate(targets):
+            np.subtract(cols[0], target[0], out=dist)
+            np.multiply(dist, dist, out=dist)
+            for c in (1, 2):
+                np.subtract(cols[c], target[c], out=delta)
+                np.multiply(delta, delta, out=delta)
+                np.add(dist, delta, out=dist)
+            np.less(dist, best, out=closer)
+            np.minimum(dist, best, out=best)
+            out[closer] = j
+    return index
+
+
+def nearest(colors: np.ndarray, palette: np.ndarray, metric: str = "rgb") -> np.ndarray:
+    """Index of the nearest palette entry for each (n, 3) uint8 color."""
+    if metric in SPACES:
+        space = SPACES[metric]
+        return nearest_points(space(colors), space(palette))
+    diff = colors[:, None, :].astype(np.int32) - palette[None, :, :].astype(np.int32)
+    return np.argmin(np.einsum("npc,npc->np", diff, diff), axis=1).astype(np.uint8)
+
+
+def build_lut(palette: np.ndarray, metric: str = "rgb") -> np.ndarray:
+    """Nearest palette index (under metric) for every 24-bit RGB key."""
+    if metric in SPACES:
+        return _build_space_lut(palette, SPACES[metric])
+    return _build_rgb_lut(palette)
+
+
+def _build_rgb_lut(palette: np.ndarray) -> np.ndarray:
+    """Exact integer RGB table.
+
+    Squared distance is separable per channel, so the G/B part is tabulated
+    once per palette entry and each red plane adds a scalar; a running
+    minimum over entries keeps the earliest index on ties, like nearest().
+    """
+    values = np.arange(256, dtype=np.int32)
+    sq = (values[None, None, :] - palette[:, :, None].astype(np.int32)) ** 2
+    gb = (sq[:, 1, :, None] + sq[:, 2, None, :]).reshape(len(palette), -1)
+    lut = np.zeros((256, 1 << 16), dtype=np.uint8)
+    best = np.empty(1 << 16, dtype=np.int32)
+    dist = np.empty_like(best)
+    closer = np.empty(1 << 16, dtype=bool)
+    for r in range(256):
+        np.add(gb[0], sq[0, 0, r], out=best)
+        for j in range(1, len(palette)):
+            np.add(gb[j], sq[j, 0, r], out=dist)
+            np.less(dist, best, out=closer)
+            np.minimum(dist, best, out=best)
+            lut[r][closer] = j
+    return lut.reshape(-1)
+
+
+def _build_space_lut(palette: np.ndarray, space, chunk: int = 1 << 16) -> np.ndarray:
+    """Perceptual table: convert each block of keys, then nearest_points()."""
+    targets = space(palette)
+    lut = np.empty(LUT_SIZE, dtype=np.uint8)
+    for start in range(0, LUT_SIZE, chunk):
+        keys = np.arange(start, start + chunk, dtype=np.uint32)
+        lut[start : start + chunk] = nearest_points(space(unpack_rgb(keys)), targets)
+    return lut
+
+
+def lut_path(palette_path: str, metric: str, cache_dir: Path) -> Path:
+    """Cache file for a palette's table, keyed by the palette file's hash."""
+    digest = palettes.file_digest(palette_path)
+    return cache_dir / f"{digest[:24]}.v{LUT_SCHEME}.{metric}.lut"
+
+
+def load_lut(
+    palette_path: str, palette: np.ndarray, metric: str, cache_dir: Path
+) -> tuple[np.ndarray, bool]:
+    """Memory-map the cached table, building it first on a miss.
+
+    Returns (table, built).
+    """
+    path = lut_path(palette_path, metric, cache_dir)
+    built = False
+    if not path.exists() or path.stat().st_size != LUT_SIZE:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        build_lut(palette, metric).tofile(tmp)
+        os.replace(tmp, path)
+        built = True
+    return np.memmap(path, dtype=np.uint8, mode="r", shape=(LUT_SIZE,)), built
+
+
+class Quantizer:
+    """Nearest-palette-color remapper backed by a 24-bit LUT.
+
+    Without a prebuilt table the LUT starts empty and is filled on demand.
+    """
+
+    def __init__(
+        self,
+        palette: np.ndarray,
+        lut: Optional[np.ndarray] = None,
+        metric: str = "rgb",
+    ):
+        self.palette = palette
+        self.metric = metric
+        self.lazy = lut is None
+        self.lut = np.full(LUT_SIZE, UNSET, dtype=np.uint8) if lut is None else lut
+
+    def indices(self, keys: np.ndarray) -> np.ndarray:
+        """Palette index for each packed RGB key, filling LUT misses."""
+        found = self.lut[keys]
+        if not self.lazy:
+            return found
+        missing = found == UNSET
+        if missing.any():
+            todo = np.unique(keys[missing])
+            self.lut[todo] = nearest(unpack_rgb(todo), self.palette, self.metric)
+            found = self.lut[keys]
+        return found
+
+    def remap(self, canvas: np.ndarray) -> np.ndarray:
+        """Return a quantized copy of an RGBA canvas; alpha is unchanged."""
+        out = canvas.copy()
+        visible = canvas[:, :, 3] > 0
+        keys = pack_rgb(canvas[:, :, :3][visible])
+        out[:, :, :3][visible] = self.palette[self.indices(keys)]
+        return out
+
+
+def collect(inputs: list[str]) -> list[str]:
+    """Expand directories into their *.png files (sorted, recursive)."""
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, dirs, files in os.walk(item):
+                dirs.sort()
+                paths.extend(
+                    os.path.join(root, name)
+                    for name in sorted(files)
+                    if name.endswith(".png")
+                )
+        else:
+            paths.append(item)
+    return paths
+
+
+def output_mode(mode: str, has_alpha: bool, result: np.ndarray) -> str:
+    """Image mode to write result in for an input of the given mode."""
+    rgb = result[..., :3]
+    if mode in ("L", "LA") and np.all(rgb == rgb[..., :1]):
+        return "LA" if has_alpha else "L"
+    return "RGBA" if has_alpha else "RGB"
+
+
+def quantize_file(
+    quantizer: Quantizer, path: str, output: Optional[str], check: bool
+) -> int:
+    """Quantize one PNG; return how many pixels changed."""
+    with Image.open(path) as img:
+        mode = img.mode
+        has_alpha = mode in ("RGBA", "LA") or "transparency" in img.info
+        canvas = np.array(img.convert("RGBA"))
+    result = quantizer.remap(canvas)
+    changed = int(np.any(result != canvas, axis=-1).sum())
+    if check:
+        return changed
+    target = output or path
+    if changed or target != path:
+        out_mode = output_mode(mode, has_alpha, result)
+        if mode in ("L", "LA") and out_mode not in ("L", "LA"):
+            print(f"[art] {path}: palette colors are not grey; writing {out_mode}")
+        Image.fromarray(result).convert(out_mode).save(target)
+    return changed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("inputs", nargs="+", help="PNG files or directories")
+    parser.add_argument("--palette", required=True, help="*.palette.json file")
+    parser.add_argument(
+        "-o", "--output", help="output path (single input file only; default: in place)"
+    )
+    parser.add_argument(
+        "--metric",
+        choices=METRICS,
+        default="rgb",
+        help="color distance: rgb (default), lab (CIELAB) or oklab",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="do not read or write the lookup table cache in .artcache/lut",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="write nothing; exit 1 if any file is not already quantized",
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    try:
+        palette = palettes.load(args.palette).colors
+        if len(palette) > MAX_COLORS:
+            raise ValueError(f"{len(palette)} colors (max {MAX_COLORS})")
+    except (OSError, ValueError) as e:
+        print(f"[art] ERROR: {args.palette}: {e}")
+        return 1
+
+    paths = collect(args.inputs)
+    if args.output and (len(paths) != 1 or os.path.isdir(args.inputs[0])):
+        print("[art] ERROR: --output needs exactly one input file")
+        return 1
+
+    lut = None
+    if not args.no_cache:
+        lut, built = load_lut(args.palette, palette, args.metric, LUT_DIR)
+        if built:
+            print(f"[art] Built {args.metric} lookup table for {args.palette}")
+    quantizer = Quantizer(palette, lut, args.metric)
+    failures = dirty = 0
+    for path in paths:
+        try:
+            changed = quantize_file(quantizer, path, args.output, args.check)
+        except OSError as e:
+            print(f"[art] ERROR: {path}: {e}")
+            failures += 1
+            continue
+        if changed:
+            dirty += 1
+            verb = "would change" if args.check else "quantized"
+            dest = f" -> {args.output}" if args.output else ""
+            print(f"[art] {verb} {path}{dest} ({changed} px)")
+
+    elapsed = time.perf_counter() - started
+    name = os.path.basename(args.palette)
+    print(
+        f"[art] {dirty}/{len(paths)} file(s) {'off' if args.check else 'remapped to'} "
+        f"palette {name} ({len(palette)} colors, {args.metric}) in {elapsed:.2f}s"
+    )
+    if failures or (args.check and dirty):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Shared NumPy raster primitives for the tools/art generators.
+
+A canvas is a (height, width, 4) uint8 RGBA array indexed [y, x]. Drawing
+helpers take x before y (like the old PIL pixel access) and spans follow
+range() semantics: start inclusive, stop exclusive. Anything drawn outside
+the canvas is clipped.
+
+Colors may be RGB or RGBA tuples; RGB colors are made opaque.
+"""
+
+import numpy as np
+from PIL import Image
+
+TRANSPARENT = (0, 0, 0, 0)
+
+
+def rgba(color, alpha=255):
+    """Normalize an RGB or RGBA tuple to RGBA."""
+    return tuple(color) if len(color) == 4 else (*color, alpha)
+
+
+def new_canvas(width, height, fill=TRANSPARENT):
+    """Create a width x height canvas filled with a single color."""
+    canvas = np.empty((height, width, 4), dtype=np.uint8)
+    canvas[:, :] = rgba(fill)
+    return canvas
+
+
+def load(path):
+    """Decode a PNG into a new canvas."""
+    with Image.open(path) as img:
+        return np.array(img.convert("RGBA"))
+
+
+def to_image(canvas):
+    """Wrap a canvas as a PIL RGBA image."""
+    return Image.fromarray(canvas)
+
+
+def save(canvas, path):
+    """Encode a canvas as PNG."""
+    to_image(canvas).save(path)
+
+
+def _clip(canvas, x0, y0, x1, y1):
+    height, width = canvas.shape[:2]
+    return max(x0, 0), max(y0, 0), min(x1, width), min(y1, height)
+
+
+def put(canvas, x, y, color):
+    """Set a single pixel; out-of-bounds writes are ignored."""
+    height, width = canvas.shape[:2]
+    if 0 <= x < width and 0 <= y < height:
+        canvas[y, x] = rgba(color)
+
+
+def plot(canvas, points, color):
+    """Set every (x, y) in points; out-of-bounds points are ignored."""
+    if not len(points):
+        return
+    xs, ys = np.asarray(points).T
+    height, width = canvas.shape[:2]
+    keep = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+    canvas[ys[keep], xs[keep]] = rgba(color)
+
+
+def run(canvas, x0, y, colors):
+    """Paint consecutive pixels on row y, starting at x0, one per color."""
+    for dx, color in enumerate(colors):
+        put(canvas, x0 + dx, y, color)
+
+
+def fill_rect(canvas, x0, y0, x1, y1, color):
+    """Fill the box [x0, x1) x [y0, y1)."""
+    x0, y0, x1, y1 = _clip(canvas, x0, y0, x1, y1)
+    if x0 < x1 and y0 < y1:
+        canvas[y0:y1, x0:x1] = rgba(color)
+
+
+def hline(canvas, x0, x1, y, color):
+    """Draw a horizontal run [x0, x1) on row y."""
+    fill_rect(canvas, x0, y, x1, y + 1, color)
+
+
+def vline(canvas, x, y0, y1, color):
+    """Draw a vertical run [y0, y1) on column x."""
+    fill_rect(canvas, x, y0, x + 1, y1, color)
+
+
+def frame_rect(canvas, x0, y0, x1, y1, color):
+    """Draw the one-pixel border of the box [x0, x1) x [y0, y1)."""
+    hline(canvas, x0, x1, y0, color)
+    hline(canvas, x0, x1, y1 - 1, color)
+    vline(canvas, x0, y0, y1, color)
+    vline(canvas, x1 - 1, y0, y1, color)
+
+
+def bands(canvas, x0, y0, x1, y1, stops):
+    """Fill the box [x0, x1) x [y0, y1) with horizontal color bands.
+
+    stops is a list of (y_stop, color) pairs in ascending order; each band
+    covers the rows from the previous stop (or y0) up to y_stop. A y_stop
+    of None runs the last band to y1.
+    """
+    start = y0
+    for stop, color in stops:
+        stop = y1 if stop is None else min(stop, y1)
+        fill_rect(canvas, x0, start, x1, stop, color)
+        start = max(start, stop)
+
+
+def col_bands(canvas, x0, y0, x1, y1, stops):
+    """Fill the box [x0, x1) x [y0, y1) with vertical color bands.
+
+    Like bands(), but stops are x thresholds splitting the box into columns.
+    """
+    start = x0
+    for stop, color in stops:
+        stop = x1 if stop is None else min(stop, x1)
+        fill_rect(canvas, start, y0, stop, y1, color)
+        start = max(start, stop)
+
+
+def edged_hline(canvas, x0, x1, y, edge, stops):
+    """Draw row y over [x0, x1): edge color at both ends, col_bands between."""
+    put(canvas, x0, y, edge)
+    put(canvas, x1 - 1, y, edge)
+    col_bands(canvas, x0 + 1, y, x1 - 1, y + 1, stops)
+
+
+def diagonal_stripes(canvas, x0, y0, x1, y1, colors):
+    """Fill the box with one-pixel diagonal stripes cycling through colors.
+
+    The pixel at (x, y) gets colors[(x + y) % len(colors)].
+    """
+    xs, ys = grid(x0, y0, x1, y1)
+    phase = (xs + ys) % len(colors)
+    for i, color in enumerate(colors):
+        fill_mask(canvas, x0, y0, phase == i, color)
+
+
+def stamp(canvas, x0, y0, rows, key):
+    """Paint ASCII art rows with their top-left at (x0, y0).
+
+    key maps characters to colors; any other character is left untouched.
+    """
+    width = max(len(row) for row in rows)
+    art = np.array([list(row.ljust(width)) for row in rows])
+    for char, color in key.items():
+        fill_mask(canvas, x0, y0, art == char, color)
+
+
+def grid(x0, y0, x1, y1):
+    """Return (xs, ys) coordinate arrays covering [x0, x1) x [y0, y1)."""
+    ys, xs = np.mgrid[y0:y1, x0:x1]
+    return xs, ys
+
+
+def fill_mask(canvas, x0, y0, mask, color):
+    """Paint color wherever mask is true, with mask[0, 0] at (x0, y0)."""
+    mask = np.asarray(mask, dtype=bool)
+    h, w = mask.shape
+    cx0, cy0, cx1, cy1 = _clip(canvas, x0, y0, x0 + w, y0 + h)
+    if cx0 >= cx1 or cy0 >= cy1:
+        return
+    sub = mask[cy0 - y0 : cy1 - y0, cx0 - x0 : cx1 - x0]
+    canvas[cy0:cy1, cx0:cx1][sub] = rgba(color)
+
+
+def ellipse_field(x0, y0, x1, y1, cx, cy, a, b):
+    """Return dx*dx/a + dy*dy/b over the box [x0, x1) x [y0, y1).
+
+    Values below 1 lie inside the ellipse centred on (cx, cy) with squared
+    radii a and b; thresholding the field gives fills and rings.
+    """
+    xs, ys = grid(x0, y0, x1, y1)
+    dx = xs - cx
+    dy = ys - cy
+    return dx * dx / a + dy * dy / b
+
+
+def diamond(canvas, cx, cy, r, color):
+    """Stamp a filled diamond (|dx| + |dy| <= r) centred on (cx, cy)."""
+    xs, ys = grid(-r, -r, r + 1, r + 1)
+    fill_mask(canvas, cx - r, cy - r, np.abs(xs) + np.abs(ys) <= r, color)
+
+
+def circle(canvas, cx, cy, r, color):
+    """Stamp a filled circle (dx*dx + dy*dy <= r*r) centred on (cx, cy)."""
+    xs, ys = grid(-r, -r, r + 1, r + 1)
+    fill_mask(canvas, cx - r, cy - r, xs * xs + ys * ys <= r * r, color)
+
+
+def opaque(canvas):
+    """Return a boolean mask of pixels with non-zero alpha."""
+    return canvas[:, :, 3] > 0
+
+
+def matches(canvas, color):
+    """Return a boolean mask of pixels exactly equal to color."""
+    return np.all(canvas == rgba(color), axis=-1)
+
+
+def outline(canvas, color, diagonal=False):
+    """Outline pass: paint transparent pixels that touch an opaque one.
+
+    Uses 4-neighbour adjacency, or 8-neighbour when diagonal is set.
+    """
+    solid = opaque(canvas)
+    padded = np.pad(solid, 1)
+    h, w = solid.shape
+    edge = np.zeros_like(solid)
+    offsets = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    if diagonal:
+        offsets += [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+    for dy, dx in offsets:
+        edge |= padded[1 + dy : 1 + dy + h, 1 + dx : 1 + dx + w]
+    canvas[edge & ~solid] = rgba(color)
@@ -1,15 +1,242 @@
 #!/usr/bin/env python3
+"""
+Validate sprites against size, transparency and palette rules in one pass.
+
+All palettes are loaded once and folded into a single 24-bit RGB -> bitmask
+table (bit k set when the color is in palette k). Each PNG is decoded once;
+its distinct visible colors are looked up in that table, which checks
+membership in every palette at the same time.
 
-"""validate_sprite.py (placeholder)
+Checks per sprite:
+- size: width/height are multiples of --grid (warning), and fixed-size
+  directories match their required size (error; see SIZE_RULES)
+- transparency: an alpha channel is present (warning) and alpha is binary,
+  0 or 255, as pixel art has no soft edges (warning)
+- palette: which palettes contain every visible color; fitting none is a
+  warning. Fully transparent pixels are ignored.
 
-Goal:
-- verify transparency
-- verify dimensions
-- verify palette compliance (no stray colors)
+Errors fail the run; warnings only fail it with --strict. --report writes
+the full per-sprite results as JSON.
 
-Implement in Milestone 7.
+Usage:
+  python3 tools/art/validate_sprite.py                      # game/assets/sprites vs all palettes
+  python3 tools/art/validate_sprite.py sprite.png --palette art/palettes/cloverhollow.palette.json --strict
+  python3 tools/art/validate_sprite.py --report .artcache/sprite-validation.json
 """
 
-import sys
-print("[art] validate_sprite placeholder. Implement in Milestone 7.")
-sys.exit(1)
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+import palette as palettes
+from palette import pack_rgb
+from quantize_to_palette import LUT_SIZE, collect
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_SPRITES = "game/assets/sprites"
+DEFAULT_PALETTES = "art/palettes"
+REPORT_SCHEME = 1
+
+# Directories (repo-relative) whose images must have an exact size
+SIZE_RULES = {
+    "game/assets/sprites/backgrounds/": (512, 288),
+}
+
+# Off-palette colors listed per palette in the report
+SAMPLE_COLORS = 8
+
+
+def membership_table(loaded: list[palettes.Palette]) -> np.ndarray:
+    """24-bit RGB -> bitmask of the palettes containing that color."""
+    for dtype in (np.uint8, np.uint16, np.uint32, np.uint64):
+        if len(loaded) <= np.iinfo(dtype).bits:
+            break
+    else:
+        raise ValueError(f"too many palettes ({len(loaded)}, max 64)")
+    table = np.zeros(LUT_SIZE, dtype=dtype)
+    for k, palette in enumerate(loaded):
+        table[palette.keys] |= dtype(1 << k)
+    return table
+
+
+def hex_color(key: int) -> str:
+    return f"#{int(key):06x}"
+
+
+def repo_relative(path: str) -> str:
+    """Path relative to the repo root with / separators, for SIZE_RULES."""
+    try:
+        return Path(path).resolve().relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return Path(path).as_posix()
+
+
+def validate(path: str, names: list[str], table: np.ndarray, grid: int) -> dict:
+    """Check one sprite and return its report entry."""
+    with Image.open(path) as img:
+        mode = img.mode
+        has_alpha = mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+        canvas = np.array(img.convert("RGBA"))
+    height, width = canvas.shape[:2]
+    alpha = canvas[:, :, 3]
+    errors: list[str] = []
+    warnings: list[str] = []
+
+    if grid and (width % grid or height % grid):
+        warnings.append(f"size {width}x{height} is not a multiple of {grid}")
+    rel = repo_relative(path)
+    for prefix, size in SIZE_RULES.items():
+        if rel.startswith(prefix) and (width, height) != size:
+            errors.append(f"size {width}x{height}, expected {size[0]}x{size[1]}")
+
+    partial = int(np.count_nonzero((alpha > 0) & (alpha < 255)))
+    if not has_alpha:
+        warnings.append(f"no alpha channel (mode {mode})")
+    if partial:
+        warnings.append(f"{partial} semi-transparent pixel(s)")
+
+    keys = np.unique(pack_rgb(canvas[:, :, :3][alpha > 0]))
+    masks = table[keys]
+    palettes = {}
+    fits = []
+    for k, name in enumerate(names):
+        off = keys[(masks >> k) & 1 == 0]
+        palettes[name] = {
+            "off_colors": int(len(off)),
+            "sample": [hex_color(c) for c in off[:SAMPLE_COLORS]],
+        }
+        if not len(off):
+            fits.append(name)
+    if names and not fits:
+        closest = min(names, key=lambda name: palettes[name]["off_colors"])
+        off = palettes[closest]
+        warnings.append(
+            f"colors fit no palette (closest: {closest}, "
+            f"{off['off_colors']} off, e.g. {', '.join(off['sample'][:3])})"
+        )
+
+    return {
+        "path": rel,
+        "width": width,
+        "height": height,
+        "mode": mode,
+        "colors": int(len(keys)),
+        "semi_transparent": partial,
+        "fits": fits,
+        "palettes": palettes,
+        "errors": errors,
+        "warnings": warnings,
+    }
+
+
+def write_report(path: str, report: dict) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        help=f"PNG files or directories (default: {DEFAULT_SPRITES})",
+    )
+    parser.add_argument(
+        "--palette",
+        action="append",
+        default=[],
+        help=f"palette file (repeatable; default: every {DEFAULT_PALETTES}/*.palette.json)",
+    )
+    parser.add_argument(
+        "--grid",
+        type=int,
+        default=16,
+        help="required size multiple in pixels (default: 16; 0 disables)",
+    )
+    parser.add_argument("--report", metavar="JSON", help="write a JSON report here")
+    parser.add_argument(
+        "--strict", action="store_true", help="fail on warnings as well as errors"
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="print every warning, not just errors"
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    palette_paths = args.palette or sorted(
+        str(p) for p in (REPO_ROOT / DEFAULT_PALETTES).glob("*.palette.json")
+    )
+    loaded = []
+    for path in palette_paths:
+        try:
+            loaded.append(palettes.load(path))
+        except (OSError, ValueError) as e:
+            print(f"[art] ERROR: {path}: {e}")
+            return 1
+    names = [palette.name for palette in loaded]
+    table = membership_table(loaded)
+
+    inputs = args.inputs or [str(REPO_ROOT / DEFAULT_SPRITES)]
+    sprites = []
+    for path in collect(inputs):
+        try:
+            entry = validate(path, names, table, args.grid)
+        except OSError as e:
+            entry = {"path": repo_relative(path), "errors": [str(e)], "warnings": []}
+        sprites.append(entry)
+
+    errors = sum(len(s["errors"]) for s in sprites)
+    warnings = sum(len(s["warnings"]) for s in sprites)
+    for s in sprites:
+        for message in s["errors"]:
+            print(f"[art] ERROR: {s['path']}: {message}")
+        if args.verbose or args.strict:
+            for message in s["warnings"]:
+                print(f"[art] WARN: {s['path']}: {message}")
+
+    fits: dict[str, int] = {name: 0 for name in names}
+    for s in sprites:
+        for name in s.get("fits", []):
+            fits[name] += 1
+    elapsed = time.perf_counter() - started
+    if args.report:
+        write_report(
+            args.report,
+            {
+                "scheme": REPORT_SCHEME,
+                "grid": args.grid,
+                "palettes": {
+                    palette.name: {"path": path, "colors": len(palette)}
+                    for path, palette in zip(palette_paths, loaded)
+                },
+                "summary": {
+                    "sprites": len(sprites),
+                    "errors": errors,
+                    "warnings": warnings,
+                    "fits": fits,
+                },
+                "sprites": sprites,
+            },
+        )
+
+    for name, count in fits.items():
+        print(f"[art] {count:4d} sprite(s) fit palette {name}")
+    hint = "" if args.verbose or args.strict else " (--verbose lists warnings)"
+    print(
+        f"[art] Validated {len(sprites)} sprite(s) against {len(names)} palette(s) "
+        f"in {elapsed:.2f}s: {errors} error(s), {warnings} warning(s){hint}"
+    )
+    if errors or (args.strict and warnings):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,7 @@
 #!/usr/bin/env bash
 set -euo pipefail
 
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 SCENARIO_ID="${1:-}"
 BASELINE_DIR="${BASELINE_DIR:-baselines/visual}"
 CAPTURE_DIR="${2:-}"
@@ -29,18 +30,6 @@ if [[ -z "$SCENARIO_ID" ]]; then
     usage
 fi
 
-if ! command -v magick &> /dev/null && ! command -v compare &> /dev/null; then
-    echo -e "${RED}ERROR:${NC} ImageMagick is required but not installed."
-    echo "Install with: brew install imagemagick"
-    exit 1
-fi
-
-if command -v magick &> /dev/null; then
-    COMPARE="magick compare"
-else
-    COMPARE="compare"
-fi
-
 BASELINE_SCENARIO_DIR="$BASELINE_DIR/$SCENARIO_ID"
 if [[ ! -d "$BASELINE_SCENARIO_DIR" ]]; then
     echo -e "${YELLOW}WARNING:${NC} No baseline found for scenario: $SCENARIO_ID"
@@ -68,68 +57,18 @@ echo "Baseline: $BASELINE_SCENARIO_DIR"
 echo "Capture:  $CAPTURE_DIR"
 echo ""
 
-DIFF_DIR="${CAPTURE_DIR}/diffs"
-mkdir -p "$DIFF_DIR"
+DIFF_DIR="${CAPTURE_DIR%/}/diffs"
 
-PASSED=0
-FAILED=0
-MISSING=0
-
-for baseline_file in "$BASELINE_SCENARIO_DIR"/*.png; do
-    if [[ ! -f "$baseline_file" ]]; then
-        continue
-    fi
-    
-    filename=$(basename "$baseline_file")
-    capture_file="$CAPTURE_DIR/$filename"
-    diff_file="$DIFF_DIR/$filename"
-    
-    if [[ ! -f "$capture_file" ]]; then
-        echo -e "${YELLOW}MISSING:${NC} $filename"
-        ((MISSING++)) || true
-        continue
-    fi
-    
-    result=$($COMPARE -metric AE "$baseline_file" "$capture_file" "$diff_file" 2>&1) || true
-    
-    if [[ "$result" == "0" ]]; then
-        echo -e "${GREEN}MATCH:${NC}   $filename"
-        rm -f "$diff_file"
-        ((PASSED++)) || true
-    else
-        echo -e "${RED}DIFF:${NC}    $filename (${result} pixels differ)"
-        ((FAILED++)) || true
-    fi
-done
-
-for capture_file in "$CAPTURE_DIR"/*.png; do
-    if [[ ! -f "$capture_file" ]]; then
-        continue
-    fi
-    
-    filename=$(basename "$capture_file")
-    baseline_file="$BASELINE_SCENARIO_DIR/$filename"
-    
-    if [[ ! -f "$baseline_file" ]]; then
-        echo -e "${YELLOW}NEW:${NC}     $filename (no baseline)"
-        ((MISSING++)) || true
-    fi
-done
-
-echo ""
-echo "=== Summary ==="
-echo -e "Passed:  ${GREEN}$PASSED${NC}"
-echo -e "Failed:  ${RED}$FAILED${NC}"
-echo -e "Missing: ${YELLOW}$MISSING${NC}"
-
-if [[ $FAILED -gt 0 ]]; then
+if python3 "$SCRIPT_DIR/../visual/diff_frames.py" \
+    --golden "$BASELINE_SCENARIO_DIR" --current "$CAPTURE_DIR" --out "$DIFF_DIR" \
+    --scenario-id "$SCENARIO_ID"; then
     echo ""
-    echo -e "${RED}Visual regression detected!${NC}"
-    echo "Diff images saved to: $DIFF_DIR"
-    echo "To update baselines: ./tools/ci/update-baseline.sh $SCENARIO_ID"
-    exit 1
+    echo -e "${GREEN}Visual regression check passed${NC}"
+    exit 0
 fi
 
 echo ""
-echo -e "${GREEN}Visual regression check passed${NC}"
-exit 0
+echo -e "${RED}Visual regression detected!${NC}"
+echo "Diff heatmaps and report saved to: $DIFF_DIR"
+echo "To update baselines: ./tools/ci/update-baseline.sh $SCENARIO_ID"
+exit 1
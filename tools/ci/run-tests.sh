@@ -1,6 +1,21 @@
 #!/usr/bin/env bash
 set -euo pipefail
 
-echo "[tests] Placeholder test runner."
-echo "[tests] Add your real test runner (e.g., GUT) in a later milestone."
-exit 0
+: "${GODOT_BIN:=godot}"
+
+# Python tool tests (tools/tests/test_*.py, stdlib unittest)
+echo "[tests] Python tool tests..."
+python3 -m unittest discover -s tools/tests -t tools/tests
+
+# Headless GDScript tests (tests/headless/*_test.gd)
+if ! "$GODOT_BIN" --version >/dev/null 2>&1; then
+  echo "[tests] SKIP headless tests: Godot not found (set GODOT_BIN)"
+  exit 0
+fi
+python3 tools/content/build_bundle.py
+for test in tests/headless/*_test.gd; do
+  echo "[tests] $test"
+  "$GODOT_BIN" --headless --path . --script "res://$test"
+done
+
+echo "[tests] OK"
@@ -1,10 +1,10 @@
 #!/usr/bin/env bash
 set -euo pipefail
 
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 SCENARIO_ID="${1:-}"
 BASELINE_DIR="${BASELINE_DIR:-baselines/visual}"
 
-GREEN='\033[0;32m'
 YELLOW='\033[1;33m'
 RED='\033[0;31m'
 NC='\033[0m'
@@ -40,30 +40,18 @@ if [[ ! -d "$CAPTURE_DIR" ]]; then
     exit 1
 fi
 
-BASELINE_SCENARIO_DIR="$BASELINE_DIR/$SCENARIO_ID"
-mkdir -p "$BASELINE_SCENARIO_DIR"
-
 echo "=== Updating Baselines ==="
 echo "Scenario: $SCENARIO_ID"
 echo "From:     $CAPTURE_DIR"
-echo "To:       $BASELINE_SCENARIO_DIR"
+echo "To:       $BASELINE_DIR (manifest: $BASELINE_DIR/$SCENARIO_ID/manifest.json)"
 echo ""
 
-COUNT=0
-for capture_file in "$CAPTURE_DIR"/*.png; do
-    if [[ ! -f "$capture_file" ]]; then
-        continue
-    fi
-    
-    filename=$(basename "$capture_file")
-    cp "$capture_file" "$BASELINE_SCENARIO_DIR/$filename"
-    echo -e "${GREEN}Updated:${NC} $filename"
-    ((COUNT++)) || true
-done
+# Frames are stored once per distinct image under $BASELINE_DIR/blobs/;
+# the scenario manifest maps frame names to those blobs.
+python3 "$SCRIPT_DIR/../visual/golden_store.py" update \
+    --store "$BASELINE_DIR" --scenario "$SCENARIO_ID" "$CAPTURE_DIR"
 
-echo ""
-echo -e "${GREEN}Updated $COUNT baseline image(s)${NC}"
 echo ""
 echo -e "${YELLOW}IMPORTANT:${NC} Review the baselines before committing!"
-echo "  git diff baselines/visual/$SCENARIO_ID/"
-echo "  git add baselines/visual/$SCENARIO_ID/"
+echo "  git diff $BASELINE_DIR/$SCENARIO_ID/"
+echo "  git add $BASELINE_DIR/$SCENARIO_ID/ $BASELINE_DIR/blobs/"
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Compile game/data JSON into one content bundle for exported builds.
+
+Every game/data/**/*.json file is validated with tools/lint (schema
+errors and duplicate ids stop the build; warnings do not) and written
+into game/data/content.bundle, which ContentBundle.gd loads with one file
+read, one native decompress() and one native bytes_to_var() call instead
+of a JSON parse per file.
+
+Layout (little-endian):
+
+  header   "WOCB", u32 version, 32-byte source digest, u32 payload size
+  payload  zlib stream (FileAccess.COMPRESSION_DEFLATE) of one Variant
+           {"<rel path>": doc} in Godot's binary serialization (the format
+           of var_to_bytes / FileAccess.store_var without the length prefix)
+
+Values use the Variant encoding: a u32 header (type, plus a 64-bit flag
+for wide numbers), then NIL nothing, BOOL u32, INT i32/i64, FLOAT
+f32/f64 (f32 only when exact), STRING u32 length + UTF-8 padded to 4
+bytes, ARRAY u32 count + values, DICTIONARY u32 count + key/value pairs.
+Documents are encoded as JSON.parse returns them (every number a float,
+keys in file order), so the engine builds the same Dictionaries and
+Arrays in C++. The uncompressed Variant is larger than the JSON (every
+number and key carries a header and padding); compressed it is a fraction
+of it.
+
+The digest hashes this compiler, the linter and its schemas
+(lint_cache.tool_fingerprint()) and every input file, so an unchanged
+tree is not rebuilt and a lint change re-validates the content; --check
+exits 1 when the bundle is stale. The export plugin in addons/content_bundle runs this script at the start of
+every export and packs the result.
+
+Usage:
+  python3 tools/content/build_bundle.py
+  python3 tools/content/build_bundle.py --check
+  python3 tools/content/build_bundle.py --data game/data --out /tmp/content.bundle
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+import time
+import zlib
+from typing import Any
+
+CONTENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(CONTENT_DIR))
+LINT_DIR = os.path.join(PROJECT_ROOT, "tools", "lint")
+
+if LINT_DIR not in sys.path:
+    sys.path.insert(0, LINT_DIR)
+
+import lint_cache  # noqa: E402
+import lint_content  # noqa: E402
+
+MAGIC = b"WOCB"
+VERSION = 3
+HEADER = struct.Struct("<4sI32sI")
+
+# Variant::Type ids (Godot 4) and the header flag for 64-bit numbers
+NIL, BOOL, INT, FLOAT, STRING = 0, 1, 2, 3, 4
+DICTIONARY, ARRAY = 27, 28
+TYPE_MASK = 0xFF
+FLAG_64 = 1 << 16
+NUMBER_FORMATS = {
+    (INT, False): "<i",
+    (INT, True): "<q",
+    (FLOAT, False): "<f",
+    (FLOAT, True): "<d",
+}
+
+
+def source_digest(data_dir: str, files: list[str]) -> tuple[bytes, dict[str, bytes]]:
+    """Digest of the compiler, the linter that gates it and every input file,
+    and the inputs' bytes."""
+    h = hashlib.sha256(f"version={VERSION}".encode())
+    with open(os.path.abspath(__file__), "rb") as f:
+        h.update(f.read())
+    # A stricter schema or lint rule must re-validate an up-to-date bundle
+    h.update(f"\0lint={lint_cache.tool_fingerprint()}".encode())
+    sources = {}
+    for rel in files:
+        with open(os.path.join(data_dir, rel), "rb") as f:
+            sources[rel] = f.read()
+        h.update(f"\0{rel}\0{len(sources[rel])}\0".encode() + sources[rel])
+    return h.digest(), sources
+
+
+def parse_json(data: bytes) -> Any:
+    """A document as Godot's JSON.parse returns it: every number a float."""
+    return json.loads(data, parse_int=float)
+
+
+def is_f32(value: float) -> bool:
+    try:
+        return struct.unpack("<f", struct.pack("<f", value))[0] == value
+    except OverflowError:
+        return False
+
+
+def encode(value: Any, out: bytearray) -> None:
+    """Append value in Godot's Variant binary encoding (var_to_bytes)."""
+    if value is None:
+        out += struct.pack("<I", NIL)
+    elif isinstance(value, bool):
+        out += struct.pack("<II", BOOL, value)
+    elif isinstance(value, int):
+        if -(1 << 31) <= value < 1 << 31:
+            out += struct.pack("<Ii", INT, value)
+        else:
+            out += struct.pack("<Iq", INT | FLAG_64, value)
+    elif isinstance(value, float):
+        if is_f32(value):
+            out += struct.pack("<If", FLOAT, value)
+        else:
+            out += struct.pack("<Id", FLOAT | FLAG_64, value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        out += struct.pack("<II", STRING, len(data)) + data
+        out += bytes(-len(data) % 4)
+    elif isinstance(value, list):
+        out += struct.pack("<II", ARRAY, len(value))
+        for item in value:
+            encode(item, out)
+    elif isinstance(value, dict):
+        out += struct.pack("<II", DICTIONARY, len(value))
+        for key, item in value.items():
+            encode(key, out)
+            encode(item, out)
+    else:
+        raise TypeError(f"cannot bundle {type(value).__name__}")
+
+
+def decode(data: bytes, at: int = 0) -> tuple[Any, int]:
+    """(value, end offset) of the Variant at offset at; inverse of encode()."""
+    (header,) = struct.unpack_from("<I", data, at)
+    kind, wide = header & TYPE_MASK, bool(header & FLAG_64)
+    at += 4
+    if kind == NIL:
+        return None, at
+    if kind == BOOL:
+        return bool(struct.unpack_from("<I", data, at)[0]), at + 4
+    if kind in (INT, FLOAT):
+        fmt = NUMBER_FORMATS[kind, wide]
+        return struct.unpack_from(fmt, data, at)[0], at + struct.calcsize(fmt)
+    if kind == STRING:
+        (size,) = struct.unpack_from("<I", data, at)
+        text = data[at + 4 : at + 4 + size].decode("utf-8")
+        return text, at + 4 + size + (-size % 4)
+    if kind in (ARRAY, DICTIONARY):
+        (count,) = struct.unpack_from("<I", data, at)
+        at += 4
+        items: Any = [] if kind == ARRAY else {}
+        for _ in range(count & 0x7FFFFFFF):  # bit 31 is the "shared" flag
+            item, at = decode(data, at)
+            if kind == ARRAY:
+                items.append(item)
+            else:
+                items[item], at = decode(data, at)
+        return items, at
+    raise ValueError(f"unsupported Variant type {kind} at offset {at - 4}")
+
+
+def same(a: Any, b: Any) -> bool:
+    """Equal with matching types and key order (1 != 1.0 != True)."""
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return list(a) == list(b) and all(same(a[k], b[k]) for k in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def compile_bundle(docs: dict[str, Any], digest: bytes) -> bytes:
+    """Bundle bytes for rel path -> parsed document."""
+    payload = bytearray()
+    encode(docs, payload)
+    return HEADER.pack(MAGIC, VERSION, digest, len(payload)) + zlib.compress(
+        payload, 9
+    )
+
+
+def read_header(data: bytes) -> tuple[bytes, int]:
+    """(digest, payload size) from a bundle's header."""
+    if len(data) < HEADER.size:
+        raise ValueError("not a content bundle: truncated header")
+    magic, version, digest, size = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"not a version {VERSION} content bundle")
+    return digest, size
+
+
+def read_bundle(data: bytes) -> tuple[bytes, dict[str, Any]]:
+    """(digest, rel path -> document) of a bundle, as ContentBundle.gd sees it."""
+    digest, size = read_header(data)
+    try:
+        payload = zlib.decompress(data[HEADER.size :])
+        docs, end = decode(payload)
+    except (zlib.error, struct.error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"not a content bundle: {e}")
+    if len(payload) != size or end != size or not isinstance(docs, dict):
+        raise ValueError(f"not a version {VERSION} content bundle")
+    return digest, docs
+
+
+def bundle_digest(path: str) -> bytes:
+    """Source digest recorded in an existing bundle, or b"" if unreadable."""
+    try:
+        with open(path, "rb") as f:
+            return read_header(f.read(HEADER.size))[0]
+    except (OSError, ValueError):
+        return b""
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--data",
+        default=os.path.join(PROJECT_ROOT, "game", "data"),
+        help="content root (default: game/data)",
+    )
+    parser.add_argument(
+        "--out", help="bundle path (default: content.bundle in the content root)"
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="exit 1 if the bundle is stale"
+    )
+    parser.add_argument("--force", action="store_true", help="rebuild even if fresh")
+    args = parser.parse_args()
+    out = args.out or os.path.join(args.data, "content.bundle")
+
+    started = time.perf_counter()
+    files = lint_content.data_files(args.data)
+    digest, sources = source_digest(args.data, files)
+    if bundle_digest(out) == digest and not args.force:
+        print(f"[bundle] {out} is up to date ({len(files)} file(s))")
+        return 0
+    if args.check:
+        print(f"[bundle] ERROR: {out} is stale; run tools/content/build_bundle.py")
+        return 1
+
+    validators = lint_content.compile_schemas()
+    results = {
+        rel: lint_content.lint_source(rel, data, validators)
+        for rel, data in sources.items()
+    }
+    _, duplicates = lint_content.build_index(results)
+    errors = [
+        d
+        for d in [d for r in results.values() for d in r.diagnostics] + duplicates
+        if d.severity == "error"
+    ]
+    for d in errors:
+        print(f"[bundle] ERROR: {d.file}: {d.path}: {d.message}")
+    if errors:
+        print(f"[bundle] {len(errors)} content error(s); bundle not written")
+        return 1
+
+    docs = {rel: parse_json(data) for rel, data in sources.items()}
+    bundle = compile_bundle(docs, digest)
+    if not same(read_bundle(bundle)[1], docs):
+        print("[bundle] ERROR: bundle does not read back as its sources")
+        return 1
+    tmp = out + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(bundle)
+    os.replace(tmp, out)
+    print(
+        f"[bundle] Wrote {out}: {len(docs)} file(s), {len(bundle)} bytes "
+        f"(JSON {sum(map(len, sources.values()))} bytes) "
+        f"in {(time.perf_counter() - started) * 1000:.0f}ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
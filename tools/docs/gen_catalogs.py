@@ -0,0 +1,512 @@
+#!/usr/bin/env python3
+"""
+Generate the content, scenario, achievement and quest catalogs in one run.
+
+Every input (game/data JSON, tests/scenarios/*.json) is read and parsed
+at most once per run, and a catalog is only rewritten when the inputs it
+is built from changed: .artcache/catalogs.json records, per catalog, a
+digest of this generator and its input files plus the sha256 of what was
+written. A catalog whose inputs and file are unchanged is skipped, so it
+keeps its "Generated" timestamp. --force rewrites everything.
+
+Catalogs (paths relative to the project root):
+  content       docs/content-catalog.md
+  scenarios     docs/testing/scenario-catalog.md
+  achievements  docs/achievement-catalog.md
+  quests        docs/quest-catalog.md
+
+Cell values follow the jq filters of the former shell generators: missing
+or null values print as the fallback ("-", 0, "(no name)"...), numbers
+print without a trailing .0.
+
+Usage:
+  python3 tools/docs/gen_catalogs.py
+  python3 tools/docs/gen_catalogs.py --force
+  python3 tools/docs/gen_catalogs.py --print scenarios > /tmp/scenarios.md
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, NamedTuple
+
+PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+DATA_DIR = os.path.join("game", "data")
+SCENARIOS_DIR = os.path.join("tests", "scenarios")
+CACHE_PATH = os.path.join(".artcache", "catalogs.json")
+SCHEME = 1
+
+
+class Inputs:
+    """Reads and parses each input file at most once (paths are relative)."""
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+        self._bytes: dict[str, bytes] = {}
+        self._docs: dict[str, Any] = {}
+
+    def raw(self, rel: str) -> bytes:
+        """File bytes, or b"" for a missing file."""
+        if rel not in self._bytes:
+            try:
+                with open(os.path.join(self.root, rel), "rb") as f:
+                    self._bytes[rel] = f.read()
+            except FileNotFoundError:
+                self._bytes[rel] = b""
+        return self._bytes[rel]
+
+    def doc(self, rel: str) -> Any:
+        """Parsed JSON, or None for a missing file; invalid JSON raises."""
+        if rel not in self._docs:
+            data = self.raw(rel)
+            try:
+                self._docs[rel] = json.loads(data) if data else None
+            except ValueError as e:
+                raise ValueError(f"{rel}: invalid JSON: {e}")
+        return self._docs[rel]
+
+    def scenarios(self) -> list[str]:
+        directory = os.path.join(self.root, SCENARIOS_DIR)
+        if not os.path.isdir(directory):
+            return []
+        return [
+            os.path.join(SCENARIOS_DIR, name)
+            for name in sorted(os.listdir(directory))
+            if name.endswith(".json")
+        ]
+
+
+def cell(value: Any, default: Any = None) -> str:
+    """A value as jq -r prints it; null/false (missing) become default."""
+    if (value is None or value is False) and default is not None:
+        value = default
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(",", ":"))
+    return str(value)
+
+
+def records(doc: Any, key: str) -> list:
+    value = doc.get(key) if isinstance(doc, dict) else None
+    return value if isinstance(value, list) else []
+
+
+def table(headers: list[str], rows: list[list[str]]) -> list[str]:
+    return [
+        "| " + " | ".join(headers) + " |",
+        "|" + "---|" * len(headers),
+        *("| " + " | ".join(row) + " |" for row in rows),
+    ]
+
+
+def header(title: str, intro: str, *extra: str) -> list[str]:
+    return [
+        f"# {title}",
+        "",
+        intro,
+        "",
+        *extra,
+        f"**Generated:** {time.strftime('%Y-%m-%d %H:%M:%S')}",
+        "",
+        "---",
+        "",
+    ]
+
+
+# (section title, data file, list key, column headers, row)
+CONTENT_SECTIONS = [
+    (
+        "Enemies",
+        "enemies/enemies.json",
+        "enemies",
+        ["ID", "Name", "HP", "MP", "ATK", "DEF", "SPD"],
+        lambda e: [
+            f"`{cell(e.get('id'))}`",
+            cell(e.get("name")),
+            cell(e.get("max_hp")),
+            cell(e.get("max_mp")),
+            cell(e.get("attack")),
+            cell(e.get("defense")),
+            cell(e.get("speed")),
+        ],
+    ),
+    (
+        "Items",
+        "items/items.json",
+        "items",
+        ["ID", "Name", "Type", "Effect", "Power", "Price"],
+        lambda i: [
+            f"`{cell(i.get('id'))}`",
+            cell(i.get("name")),
+            cell(i.get("type")),
+            cell(i.get("effect"), "-"),
+            cell(i.get("power"), "-"),
+            cell(i.get("price"), "-"),
+        ],
+    ),
+    (
+        "Skills",
+        "skills/skills.json",
+        "skills",
+        ["ID", "Name", "Type", "MP Cost", "Power", "Target", "Element"],
+        lambda s: [
+            f"`{cell(s.get('id'))}`",
+            cell(s.get("name")),
+            cell(s.get("type")),
+            cell(s.get("mp_cost")),
+            cell(s.get("power"), "-"),
+            cell(s.get("target")),
+            cell(s.get("element"), "-"),
+        ],
+    ),
+    (
+        "Equipment",
+        "equipment/equipment.json",
+        "equipment",
+        ["ID", "Name", "Slot", "ATK+", "DEF+", "SPD+", "Price"],
+        lambda e: [
+            f"`{cell(e.get('id'))}`",
+            cell(e.get("name")),
+            cell(e.get("slot")),
+            cell(e.get("attack_bonus"), 0),
+            cell(e.get("defense_bonus"), 0),
+            cell(e.get("speed_bonus"), 0),
+            cell(e.get("price"), "-"),
+        ],
+    ),
+    (
+        "Party Members",
+        "party/party.json",
+        "members",
+        ["ID", "Name", "Role", "HP", "MP", "ATK", "DEF", "SPD"],
+        lambda m: [
+            f"`{cell(m.get('id'))}`",
+            cell(m.get("name")),
+            cell(m.get("role")),
+            cell(m.get("max_hp")),
+            cell(m.get("max_mp")),
+            cell(m.get("attack")),
+            cell(m.get("defense")),
+            cell(m.get("speed")),
+        ],
+    ),
+    (
+        "Quests",
+        "quests/quests.json",
+        "quests",
+        ["ID", "Name", "Type", "Reward (Gold)"],
+        lambda q: [
+            f"`{cell(q.get('id'))}`",
+            cell(q.get("name")),
+            cell(q.get("type"), "-"),
+            cell(q.get("reward_gold"), 0),
+        ],
+    ),
+]
+
+
+def data_path(name: str) -> str:
+    return os.path.join(DATA_DIR, name)
+
+
+def content_catalog(inputs: Inputs) -> list[str]:
+    lines = header(
+        "Game Content Catalog",
+        "Auto-generated catalog of game content from data files.",
+    )
+    counts = []
+    for title, name, key, headers, row in CONTENT_SECTIONS:
+        found = records(inputs.doc(data_path(name)), key)
+        lines += [f"## {title}", "", *table(headers, [row(r) for r in found]), ""]
+        counts.append([title, str(len(found))])
+    return lines + ["---", "", "## Summary", "", *table(["Category", "Count"], counts)]
+
+
+def scene_name(scene: Any) -> str:
+    text = cell(scene, "-")
+    return text.replace("res://game/scenes/areas/", "", 1).replace(".tscn", "", 1)
+
+
+def scenario_catalog(inputs: Inputs) -> list[str]:
+    files = inputs.scenarios()
+    rows = []
+    for rel in files:
+        doc = inputs.doc(rel)
+        doc = doc if isinstance(doc, dict) else {}
+        description = cell(doc.get("description"), "(no description)")
+        # The shell version cut at 80 bytes (head -c 80)
+        description = description.encode()[:80].decode(errors="ignore").rstrip("\n")
+        rows.append(
+            [
+                f"`{cell(doc.get('id'), '(unknown)')}`",
+                cell(doc.get("name"), "(no name)"),
+                description,
+                scene_name(doc.get("scene")),
+            ]
+        )
+    return [
+        *header(
+            "Scenario Catalog",
+            "Auto-generated catalog of all test scenarios.",
+            f"**Total scenarios:** {len(files)}",
+            "",
+        ),
+        "## Scenarios",
+        "",
+        *table(["ID", "Name", "Description", "Scene"], rows),
+        "",
+        "---",
+        "",
+        "## Running Scenarios",
+        "",
+        "```bash",
+        "# Run a specific scenario",
+        "./tools/ci/run-scenario.sh <scenario_id>",
+        "",
+        "# Run with rendering (for visual tests)",
+        "./tools/ci/run-scenario-rendered.sh <scenario_id>",
+        "",
+        "# Example",
+        "./tools/ci/run-scenario.sh battle_one_turn",
+        "```",
+        "",
+        "## Scenario Categories",
+        "",
+        "### Smoke Tests",
+        "Quick validation scenarios with `_smoke` suffix.",
+        "",
+        "### Render Tests",
+        "Visual verification scenarios with `_render` suffix.",
+        "",
+        "### Walkthrough Tests",
+        "Full interaction flows with `_walkthrough` suffix.",
+        "",
+        "### Stub Tests",
+        "Placeholder scenarios with `_stub` suffix for future content.",
+    ]
+
+
+def achievement_catalog(inputs: Inputs) -> list[str]:
+    doc = inputs.doc(data_path("achievements/achievements.json"))
+    found = doc.get("achievements", {}) if isinstance(doc, dict) else {}
+    found = found if isinstance(found, dict) else {}
+    rows = [
+        [
+            f"`{cell(a.get('id'), key)}`",
+            cell(a.get("name")),
+            cell(a.get("description"), "-"),
+            cell(a.get("trigger"), "-"),
+            cell(a.get("trigger_value"), "-"),
+            cell(a.get("points"), 0),
+            "yes" if a.get("hidden") else "no",
+        ]
+        for key, a in found.items()
+        if isinstance(a, dict)
+    ]
+    points = sum(
+        a.get("points", 0)
+        for a in found.values()
+        if isinstance(a, dict) and isinstance(a.get("points"), (int, float))
+    )
+    return [
+        *header(
+            "Achievement Catalog",
+            "Auto-generated catalog of achievements from game/data/achievements.",
+        ),
+        "## Achievements",
+        "",
+        *table(
+            ["ID", "Name", "Description", "Trigger", "Value", "Points", "Hidden"], rows
+        ),
+        "",
+        "---",
+        "",
+        f"**Total:** {len(rows)} achievements, {cell(points)} points",
+    ]
+
+
+def quest_catalog(inputs: Inputs) -> list[str]:
+    found = records(inputs.doc(data_path("quests/quests.json")), "quests")
+    rows = [
+        [
+            f"`{cell(q.get('id'))}`",
+            cell(q.get("name")),
+            cell(q.get("type"), "-"),
+            f"`{q['required_flag']}`" if q.get("required_flag") else "-",
+            f"`{cell(q.get('completion_flag'))}`",
+            cell(q.get("reward_gold"), 0),
+            ", ".join(f"`{i}`" for i in q.get("reward_items") or []) or "-",
+            str(len(q.get("objectives") or [])),
+        ]
+        for q in found
+        if isinstance(q, dict)
+    ]
+    return [
+        *header(
+            "Quest Catalog",
+            "Auto-generated catalog of quests from game/data/quests, in file order.",
+        ),
+        "## Quests",
+        "",
+        *table(
+            [
+                "ID",
+                "Name",
+                "Type",
+                "Requires",
+                "Sets",
+                "Gold",
+                "Items",
+                "Objectives",
+            ],
+            rows,
+        ),
+        "",
+        "---",
+        "",
+        f"**Total:** {len(rows)} quests",
+    ]
+
+
+class Catalog(NamedTuple):
+    name: str
+    out: str
+    inputs: Callable[[Inputs], list[str]]  # relative input paths
+    build: Callable[[Inputs], list[str]]  # markdown lines
+
+
+CATALOGS = [
+    Catalog(
+        "content",
+        os.path.join("docs", "content-catalog.md"),
+        lambda i: [data_path(name) for _, name, *_ in CONTENT_SECTIONS],
+        content_catalog,
+    ),
+    Catalog(
+        "scenarios",
+        os.path.join("docs", "testing", "scenario-catalog.md"),
+        lambda i: i.scenarios(),
+        scenario_catalog,
+    ),
+    Catalog(
+        "achievements",
+        os.path.join("docs", "achievement-catalog.md"),
+        lambda i: [data_path("achievements/achievements.json")],
+        achievement_catalog,
+    ),
+    Catalog(
+        "quests",
+        os.path.join("docs", "quest-catalog.md"),
+        lambda i: [data_path("quests/quests.json")],
+        quest_catalog,
+    ),
+]
+
+
+def inputs_digest(inputs: Inputs, paths: list[str]) -> str:
+    h = hashlib.sha256(f"scheme={SCHEME}".encode())
+    with open(os.path.abspath(__file__), "rb") as f:
+        h.update(f.read())
+    for rel in paths:
+        data = inputs.raw(rel)
+        h.update(f"\0{rel}\0{len(data)}\0".encode() + data)
+    return h.hexdigest()
+
+
+def file_sha256(path: str) -> str:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return ""
+
+
+def load_cache(path: str) -> dict:
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return data.get("catalogs", {}) if data.get("scheme") == SCHEME else {}
+
+
+def save_cache(path: str, catalogs: dict) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump({"scheme": SCHEME, "catalogs": catalogs}, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--root", default=PROJECT_ROOT, help="project root (default: this repo)"
+    )
+    parser.add_argument("--force", action="store_true", help="rewrite every catalog")
+    parser.add_argument(
+        "--print",
+        metavar="NAME",
+        choices=[c.name for c in CATALOGS],
+        help="write one catalog to stdout instead (no cache)",
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    inputs = Inputs(args.root)
+    try:
+        if args.print:
+            catalog = next(c for c in CATALOGS if c.name == args.print)
+            try:
+                print("\n".join(catalog.build(inputs)), flush=True)
+            except BrokenPipeError:
+                # The reader went away (| head); stop quietly like jq did.
+                # stdout goes to devnull so the exit-time flush cannot fail.
+                os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            return 0
+
+        cache_path = os.path.join(args.root, CACHE_PATH)
+        cache = load_cache(cache_path)
+        written = 0
+        for catalog in CATALOGS:
+            out = os.path.join(args.root, catalog.out)
+            digest = inputs_digest(inputs, catalog.inputs(inputs))
+            entry = cache.get(catalog.name, {})
+            if (
+                not args.force
+                and entry.get("inputs") == digest
+                and entry.get("sha256") == file_sha256(out)
+            ):
+                print(f"[docs] {catalog.out} is up to date")
+                continue
+            text = "\n".join(catalog.build(inputs)) + "\n"
+            os.makedirs(os.path.dirname(out), exist_ok=True)
+            with open(out, "w") as f:
+                f.write(text)
+            cache[catalog.name] = {"inputs": digest, "sha256": file_sha256(out)}
+            written += 1
+            print(f"[docs] Wrote {catalog.out}")
+    except ValueError as e:
+        print(f"[docs] ERROR: {e}")
+        return 1
+    save_cache(cache_path, cache)
+    print(
+        f"[docs] {written} of {len(CATALOGS)} catalog(s) written "
+        f"in {(time.perf_counter() - started) * 1000:.0f}ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,653 @@
+"""
+Declarative schemas for game/data, checked by lint_content.py.
+
+Each entry of SCHEMAS maps a glob (relative to game/data) to a schema in
+a small JSON Schema subset: type (name or list of names), properties,
+required, additionalProperties (false, or a schema for every other key),
+items, enum, minimum, maximum, minLength, minItems and propertyNames
+(a schema for every key). The first matching glob wins. obj() and arr()
+below only build these dicts.
+
+Two extra keywords link files together: {"defines": kind} marks a string
+as an id of that kind and {"ref": kind} as a reference that must resolve
+to one; define() and ref() build them. Kinds are plain names ("enemy",
+"item", ...); items and equipment share "item" since both can be given
+as rewards and drops.
+"""
+
+from typing import Optional
+
+STR = {"type": "string"}
+TEXT = {"type": "string", "minLength": 1}  # required-and-non-empty, like jq's // ""
+INT = {"type": "integer"}
+COUNT = {"type": "integer", "minimum": 0}
+NUM = {"type": "number"}
+BOOL = {"type": "boolean"}
+RES_PATH = {"type": "string", "minLength": 1}
+OPT_STR = {"type": ["string", "null"]}
+RARITY = {"enum": ["common", "uncommon", "rare", "legendary"]}
+TARGET = {
+    "enum": [
+        "self",
+        "single_ally",
+        "all_allies",
+        "single_enemy",
+        "all_enemies",
+        "party",
+        "pet",
+        "world",
+        "none",
+    ]
+}
+
+
+def obj(
+    required: Optional[dict] = None, optional: Optional[dict] = None, **extra
+) -> dict:
+    """An object schema; required keys must be present."""
+    required = required or {}
+    return {
+        "type": "object",
+        "properties": {**required, **(optional or {})},
+        "required": list(required),
+        **extra,
+    }
+
+
+def arr(items: dict, **extra) -> dict:
+    return {"type": "array", "items": items, **extra}
+
+
+def map_of(values: dict, keys: Optional[dict] = None) -> dict:
+    """An object used as a dictionary: any keys, uniform values."""
+    schema = {"type": "object", "additionalProperties": values}
+    if keys is not None:
+        schema["propertyNames"] = keys
+    return schema
+
+
+def define(kind: str) -> dict:
+    """A non-empty id of the given kind."""
+    return {**TEXT, "defines": kind}
+
+
+def ref(kind: str) -> dict:
+    """A non-empty id that must be defined somewhere as the given kind."""
+    return {**TEXT, "ref": kind}
+
+
+NAMED = obj({"id": TEXT, "name": TEXT})
+REWARD_ITEM = obj({"id": ref("item"), "count": COUNT})
+UNLOCK = obj(
+    {"type": TEXT},
+    {
+        "value": {"type": ["integer", "string"]},
+        "category": STR,
+        "count": COUNT,
+        "quest_id": ref("quest"),
+        "flag": TEXT,
+        "area": TEXT,
+    },
+)
+COSMETIC = {
+    "id": TEXT,
+    "name": TEXT,
+    "description": STR,
+    "category": TEXT,
+    "sprite_path": RES_PATH,
+}
+UNLOCKABLE = {"unlocked_by_default": BOOL, "unlock_condition": UNLOCK}
+BATTLER = {
+    "id": TEXT,
+    "name": TEXT,
+    "max_hp": COUNT,
+    "max_mp": COUNT,
+    "attack": COUNT,
+    "defense": COUNT,
+    "speed": COUNT,
+}
+SCHEDULE_SLOT = obj(
+    {"area": OPT_STR, "position": {"type": ["array", "null"], "items": INT}},
+    {"marker": OPT_STR},
+)
+
+SCHEMAS = [
+    (
+        "accessories/*.json",
+        obj(
+            {
+                "accessories": arr(obj({**COSMETIC, "slot": TEXT}, UNLOCKABLE)),
+                "categories": arr(NAMED),
+                "slots": arr(NAMED),
+            }
+        ),
+    ),
+    (
+        "achievements/*.json",
+        obj(
+            {
+                "achievements": map_of(
+                    obj(
+                        {
+                            "id": ref("achievement"),
+                            "name": TEXT,
+                            "description": STR,
+                            "hidden": BOOL,
+                            "trigger": TEXT,
+                            "points": COUNT,
+                        },
+                        {"icon": STR, "trigger_value": {"type": ["integer", "string"]}},
+                    ),
+                    keys=define("achievement"),
+                )
+            }
+        ),
+    ),
+    (
+        "biomes/*.json",
+        obj(
+            {"id": define("biome"), "name": TEXT, "type": TEXT},
+            {"palette": RES_PATH, "palette_path": RES_PATH, "description": STR},
+        ),
+    ),
+    (
+        "bugs/*.json",
+        obj(
+            {
+                "bugs": arr(
+                    obj(
+                        {
+                            "id": define("bug"),
+                            "name": TEXT,
+                            "rarity": RARITY,
+                            "locations": arr(TEXT),
+                            "value": COUNT,
+                        },
+                        {"description": STR, "speed": COUNT, "time_of_day": arr(TEXT)},
+                    )
+                ),
+                "spawn_areas": arr(
+                    obj(
+                        {"id": TEXT, "area": TEXT, "bug_pool": arr(ref("bug"))},
+                        {"name": STR},
+                    )
+                ),
+                "rarity_weights": map_of(COUNT),
+            }
+        ),
+    ),
+    (
+        "challenges/*.json",
+        obj(
+            {
+                "challenges": arr(
+                    obj(
+                        {
+                            "id": TEXT,
+                            "name": TEXT,
+                            "type": TEXT,
+                            "target_count": {"type": "integer", "minimum": 1},
+                        },
+                        {
+                            "description": STR,
+                            "reward_gold": COUNT,
+                            "reward_items": arr(REWARD_ITEM),
+                        },
+                    )
+                ),
+                "daily_count": COUNT,
+            }
+        ),
+    ),
+    (
+        "collections/*.json",
+        obj(
+            {
+                "categories": arr(
+                    obj(
+                        {
+                            "id": TEXT,
+                            "name": TEXT,
+                            "data_source": TEXT,
+                            "data_key": TEXT,
+                        },
+                        {"description": STR},
+                    )
+                ),
+                "milestones": arr(
+                    obj(
+                        {"percent": {"type": "integer", "minimum": 0, "maximum": 100}},
+                        {"reward_gold": COUNT, "reward_items": arr(REWARD_ITEM)},
+                    )
+                ),
+            }
+        ),
+    ),
+    (
+        "cutscenes/*.json",
+        obj(
+            {
+                "cutscenes": map_of(
+                    obj(
+                        {
+                            "id": ref("cutscene"),
+                            "steps": arr(
+                                obj(
+                                    {
+                                        "type": {
+                                            "enum": ["text", "wait", "shake", "flash"]
+                                        }
+                                    },
+                                    {
+                                        "speaker": STR,
+                                        "text": STR,
+                                        "duration": {"type": "number", "minimum": 0},
+                                        "intensity": NUM,
+                                        "color": STR,
+                                    },
+                                ),
+                                minItems=1,
+                            ),
+                        },
+                        {"name": STR, "background_color": STR, "music": OPT_STR},
+                    ),
+                    keys=define("cutscene"),
+                )
+            }
+        ),
+    ),
+    (
+        "encounters/*.json",
+        obj(
+            {},
+            {
+                "biome_id": ref("biome"),
+                "biome": ref("biome"),
+                "biome_name": STR,
+                "encounter_rate": {"type": "number", "minimum": 0, "maximum": 1},
+                "encounters": arr(
+                    obj(
+                        {"weight": {"type": "number", "minimum": 0}},
+                        {
+                            "id": TEXT,
+                            "enemy_id": ref("enemy"),
+                            "enemies": arr(ref("enemy"), minItems=1),
+                            "min_count": COUNT,
+                            "max_count": COUNT,
+                            "min_level": COUNT,
+                            "boss": BOOL,
+                        },
+                    )
+                ),
+                "visible_enemies": arr(
+                    obj(
+                        {"id": ref("enemy"), "weight": {"type": "number", "minimum": 0}}
+                    )
+                ),
+            },
+        ),
+    ),
+    (
+        "enemies/*.json",
+        obj(
+            {
+                "enemies": arr(
+                    obj(
+                        {**BATTLER, "id": define("enemy")},
+                        {
+                            "description": STR,
+                            "xp": COUNT,
+                            "gold": COUNT,
+                            "sprite": RES_PATH,
+                            "skills": arr(ref("skill")),
+                            "drops": arr(ref("item")),
+                            "flags": arr(TEXT),
+                            "phase_threshold": {
+                                "type": "integer",
+                                "minimum": 0,
+                                "maximum": 100,
+                            },
+                            "phase_2_attack_bonus": INT,
+                            "phase_2_speed_bonus": INT,
+                        },
+                    )
+                )
+            }
+        ),
+    ),
+    (
+        "equipment/*.json",
+        obj(
+            {
+                "equipment": arr(
+                    obj(
+                        {
+                            "id": define("item"),
+                            "name": TEXT,
+                            "slot": {"enum": ["weapon", "armor", "accessory"]},
+                        },
+                        {
+                            "description": STR,
+                            "attack_bonus": INT,
+                            "defense_bonus": INT,
+                            "speed_bonus": INT,
+                            "price": COUNT,
+                        },
+                    )
+                )
+            }
+        ),
+    ),
+    (
+        "events/community_events.json",
+        obj(
+            {
+                "schema_version": COUNT,
+                "events": arr(
+                    obj(
+                        {
+                            "id": TEXT,
+                            "name": TEXT,
+                            "type": TEXT,
+                            "start_timestamp": COUNT,
+                            "end_timestamp": COUNT,
+                            "target_count": {"type": "integer", "minimum": 1},
+                        },
+                        {
+                            "description": STR,
+                            "reward_gold": COUNT,
+                            "reward_items": arr(REWARD_ITEM),
+                            "banner_color": STR,
+                        },
+                    )
+                ),
+                "event_types": map_of(STR),
+            },
+            {"description": STR, "notes": arr(STR)},
+        ),
+    ),
+    (
+        "events/*.json",
+        obj(
+            {
+                "events": arr(
+                    obj(
+                        {
+                            "id": TEXT,
+                            "name": TEXT,
+                            "start_month": {
+                                "type": "integer",
+                                "minimum": 1,
+                                "maximum": 12,
+                            },
+                            "start_day": {
+                                "type": "integer",
+                                "minimum": 1,
+                                "maximum": 31,
+                            },
+                            "end_month": {
+                                "type": "integer",
+                                "minimum": 1,
+                                "maximum": 12,
+                            },
+                            "end_day": {"type": "integer", "minimum": 1, "maximum": 31},
+                        },
+                        {
+                            "description": STR,
+                            "special_npcs": arr(ref("npc")),
+                            "special_items": arr(ref("item")),
+                            "special_quests": arr(ref("quest")),
+                            "decorations": arr(TEXT),
+                            "music_override": STR,
+                        },
+                    )
+                )
+            }
+        ),
+    ),
+    (
+        "fishing/*.json",
+        obj(
+            {
+                "fish": arr(
+                    obj(
+                        {
+                            "id": define("fish"),
+                            "name": TEXT,
+                            "rarity": RARITY,
+                            "locations": arr(TEXT),
+                            "value": COUNT,
+                        },
+                        {"description": STR, "difficulty": COUNT},
+                    )
+                ),
+                "fishing_spots": arr(
+                    obj(
+                        {"id": TEXT, "area": TEXT, "fish_pool": arr(ref("fish"))},
+                        {"name": STR},
+                    )
+                ),
+                "rarity_weights": map_of(COUNT),
+            }
+        ),
+    ),
+    (
+        "furniture/*.json",
+        obj(
+            {
+                "furniture": arr(
+                    obj(
+                        {
+                            **COSMETIC,
+                            "size": obj({"width": COUNT, "height": COUNT}),
+                        },
+                        {"price": COUNT, **UNLOCKABLE},
+                    )
+                ),
+                "categories": arr(NAMED),
+                "rooms": arr(
+                    obj(
+                        {
+                            "id": TEXT,
+                            "name": TEXT,
+                            "grid_size": obj({"width": COUNT, "height": COUNT}),
+                        },
+                        {"placement_layer": INT},
+                    )
+                ),
+            }
+        ),
+    ),
+    (
+        "items/*.json",
+        obj(
+            {
+                "items": arr(
+                    obj(
+                        {
+                            "id": define("item"),
+                            "name": TEXT,
+                            "type": TEXT,
+                            "effect": TEXT,
+                        },
+                        {
+                            "description": STR,
+                            "power": INT,
+                            "target": TARGET,
+                            "price": COUNT,
+                            "element": TEXT,
+                        },
+                    )
+                )
+            }
+        ),
+    ),
+    (
+        "multiplayer/*.json",
+        obj(
+            {
+                "schema_version": COUNT,
+                "message_types": map_of(
+                    obj(
+                        {"id": COUNT, "reliable": BOOL},
+                        {"description": STR, "frequency": STR, "fields": map_of(obj())},
+                    )
+                ),
+                "connection_states": map_of(obj({"id": COUNT}, {"description": STR})),
+            },
+            {
+                "description": STR,
+                "max_players": {"type": "integer", "minimum": 1},
+                "sync_interval_ms": {"type": "integer", "minimum": 1},
+                "notes": arr(STR),
+            },
+        ),
+    ),
+    (
+        "npcs/affinity.json",
+        obj(
+            {
+                "npcs": arr(
+                    obj(
+                        {"id": define("npc"), "name": TEXT, "starting_affinity": INT},
+                        {"portrait": STR},
+                    )
+                ),
+                "affinity_events": map_of(INT),
+            }
+        ),
+    ),
+    (
+        "npcs/schedules.json",
+        obj(
+            {
+                "schedules": map_of(
+                    obj(
+                        {
+                            # The key is resolved (GameData looks schedules
+                            # up by it); resolving npc_id too doubles warnings
+                            "npc_id": TEXT,
+                            "weekday_locations": map_of(SCHEDULE_SLOT),
+                            "weekend_locations": map_of(SCHEDULE_SLOT),
+                            "default_area": TEXT,
+                            "default_position": arr(INT, minItems=2),
+                        },
+                        {"npc_name": STR, "weekend_dialogue": arr(STR)},
+                    ),
+                    keys=ref("npc"),
+                )
+            }
+        ),
+    ),
+    (
+        "outfits/*.json",
+        obj(
+            {
+                "outfits": arr(obj(COSMETIC, UNLOCKABLE)),
+                "categories": arr(NAMED),
+            }
+        ),
+    ),
+    (
+        "party/*.json",
+        obj(
+            {
+                "members": arr(
+                    obj(
+                        BATTLER,
+                        {
+                            "role": TEXT,
+                            "description": STR,
+                            "level": {"type": "integer", "minimum": 1},
+                            "xp": COUNT,
+                            "skills": arr(ref("skill")),
+                            "sprite": RES_PATH,
+                            "recruitment_quest": ref("quest"),
+                        },
+                    )
+                ),
+            },
+            {
+                "party_max_size": {"type": "integer", "minimum": 1},
+                "level_thresholds": arr(COUNT),
+                "stat_growth": map_of(COUNT),
+                "pet_options": arr(
+                    obj(
+                        BATTLER,
+                        {
+                            "type": TEXT,
+                            "description": STR,
+                            "skills": arr(ref("skill")),
+                            "sprite": RES_PATH,
+                        },
+                    )
+                ),
+            },
+        ),
+    ),
+    (
+        "quests/*.json",
+        obj(
+            {
+                "quests": arr(
+                    obj(
+                        {
+                            "id": define("quest"),
+                            "name": TEXT,
+                            "type": TEXT,
+                            "completion_flag": TEXT,
+                        },
+                        {
+                            "description": STR,
+                            "reward_gold": COUNT,
+                            "reward_items": arr(ref("item")),
+                            "required_flag": OPT_STR,
+                            "objectives": arr(TEXT),
+                        },
+                    )
+                )
+            }
+        ),
+    ),
+    (
+        "skills/*.json",
+        obj(
+            {
+                "skills": arr(
+                    obj(
+                        {
+                            "id": define("skill"),
+                            "name": TEXT,
+                            "type": {
+                                "enum": ["attack", "heal", "buff", "status", "special"]
+                            },
+                            "mp_cost": COUNT,
+                        },
+                        {
+                            "description": STR,
+                            "power": INT,
+                            "target": TARGET,
+                            "element": TEXT,
+                            "effect": TEXT,
+                            "priority": TEXT,
+                            "hit_count": {"type": "integer", "minimum": 1},
+                            "pet_only": BOOL,
+                            "pet_skill": BOOL,
+                            "boss_only": BOOL,
+                            "mini_boss_only": BOOL,
+                        },
+                    )
+                )
+            }
+        ),
+    ),
+    (
+        "stickers/*.json",
+        obj(
+            {
+                "stickers": arr(obj(COSMETIC, UNLOCKABLE)),
+                "categories": arr(NAMED),
+            }
+        ),
+    ),
+]
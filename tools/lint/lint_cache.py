@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Per-file cache for lint_content.py.
+
+The cache (.artcache/content-lint-cache.json under the project root)
+keeps, per data file, the sha256/size/mtime of the bytes that were
+linted and what linting them produced: schema diagnostics, the ids it
+defines, the ids it references and which of those were unresolved. It
+also keeps the reverse reference map, kind -> id -> files referring to
+it, so the files depending on a changed definition are a lookup away.
+
+The whole cache is dropped when the linter or the schemas change (their
+source is hashed into the cache's tool fingerprint) or when it was
+written for another data root.
+"""
+
+import hashlib
+import json
+import os
+from typing import Optional
+
+SCHEME = 1
+LINT_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(LINT_DIR)), ".artcache", "content-lint-cache.json"
+)
+
+
+def tool_fingerprint() -> str:
+    """Hash of the linter and schema sources; any edit invalidates the cache."""
+    h = hashlib.sha256(f"scheme={SCHEME}".encode())
+    for name in ("lint_content.py", "content_schemas.py"):
+        with open(os.path.join(LINT_DIR, name), "rb") as f:
+            h.update(b"\0" + name.encode() + b"=" + f.read())
+    return h.hexdigest()
+
+
+def is_unchanged(st: os.stat_result, entry: Optional[dict]) -> bool:
+    """True when stat data matches what was linted (bytes not read)."""
+    return (
+        entry is not None
+        and st.st_size == entry.get("size")
+        and st.st_mtime_ns == entry.get("mtime_ns")
+    )
+
+
+def load(data_dir: str, tool: str, path: str = CACHE_PATH) -> tuple[dict, dict]:
+    """(files, referrers) from the cache, or two empty dicts."""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}, {}
+    if (
+        data.get("scheme") != SCHEME
+        or data.get("tool") != tool
+        or data.get("data") != os.path.abspath(data_dir)
+    ):
+        return {}, {}
+    return data.get("files", {}), data.get("referrers", {})
+
+
+def save(
+    data_dir: str, tool: str, files: dict, referrers: dict, path: str = CACHE_PATH
+) -> None:
+    """Write the cache atomically."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        # json.dumps, unlike json.dump, runs the C encoder in one call
+        f.write(
+            json.dumps(
+                {
+                    "scheme": SCHEME,
+                    "tool": tool,
+                    "data": os.path.abspath(data_dir),
+                    "files": files,
+                    "referrers": referrers,
+                },
+                separators=(",", ":"),
+                sort_keys=True,
+            )
+        )
+        f.write("\n")
+    os.replace(tmp, path)
@@ -0,0 +1,521 @@
+#!/usr/bin/env python3
+"""
+Lint game/data JSON against the declarative schemas in content_schemas.py.
+
+Every game/data/**/*.json file is read and parsed once. Each schema is
+compiled once into a tree of small validator closures (type checks as
+isinstance tuples, required keys as a tuple walk, enums as sets), so
+validating a record costs a few function calls per field rather than an
+interpretation of the schema.
+
+Every problem is reported, not just the first per file, as
+  <file>: <JSON path>: <message>
+with paths like $.enemies[3].max_hp. Invalid JSON and schema violations
+are errors; a file no schema matches is a warning. Exits 1 on errors
+(and on warnings with --strict).
+
+Cross-file references use two schema keywords on strings: "defines"
+(the value is an id of a kind, e.g. "enemy") and "ref" (the value must
+be an id of a kind). Both are collected in the same validation walk;
+the definitions then form one symbol index, (kind, id) -> (file, path),
+and every reference is a single dict lookup against it. A duplicate id
+is an error, a dangling reference a warning.
+
+Runs are incremental (see lint_cache.py): a file whose bytes match the
+cache is not parsed again, and references are re-resolved only in
+changed files and in the files that refer to ids a changed or deleted
+file gained or lost. Output is the same as a full run; --no-cache forces
+one.
+
+Usage:
+  python3 tools/lint/lint_content.py
+  python3 tools/lint/lint_content.py --data game/data --strict
+  python3 tools/lint/lint_content.py --report .artcache/content-lint.json
+  python3 tools/lint/lint_content.py --no-cache
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import time
+from typing import Any, Callable, NamedTuple
+
+import lint_cache
+from content_schemas import SCHEMAS
+
+PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+
+# JSON Schema type name -> Python types; bool is excluded from the numbers
+TYPES = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "null": (type(None),),
+    "object": (dict,),
+    "array": (list,),
+}
+KEYWORDS = {
+    "type",
+    "properties",
+    "required",
+    "additionalProperties",
+    "items",
+    "enum",
+    "minimum",
+    "maximum",
+    "minLength",
+    "minItems",
+    "propertyNames",
+    "defines",
+    "ref",
+}
+
+
+class Findings:
+    """What validating one document collects; each entry starts with a path."""
+
+    __slots__ = ("problems", "defines", "refs")
+
+    def __init__(self) -> None:
+        self.problems: list[tuple[str, str]] = []  # (path, message)
+        self.defines: list[tuple[str, str, str]] = []  # (path, kind, id)
+        self.refs: list[tuple[str, str, str]] = []  # (path, kind, id)
+
+
+# Validator(value, path, found): records into found, never raises
+Validator = Callable[[Any, str, Findings], None]
+
+
+class Diagnostic(NamedTuple):
+    file: str  # relative to the data root, / separated
+    path: str  # JSON path, "$" for the whole document
+    severity: str  # "error" or "warning"
+    message: str
+
+
+class FileResult(NamedTuple):
+    diagnostics: list[Diagnostic]
+    defines: list[tuple[str, str, str]]
+    refs: list[tuple[str, str, str]]
+
+
+def type_name(value: Any) -> str:
+    if isinstance(value, bool):
+        return "boolean"
+    if value is None:
+        return "null"
+    for name, types in TYPES.items():
+        if isinstance(value, types):
+            return name
+    return type(value).__name__
+
+
+def child(path: str, key: str) -> str:
+    return f"{path}.{key}" if key.isidentifier() else f"{path}[{json.dumps(key)}]"
+
+
+def compile_schema(schema: dict) -> Validator:
+    """Turn a schema into a validator; unknown keywords are a ValueError."""
+    unknown = schema.keys() - KEYWORDS
+    if unknown:
+        raise ValueError(f"unsupported schema keyword(s): {', '.join(sorted(unknown))}")
+    checks: list[Validator] = []
+
+    if "enum" in schema:
+        allowed = frozenset(schema["enum"])
+        listed = ", ".join(map(json.dumps, schema["enum"]))
+
+        def check_enum(value, path, found):
+            if isinstance(value, (dict, list)) or value not in allowed:
+                found.problems.append(
+                    (path, f"{json.dumps(value)} is not one of {listed}")
+                )
+
+        checks.append(check_enum)
+
+    if "minimum" in schema or "maximum" in schema:
+        low = schema.get("minimum", float("-inf"))
+        high = schema.get("maximum", float("inf"))
+
+        def check_range(value, path, found):
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                if value < low:
+                    found.problems.append((path, f"{value} is below the minimum {low}"))
+                elif value > high:
+                    found.problems.append(
+                        (path, f"{value} is above the maximum {high}")
+                    )
+
+        checks.append(check_range)
+
+    if "minLength" in schema:
+        min_length = schema["minLength"]
+
+        def check_length(value, path, found):
+            if isinstance(value, str) and len(value) < min_length:
+                found.problems.append(
+                    (
+                        path,
+                        (
+                            "must not be empty"
+                            if min_length == 1
+                            else f"shorter than {min_length}"
+                        ),
+                    )
+                )
+
+        checks.append(check_length)
+
+    if "minItems" in schema:
+        min_items = schema["minItems"]
+
+        def check_items_count(value, path, found):
+            if isinstance(value, list) and len(value) < min_items:
+                found.problems.append((path, f"needs at least {min_items} item(s)"))
+
+        checks.append(check_items_count)
+
+    if "defines" in schema:
+        defines_kind = schema["defines"]
+
+        def check_defines(value, path, found):
+            if isinstance(value, str):
+                found.defines.append((path, defines_kind, value))
+
+        checks.append(check_defines)
+
+    if "ref" in schema:
+        ref_kind = schema["ref"]
+
+        def check_ref(value, path, found):
+            if isinstance(value, str):
+                found.refs.append((path, ref_kind, value))
+
+        checks.append(check_ref)
+
+    if (
+        "required" in schema
+        or "properties" in schema
+        or "additionalProperties" in schema
+        or "propertyNames" in schema
+    ):
+        required = tuple(schema.get("required", ()))
+        properties = {
+            key: compile_schema(sub)
+            for key, sub in schema.get("properties", {}).items()
+        }
+        extra = schema.get("additionalProperties", True)
+        extra_check = compile_schema(extra) if isinstance(extra, dict) else None
+        names = schema.get("propertyNames")
+        name_check = compile_schema(names) if names is not None else None
+
+        def check_object(value, path, found):
+            if not isinstance(value, dict):
+                return
+            for key in required:
+                if key not in value:
+                    found.problems.append((path, f"missing required field {key!r}"))
+            for key, item in value.items():
+                if name_check is not None:
+                    name_check(key, child(path, key), found)
+                check = properties.get(key, extra_check)
+                if check is not None:
+                    check(item, child(path, key), found)
+                elif extra is False:
+                    found.problems.append((child(path, key), "unknown field"))
+
+        checks.append(check_object)
+
+    if "items" in schema:
+        item_check = compile_schema(schema["items"])
+
+        def check_array(value, path, found):
+            if isinstance(value, list):
+                for index, item in enumerate(value):
+                    item_check(item, f"{path}[{index}]", found)
+
+        checks.append(check_array)
+
+    if "type" in schema:
+        names = [schema["type"]] if isinstance(schema["type"], str) else schema["type"]
+        types = tuple(t for name in names for t in TYPES[name])
+        allows_bool = "boolean" in names
+        expected = " or ".join(names)
+        rest = tuple(checks)
+
+        def check_typed(value, path, found):
+            if not isinstance(value, types) or (
+                isinstance(value, bool) and not allows_bool
+            ):
+                found.problems.append(
+                    (path, f"expected {expected}, got {type_name(value)}")
+                )
+                return
+            for check in rest:
+                check(value, path, found)
+
+        return check_typed
+
+    rest = tuple(checks)
+
+    def check_untyped(value, path, found):
+        for check in rest:
+            check(value, path, found)
+
+    return check_untyped
+
+
+def compile_schemas() -> list[tuple[str, Validator]]:
+    return [(pattern, compile_schema(schema)) for pattern, schema in SCHEMAS]
+
+
+def data_files(data_dir: str) -> list[str]:
+    """Every JSON file under data_dir, relative and / separated, sorted."""
+    found = []
+    for dirpath, dirnames, filenames in os.walk(data_dir):
+        dirnames.sort()
+        for name in filenames:
+            if name.endswith(".json"):
+                rel = os.path.relpath(os.path.join(dirpath, name), data_dir)
+                found.append(rel.replace(os.sep, "/"))
+    return sorted(found)
+
+
+def schema_for(rel: str, validators: list[tuple[str, Validator]]):
+    for pattern, validator in validators:
+        if fnmatch.fnmatchcase(rel, pattern):
+            return validator
+    return None
+
+
+def lint_source(rel: str, data: bytes, validators: list) -> FileResult:
+    """Diagnostics, definitions and references of one data file's bytes."""
+    try:
+        doc = json.loads(data)
+    except ValueError as e:
+        return FileResult([Diagnostic(rel, "$", "error", f"invalid JSON: {e}")], [], [])
+    validator = schema_for(rel, validators)
+    if validator is None:
+        return FileResult(
+            [Diagnostic(rel, "$", "warning", "no schema in content_schemas.py")], [], []
+        )
+    found = Findings()
+    validator(doc, "$", found)
+    return FileResult(
+        [Diagnostic(rel, path, "error", msg) for path, msg in found.problems],
+        found.defines,
+        found.refs,
+    )
+
+
+def build_index(
+    results: dict[str, FileResult],
+) -> tuple[dict[tuple[str, str], tuple[str, str]], list[Diagnostic]]:
+    """(kind, id) -> (file, path) of its first definition, and duplicates."""
+    index: dict[tuple[str, str], tuple[str, str]] = {}
+    duplicates = []
+    for rel, result in results.items():
+        for path, kind, name in result.defines:
+            first = index.setdefault((kind, name), (rel, path))
+            if first != (rel, path):
+                duplicates.append(
+                    Diagnostic(
+                        rel,
+                        path,
+                        "error",
+                        f"duplicate {kind} id {name!r} (first at {first[0]}: {first[1]})",
+                    )
+                )
+    return index, duplicates
+
+
+def unresolved(refs: list, index: dict) -> list[tuple[str, str, str]]:
+    """The references whose (kind, id) is not in the index."""
+    return [ref for ref in refs if (ref[1], ref[2]) not in index]
+
+
+def cached_result(rel: str, entry: dict) -> FileResult:
+    return FileResult(
+        [Diagnostic(rel, *d) for d in entry["diagnostics"]],
+        [tuple(d) for d in entry["defines"]],
+        [tuple(r) for r in entry["refs"]],
+    )
+
+
+def link(referrers: dict, rel: str, refs: list, add: bool) -> None:
+    """Add rel to (or drop it from) referrers[kind][id] for each reference."""
+    for kind, name in {(kind, name) for _, kind, name in refs}:
+        files = referrers.setdefault(kind, {}).setdefault(name, [])
+        if add:
+            files.append(rel)
+        elif rel in files:
+            files.remove(rel)
+            if not files:
+                del referrers[kind][name]
+
+
+def lint_incremental(
+    data_dir: str, files: list[str], entries: dict, referrers: dict
+) -> tuple[dict[str, FileResult], dict[str, list], list[str], set[str]]:
+    """Lint the files whose bytes differ from the cache entries.
+
+    entries and referrers (see lint_cache.py) are updated in place; pass
+    empty dicts to lint everything. References are re-resolved only in
+    changed files and in files referring to an id that a changed or
+    deleted file gained or lost.
+
+    Returns (results, unresolved references per file, changed, dependents).
+    """
+    previous = dict(entries)
+    results: dict[str, FileResult] = {}
+    changed = []
+    validators = None
+    for rel in files:
+        entry = entries.get(rel)
+        try:
+            st = os.stat(os.path.join(data_dir, rel))
+            if lint_cache.is_unchanged(st, entry):
+                results[rel] = cached_result(rel, entry)
+                continue
+            with open(os.path.join(data_dir, rel), "rb") as f:
+                data = f.read()
+        except OSError as e:
+            results[rel] = FileResult([Diagnostic(rel, "$", "error", str(e))], [], [])
+            changed.append(rel)
+            entries.pop(rel, None)
+            continue
+        digest = hashlib.sha256(data).hexdigest()
+        if entry is not None and entry["sha256"] == digest:
+            # Touched or copied: same bytes, only the stat data moved
+            entry["size"], entry["mtime_ns"] = st.st_size, st.st_mtime_ns
+            results[rel] = cached_result(rel, entry)
+            continue
+        if validators is None:
+            validators = compile_schemas()
+        results[rel] = lint_source(rel, data, validators)
+        changed.append(rel)
+        entries[rel] = {
+            "sha256": digest,
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+        }
+
+    touched = set()
+    for rel in changed + [rel for rel in previous if rel not in results]:
+        before = after = set()
+        if rel in previous:
+            before = {(kind, name) for _, kind, name in previous[rel]["defines"]}
+            link(referrers, rel, previous[rel]["refs"], add=False)
+        if rel in results:
+            after = {(kind, name) for _, kind, name in results[rel].defines}
+            link(referrers, rel, results[rel].refs, add=True)
+        else:
+            entries.pop(rel, None)
+        # An id defined before and after still resolves the same way
+        touched |= before ^ after
+    dependents = {
+        rel
+        for kind, name in touched
+        for rel in referrers.get(kind, {}).get(name, ())
+        if rel in results
+    } - set(changed)
+
+    index, _ = build_index(results)
+    dangling = {}
+    for rel, result in results.items():
+        if rel not in entries:
+            dangling[rel] = unresolved(result.refs, index)
+        elif rel in dependents or rel in changed:
+            dangling[rel] = unresolved(result.refs, index)
+            entries[rel].update(
+                diagnostics=[d[1:] for d in result.diagnostics],
+                defines=result.defines,
+                refs=result.refs,
+                unresolved=dangling[rel],
+            )
+        else:
+            dangling[rel] = [tuple(r) for r in entries[rel]["unresolved"]]
+    return results, dangling, changed, dependents
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--data",
+        default=os.path.join(PROJECT_ROOT, "game", "data"),
+        help="content root (default: game/data)",
+    )
+    parser.add_argument("--strict", action="store_true", help="fail on warnings too")
+    parser.add_argument("--report", metavar="FILE", help="write diagnostics as JSON")
+    parser.add_argument("--quiet", action="store_true", help="only print the summary")
+    parser.add_argument(
+        "--cache",
+        default=lint_cache.CACHE_PATH,
+        help="cache file (default: .artcache/content-lint-cache.json)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="lint everything; leave the cache alone"
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    files = data_files(args.data)
+    tool = lint_cache.tool_fingerprint()
+    entries, referrers = (
+        ({}, {}) if args.no_cache else lint_cache.load(args.data, tool, args.cache)
+    )
+    results, dangling, changed, dependents = lint_incremental(
+        args.data, files, entries, referrers
+    )
+    if not args.no_cache:
+        lint_cache.save(args.data, tool, entries, referrers, args.cache)
+    diagnostics = [d for result in results.values() for d in result.diagnostics]
+    index, duplicates = build_index(results)
+    diagnostics += duplicates
+    diagnostics += [
+        Diagnostic(rel, path, "warning", f"undefined {kind} {name!r}")
+        for rel, refs in dangling.items()
+        for path, kind, name in refs
+    ]
+    refs = sum(len(result.refs) for result in results.values())
+    errors = sum(1 for d in diagnostics if d.severity == "error")
+    warnings = len(diagnostics) - errors
+
+    if not args.quiet:
+        for d in diagnostics:
+            print(f"[lint] {d.severity.upper()}: {d.file}: {d.path}: {d.message}")
+    if args.report:
+        os.makedirs(os.path.dirname(os.path.abspath(args.report)), exist_ok=True)
+        with open(args.report, "w") as f:
+            json.dump(
+                {
+                    "files": len(files),
+                    "symbols": len(index),
+                    "references": refs,
+                    "errors": errors,
+                    "warnings": warnings,
+                    "diagnostics": [d._asdict() for d in diagnostics],
+                },
+                f,
+                indent=2,
+            )
+            f.write("\n")
+    print(
+        f"[lint] {len(files)} file(s) ({len(changed)} linted, "
+        f"{len(dependents)} dependent(s)), {len(index)} symbol(s), {refs} reference(s): "
+        f"{errors} error(s), {warnings} warning(s) "
+        f"in {(time.perf_counter() - started) * 1000:.0f}ms"
+    )
+    if errors or (args.strict and warnings):
+        print("[lint] Content lint FAILED")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+"""tools/content/build_bundle.py's Variant encoding and round trip."""
+
+import struct
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "tools" / "content"))
+
+import build_bundle  # noqa: E402
+
+
+def encoded(value) -> bytes:
+    out = bytearray()
+    build_bundle.encode(value, out)
+    return bytes(out)
+
+
+class VariantEncodingTest(unittest.TestCase):
+    def test_matches_var_to_bytes(self):
+        # Expected bytes are what Godot 4's var_to_bytes() returns
+        self.assertEqual(encoded(None), bytes.fromhex("00000000"))
+        self.assertEqual(encoded(True), bytes.fromhex("01000000 01000000"))
+        self.assertEqual(encoded(7), bytes.fromhex("02000000 07000000"))
+        self.assertEqual(encoded(1 << 40), bytes.fromhex("02000100 0000000000010000"))
+        self.assertEqual(encoded(1.5), bytes.fromhex("03000000 0000c03f"))
+        self.assertEqual(encoded(0.1), b"\x03\x00\x01\x00" + struct.pack("<d", 0.1))
+        self.assertEqual(
+            encoded("hello"), bytes.fromhex("04000000 05000000 68656c6c6f000000")
+        )
+        self.assertEqual(encoded([None]), bytes.fromhex("1c000000 01000000 00000000"))
+        self.assertEqual(
+            encoded({"a": 1.0}),
+            bytes.fromhex("1b000000 01000000 04000000 01000000 61000000")
+            + bytes.fromhex("03000000 0000803f"),
+        )
+
+    def test_round_trip_keeps_types_and_order(self):
+        doc = {"z": [1.0, 0.1, 1e300, "é", None, True], "a": {"id": "x"}}
+        value, end = build_bundle.decode(encoded(doc))
+        self.assertEqual(end, len(encoded(doc)))
+        self.assertTrue(build_bundle.same(value, doc))
+        self.assertFalse(build_bundle.same({"a": 1}, {"a": 1.0}))
+        self.assertFalse(build_bundle.same({"a": 1, "b": 2}, {"b": 2, "a": 1}))
+
+    def test_game_data_round_trips(self):
+        data_dir = str(ROOT / "game" / "data")
+        files = build_bundle.lint_content.data_files(data_dir)
+        digest, sources = build_bundle.source_digest(data_dir, files)
+        docs = {rel: build_bundle.parse_json(raw) for rel, raw in sources.items()}
+        read_digest, read_docs = build_bundle.read_bundle(
+            build_bundle.compile_bundle(docs, digest)
+        )
+        self.assertEqual(read_digest, digest)
+        self.assertTrue(build_bundle.same(read_docs, docs))
+
+    def test_rejects_other_files(self):
+        with self.assertRaises(ValueError):
+            build_bundle.read_bundle(b"WOCB\x01\x00\x00\x00")
+        with self.assertRaises(ValueError):
+            build_bundle.read_bundle(encoded({"version": 2, "documents": {}}))
+        bundle = build_bundle.compile_bundle({"a.json": {}}, bytes(32))
+        with self.assertRaises(ValueError):
+            build_bundle.read_bundle(bundle[:-1])
+
+    def test_bundle_is_smaller_than_json(self):
+        data_dir = str(ROOT / "game" / "data")
+        files = build_bundle.lint_content.data_files(data_dir)
+        digest, sources = build_bundle.source_digest(data_dir, files)
+        docs = {rel: build_bundle.parse_json(raw) for rel, raw in sources.items()}
+        bundle = build_bundle.compile_bundle(docs, digest)
+        self.assertLess(len(bundle), sum(map(len, sources.values())))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""golden_store.py update/prune/gc on a scratch store."""
+
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+TOOL = Path(__file__).resolve().parents[1] / "visual" / "golden_store.py"
+sys.path.insert(0, str(TOOL.parent))
+
+import golden_store  # noqa: E402
+
+
+def capture(root: Path, scenario: str, *shades: int) -> None:
+    directory = root / scenario
+    directory.mkdir(parents=True, exist_ok=True)
+    for i, shade in enumerate(shades):
+        pixels = np.full((4, 4, 4), shade, dtype=np.uint8)
+        Image.fromarray(pixels, "RGBA").save(directory / f"frame_{i}.png")
+
+
+def run(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(TOOL), *args], capture_output=True, text=True
+    )
+
+
+class UpdateTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = Path(tmp.name) / "golden"
+        self.first = Path(tmp.name) / "first"
+        self.second = Path(tmp.name) / "second"
+        capture(self.first, "kept", 10, 20)
+        capture(self.first, "renamed_old", 30)
+        capture(self.second, "kept", 10, 20)
+        capture(self.second, "renamed_new", 30)
+        self.assertEqual(
+            run("update", "--store", str(self.store), str(self.first)).returncode, 0
+        )
+
+    def test_update_keeps_uncaptured_scenarios(self):
+        run("update", "--store", str(self.store), str(self.second))
+        self.assertEqual(
+            golden_store.scenarios(str(self.store)),
+            ["kept", "renamed_new", "renamed_old"],
+        )
+
+    def test_prune_drops_uncaptured_scenarios(self):
+        result = run("update", "--prune", "--store", str(self.store), str(self.second))
+        self.assertEqual(result.returncode, 0, result.stdout)
+        self.assertEqual(
+            golden_store.scenarios(str(self.store)), ["kept", "renamed_new"]
+        )
+        self.assertFalse((self.store / "renamed_old").exists())
+        # renamed_new reuses renamed_old's blob, so gc removes nothing
+        run("gc", "--store", str(self.store))
+        self.assertEqual(len(golden_store.all_blobs(str(self.store))), 3)
+        self.assertEqual(run("stats", "--store", str(self.store)).returncode, 0)
+
+    def test_prune_rejects_single_scenario(self):
+        result = run(
+            "update",
+            "--prune",
+            "--store",
+            str(self.store),
+            "--scenario",
+            "kept",
+            str(self.second / "kept"),
+        )
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("renamed_old", golden_store.scenarios(str(self.store)))
+
+
+if __name__ == "__main__":
+    unittest.main()
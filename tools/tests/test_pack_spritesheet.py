@@ -0,0 +1,59 @@
+"""Layouts of tools/art/pack_spritesheet.py's MaxRects packer."""
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "art"))
+
+import pack_spritesheet as packer  # noqa: E402
+
+
+def sizes(seed: int, count: int) -> list[tuple[int, int]]:
+    rng = random.Random(seed)
+    return sorted(
+        ((rng.randint(4, 60), rng.randint(4, 60)) for _ in range(count)),
+        key=lambda s: (-max(s), -s[1], -s[0]),
+    )
+
+
+class MaxRectsTest(unittest.TestCase):
+    def check_layout(self, rects, placements, padding=0):
+        self.assertEqual([(p.rect.w, p.rect.h) for p in placements], rects)
+        padded = [
+            packer.Rect(p.rect.x, p.rect.y, p.rect.w + padding, p.rect.h + padding)
+            for p in placements
+        ]
+        for i, a in enumerate(padded):
+            for b in padded[i + 1 :]:
+                self.assertFalse(a.intersects(b))
+
+    def test_cropped_pages_beat_power_of_two(self):
+        for seed in range(5):
+            rects = sizes(seed, 30)
+            pot = packer.pack_maxrects(rects, 512, pot=True)
+            tight = packer.pack_maxrects(rects, 512, pot=False)
+            self.check_layout(rects, pot)
+            self.check_layout(rects, tight)
+            w, h = packer.used_extent(tight)
+            pw, ph = packer.used_extent(pot)
+            self.assertLessEqual(w * h, packer.next_pot(pw) * packer.next_pot(ph))
+            self.assertGreater(sum(a * b for a, b in rects) / (w * h), 0.8)
+
+    def test_padding(self):
+        rects = sizes(7, 20)
+        placements = packer.pack_maxrects(rects, 256, padding=2, pot=False)
+        self.check_layout(rects, placements, padding=2)
+        w, h = packer.used_extent(placements)
+        self.assertLessEqual(max(w, h), 256)
+
+    def test_spills_over_pages(self):
+        rects = [(100, 100)] * 5
+        placements = packer.pack_maxrects(rects, 200, pot=False)
+        self.assertEqual(max(p.page for p in placements), 1)
+        self.assertIsNone(packer.pack_maxrects([(300, 10)], 200, pot=False))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""Round trips of tools/art/palette.py's compiled form."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "art"))
+
+import palette  # noqa: E402
+
+
+class CompiledPaletteTest(unittest.TestCase):
+    def round_trip(self, doc: dict) -> None:
+        parsed = palette.parse(doc, "test")
+        loaded = palette.decompile(palette.compile_palette(parsed), "test")
+        self.assertEqual(loaded.names, parsed.names)
+        self.assertEqual(loaded.entries(), parsed.entries())
+
+    def test_flat(self):
+        self.round_trip(
+            {
+                "colors": ["#ff0000", "#00ff00", "#ff0000"],
+                "color_names": ["a", "b", "c"],
+            }
+        )
+
+    def test_nested(self):
+        self.round_trip({"colors": {"foliage": {"dark": "#102010", "mid": "#204020"}}})
+
+    def test_non_ascii_names(self):
+        self.round_trip(
+            {
+                "colors": ["#ffc0cb", "#00ff00", "#0000ff"],
+                "color_names": ["rosé", "vert", "青"],
+            }
+        )
+
+    def test_load_uses_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "x.palette.json"
+            path.write_text('{"colors": {"rosé": "#ffc0cb", "vert": "#00ff00"}}')
+            cache = Path(tmp) / "cache"
+            first = palette.load(str(path), cache)
+            self.assertEqual(len(list(cache.iterdir())), 1)
+            second = palette.load(str(path), cache)
+            self.assertEqual(second.names, ["rosé", "vert"])
+            self.assertEqual(second.entries(), first.entries())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+"""Output modes of tools/art/quantize_to_palette.py."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "art"))
+
+import quantize_to_palette as quantize  # noqa: E402
+
+GREYS = np.array([[0, 0, 0], [128, 128, 128], [255, 255, 255]], dtype=np.uint8)
+COLORS = np.array([[0, 0, 0], [200, 40, 40], [255, 255, 255]], dtype=np.uint8)
+
+
+class QuantizeFileTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.ramp = np.tile(np.arange(0, 256, 16, dtype=np.uint8), (4, 1))
+
+    def quantize(self, image: Image.Image, palette: np.ndarray) -> Image.Image:
+        src = self.dir / f"in_{image.mode}.png"
+        out = self.dir / f"out_{image.mode}.png"
+        image.save(src)
+        quantize.quantize_file(quantize.Quantizer(palette), str(src), str(out), False)
+        with Image.open(out) as result:
+            result.load()
+            return result
+
+    def test_greyscale_stays_greyscale(self):
+        result = self.quantize(Image.fromarray(self.ramp, "L"), GREYS)
+        self.assertEqual(result.mode, "L")
+        self.assertEqual(set(np.unique(np.asarray(result))), {0, 128, 255})
+
+    def test_greyscale_alpha_stays_greyscale(self):
+        alpha = np.full_like(self.ramp, 255)
+        alpha[0] = 0
+        image = Image.fromarray(np.dstack([self.ramp, alpha]), "LA")
+        result = self.quantize(image, GREYS)
+        self.assertEqual(result.mode, "LA")
+        self.assertTrue(np.array_equal(np.asarray(result)[..., 1], alpha))
+
+    def test_greyscale_with_colored_palette_becomes_rgb(self):
+        result = self.quantize(Image.fromarray(self.ramp, "L"), COLORS)
+        self.assertEqual(result.mode, "RGB")
+
+    def test_rgb_stays_rgb(self):
+        rgb = np.dstack([self.ramp] * 3)
+        result = self.quantize(Image.fromarray(rgb, "RGB"), COLORS)
+        self.assertEqual(result.mode, "RGB")
+
+
+if __name__ == "__main__":
+    unittest.main()
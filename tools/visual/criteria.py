@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Per-scenario pass criteria for diff_frames.py.
+
+By default a capture passes only if no pixel's largest channel delta
+exceeds --fuzz. A scenario can relax that in tests/scenarios/<id>.json,
+for the whole scenario or for one capture action (matched by label; its
+keys override the scenario's):
+
+  "visual_tolerance": {
+    "fuzz": 2,              percent of 255 a pixel may drift and still count as equal
+    "max_diff_ratio": 0.01, share of pixels allowed to differ (beyond fuzz)
+    "max_delta": 24,        largest channel delta allowed anywhere (0-255)
+    "min_ssim": 0.98        lowest mean SSIM allowed (8x8 windows, luma)
+  }
+
+Only the criteria that are set are checked; when none of max_diff_ratio,
+max_delta and min_ssim is set, max_diff_ratio is 0 (every pixel must be
+within fuzz). So a tinted scenario can pass on SSIM and max_delta alone
+while every other scenario stays pixel-exact.
+
+Captures are named <frame>_<label>.png by ScenarioRunner; a capture
+without that prefix matches a label equal to its whole stem.
+
+Usage:
+  python3 tools/visual/criteria.py                      # list scenarios with tolerances
+  python3 tools/visual/criteria.py --scenarios DIR
+"""
+
+import argparse
+import json
+import os
+import re
+from typing import NamedTuple, Optional
+
+KEY = "visual_tolerance"
+CHECKS = ("max_diff_ratio", "max_delta", "min_ssim")
+CAPTURE_NAME = re.compile(r"^\d+_(.+)$")
+
+
+class Criteria(NamedTuple):
+    fuzz: float = 0.0  # percent of 255
+    max_diff_ratio: Optional[float] = 0.0
+    max_delta: Optional[int] = None
+    min_ssim: Optional[float] = None
+
+    @property
+    def tolerance(self) -> float:
+        """fuzz as a channel delta (0-255)."""
+        return self.fuzz * 255 / 100
+
+    def as_dict(self) -> dict:
+        return {k: v for k, v in self._asdict().items() if v is not None}
+
+
+def make_criteria(config: dict, fuzz: float, where: str) -> Criteria:
+    """Criteria from a visual_tolerance object; fuzz is the default fuzz."""
+    unknown = config.keys() - {"fuzz", *CHECKS}
+    if unknown:
+        raise ValueError(f"{where}: unknown {KEY} key(s) {', '.join(sorted(unknown))}")
+    for key, value in config.items():
+        if not isinstance(value, (int, float)) or isinstance(value, bool) or value < 0:
+            raise ValueError(f"{where}: {KEY}.{key} must be a non-negative number")
+    if "max_delta" in config and not isinstance(config["max_delta"], int):
+        raise ValueError(f"{where}: {KEY}.max_delta must be an integer")
+    checks = {key: config.get(key) for key in CHECKS}
+    if all(v is None for v in checks.values()):
+        checks["max_diff_ratio"] = 0.0
+    return Criteria(fuzz=float(config.get("fuzz", fuzz)), **checks)
+
+
+def load_tolerances(scenarios_dir: str) -> dict[str, tuple[dict, dict[str, dict]]]:
+    """Scenario id -> (scenario config, label -> capture config).
+
+    Only scenarios with a visual_tolerance somewhere are included; the id
+    is the file name, as ScenarioRunner loads tests/scenarios/<id>.json.
+    Raises ValueError for an invalid visual_tolerance.
+    """
+    found = {}
+    if not os.path.isdir(scenarios_dir):
+        return found
+    for name in sorted(os.listdir(scenarios_dir)):
+        if not name.endswith(".json"):
+            continue
+        path = os.path.join(scenarios_dir, name)
+        with open(path) as f:
+            try:
+                doc = json.load(f)
+            except ValueError as e:
+                raise ValueError(f"{path}: {e}")
+        if not isinstance(doc, dict):
+            continue
+        captures = {
+            str(action.get("label", "capture")): action[KEY]
+            for action in doc.get("actions", [])
+            if isinstance(action, dict)
+            and action.get("type") == "capture"
+            and KEY in action
+        }
+        if KEY in doc or captures:
+            scenario = name[: -len(".json")]
+            config = doc.get(KEY, {})
+            # Fail on typos up front, not when a matching capture shows up
+            make_criteria(config, 0.0, path)
+            for label, override in captures.items():
+                make_criteria({**config, **override}, 0.0, f"{path} ({label})")
+            found[scenario] = (config, captures)
+    return found
+
+
+def capture_label(frame: str) -> str:
+    """Scenario capture label of a frame file name."""
+    stem = os.path.splitext(frame)[0]
+    match = CAPTURE_NAME.match(stem)
+    return match.group(1) if match else stem
+
+
+def criteria_for(tolerances: dict, scenario: str, frame: str, fuzz: float) -> Criteria:
+    """Criteria for one capture of a scenario."""
+    if scenario not in tolerances:
+        return Criteria(fuzz=fuzz)
+    config, captures = tolerances[scenario]
+    merged = {**config, **captures.get(capture_label(frame), {})}
+    return make_criteria(merged, fuzz, f"{scenario}/{frame}")
+
+
+def violations(criteria: Criteria, stats: dict) -> list[str]:
+    """Broken criteria for a diff's ae/diff_ratio/max_delta/ssim stats."""
+    broken = []
+    if (
+        criteria.max_diff_ratio is not None
+        and stats["diff_ratio"] > criteria.max_diff_ratio
+    ):
+        broken.append(
+            f"diff ratio {stats['diff_ratio']:.6g} > {criteria.max_diff_ratio:g}"
+        )
+    if criteria.max_delta is not None and stats["max_delta"] > criteria.max_delta:
+        broken.append(f"max delta {stats['max_delta']} > {criteria.max_delta}")
+    if criteria.min_ssim is not None and stats["ssim"] < criteria.min_ssim:
+        broken.append(f"SSIM {stats['ssim']:.5f} < {criteria.min_ssim:g}")
+    return broken
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--scenarios",
+        default="tests/scenarios",
+        help="scenario JSON directory (default: tests/scenarios)",
+    )
+    args = parser.parse_args()
+    try:
+        tolerances = load_tolerances(args.scenarios)
+        for scenario, (config, captures) in tolerances.items():
+            print(
+                f"[visual-diff] {scenario}: {make_criteria(config, 0.0, scenario).as_dict()}"
+            )
+            for label, override in captures.items():
+                criteria = make_criteria(
+                    {**config, **override}, 0.0, f"{scenario}/{label}"
+                )
+                print(f"[visual-diff]   {label}: {criteria.as_dict()}")
+    except (OSError, ValueError) as e:
+        print(f"[visual-diff] ERROR: {e}")
+        return 1
+    print(f"[visual-diff] {len(tolerances)} scenario(s) with a {KEY}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
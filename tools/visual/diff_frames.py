@@ -1,13 +1,682 @@
 #!/usr/bin/env python3
+"""
+Compare current captures against golden captures with NumPy.
+
+Captures are paired by path relative to the two roots, so both layouts
+work: captures/golden/<scenario>/<frame>.png vs captures/current/..., or a
+single scenario's baselines/visual/<id>/ vs one capture directory. The
+first path component is the scenario ("." for a flat directory).
+
+Each pair is decoded once and compared as RGBA. Per pixel the delta is the
+largest channel difference; a pixel differs when its delta exceeds --fuzz
+(percent of 255, like ImageMagick's -fuzz; default 0 = exact). Reported
+per capture:
+- ae: number of differing pixels (ImageMagick's AE metric)
+- max_delta: largest channel difference anywhere (0-255)
+- psnr: over all RGBA channels in dB (null when identical)
+- bbox: [x, y, w, h] around the differing pixels (null when none)
+- regions: changed --tile tiles (default 16) merged into rectangles, each
+  {"rect": [x, y, w, h], "ae", "max_delta"}, so a one-pixel shimmer and a
+  missing sprite read differently; tiles_changed counts tiles with any
+  difference at all
+
+Frames are diffed tile by tile: one comparison pass finds the tiles that
+differ, and only those are diffed, which keeps mostly identical large
+captures cheap.
+
+A capture fails if any pixel differs or the sizes differ. Failures get a
+heatmap, <out>/<relative dir>/<stem>_diff.png: the golden frame dimmed to
+grey with differing pixels drawn from yellow (small delta) to red (255).
+Current captures without a golden are "new"; goldens without a current
+capture are "missing"; neither fails the run.
+
+Identical captures are settled by hashes before any diff: equal file
+bytes pass without decoding; otherwise the current capture is decoded and
+its pixel digest (sha256 of size + RGBA) is compared with the golden's.
+Golden pixel digests are cached in a sidecar <golden>/pixel-index.json,
+keyed by the golden file's sha256 so it stays valid across checkouts, and
+the golden is decoded only on a miss. --no-index skips the sidecar.
+When the golden root is a golden store (golden_store.py) or a scenario
+directory inside one, goldens resolve to their blobs and the manifests
+supply every golden digest, so the sidecar is not used.
 
-"""Placeholder visual diff tool.
+All pairs across all scenarios form one work list. --jobs N compares
+them on a process pool; --shard I/N keeps only the scenarios whose name
+hashes (crc32) to shard I, so CI machines can split the work without
+coordinating. Each result is appended to <out>/results.jsonl as soon as
+it completes; when the run ends, <out>/results.json holds every result
+in path order, and report.py builds the HTML report from it in <out>
+(--no-report skips that, e.g. on shards whose results are merged later).
 
-Implement in Milestone 8:
-- compare captures vs baselines
-- generate diff images + metrics
-- write reports/visual-diff/.../index.html
+Usage:
+  python3 tools/visual/diff_frames.py                                # captures/golden vs captures/current
+  python3 tools/visual/diff_frames.py --golden baselines/visual/golden_battle --current CAPTURE_DIR --out CAPTURE_DIR/diffs
+  python3 tools/visual/diff_frames.py --fuzz 2 --json /tmp/results.json
+  python3 tools/visual/diff_frames.py --jobs 0 --shard 2/4
+  python3 tools/visual/diff_frames.py --tile 32
 """
 
-import sys
-print("[visual-diff] Placeholder. Implement in Milestone 8.")
-sys.exit(0)
+import argparse
+import concurrent.futures
+import hashlib
+import json
+import os
+import time
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional
+
+import numpy as np
+from PIL import Image
+
+from criteria import Criteria, criteria_for, load_tolerances, violations
+from golden_store import decode, list_goldens, pixel_digest
+from report import build_report
+
+SCENARIOS_DIR = str(Path(__file__).resolve().parents[2] / "tests" / "scenarios")
+
+RESULTS_SCHEME = 1
+INDEX_NAME = "pixel-index.json"
+INDEX_SCHEME = 1
+
+# Most captures a pool task compares at once
+BATCH_SIZE = 16
+TILE_SIZE = 16  # matches the --grid 16 art convention
+SSIM_WINDOW = 8
+SSIM_C1 = (0.01 * 255) ** 2
+SSIM_C2 = (0.03 * 255) ** 2
+
+
+class Pair(NamedTuple):
+    rel: str  # path relative to both roots, / separated
+    golden: Optional[str]
+    current: Optional[str]
+    golden_pixels: Optional[str] = None  # known digest (golden store)
+    criteria: Criteria = Criteria()
+
+    @property
+    def scenario(self) -> str:
+        head, _, _ = self.rel.rpartition("/")
+        return head.split("/")[0] if head else "."
+
+
+def list_pngs(root: str, skip: Optional[str] = None) -> dict[str, str]:
+    """Relative path -> path for every PNG under root (recursive).
+
+    skip is a directory to leave out, e.g. an output dir inside root.
+    """
+    found = {}
+    if not os.path.isdir(root):
+        return found
+    skip = os.path.realpath(skip) if skip else None
+    for base, dirs, files in os.walk(root):
+        dirs[:] = sorted(
+            d for d in dirs if os.path.realpath(os.path.join(base, d)) != skip
+        )
+        for name in files:
+            if name.endswith(".png"):
+                path = os.path.join(base, name)
+                found[os.path.relpath(path, root).replace(os.sep, "/")] = path
+    return found
+
+
+def list_golden(root: str, skip: Optional[str] = None) -> dict[str, tuple]:
+    """Relative path -> (file, pixel digest or None) for a golden root.
+
+    The root may be a golden store (or one scenario in it), whose
+    manifests already know every digest, or a plain directory of PNGs.
+    """
+    stored = list_goldens(root)
+    if stored is not None:
+        return stored
+    return {rel: (path, None) for rel, path in list_pngs(root, skip).items()}
+
+
+def collect_pairs(golden: dict[str, tuple], current: dict[str, str]) -> list[Pair]:
+    """Every capture present on either side, sorted by relative path."""
+    pairs = []
+    for rel in sorted(golden.keys() | current.keys()):
+        golden_file, digest = golden.get(rel, (None, None))
+        pairs.append(Pair(rel, golden_file, current.get(rel), digest))
+    return pairs
+
+
+def abs_diff(golden: np.ndarray, current: np.ndarray) -> np.ndarray:
+    """Per-channel |golden - current| without leaving uint8."""
+    return np.maximum(golden, current) - np.minimum(golden, current)
+
+
+def psnr_sum(diff: np.ndarray, size: int) -> Optional[float]:
+    """PSNR of a frame with size channel values whose nonzero differences
+    (from abs_diff()) are all in diff; None when identical."""
+    squared = np.square(diff, dtype=np.uint16)
+    mse = int(squared.sum(dtype=np.uint64)) / size
+    if mse == 0:
+        return None
+    return round(10 * np.log10(255.0 * 255.0 / mse), 3)
+
+
+def luma(canvas: np.ndarray) -> np.ndarray:
+    return canvas[:, :, :3] @ np.array([0.299, 0.587, 0.114])
+
+
+def box_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Mean over every window x window box (valid positions only)."""
+    sums = np.pad(values.cumsum(axis=0).cumsum(axis=1), ((1, 0), (1, 0)))
+    boxes = (
+        sums[window:, window:]
+        - sums[:-window, window:]
+        - sums[window:, :-window]
+        + sums[:-window, :-window]
+    )
+    return boxes / (window * window)
+
+
+def ssim(golden: np.ndarray, current: np.ndarray) -> float:
+    """Mean SSIM of the luma over SSIM_WINDOW boxes, from summed-area tables."""
+    x, y = luma(golden), luma(current)
+    window = min(SSIM_WINDOW, *x.shape)
+    mean_x, mean_y = box_mean(x, window), box_mean(y, window)
+    var_x = box_mean(x * x, window) - mean_x * mean_x
+    var_y = box_mean(y * y, window) - mean_y * mean_y
+    cov = box_mean(x * y, window) - mean_x * mean_y
+    index = ((2 * mean_x * mean_y + SSIM_C1) * (2 * cov + SSIM_C2)) / (
+        (mean_x * mean_x + mean_y * mean_y + SSIM_C1) * (var_x + var_y + SSIM_C2)
+    )
+    return round(float(index.mean()), 6)
+
+
+def tile_grid(canvas: np.ndarray, size: int) -> np.ndarray:
+    """(rows, cols, size, size, ...) tiles of canvas; edges are zero-padded."""
+    height, width = canvas.shape[:2]
+    pad = [(0, -height % size), (0, -width % size)] + [(0, 0)] * (canvas.ndim - 2)
+    if pad[0][1] or pad[1][1]:
+        canvas = np.pad(canvas, pad)
+    rows, cols = canvas.shape[0] // size, canvas.shape[1] // size
+    return canvas.reshape(rows, size, cols, size, *canvas.shape[2:]).swapaxes(1, 2)
+
+
+def untile(tiles: np.ndarray, height: int, width: int) -> np.ndarray:
+    """Inverse of tile_grid(), cropped back to height x width."""
+    rows, cols, size = tiles.shape[:3]
+    full = tiles.swapaxes(1, 2).reshape(rows * size, cols * size, *tiles.shape[4:])
+    return full[:height, :width]
+
+
+def merge_tiles(grid: np.ndarray) -> list[tuple[int, int, int, int]]:
+    """Cover the True cells of a (rows, cols) grid with (col, row, w, h) rects.
+
+    Each row's horizontal runs grow downward while the next row has a run
+    with the same span, so every cell lands in exactly one rectangle.
+    """
+    done = []
+    growing: dict[tuple[int, int], list[int]] = {}
+    for row, cells in enumerate(grid):
+        edges = np.flatnonzero(
+            np.diff(np.concatenate(([0], cells, [0])).astype(np.int8))
+        )
+        runs = {(int(a), int(b)) for a, b in zip(edges[::2], edges[1::2])}
+        for span in list(growing):
+            if span not in runs:
+                done.append(tuple(growing.pop(span)))
+        for start, end in runs:
+            if (start, end) in growing:
+                growing[start, end][3] += 1
+            else:
+                growing[start, end] = [start, row, end - start, 1]
+    done.extend(tuple(rect) for rect in growing.values())
+    return sorted(done, key=lambda r: (r[1], r[0]))
+
+
+def bounding_box(mask: np.ndarray) -> Optional[list[int]]:
+    """[x, y, w, h] around the True pixels of a (h, w) mask."""
+    rows = np.flatnonzero(mask.any(axis=1))
+    if not len(rows):
+        return None
+    cols = np.flatnonzero(mask.any(axis=0))
+    x, y = int(cols[0]), int(rows[0])
+    return [x, y, int(cols[-1]) - x + 1, int(rows[-1]) - y + 1]
+
+
+def heatmap(golden: np.ndarray, delta: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Golden dimmed to grey, differing pixels yellow (small) to red (large)."""
+    grey = golden[:, :, :3] @ np.array([0.299, 0.587, 0.114])
+    out = np.repeat((grey * 0.3).astype(np.uint8)[:, :, None], 3, axis=2)
+    out[mask, 0] = 255
+    out[mask, 1] = 255 - delta[mask]
+    out[mask, 2] = 0
+    return out
+
+
+def diff_path(out_dir: str, rel: str) -> str:
+    stem = os.path.splitext(rel)[0]
+    return os.path.join(out_dir, *f"{stem}_diff.png".split("/"))
+
+
+def file_sha256(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+# Golden file sha256 -> pixel digest; see load_pixel_index(). Module-level so
+# pool workers get it once through the initializer, not with every task.
+_golden_pixels: dict[str, str] = {}
+
+
+def use_index(index: dict[str, str]) -> None:
+    _golden_pixels.clear()
+    _golden_pixels.update(index)
+
+
+def diff_tiles(
+    golden: np.ndarray, current: np.ndarray, tolerance: float, tile: int
+) -> dict:
+    """Diff two same-size frames tile by tile.
+
+    Equal tiles are found with one comparison pass and skipped; only
+    changed tiles get per-channel deltas. Tiles with pixels beyond the
+    tolerance are merged into rectangular regions, each with its own
+    ae and max_delta. Also returns the full-frame delta and mask for the
+    heatmap (None when no pixel is beyond the tolerance).
+    """
+    height, width = golden.shape[:2]
+    golden_tiles = tile_grid(golden, tile)
+    current_tiles = tile_grid(current, tile)
+    changed = tile_grid((golden != current).any(axis=2), tile).any(axis=(2, 3))
+
+    diff = abs_diff(golden_tiles[changed], current_tiles[changed])
+    delta = diff.max(axis=3)  # per pixel, largest channel difference
+    mask = delta > tolerance
+    tile_ae = np.zeros(changed.shape, dtype=np.int64)
+    tile_ae[changed] = np.count_nonzero(mask, axis=(1, 2))
+    tile_max = np.zeros(changed.shape, dtype=np.uint8)
+    tile_max[changed] = delta.max(axis=(1, 2), initial=0)
+
+    regions = []
+    for col, row, w, h in merge_tiles(tile_ae > 0):
+        x, y = col * tile, row * tile
+        area = (slice(row, row + h), slice(col, col + w))
+        regions.append(
+            {
+                "rect": [x, y, min(w * tile, width - x), min(h * tile, height - y)],
+                "ae": int(tile_ae[area].sum()),
+                "max_delta": int(tile_max[area].max()),
+            }
+        )
+    ae = int(tile_ae.sum())
+    stats = {
+        "ae": ae,
+        "max_delta": int(tile_max.max()),
+        # Unchanged tiles add nothing to the squared error
+        "psnr": psnr_sum(diff, golden.size),
+        "tiles_changed": int(np.count_nonzero(changed)),
+        "regions": regions,
+        "delta": None,
+        "mask": None,
+    }
+    if ae:
+        full = np.zeros(changed.shape + (tile, tile), dtype=np.uint8)
+        full[changed] = delta
+        stats["delta"] = untile(full, height, width)
+        stats["mask"] = stats["delta"] > tolerance
+    return stats
+
+
+def compare(pair: Pair, out_dir: str, tile: int) -> dict:
+    """Compare one pair against its criteria; write a heatmap if it fails.
+
+    Cheapest evidence first: identical file bytes pass without decoding;
+    otherwise the current capture's pixel digest is checked against the
+    golden's (from the index, or by decoding it) before any diff runs.
+    """
+    result = {"path": pair.rel, "scenario": pair.scenario, "status": "pass"}
+    if pair.golden is None:
+        result.update(status="new", current_file=pair.current)
+        return result
+    if pair.current is None:
+        result.update(status="missing", golden_file=pair.golden)
+        return result
+
+    golden_sha = file_sha256(pair.golden)
+    current_sha = file_sha256(pair.current)
+    result.update(
+        golden_file=pair.golden,
+        current_file=pair.current,
+        golden_sha256=golden_sha,
+        sha256=current_sha,
+    )
+    known = pair.golden_pixels or _golden_pixels.get(golden_sha)
+    if known:
+        result["golden_pixels"] = known
+    if golden_sha == current_sha:
+        result["match"] = "bytes"
+        return result
+
+    current = decode(pair.current)
+    result["pixels"] = pixel_digest(current)
+    if known == result["pixels"]:
+        result["match"] = "pixels"
+        return result
+    golden = decode(pair.golden)
+    result["golden_pixels"] = pixel_digest(golden)
+    if result["golden_pixels"] == result["pixels"]:
+        result["match"] = "pixels"
+        return result
+
+    height, width = golden.shape[:2]
+    result.update(width=width, height=height)
+    if golden.shape != current.shape:
+        cur_h, cur_w = current.shape[:2]
+        result.update(
+            status="fail",
+            error=f"size {cur_w}x{cur_h}, golden is {width}x{height}",
+        )
+        return result
+
+    criteria = pair.criteria
+    stats = diff_tiles(golden, current, criteria.tolerance, tile)
+    delta, mask = stats.pop("delta"), stats.pop("mask")
+    stats["diff_ratio"] = stats["ae"] / (width * height)
+    if criteria.min_ssim is not None:
+        stats["ssim"] = ssim(golden, current)
+    result.update(stats, bbox=None, criteria=criteria.as_dict())
+    if mask is not None:
+        result["bbox"] = bounding_box(mask)
+    broken = violations(criteria, stats)
+    if broken:
+        result.update(status="fail", violations=broken)
+    if broken and mask is not None:
+        path = diff_path(out_dir, pair.rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        Image.fromarray(heatmap(golden, delta, mask)).save(path)
+        result["diff"] = os.path.relpath(path, out_dir).replace(os.sep, "/")
+    return result
+
+
+def load_pixel_index(golden_root: str) -> dict[str, str]:
+    """The golden root's pixel index, or {} if missing or unreadable."""
+    try:
+        with open(os.path.join(golden_root, INDEX_NAME)) as f:
+            doc = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(doc, dict) or doc.get("scheme") != INDEX_SCHEME:
+        return {}
+    return dict(doc.get("pixels", {}))
+
+
+def save_pixel_index(golden_root: str, index: dict[str, str]) -> bool:
+    """Write the index if it changed; a read-only golden root is fine."""
+    path = os.path.join(golden_root, INDEX_NAME)
+    text = json.dumps(
+        {"scheme": INDEX_SCHEME, "pixels": index}, indent=2, sort_keys=True
+    )
+    try:
+        with open(path) as f:
+            if f.read() == text + "\n":
+                return False
+    except OSError:
+        pass
+    try:
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(text + "\n")
+        os.replace(tmp, path)
+    except OSError:
+        return False
+    return True
+
+
+def try_compare(pair: Pair, out_dir: str, tile: int) -> dict:
+    """compare() that reports an unreadable capture as a failure."""
+    try:
+        return compare(pair, out_dir, tile)
+    except OSError as e:
+        return {
+            "path": pair.rel,
+            "scenario": pair.scenario,
+            "status": "fail",
+            "error": str(e),
+        }
+
+
+def compare_batch(pairs: list[Pair], out_dir: str, tile: int) -> list[dict]:
+    """One pool task: a few pairs, so small captures amortize the IPC."""
+    return [try_compare(pair, out_dir, tile) for pair in pairs]
+
+
+def parse_shard(text: str) -> tuple[int, int]:
+    """'i/n' (1-based) -> (i, n)."""
+    try:
+        index, count = (int(v) for v in text.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected i/n, got {text!r}")
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard {text!r} out of range")
+    return index, count
+
+
+def shard_of(scenario: str, count: int) -> int:
+    """1-based shard owning a scenario; depends on nothing but its name."""
+    return zlib.crc32(scenario.encode()) % count + 1
+
+
+def run_pairs(
+    pairs: list[Pair],
+    out_dir: str,
+    tile: int,
+    jobs: int,
+    index: dict[str, str],
+) -> Iterator[dict]:
+    """Yield results as they complete, in-process or over a process pool."""
+    use_index(index)
+    if jobs <= 1:
+        for pair in pairs:
+            yield try_compare(pair, out_dir, tile)
+        return
+    size = max(1, min(BATCH_SIZE, len(pairs) // (jobs * 4)))
+    batches = [pairs[i : i + size] for i in range(0, len(pairs), size)]
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs, initializer=use_index, initargs=(index,)
+    ) as pool:
+        futures = [
+            pool.submit(compare_batch, batch, out_dir, tile) for batch in batches
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            yield from future.result()
+
+
+def summarize(results: list[dict]) -> dict:
+    counts = {"pass": 0, "fail": 0, "new": 0, "missing": 0}
+    for r in results:
+        counts[r["status"]] += 1
+    counts["total"] = len(results)
+    return counts
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--golden",
+        default=os.environ.get("GOLDEN_DIR", "captures/golden"),
+        help="golden captures root (default: $GOLDEN_DIR or captures/golden)",
+    )
+    parser.add_argument(
+        "--current",
+        default=os.environ.get("CURRENT_DIR", "captures/current"),
+        help="current captures root (default: $CURRENT_DIR or captures/current)",
+    )
+    parser.add_argument(
+        "--out",
+        default=os.environ.get("DIFF_DIR", "captures/diff-report"),
+        help="heatmaps, results and HTML report (default: $DIFF_DIR or captures/diff-report)",
+    )
+    parser.add_argument(
+        "--fuzz",
+        type=float,
+        default=0.0,
+        metavar="PERCENT",
+        help="per-pixel channel tolerance in percent of 255 (default: 0, exact); "
+        "scenarios may override it",
+    )
+    parser.add_argument(
+        "--scenarios",
+        metavar="DIR",
+        help="scenario JSONs with visual_tolerance criteria "
+        "(default: the repo's tests/scenarios)",
+    )
+    parser.add_argument(
+        "--scenario-id",
+        default="",
+        metavar="ID",
+        help="scenario whose criteria apply when --current is one capture directory",
+    )
+    parser.add_argument(
+        "--tile",
+        type=int,
+        default=TILE_SIZE,
+        metavar="PX",
+        help=f"tile size for change detection and regions (default: {TILE_SIZE})",
+    )
+    parser.add_argument(
+        "--json", metavar="FILE", help="results path (default: <out>/results.json)"
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="worker processes (default: 1; 0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        metavar="I/N",
+        help="only compare the scenarios of shard I of N (1-based)",
+    )
+    parser.add_argument(
+        "--no-index",
+        action="store_true",
+        help=f"neither read nor update the golden root's {INDEX_NAME}",
+    )
+    parser.add_argument(
+        "--no-report",
+        action="store_true",
+        help="skip the HTML report (e.g. per shard; merge with report.py)",
+    )
+    parser.add_argument(
+        "--quiet", action="store_true", help="only print failures and the summary"
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if not os.path.isdir(args.golden):
+        print(f"[visual-diff] No golden captures found at {args.golden}")
+        return 0
+    if args.tile < 1:
+        parser.error("--tile must be at least 1")
+    if args.scenarios is None:
+        args.scenarios = SCENARIOS_DIR
+        if not os.path.isdir(args.scenarios):
+            print(
+                f"[visual-diff] WARNING: no scenarios at {args.scenarios}; "
+                "per-scenario criteria do not apply"
+            )
+    elif not os.path.isdir(args.scenarios):
+        print(f"[visual-diff] ERROR: --scenarios {args.scenarios} is not a directory")
+        return 1
+    try:
+        tolerances = load_tolerances(args.scenarios)
+    except (OSError, ValueError) as e:
+        print(f"[visual-diff] ERROR: {e}")
+        return 1
+    os.makedirs(args.out, exist_ok=True)
+
+    golden = list_golden(args.golden, args.out)
+    pairs = collect_pairs(golden, list_pngs(args.current, args.out))
+    try:
+        pairs = [
+            p._replace(
+                criteria=criteria_for(
+                    tolerances,
+                    args.scenario_id if p.scenario == "." else p.scenario,
+                    p.rel.rpartition("/")[2],
+                    args.fuzz,
+                )
+            )
+            for p in pairs
+        ]
+    except ValueError as e:
+        print(f"[visual-diff] ERROR: {e}")
+        return 1
+    # Store manifests already carry every golden digest
+    sidecar = not args.no_index and not any(p.golden_pixels for p in pairs)
+    if args.shard:
+        index, count = args.shard
+        pairs = [p for p in pairs if shard_of(p.scenario, count) == index]
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+    index = load_pixel_index(args.golden) if sidecar else {}
+
+    results = []
+    with open(os.path.join(args.out, "results.jsonl"), "w") as stream:
+        for result in run_pairs(pairs, args.out, args.tile, jobs, index):
+            stream.write(json.dumps(result) + "\n")
+            stream.flush()
+            results.append(result)
+            status = result["status"]
+            if status == "fail":
+                detail = result.get("error") or (
+                    f"{result['ae']} pixels differ, max delta {result['max_delta']}, "
+                    f"{len(result['regions'])} region(s) in bbox {result['bbox']}; "
+                    + ", ".join(result["violations"])
+                )
+                print(f"[visual-diff] FAIL: {result['path']} ({detail})", flush=True)
+            elif not args.quiet:
+                print(f"[visual-diff] {status.upper()}: {result['path']}", flush=True)
+    results.sort(key=lambda r: r["path"])
+
+    if sidecar:
+        # A full run drops entries for goldens that no longer exist
+        learned = {} if args.shard is None else dict(index)
+        for r in results:
+            if "golden_pixels" in r:
+                learned[r["golden_sha256"]] = r["golden_pixels"]
+        save_pixel_index(args.golden, learned)
+
+    summary = summarize(results)
+    shortcuts = sum(1 for r in results if "match" in r)
+    doc = {
+        "scheme": RESULTS_SCHEME,
+        "generated": datetime.now().astimezone().isoformat(timespec="seconds"),
+        "golden": args.golden,
+        "current": args.current,
+        "out": args.out,
+        "fuzz": args.fuzz,
+        "tile": args.tile,
+        "shard": "/".join(map(str, args.shard)) if args.shard else None,
+        "summary": summary,
+        "results": results,
+    }
+    results_path = args.json or os.path.join(args.out, "results.json")
+    with open(results_path, "w") as f:
+        json.dump(doc, f, indent=2)
+        f.write("\n")
+    if not args.no_report:
+        build_report([results_path], args.out)
+
+    print(
+        f"[visual-diff] Summary: {summary['pass']} passed, {summary['fail']} failed, "
+        f"{summary['new']} new, {summary['missing']} missing "
+        f"({shortcuts} matched by hash), in {time.perf_counter() - started:.2f}s "
+        f"({jobs} job(s))"
+    )
+    if summary["fail"]:
+        print("[visual-diff] Visual regression detected!")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
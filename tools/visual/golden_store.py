@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Content-addressed store for golden (baseline) captures.
+
+Layout under a store root (baselines/visual, captures/golden):
+  blobs/<aa>/<digest>.png       one PNG per distinct pixel content
+  <scenario>/manifest.json      {"scheme": 1, "frames": {"<frame>.png": "<digest>"}}
+
+The digest is the sha256 of "WxH:" plus the decoded RGBA bytes, so frames
+that look the same share one blob however they were encoded (title
+screens, idle town views repeated across scenarios). A blob keeps the
+bytes of the first capture stored under its digest.
+
+Updating a scenario stores any missing blobs and rewrites its manifest to
+exactly the captured frames; unchanged frames cost nothing. With
+--prune, scenarios that have no capture directory lose their manifest,
+as a full re-capture replaces the whole baseline. Blobs no manifest
+references are only removed by `gc`.
+
+diff_frames.py reads a store root, or one scenario directory inside it,
+like a plain directory of PNGs, and takes golden digests from the
+manifests instead of hashing the goldens.
+
+Usage:
+  python3 tools/visual/golden_store.py update --store baselines/visual --scenario golden_battle CAPTURE_DIR
+  python3 tools/visual/golden_store.py update --store captures/golden captures/current   # every scenario dir
+  python3 tools/visual/golden_store.py update --prune --store captures/golden captures/current
+  python3 tools/visual/golden_store.py migrate --store baselines/visual    # plain PNG dirs -> store
+  python3 tools/visual/golden_store.py gc --store baselines/visual
+  python3 tools/visual/golden_store.py stats --store baselines/visual
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+from typing import Optional
+
+import numpy as np
+from PIL import Image
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_SCHEME = 1
+BLOB_DIR = "blobs"
+
+
+def decode(path: str) -> np.ndarray:
+    with Image.open(path) as img:
+        return np.asarray(img.convert("RGBA"))
+
+
+def pixel_digest(canvas: np.ndarray) -> str:
+    """Identifies decoded pixels regardless of PNG encoding."""
+    height, width = canvas.shape[:2]
+    h = hashlib.sha256(f"{width}x{height}:".encode())
+    h.update(np.ascontiguousarray(canvas).data)
+    return h.hexdigest()
+
+
+def is_store(root: str) -> bool:
+    return os.path.isdir(os.path.join(root, BLOB_DIR))
+
+
+def blob_path(root: str, digest: str) -> str:
+    return os.path.join(root, BLOB_DIR, digest[:2], f"{digest}.png")
+
+
+def manifest_path(root: str, scenario: str) -> str:
+    return os.path.join(root, scenario, MANIFEST_NAME)
+
+
+def read_manifest(path: str) -> dict[str, str]:
+    """Frame name -> digest; {} if the manifest is missing."""
+    try:
+        with open(path) as f:
+            doc = json.load(f)
+    except FileNotFoundError:
+        return {}
+    if doc.get("scheme") != MANIFEST_SCHEME:
+        raise ValueError(f"{path}: unsupported manifest scheme {doc.get('scheme')}")
+    return dict(doc["frames"])
+
+
+def write_manifest(path: str, frames: dict[str, str]) -> bool:
+    """Write the manifest if its content changed."""
+    text = json.dumps(
+        {"scheme": MANIFEST_SCHEME, "frames": dict(sorted(frames.items()))}, indent=2
+    )
+    try:
+        with open(path) as f:
+            if f.read() == text + "\n":
+                return False
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text + "\n")
+    return True
+
+
+def scenarios(root: str) -> list[str]:
+    """Scenario directories of a store that have a manifest, sorted."""
+    return sorted(
+        name
+        for name in os.listdir(root)
+        if name != BLOB_DIR and os.path.isfile(manifest_path(root, name))
+    )
+
+
+def list_goldens(root: str) -> Optional[dict[str, tuple[str, str]]]:
+    """Relative path -> (blob path, digest) for a store or one scenario in it.
+
+    Returns None when root is neither, i.e. a plain directory of PNGs.
+    """
+    if is_store(root):
+        found = {}
+        for scenario in scenarios(root):
+            for frame, digest in read_manifest(manifest_path(root, scenario)).items():
+                found[f"{scenario}/{frame}"] = (blob_path(root, digest), digest)
+        return found
+    store = os.path.dirname(os.path.abspath(root))
+    if os.path.isfile(os.path.join(root, MANIFEST_NAME)) and is_store(store):
+        frames = read_manifest(os.path.join(root, MANIFEST_NAME))
+        return {
+            frame: (blob_path(store, digest), digest)
+            for frame, digest in frames.items()
+        }
+    return None
+
+
+def put(root: str, path: str) -> tuple[str, bool]:
+    """Store one PNG; returns (digest, whether a new blob was written)."""
+    digest = pixel_digest(decode(path))
+    target = blob_path(root, digest)
+    if os.path.exists(target):
+        return digest, False
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp = f"{target}.{os.getpid()}.tmp"
+    shutil.copyfile(path, tmp)
+    os.replace(tmp, target)
+    return digest, True
+
+
+def capture_frames(capture_dir: str) -> list[str]:
+    return sorted(n for n in os.listdir(capture_dir) if n.endswith(".png"))
+
+
+def update(root: str, scenario: str, capture_dir: str) -> tuple[int, int, bool]:
+    """Point a scenario's manifest at capture_dir's frames.
+
+    Returns (frames, new blobs, manifest changed).
+    """
+    frames = {}
+    added = 0
+    for name in capture_frames(capture_dir):
+        digest, new = put(root, os.path.join(capture_dir, name))
+        frames[name] = digest
+        added += new
+    changed = write_manifest(manifest_path(root, scenario), frames)
+    return len(frames), added, changed
+
+
+def prune(root: str, keep: set[str]) -> list[str]:
+    """Delete the manifests of scenarios not in keep; returns their names."""
+    removed = []
+    for scenario in scenarios(root):
+        if scenario in keep:
+            continue
+        os.remove(manifest_path(root, scenario))
+        try:
+            os.rmdir(os.path.join(root, scenario))
+        except OSError:
+            pass  # other files remain; leave the directory
+        removed.append(scenario)
+    return removed
+
+
+def referenced(root: str) -> set[str]:
+    return {
+        digest
+        for scenario in scenarios(root)
+        for digest in read_manifest(manifest_path(root, scenario)).values()
+    }
+
+
+def all_blobs(root: str) -> dict[str, str]:
+    """Digest -> path for every blob in the store."""
+    blobs = {}
+    base = os.path.join(root, BLOB_DIR)
+    for fan in sorted(os.listdir(base)) if os.path.isdir(base) else []:
+        for name in sorted(os.listdir(os.path.join(base, fan))):
+            if name.endswith(".png"):
+                blobs[name[: -len(".png")]] = os.path.join(base, fan, name)
+    return blobs
+
+
+def cmd_update(args: argparse.Namespace) -> int:
+    if args.scenario:
+        if len(args.captures) != 1:
+            print("[baseline] ERROR: --scenario takes exactly one capture directory")
+            return 1
+        if args.prune:
+            print("[baseline] ERROR: --prune needs capture roots, not --scenario")
+            return 1
+        jobs = [(args.scenario, args.captures[0])]
+    else:
+        jobs = []
+        for capture_root in args.captures:
+            for name in sorted(os.listdir(capture_root)):
+                path = os.path.join(capture_root, name)
+                if os.path.isdir(path) and capture_frames(path):
+                    jobs.append((name, path))
+    if not jobs:
+        print("[baseline] ERROR: no capture directories with PNGs")
+        return 1
+
+    total = added = changed = 0
+    for scenario, capture_dir in jobs:
+        frames, new, rewritten = update(args.store, scenario, capture_dir)
+        total += frames
+        added += new
+        changed += rewritten
+        note = "updated" if rewritten else "unchanged"
+        print(f"[baseline] {scenario}: {frames} frame(s), {new} new blob(s), {note}")
+    pruned = prune(args.store, {scenario for scenario, _ in jobs}) if args.prune else []
+    for scenario in pruned:
+        print(f"[baseline] {scenario}: not captured, manifest removed")
+    print(
+        f"[baseline] {len(jobs)} scenario(s), {total} frame(s): {added} new blob(s), "
+        f"{changed} manifest(s) rewritten, {len(pruned)} pruned"
+    )
+    return 0
+
+
+def cmd_migrate(args: argparse.Namespace) -> int:
+    """Turn plain <scenario>/*.png directories into manifests + blobs."""
+    migrated = 0
+    os.makedirs(os.path.join(args.store, BLOB_DIR), exist_ok=True)
+    for name in sorted(os.listdir(args.store)):
+        path = os.path.join(args.store, name)
+        if name == BLOB_DIR or not os.path.isdir(path):
+            continue
+        pngs = capture_frames(path)
+        if not pngs:
+            continue
+        frames = read_manifest(manifest_path(args.store, name))
+        for png in pngs:
+            frames[png], _ = put(args.store, os.path.join(path, png))
+        write_manifest(manifest_path(args.store, name), frames)
+        for png in pngs:
+            os.remove(os.path.join(path, png))
+        migrated += 1
+        print(f"[baseline] {name}: migrated {len(pngs)} frame(s)")
+    print(f"[baseline] Migrated {migrated} scenario(s)")
+    return 0
+
+
+def cmd_gc(args: argparse.Namespace) -> int:
+    keep = referenced(args.store)
+    removed = 0
+    for digest, path in all_blobs(args.store).items():
+        if digest not in keep:
+            os.remove(path)
+            removed += 1
+    print(f"[baseline] Removed {removed} unreferenced blob(s), kept {len(keep)}")
+    return 0
+
+
+def cmd_stats(args: argparse.Namespace) -> int:
+    frames = 0
+    logical = 0
+    blobs = all_blobs(args.store)
+    sizes = {d: os.path.getsize(p) for d, p in blobs.items()}
+    for scenario in scenarios(args.store):
+        for digest in read_manifest(manifest_path(args.store, scenario)).values():
+            frames += 1
+            logical += sizes.get(digest, 0)
+    missing = referenced(args.store) - blobs.keys()
+    stored = sum(sizes.values())
+    print(
+        f"[baseline] {len(scenarios(args.store))} scenario(s), {frames} frame(s), "
+        f"{len(blobs)} blob(s): {stored / 1024:.0f} KiB stored for "
+        f"{logical / 1024:.0f} KiB of frames"
+    )
+    if missing:
+        print(f"[baseline] ERROR: {len(missing)} referenced blob(s) missing")
+        return 1
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("update", help="store captures and rewrite scenario manifests")
+    p.add_argument(
+        "captures",
+        nargs="+",
+        help="capture root(s) with one directory per scenario, or one "
+        "capture directory with --scenario",
+    )
+    p.add_argument("--scenario", help="scenario id for a single capture directory")
+    p.add_argument(
+        "--prune",
+        action="store_true",
+        help="delete manifests of scenarios with no capture directory",
+    )
+    p.set_defaults(run=cmd_update)
+
+    p = sub.add_parser("migrate", help="convert plain PNG baseline dirs to the store")
+    p.set_defaults(run=cmd_migrate)
+
+    p = sub.add_parser("gc", help="delete blobs no manifest references")
+    p.set_defaults(run=cmd_gc)
+
+    p = sub.add_parser("stats", help="frame, blob and size counts")
+    p.set_defaults(run=cmd_stats)
+
+    for p in sub.choices.values():
+        p.add_argument(
+            "--store",
+            default="baselines/visual",
+            help="store root (default: baselines/visual)",
+        )
+    args = parser.parse_args()
+    try:
+        return args.run(args)
+    except (OSError, ValueError) as e:
+        print(f"[baseline] ERROR: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
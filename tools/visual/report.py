@@ -1,4 +1,415 @@
 #!/usr/bin/env python3
-import sys
-print("[visual-report] Placeholder. Implement in Milestone 8.")
-sys.exit(0)
+"""
+Build the visual regression HTML report from diff_frames.py results.
+
+Reads one or more results files (results.json, or a results.jsonl stream
+from a run still in progress) - e.g. one per CI shard - and writes:
+  index.html                     summary and one row per scenario, failing first
+  scenarios/<scenario>.html      that scenario's captures; failures, new and
+                                 missing captures with thumbnails, PAGE_SIZE
+                                 per page (<scenario>-2.html, ...)
+  thumbs/<sha256>.png            downscaled golden/current/heatmap images
+  summary.json                   machine-readable counts per scenario plus
+                                 every failure with its metrics
+
+Every page is written once, in a single pass over the results. Thumbnails
+are at most THUMB_WIDTH pixels wide (integer downscale, so pixel art stays
+aligned; heatmaps are max-pooled so single changed pixels stay visible),
+lazy-loaded, and link to the full-size image. They are named by the
+source file's sha256, so reruns reuse them; thumbnails no longer
+referenced are deleted.
+
+Image paths in the results are resolved against the current directory
+(the directory diff_frames.py ran in); heatmap paths against the results
+file's directory, falling back to the run's --out. Images that cannot be
+found are reported as unavailable. When several files contain the same
+capture, the last one wins.
+
+Usage:
+  python3 tools/visual/report.py                                  # captures/diff-report/results.json
+  python3 tools/visual/report.py shard-*/results.json --out captures/diff-report
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import shutil
+from datetime import datetime
+from typing import Iterator, Optional
+
+import numpy as np
+from PIL import Image
+
+SUMMARY_SCHEME = 1
+PAGE_SIZE = 25  # failing/new/missing captures per scenario page
+THUMB_WIDTH = 256
+MAX_LISTED = 8  # regions spelled out per failure
+STATUSES = ("fail", "missing", "new", "pass")
+
+STYLE = """\
+body { font-family: sans-serif; max-width: 1200px; margin: 0 auto; padding: 20px; }
+.pass { color: green; } .fail { color: red; } .new, .missing { color: blue; }
+.comparison { display: flex; gap: 10px; margin: 10px 0; flex-wrap: wrap; }
+.comparison img { border: 1px solid #ccc; image-rendering: pixelated; }
+.diff-image { border-color: red !important; }
+table { border-collapse: collapse; } td, th { padding: 2px 10px; text-align: right; }
+td:first-child, th:first-child { text-align: left; }
+h2 { border-bottom: 1px solid #ccc; padding-bottom: 5px; }"""
+
+
+def file_sha256(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def read_results(paths: list[str]) -> Iterator[tuple[dict, str]]:
+    """Yield (result, heatmap base dir) from results.json/.jsonl files."""
+    for path in paths:
+        base = os.path.dirname(os.path.abspath(path))
+        with open(path) as f:
+            if path.endswith(".jsonl"):
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line), base
+                continue
+            doc = json.load(f)
+        out = doc.get("out")
+        for result in doc["results"]:
+            diff = result.get("diff")
+            if diff and out and not os.path.exists(os.path.join(base, diff)):
+                yield result, os.path.abspath(out)
+            else:
+                yield result, base
+
+
+def page_name(scenario: str, page: int = 1) -> str:
+    """File name of a scenario page, safe for any scenario id."""
+    stem = "".join(c if c.isalnum() or c in "-_" else "_" for c in scenario)
+    stem = stem or "_"
+    return f"{stem}.html" if page == 1 else f"{stem}-{page}.html"
+
+
+def downscale(canvas: np.ndarray, factor: int, pool_max: bool) -> np.ndarray:
+    """Shrink by an integer factor: box average, or max for heatmaps."""
+    height, width = canvas.shape[:2]
+    pad = ((0, -height % factor), (0, -width % factor), (0, 0))
+    canvas = np.pad(canvas, pad, mode="edge")
+    blocks = canvas.reshape(
+        canvas.shape[0] // factor, factor, canvas.shape[1] // factor, factor, -1
+    )
+    if pool_max:
+        # Brightest red/yellow wins, i.e. the largest delta in the block
+        return blocks.max(axis=(1, 3))
+    return blocks.mean(axis=(1, 3)).round().astype(np.uint8)
+
+
+class Thumbnails:
+    """Content-addressed thumbnails under <out>/thumbs."""
+
+    def __init__(self, out_dir: str):
+        self.dir = os.path.join(out_dir, "thumbs")
+        self.used: set[str] = set()
+
+    def get(
+        self, path: Optional[str], sha: Optional[str] = None, heatmap: bool = False
+    ) -> Optional[tuple[str, int, int]]:
+        """(thumbnail path, width, height), or None if path is unreadable."""
+        if not path or not os.path.isfile(path):
+            return None
+        try:
+            sha = sha or file_sha256(path)
+            name = f"{sha}.png"
+            target = os.path.join(self.dir, name)
+            if os.path.exists(target):
+                with Image.open(target) as img:
+                    size = img.size
+            else:
+                with Image.open(path) as img:
+                    canvas = np.asarray(img.convert("RGBA"))
+                factor = max(1, -(-canvas.shape[1] // THUMB_WIDTH))
+                thumb = Image.fromarray(downscale(canvas, factor, heatmap))
+                os.makedirs(self.dir, exist_ok=True)
+                thumb.save(target, optimize=True)
+                size = thumb.size
+        except OSError:
+            return None
+        self.used.add(name)
+        return target, size[0], size[1]
+
+    def prune(self) -> int:
+        """Delete thumbnails this report did not use."""
+        removed = 0
+        for name in os.listdir(self.dir) if os.path.isdir(self.dir) else []:
+            if name not in self.used:
+                os.remove(os.path.join(self.dir, name))
+                removed += 1
+        return removed
+
+
+def describe_region(region: dict) -> str:
+    x, y, w, h = region["rect"]
+    return f"{w}x{h}+{x}+{y} ({region['ae']} px, max {region['max_delta']})"
+
+
+def describe(result: dict) -> str:
+    if "error" in result:
+        return result["error"]
+    regions = result.get("regions", [])
+    listed = ", ".join(describe_region(g) for g in regions[:MAX_LISTED])
+    more = f", +{len(regions) - MAX_LISTED} more" if len(regions) > MAX_LISTED else ""
+    ssim = f", SSIM {result['ssim']}" if "ssim" in result else ""
+    broken = "; ".join(result.get("violations", []))
+    return (
+        f"{broken}: {result['ae']} pixels differ, max delta {result['max_delta']}, "
+        f"PSNR {result['psnr']} dB{ssim}; {len(regions)} region(s): {listed}{more}"
+    )
+
+
+def figure(
+    page_dir: str,
+    label: str,
+    full: Optional[str],
+    thumb: Optional[tuple[str, int, int]],
+    css: str = "",
+) -> str:
+    if thumb is None:
+        return f"<div><p>{label}</p><p><em>image unavailable</em></p></div>"
+    src, width, height = thumb
+    href = html.escape(os.path.relpath(full, page_dir))
+    img = html.escape(os.path.relpath(src, page_dir))
+    cls = f' class="{css}"' if css else ""
+    return (
+        f'<div><p>{label}</p><a href="{href}"><img src="{img}" width="{width}" '
+        f'height="{height}" loading="lazy" alt="{label.lower()}"{cls}></a></div>'
+    )
+
+
+def entry_html(result: dict, base: str, page_dir: str, thumbs: Thumbnails) -> list[str]:
+    name = html.escape(result["path"].rpartition("/")[2])
+    status = result["status"]
+    golden, current = result.get("golden_file"), result.get("current_file")
+    if status == "new":
+        return [
+            f'<p class="new">NEW: {name}</p>',
+            '<div class="comparison">',
+            figure(page_dir, "Current", current, thumbs.get(current)),
+            "</div>",
+        ]
+    if status == "missing":
+        return [
+            f'<p class="missing">MISSING: {name}</p>',
+            '<div class="comparison">',
+            figure(page_dir, "Golden", golden, thumbs.get(golden)),
+            "</div>",
+        ]
+    lines = [
+        f'<p class="fail">&#10007; {name} - {html.escape(describe(result))}</p>',
+        '<div class="comparison">',
+        figure(
+            page_dir, "Golden", golden, thumbs.get(golden, result.get("golden_sha256"))
+        ),
+        figure(page_dir, "Current", current, thumbs.get(current, result.get("sha256"))),
+    ]
+    if "diff" in result:
+        diff = os.path.join(base, result["diff"])
+        lines.append(
+            figure(page_dir, "Diff", diff, thumbs.get(diff, heatmap=True), "diff-image")
+        )
+    lines.append("</div>")
+    return lines
+
+
+def write_scenario(
+    out_dir: str,
+    scenario: str,
+    entries: list[tuple[dict, str]],
+    thumbs: Thumbnails,
+    generated: str,
+) -> int:
+    """Write a scenario's pages; returns the number of pages."""
+    page_dir = os.path.join(out_dir, "scenarios")
+    entries.sort(key=lambda e: (STATUSES.index(e[0]["status"]), e[0]["path"]))
+    shown = [e for e in entries if e[0]["status"] != "pass"]
+    passed = [e[0] for e in entries if e[0]["status"] == "pass"]
+    pages = max(1, -(-len(shown) // PAGE_SIZE))
+    title = html.escape(scenario)
+    for page in range(1, pages + 1):
+        nav = ['<p><a href="../index.html">&larr; all scenarios</a>']
+        if page > 1:
+            nav.append(f' | <a href="{page_name(scenario, page - 1)}">previous</a>')
+        if page < pages:
+            nav.append(f' | <a href="{page_name(scenario, page + 1)}">next</a>')
+        nav.append(f" | page {page} of {pages}</p>")
+        lines = [
+            "<!DOCTYPE html>",
+            "<html>",
+            "<head>",
+            '<meta charset="utf-8">',
+            f"<title>{title} - Visual Regression Report</title>",
+            f"<style>\n{STYLE}\n</style>",
+            "</head>",
+            "<body>",
+            f"<h1>{title}</h1>",
+            f"<p>Generated: {html.escape(generated)}</p>",
+            "".join(nav),
+        ]
+        for result, base in shown[(page - 1) * PAGE_SIZE : page * PAGE_SIZE]:
+            lines += entry_html(result, base, page_dir, thumbs)
+        if page == pages and passed:
+            lines.append(f"<details><summary>{len(passed)} passed</summary>")
+            lines += [
+                f'<p class="pass">&#10003; {html.escape(r["path"].rpartition("/")[2])}</p>'
+                for r in passed
+            ]
+            lines.append("</details>")
+        lines.append("".join(nav))
+        lines += ["</body>", "</html>", ""]
+        with open(os.path.join(page_dir, page_name(scenario, page)), "w") as f:
+            f.write("\n".join(lines))
+    return pages
+
+
+def write_index(path: str, generated: str, totals: dict, scenarios: dict) -> None:
+    order = sorted(
+        scenarios, key=lambda s: (-scenarios[s]["fail"], -scenarios[s]["missing"], s)
+    )
+    lines = [
+        "<!DOCTYPE html>",
+        "<html>",
+        "<head>",
+        '<meta charset="utf-8">',
+        "<title>Visual Regression Report</title>",
+        f"<style>\n{STYLE}\n</style>",
+        "</head>",
+        "<body>",
+        "<h1>Visual Regression Report</h1>",
+        f"<p>Generated: {html.escape(generated)}</p>",
+        f"<p><strong>Summary:</strong> {totals['pass']} passed, {totals['fail']} failed, "
+        f"{totals['new']} new, {totals['missing']} missing (total: {totals['total']}) "
+        f"in {len(scenarios)} scenario(s)</p>",
+        "<table>",
+        "<tr><th>Scenario</th><th>Failed</th><th>Missing</th><th>New</th>"
+        "<th>Passed</th></tr>",
+    ]
+    for scenario in order:
+        counts = scenarios[scenario]
+        css = (
+            "fail"
+            if counts["fail"]
+            else "new" if counts["new"] + counts["missing"] else "pass"
+        )
+        lines.append(
+            f'<tr class="{css}"><td><a href="{html.escape(counts["page"])}">'
+            f"{html.escape(scenario)}</a></td><td>{counts['fail']}</td>"
+            f"<td>{counts['missing']}</td><td>{counts['new']}</td>"
+            f"<td>{counts['pass']}</td></tr>"
+        )
+    lines += ["</table>", "</body>", "</html>", ""]
+    with open(path, "w") as f:
+        f.write("\n".join(lines))
+
+
+def build_report(sources: list[str], out_dir: str) -> dict:
+    """Write the report for the given results files; returns summary.json."""
+    by_path = {}
+    for result, base in read_results(sources):
+        by_path[result["path"]] = (result, base)
+    grouped: dict[str, list[tuple[dict, str]]] = {}
+    for entry in by_path.values():
+        grouped.setdefault(entry[0]["scenario"], []).append(entry)
+
+    generated = datetime.now().astimezone().isoformat(timespec="seconds")
+    page_dir = os.path.join(out_dir, "scenarios")
+    shutil.rmtree(page_dir, ignore_errors=True)
+    os.makedirs(page_dir)
+    thumbs = Thumbnails(out_dir)
+    totals = dict.fromkeys(("pass", "fail", "new", "missing", "total"), 0)
+    scenarios = {}
+    failures = []
+    for scenario in sorted(grouped):
+        entries = grouped[scenario]
+        counts = dict.fromkeys(STATUSES, 0)
+        for result, _ in entries:
+            counts[result["status"]] += 1
+            if result["status"] == "fail":
+                failures.append(
+                    {
+                        key: result[key]
+                        for key in (
+                            "path",
+                            "error",
+                            "violations",
+                            "ae",
+                            "max_delta",
+                            "psnr",
+                            "ssim",
+                            "diff_ratio",
+                            "bbox",
+                            "regions",
+                        )
+                        if key in result
+                    }
+                )
+        pages = write_scenario(out_dir, scenario, entries, thumbs, generated)
+        counts.update(
+            total=len(entries), page=f"scenarios/{page_name(scenario)}", pages=pages
+        )
+        scenarios[scenario] = counts
+        for status in STATUSES:
+            totals[status] += counts[status]
+        totals["total"] += len(entries)
+    thumbs.prune()
+
+    write_index(os.path.join(out_dir, "index.html"), generated, totals, scenarios)
+    summary = {
+        "scheme": SUMMARY_SCHEME,
+        "generated": generated,
+        "sources": sources,
+        "summary": totals,
+        "scenarios": scenarios,
+        "failures": sorted(failures, key=lambda r: r["path"]),
+    }
+    with open(os.path.join(out_dir, "summary.json"), "w") as f:
+        json.dump(summary, f, indent=2)
+        f.write("\n")
+    return summary
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "results",
+        nargs="*",
+        help="results.json / results.jsonl files (default: <out>/results.json)",
+    )
+    parser.add_argument(
+        "--out",
+        default=os.environ.get("DIFF_DIR", "captures/diff-report"),
+        help="report directory (default: $DIFF_DIR or captures/diff-report)",
+    )
+    args = parser.parse_args()
+
+    sources = args.results or [os.path.join(args.out, "results.json")]
+    missing = [p for p in sources if not os.path.isfile(p)]
+    if missing:
+        print(f"[visual-report] ERROR: results not found: {', '.join(missing)}")
+        return 1
+    os.makedirs(args.out, exist_ok=True)
+    try:
+        summary = build_report(sources, args.out)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"[visual-report] ERROR: {e}")
+        return 1
+    s = summary["summary"]
+    print(
+        f"[visual-report] {s['pass']} passed, {s['fail']} failed, {s['new']} new, "
+        f"{s['missing']} missing in {len(summary['scenarios'])} scenario(s): "
+        f"{os.path.join(args.out, 'index.html')}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
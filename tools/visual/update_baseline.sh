@@ -1,4 +1,14 @@
 #!/usr/bin/env bash
+# Usage: update_baseline.sh <scenario_id> [run_id]
+# Stores captures/rendered/<scenario_id>/<run_id> (default: most recent run)
+# as the scenario's baseline in the golden store.
 set -euo pipefail
-echo "[baseline] Placeholder. Implement in Milestone 8."
-exit 1
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+SCENARIO_ID="${1:?usage: update_baseline.sh <scenario_id> [run_id]}"
+RUN_ID="${2:-}"
+
+if [[ -n "$RUN_ID" ]]; then
+    exec "$SCRIPT_DIR/../ci/update-baseline.sh" "$SCENARIO_ID" "captures/rendered/$SCENARIO_ID/$RUN_ID"
+fi
+exec "$SCRIPT_DIR/../ci/update-baseline.sh" "$SCENARIO_ID"